@@ -0,0 +1,238 @@
+import hashlib
+import logging
+import pickle
+import threading
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+logger = logging.getLogger(__name__)
+
+# Deleted keys kept in the invalidation log; a process that fell further behind clears its whole local tier
+INVALIDATION_LOG_SIZE = 1000
+
+_MISSING = object()
+
+
+def migrations_fingerprint(base_dir: Path) -> str:
+    """
+    A short hash of the names of the migration files of the project's apps. The database schema and the reporting
+    configuration only change with migrations, so cache keys prefixed with it are never read by a release that
+    pickles or builds the cached values differently.
+    """
+    names = sorted(path.relative_to(base_dir).as_posix() for path in base_dir.glob("*/migrations/[0-9]*.py"))
+    return hashlib.sha256("\n".join(names).encode()).hexdigest()[:12]
+
+
+@dataclass
+class _ProcessState:
+    """State of a tiered cache shared by the threads of a process (Django creates a cache instance per thread)"""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    counters: Counter = field(default_factory=Counter)
+    synced: bool = False
+    # (epoch, sequence) of the invalidation log when it was last applied to the local tier, None if there was no log
+    seen_position: Optional[Tuple[str, int]] = None
+    next_sync_at: float = 0.0
+
+
+class TieredCache(BaseCache):
+    """
+    Cache with a local memory tier (L1) per process in front of a cache shared by every worker and pod, e.g. a
+    DatabaseCache on the `erc.shared_cache` table or a FileBasedCache.
+
+    - Reads try the local tier, then the shared tier, and keep shared hits in the local tier.
+    - Writes go to both tiers.
+    - Deleted keys are appended to an invalidation log in the shared tier. Each process reads the log at most every
+      INVALIDATION_INTERVAL seconds and drops the logged keys from its local tier, so an invalidation made by one
+      process reaches the others within that interval. Concurrent deletes can overwrite each other's log entries, so
+      local entries are also dropped after LOCAL_TIMEOUT seconds.
+
+    OPTIONS:
+    - SHARED: alias of the shared cache in CACHES
+    - LOCAL_TIMEOUT: seconds an entry stays in the local tier (default 60, None to keep it until it is evicted)
+    - LOCAL_MAX_ENTRIES: entries kept in the local tier of each process (default 1000)
+    - INVALIDATION_INTERVAL: seconds between reads of the invalidation log (default 1)
+    """
+
+    _states: Dict[str, _ProcessState] = {}
+    _states_lock = threading.Lock()
+
+    def __init__(self, location: str, params: Dict[str, Any]) -> None:
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._name = location
+        self._shared_alias = options["SHARED"]
+        self._local_timeout: Optional[float] = options.get("LOCAL_TIMEOUT", 60)
+        self._invalidation_interval: float = options.get("INVALIDATION_INTERVAL", 1)
+        # Local memory caches with the same name share their entries, so every thread of the process sees them
+        self._local = LocMemCache(
+            f"tiered-{location}",
+            {"TIMEOUT": self._local_timeout, "OPTIONS": {"MAX_ENTRIES": options.get("LOCAL_MAX_ENTRIES", 1000)}},
+        )
+        with self._states_lock:
+            self._state = self._states.setdefault(location, _ProcessState())
+
+    @property
+    def _shared(self) -> BaseCache:
+        return caches[self._shared_alias]
+
+    @property
+    def _invalidation_log_key(self) -> str:
+        return self.make_key("__invalidations__")
+
+    def _count(self, counter: str) -> None:
+        with self._state.lock:
+            self._state.counters[counter] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Hits, misses, writes and invalidations of this cache in the current process"""
+        with self._state.lock:
+            return {
+                counter: self._state.counters[counter]
+                for counter in ("local_hits", "shared_hits", "misses", "sets", "deletes", "local_invalidations")
+            }
+
+    def reset_stats(self) -> None:
+        with self._state.lock:
+            self._state.counters.clear()
+
+    def _local_timeout_for(self, timeout: Optional[float]) -> Optional[float]:
+        if self._local_timeout is None:
+            return timeout
+        if timeout is None:
+            return self._local_timeout
+        return min(timeout, self._local_timeout)
+
+    def _get_shared(self, key: str) -> Any:
+        try:
+            return self._shared.get(key, _MISSING)
+        except (pickle.UnpicklingError, AttributeError, EOFError, ImportError) as e:
+            # An entry pickled by code that no longer exists is a miss; it's overwritten on the next set
+            logger.warning(f"Ignoring unreadable shared cache entry {key}: {e}")
+            return _MISSING
+
+    def sync_invalidations(self, force: bool = False) -> None:
+        """Drops the keys deleted by other processes from the local tier, at most every INVALIDATION_INTERVAL"""
+        state = self._state
+        now = time.monotonic()
+        with state.lock:
+            if not force and now < state.next_sync_at:
+                return
+            state.next_sync_at = now + self._invalidation_interval
+            synced, seen_position = state.synced, state.seen_position
+
+        log = self._get_shared(self._invalidation_log_key)
+        log = log if isinstance(log, dict) else None
+        position = (log["epoch"], log["sequence"]) if log else None
+        if not synced or position == seen_position:
+            # The local tier is empty until the first sync, so there is nothing to drop
+            with state.lock:
+                state.synced, state.seen_position = True, position
+            return
+
+        if log is None or seen_position is None or log["epoch"] != seen_position[0]:
+            # The log was lost (e.g. the shared tier was emptied), so any key may have changed
+            self._local.clear()
+        else:
+            seen_sequence = seen_position[1]
+            entries = log["entries"]
+            if log["cleared_sequence"] > seen_sequence or (entries and entries[0][0] > seen_sequence + 1):
+                # The cache was cleared, or more keys were deleted than the log keeps
+                self._local.clear()
+            else:
+                for entry_sequence, key in entries:
+                    if entry_sequence > seen_sequence:
+                        self._local.delete(key)
+        with state.lock:
+            state.seen_position = position
+            state.counters["local_invalidations"] += 1
+
+    def _log_invalidation(self, key: Optional[str] = None, log: Any = _MISSING) -> None:
+        """
+        Appends a deleted key to the invalidation log, or records that the cache was cleared if key is None.
+        `log` is the current log if it was already read.
+        """
+        if log is _MISSING:
+            log = self._get_shared(self._invalidation_log_key)
+        if not isinstance(log, dict):
+            # A new epoch tells other processes that the log they read before is gone
+            log = {"epoch": uuid.uuid4().hex, "sequence": 0, "cleared_sequence": 0, "entries": []}
+        sequence = log["sequence"] + 1
+        if key is None:
+            log = {**log, "sequence": sequence, "cleared_sequence": sequence, "entries": []}
+        else:
+            log = {**log, "sequence": sequence, "entries": [*log["entries"], (sequence, key)][-INVALIDATION_LOG_SIZE:]}
+        self._shared.set(self._invalidation_log_key, log, None)
+        # This process applied the invalidation already
+        with self._state.lock:
+            if self._state.seen_position == (log["epoch"], sequence - 1):
+                self._state.seen_position = (log["epoch"], sequence)
+
+    def get(self, key: Any, default: Any = None, version: Optional[int] = None) -> Any:
+        key = self.make_and_validate_key(key, version=version)
+        self.sync_invalidations()
+        value = self._local.get(key, _MISSING)
+        if value is not _MISSING:
+            self._count("local_hits")
+            return value
+
+        value = self._get_shared(key)
+        if value is _MISSING:
+            self._count("misses")
+            return default
+        # The remaining lifetime of the shared entry isn't known, so the local copy lives for LOCAL_TIMEOUT
+        self._local.set(key, value, self._local_timeout)
+        self._count("shared_hits")
+        return value
+
+    def set(self, key: Any, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: Optional[int] = None) -> None:
+        key = self.make_and_validate_key(key, version=version)
+        timeout = self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+        self._shared.set(key, value, timeout)
+        self._local.set(key, value, self._local_timeout_for(timeout))
+        self._count("sets")
+
+    def add(self, key: Any, value: Any, timeout: Any = DEFAULT_TIMEOUT, version: Optional[int] = None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        timeout = self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+        if not self._shared.add(key, value, timeout):
+            return False
+        self._local.set(key, value, self._local_timeout_for(timeout))
+        self._count("sets")
+        return True
+
+    def touch(self, key: Any, timeout: Any = DEFAULT_TIMEOUT, version: Optional[int] = None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        timeout = self.default_timeout if timeout is DEFAULT_TIMEOUT else timeout
+        # The local copy is read from the shared tier again, with the new timeout
+        self._local.delete(key)
+        return self._shared.touch(key, timeout)
+
+    def has_key(self, key: Any, version: Optional[int] = None) -> bool:
+        return self.get(key, _MISSING, version=version) is not _MISSING
+
+    def delete(self, key: Any, version: Optional[int] = None) -> bool:
+        key = self.make_and_validate_key(key, version=version)
+        self._local.delete(key)
+        deleted = self._shared.delete(key)
+        self._log_invalidation(key)
+        self._count("deletes")
+        return deleted
+
+    def clear(self) -> None:
+        # Clears the whole shared tier, including the entries of other caches that share it
+        # The log is read first, so its sequence keeps increasing and other processes notice the clear
+        log = self._get_shared(self._invalidation_log_key)
+        self._local.clear()
+        self._shared.clear()
+        self._log_invalidation(log=log)
+
+    def close(self, **kwargs: Any) -> None:
+        self._shared.close(**kwargs)
@@ -0,0 +1,26 @@
+from typing import Any, Optional, Type
+from django.db.models import Model
+
+# Alias of the connection used by the shared cache tier (see settings.SHARED_CACHE_BACKEND)
+SHARED_CACHE_DATABASE = "shared_cache"
+
+# App label of the model Django's DatabaseCache builds for its table
+DATABASE_CACHE_APP_LABEL = "django_cache"
+
+
+class SharedCacheRouter:
+    """
+    Sends the queries of the database cache to their own connection. Requests set their RLS role on the default
+    connection; the cache connection never takes a request role, so `erc.shared_cache` (pickled values, including
+    cached users) is granted to no application role and can't be read or written by the request roles.
+    """
+
+    def db_for_read(self, model: Type[Model], **hints: Any) -> Optional[str]:
+        return SHARED_CACHE_DATABASE if model._meta.app_label == DATABASE_CACHE_APP_LABEL else None
+
+    def db_for_write(self, model: Type[Model], **hints: Any) -> Optional[str]:
+        return SHARED_CACHE_DATABASE if model._meta.app_label == DATABASE_CACHE_APP_LABEL else None
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> Optional[bool]:
+        # The cache connection points at the default database, which is migrated through the default connection
+        return False if db == SHARED_CACHE_DATABASE else None
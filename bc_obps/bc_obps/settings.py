@@ -18,6 +18,7 @@ import dj_database_url
 from dotenv import load_dotenv
 import urllib.parse
 
+from .cache_backends import migrations_fingerprint
 from .error_tracking import configure_error_tracking
 
 load_dotenv()
@@ -38,6 +39,10 @@ if ENVIRONMENT == 'local' or CI == 'true':
     STORAGES = {
         "default": {"BACKEND": "bc_obps.storage_backends.SimpleLocal"},
         "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+        "pdf_cache": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": os.path.join(MEDIA_ROOT, "pdf_cache"), "allow_overwrite": True},
+        },
     }
 else:
     # Google Cloud Storage Settings
@@ -49,6 +54,14 @@ else:
         "default": {"BACKEND": "bc_obps.storage_backends.UnifiedGcsStorage"},
         "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
     }
+    # Generated PDFs are cached in their own bucket (they don't go through the malware scan, so they must not share
+    # the scanned documents' buckets); without one, PDFs are rendered on every request
+    GS_PDF_CACHE_BUCKET_NAME = os.environ.get("GS_PDF_CACHE_BUCKET_NAME")
+    if GS_PDF_CACHE_BUCKET_NAME:
+        STORAGES["pdf_cache"] = {
+            "BACKEND": "storages.backends.gcloud.GoogleCloudStorage",
+            "OPTIONS": {"bucket_name": GS_PDF_CACHE_BUCKET_NAME, "location": "pdf_cache", "file_overwrite": True},
+        }
     if os.environ.get("GOOGLE_APPLICATION_CREDENTIALS"):
         GS_CREDENTIALS = service_account.Credentials.from_service_account_file(
             os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
@@ -80,6 +93,31 @@ BCCR_API_URL = os.getenv("BCCR_API_URL")
 BCCR_CLIENT_ID = os.getenv("BCCR_CLIENT_ID")
 BCCR_CLIENT_SECRET = os.getenv("BCCR_CLIENT_SECRET")
 
+# Outbound HTTP settings shared by the eLicensing, CHES and BCCR API clients
+# Connection pool size per API host; each gunicorn worker keeps its own pools
+OUTBOUND_HTTP_POOL_MAXSIZE = {
+    "eLicensing": int(os.getenv("ELICENSING_HTTP_POOL_MAXSIZE", "10")),
+    "CHES": int(os.getenv("CHES_HTTP_POOL_MAXSIZE", "4")),
+    "BCCR": int(os.getenv("BCCR_HTTP_POOL_MAXSIZE", "4")),
+}
+OUTBOUND_HTTP_MAX_RETRIES = int(os.getenv("OUTBOUND_HTTP_MAX_RETRIES", "3"))
+OUTBOUND_HTTP_BACKOFF_FACTOR = float(os.getenv("OUTBOUND_HTTP_BACKOFF_FACTOR", "0.5"))
+OUTBOUND_HTTP_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("OUTBOUND_HTTP_CIRCUIT_FAILURE_THRESHOLD", "5"))
+OUTBOUND_HTTP_CIRCUIT_RESET_SECONDS = float(os.getenv("OUTBOUND_HTTP_CIRCUIT_RESET_SECONDS", "30"))
+# How often each worker logs its per-endpoint latency metrics; 0 disables the log
+OUTBOUND_HTTP_METRICS_LOG_SECONDS = float(os.getenv("OUTBOUND_HTTP_METRICS_LOG_SECONDS", "300"))
+
+# Number of threads per gunicorn worker rendering PDFs (see PDFGeneratorService)
+PDF_RENDER_MAX_WORKERS = int(os.getenv("PDF_RENDER_MAX_WORKERS", "2"))
+# A background PDF render still pending after this long is treated as lost (e.g. its worker was restarted)
+PDF_RENDER_PENDING_TIMEOUT_SECONDS = int(os.getenv("PDF_RENDER_PENDING_TIMEOUT_SECONDS", "300"))
+# Cached PDFs and render markers older than this are deleted by the daily PDF cache cleanup
+PDF_CACHE_MAX_AGE_DAYS = int(os.getenv("PDF_CACHE_MAX_AGE_DAYS", "7"))
+
+# Queue the calls of retryable functions (eLicensing integration, emails) for the task scheduler instead of running
+# them during the request (see RetryableFunction)
+TASK_SCHEDULER_OUTBOX = os.getenv("TASK_SCHEDULER_OUTBOX", "False") == "True"
+
 NON_PROD_ENVIRONMENT = ENVIRONMENT in ["CI", "local", "dev", "test"] or CI == "true"
 
 LOCAL_APPS = ["registration", "reporting", "common", "rls", "task_scheduler", "compliance"]
@@ -164,7 +202,31 @@ WSGI_APPLICATION = "bc_obps.wsgi.application"
 DB_USER = os.environ.get("DB_USER", "postgres")
 
 default_db_url = f"postgres://{DB_USER}:{urllib.parse.quote(str(os.environ.get('DB_PASSWORD')))}@{os.environ.get('DB_HOST', '127.0.0.1')}:{os.environ.get('DB_PORT', '5432')}/{os.environ.get('DB_NAME', 'registration')}"
-DATABASES = {'default': dj_database_url.config(default=default_db_url, conn_max_age=0, conn_health_checks=True)}
+# Connection pooling mode (DB_POOL_MODE):
+#   "none"       - a new connection for every request (default)
+#   "persistent" - each worker keeps its connection open for DB_CONN_MAX_AGE seconds
+#   "pgbouncer"  - persistent connections to a transaction-mode PgBouncer (DB_HOST/DB_PORT point at PgBouncer)
+DB_POOL_MODE = os.environ.get("DB_POOL_MODE", "none")
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", "60"))
+
+DATABASES = {
+    'default': dj_database_url.config(
+        default=default_db_url,
+        conn_max_age=DB_CONN_MAX_AGE if DB_POOL_MODE in ("persistent", "pgbouncer") else 0,
+        conn_health_checks=True,
+    )
+}
+if DB_POOL_MODE == "pgbouncer":
+    # Transaction-mode PgBouncer can hand each transaction a different server connection,
+    # so neither server-side cursors nor prepared statements survive between queries
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+    DATABASES['default']['OPTIONS'] = {"prepare_threshold": None}
+
+# With pooled connections a server session outlives the request that used it, so the RLS user context is set
+# transaction-local (SET LOCAL) and each request runs in a single transaction instead of setting it per session
+RLS_TRANSACTION_SCOPED_CONTEXT = (
+    os.environ.get("RLS_TRANSACTION_SCOPED_CONTEXT", str(DB_POOL_MODE == "pgbouncer")) == "True"
+)
 
 
 # Password validation
@@ -239,18 +301,64 @@ QUERYCOUNT = {
 }
 
 
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "default_local_memcache",
-    },
-    "form_builder": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "form_builder_memcache",
-        # Cache keys don't expire, since we don't update program configuration without a release.
-        "TIMEOUT": None,
-    },
-}
+# Caches
+# SHARED_CACHE_BACKEND puts a tier shared by every worker (and pod) behind the local memory of each process, so
+# cached users and form schemas are built once instead of once per process:
+# - none (default): local memory only
+# - database: the erc.shared_cache table, shared by every pod
+# - file: the SHARED_CACHE_LOCATION directory, shared by the workers of a pod
+SHARED_CACHE_BACKEND = os.environ.get("SHARED_CACHE_BACKEND", "none")
+# Shared entries outlive a release, so their keys are versioned by the migrations (which ship the schema and the
+# program configuration): a release never reads values pickled or built by the previous one
+CACHE_KEY_VERSION = os.environ.get("CACHE_KEY_VERSION") or migrations_fingerprint(BASE_DIR)
+
+if SHARED_CACHE_BACKEND == "database":
+    # The cache table is read and written on its own connection, outside the RLS role of the request, since no
+    # application role is granted access to it
+    DATABASES["shared_cache"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+    DATABASE_ROUTERS = ["bc_obps.db_routers.SharedCacheRouter"]
+
+if SHARED_CACHE_BACKEND in ("database", "file"):
+    CACHES = {
+        "shared": {
+            **(
+                {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": 'erc"."shared_cache'}
+                if SHARED_CACHE_BACKEND == "database"
+                else {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": os.environ.get("SHARED_CACHE_LOCATION", "/tmp/bc_obps_cache"),
+                }
+            ),
+            "OPTIONS": {"MAX_ENTRIES": int(os.environ.get("SHARED_CACHE_MAX_ENTRIES", "50000"))},
+        },
+        "default": {
+            "BACKEND": "bc_obps.cache_backends.TieredCache",
+            "LOCATION": "default",
+            "KEY_PREFIX": f"default-{CACHE_KEY_VERSION}",
+            "OPTIONS": {"SHARED": "shared", "LOCAL_TIMEOUT": 60},
+        },
+        "form_builder": {
+            "BACKEND": "bc_obps.cache_backends.TieredCache",
+            "LOCATION": "form_builder",
+            "KEY_PREFIX": f"form_builder-{CACHE_KEY_VERSION}",
+            # Cache keys don't expire, since we don't update program configuration without a release.
+            "TIMEOUT": None,
+            "OPTIONS": {"SHARED": "shared", "LOCAL_TIMEOUT": None},
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "default_local_memcache",
+        },
+        "form_builder": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "form_builder_memcache",
+            # Cache keys don't expire, since we don't update program configuration without a release.
+            "TIMEOUT": None,
+        },
+    }
 
 # Logging configuration
 # Logging Levels (from lowest to highest priority):
@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
 import re
 import shutil
-from typing import Any
+from typing import Any, Dict, Iterable
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.core.files.storage import FileSystemStorage, Storage
 from storages.backends.gcloud import GoogleCloudStorage  # type: ignore
 from django.core.files.base import ContentFile
@@ -16,7 +18,7 @@ def add_filename_suffix(filename: str, suffix: str | None = None) -> str:
     Example:
       the/path/the_file.txt -> the/path/the_file_20250522245133.txt
     """
-    (name, extension) = os.path.splitext(filename)
+    name, extension = os.path.splitext(filename)
     file_suffix = suffix if suffix is not None else f'_{datetime.now().strftime("%Y%m%d%H%M%S")}'
 
     # Remove the last 15 characters if we match a timestamp we inserted previously
@@ -44,6 +46,9 @@ class SimpleLocal(FileSystemStorage):
     def get_file_bucket(self, name: str) -> str | None:
         return "Clean"
 
+    def get_file_buckets(self, names: Iterable[str], max_workers: int | None = None) -> Dict[str, str | None]:
+        return {name: "Clean" for name in names}
+
     def duplicate_file(self, name: str) -> str:
         """
         Duplicate a file
@@ -66,18 +71,30 @@ class UnifiedGcsStorage(GoogleCloudStorage):
         self._unscanned_bucket_name = settings.GS_UNSCANNED_BUCKET_NAME
         self._quarantined_bucket_name = settings.GS_QUARANTINED_BUCKET_NAME
         self._clean_bucket_name = settings.GS_CLEAN_BUCKET_NAME
+        self._bucket_handlers: Dict[str, GoogleCloudStorage] = {}
 
         # Defaults to the clean bucket
         super().__init__(bucket_name=self._clean_bucket_name, *args, **kwargs)
 
+    def _bucket_handler(self, bucket_name: str | None) -> GoogleCloudStorage:
+        """Handlers are created once and reused, along with their client and bucket objects."""
+        if not bucket_name:
+            raise ImproperlyConfigured(
+                "GS_UNSCANNED_BUCKET_NAME, GS_QUARANTINED_BUCKET_NAME and GS_CLEAN_BUCKET_NAME must be set"
+            )
+        handler = self._bucket_handlers.get(bucket_name)
+        if handler is None:
+            handler = self._bucket_handlers[bucket_name] = GoogleCloudStorage(bucket_name=bucket_name)
+        return handler
+
     def _quarantined_handler(self) -> GoogleCloudStorage:
-        return GoogleCloudStorage(bucket_name=self._quarantined_bucket_name)
+        return self._bucket_handler(self._quarantined_bucket_name)
 
     def _unscanned_handler(self) -> GoogleCloudStorage:
-        return GoogleCloudStorage(bucket_name=self._unscanned_bucket_name)
+        return self._bucket_handler(self._unscanned_bucket_name)
 
     def _clean_handler(self) -> GoogleCloudStorage:
-        return GoogleCloudStorage(bucket_name=self._clean_bucket_name)
+        return self._bucket_handler(self._clean_bucket_name)
 
     def _save(self, name: str, content: ContentFile) -> Any:
         """Always save to the unscanned bucket."""
@@ -117,6 +134,21 @@ class UnifiedGcsStorage(GoogleCloudStorage):
 
         return None
 
+    def get_file_buckets(self, names: Iterable[str], max_workers: int | None = None) -> Dict[str, str | None]:
+        """
+        get_file_bucket for many files, probed concurrently on max_workers threads (8 by default).
+        """
+        names = list(dict.fromkeys(names))
+        if not names:
+            return {}
+
+        # Create the clients and bucket objects before the threads share them
+        for handler in (self._clean_handler(), self._unscanned_handler(), self._quarantined_handler()):
+            handler.bucket
+
+        with ThreadPoolExecutor(max_workers=max_workers or 8, thread_name_prefix="file-bucket") as executor:
+            return dict(zip(names, executor.map(self.get_file_bucket, names)))
+
     def duplicate_file(self, name: str) -> str:
         """
         Duplicate a file
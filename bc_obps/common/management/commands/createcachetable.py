@@ -0,0 +1,16 @@
+from django.apps import apps
+from django.core.management.commands import createcachetable
+
+
+class Command(createcachetable.Command):
+    help = (
+        "Same as Django's createcachetable, but skips the cache tables of models (e.g. erc.shared_cache), which are "
+        "created by migrations. Django doesn't find schema-qualified tables and would try to create them again."
+    )
+
+    def create_table(self, database: str, tablename: str, dry_run: bool) -> None:
+        if any(model._meta.db_table == tablename for model in apps.get_models()):
+            if self.verbosity > 0:
+                self.stdout.write(f"Cache table '{tablename}' is created by migrations.")
+            return
+        super().create_table(database, tablename, dry_run)
@@ -47,6 +47,18 @@ class Command(BaseCommand):
         if environment != 'prod':
             self.load_env_specific_fixtures(environment)
 
+        self.warm_activity_validation_cache(clear=has_migrations)
+
+    def warm_activity_validation_cache(self, clear: bool) -> None:
+        """
+        Cached validation schemas are derived from the reporting configuration, which only changes through
+        migrations, so they are rebuilt whenever migrations were applied. Warming must never block a deploy.
+        """
+        try:
+            call_command('warm_activity_validation_cache', clear=clear)
+        except Exception as e:
+            logger.error("Warming the activity validation cache failed: %s", e, exc_info=True)
+
     def _load_fixtures_with_triggers_disabled(self, fixture_commands):
         """
         Disables pgtrigger triggers on the 'erc' schema, runs the given fixture
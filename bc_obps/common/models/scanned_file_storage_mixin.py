@@ -1,4 +1,5 @@
 import typing
+from collections import Counter, defaultdict
 
 from common.lib import pgtrigger
 from django.core.files import File
@@ -66,6 +67,43 @@ class ScannedFileStorageMixin(models.Model):
             self.save(update_fields=['status'])
         return self.status
 
+    @staticmethod
+    def sync_file_statuses(
+        instances: typing.Iterable["ScannedFileStorageMixin"], max_workers: int | None = None
+    ) -> typing.Dict["ScannedFileStorageMixin.FileStatus", int]:
+        """
+        Batched sync_file_status for many instances, of any models using the mixin: the buckets of all the files are
+        looked up concurrently, then the statuses are saved with one update per model and status.
+        Returns the number of instances per status.
+        """
+        instances = list(instances)
+        file_buckets = default_storage.get_file_buckets(  # type: ignore
+            [instance.get_file_field().name or "" for instance in instances], max_workers=max_workers
+        )
+
+        ids_to_update: typing.Dict[typing.Tuple[typing.Type[models.Model], str], list] = defaultdict(list)
+        status_counts: typing.Counter[ScannedFileStorageMixin.FileStatus] = Counter()
+        missing_file_names: typing.List[str] = []
+        for instance in instances:
+            file_name = instance.get_file_field().name or ""
+            file_bucket = file_buckets.get(file_name)
+            if not file_bucket:
+                missing_file_names.append(file_name)
+                continue
+            instance.status = ScannedFileStorageMixin.FileStatus(file_bucket)
+            status_counts[instance.status] += 1
+            if instance.status != ScannedFileStorageMixin.FileStatus.UNSCANNED:
+                ids_to_update[(type(instance), instance.status)].append(instance.pk)
+
+        for (model, status), ids in ids_to_update.items():
+            # Ignore the audit columns triggers, we're not changing anything about the documents themselves
+            with pgtrigger.ignore(f"{model._meta.app_label}.{model._meta.object_name}:set_updated_audit_columns"):
+                model._base_manager.filter(pk__in=ids).update(status=status)
+
+        if missing_file_names:
+            raise FileNotFoundError(f"Files {', '.join(missing_file_names)} not found in storage.")
+        return dict(status_counts)
+
     # Django method overrides
 
     @typing.no_type_check
@@ -13,6 +13,7 @@ from ._compliance_report_versions._compliance_report_version_id import (
     penalty,
     late_submission_penalty,
     manual_handling,
+    pdf_render,
 )
 from ._compliance_report_versions._compliance_report_version_id._automatic_overdue_penalty.invoice import (
     pdf as penalty_invoice,
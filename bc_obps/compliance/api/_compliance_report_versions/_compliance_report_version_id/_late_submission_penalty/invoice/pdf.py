@@ -9,19 +9,21 @@ from compliance.api.permissions import approved_authorized_roles_compliance_repo
 
 @router.get(
     "/compliance-report-versions/{compliance_report_version_id}/late-submission-penalty/invoice/pdf",
-    response={200: None, custom_codes_4xx: Message},
+    response={200: None, 202: None, custom_codes_4xx: Message},
     tags=COMPLIANCE,
     description="Generate a PDF invoice for a compliance report version's late submission penalty and stream it to the client",
     auth=approved_authorized_roles_compliance_report_version_composite_auth,
 )
 def generate_compliance_report_version_late_submission_penalty_invoice(
-    request: HttpRequest, compliance_report_version_id: int
+    request: HttpRequest, compliance_report_version_id: int, background: bool = False
 ) -> StreamingHttpResponse:
     """
     Generate a PDF invoice for a compliance report version's late submission penalty.
     Delegates context-building and error handling to ElicensingInvoiceService.generate_late_submission_penalty_invoice_pdf.
     """
 
-    result = ElicensingInvoiceService.generate_late_submission_penalty_invoice_pdf(compliance_report_version_id)
+    result = ElicensingInvoiceService.generate_late_submission_penalty_invoice_pdf(
+        compliance_report_version_id, background=background
+    )
 
     return ElicensingInvoiceService.create_pdf_response(result)
@@ -13,20 +13,22 @@ from compliance.api.permissions import approved_authorized_roles_compliance_repo
 
 @router.get(
     "/compliance-report-versions/{compliance_report_version_id}/invoice/pdf",
-    response={200: None, custom_codes_4xx: Message},
+    response={200: None, 202: None, custom_codes_4xx: Message},
     tags=COMPLIANCE,
     description="Generate a PDF invoice for a compliance report version and stream it to the client",
     auth=approved_authorized_roles_compliance_report_version_composite_auth,
 )
 def generate_compliance_report_version_invoice(
-    request: HttpRequest, compliance_report_version_id: int
+    request: HttpRequest, compliance_report_version_id: int, background: bool = False
 ) -> StreamingHttpResponse:
     """
     Generate a PDF invoice for a compliance report version's obligation and stream it to the client.
     Delegates all context-building and error handling to ElicensingInvoiceService.generate_obligation_invoice_pdf.
     """
     # Call the refactored service method; it returns either a PDF tuple or an errors dict
-    result = ElicensingInvoiceService.generate_obligation_invoice_pdf(compliance_report_version_id)
+    result = ElicensingInvoiceService.generate_obligation_invoice_pdf(
+        compliance_report_version_id, background=background
+    )
 
     return ElicensingInvoiceService.create_pdf_response(result)
 
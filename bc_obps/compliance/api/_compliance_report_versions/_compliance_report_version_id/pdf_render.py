@@ -0,0 +1,38 @@
+from typing import Literal, Tuple
+from django.http import HttpRequest, StreamingHttpResponse
+from compliance.service.elicensing_invoice_service import ElicensingInvoiceService
+from service.error_service.custom_codes_4xx import custom_codes_4xx
+from service.pdf.pdf_generator_service import PDFGeneratorService, PendingPdfRender
+from registration.schema.generic import Message
+from compliance.api.router import router
+from compliance.constants import COMPLIANCE, COMPLIANCE_REPORT_VERSION_PDF_SCOPE
+from compliance.api.permissions import approved_authorized_roles_compliance_report_version_composite_auth
+
+
+@router.get(
+    "/compliance-report-versions/{compliance_report_version_id}/pdf-renders/{render_id}",
+    response={200: None, 202: None, custom_codes_4xx: Message},
+    tags=COMPLIANCE,
+    description="""Poll a PDF requested with `background=true`. Streams the PDF once it is rendered and returns 202
+    while it is still rendering.""",
+    auth=approved_authorized_roles_compliance_report_version_composite_auth,
+)
+def get_compliance_report_version_pdf_render(
+    request: HttpRequest, compliance_report_version_id: int, render_id: str
+) -> StreamingHttpResponse | Tuple[Literal[400, 404], dict]:
+    """
+    Returns the rendered PDF, a 202 with the render id while it is pending, or a 404 if the render is unknown
+    (or was lost with the process rendering it) in which case the client requests the PDF again.
+    Renders are looked up under the compliance report version's scope, so only PDFs of this version are served.
+    """
+    scope = COMPLIANCE_REPORT_VERSION_PDF_SCOPE.format(compliance_report_version_id=compliance_report_version_id)
+    status = PDFGeneratorService.get_render_status(render_id, scope)
+    if status == "pending":
+        return ElicensingInvoiceService.create_pdf_response(PendingPdfRender(render_id=render_id))
+    if status == "failed":
+        return 400, {"message": "Failed to generate PDF document"}
+
+    pdf = PDFGeneratorService.get_rendered_pdf(render_id, scope) if status == "ready" else None
+    if pdf is None:
+        return 404, {"message": "Not Found"}
+    return ElicensingInvoiceService.create_pdf_response(pdf)
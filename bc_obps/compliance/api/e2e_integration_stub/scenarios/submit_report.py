@@ -67,12 +67,15 @@ class SubmitReportScenario(ScenarioHandler):
         # Pin updated_at to a fixed value so screenshot diffs are deterministic
         from common.lib import pgtrigger
         from reporting.models.report_version import ReportVersion
+        from reporting.service.reporting_dashboard_service import ReportingDashboardService
 
         with pgtrigger.ignore(
             "reporting.ReportVersion:immutable_report_version",
             "reporting.ReportVersion:set_updated_audit_columns",
         ):
             ReportVersion.objects.filter(id=report_version.id).update(updated_at=FIXED_SNAPSHOT_TIMESTAMP)
+        # Bulk updates don't send signals, so the dashboard row is refreshed explicitly
+        ReportingDashboardService.refresh_dashboard_reports([report_version.report_id])
 
         compliance_report = ComplianceReport.objects.filter(report_id=report_version.report_id).first()
         if compliance_report is None:
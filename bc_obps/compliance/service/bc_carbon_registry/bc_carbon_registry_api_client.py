@@ -24,7 +24,7 @@ from compliance.service.bc_carbon_registry.schema import (
 )
 from requests.exceptions import Timeout, ConnectionError, HTTPError, RequestException
 from compliance.service.bc_carbon_registry.utils import log_error_message
-
+from service.http.outbound_http_client import OutboundHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +39,7 @@ class BCCarbonRegistryAPIClient:
     api_url: Optional[str]
     client_id: Optional[str]
     client_secret: Optional[str]
+    _http_client: OutboundHttpClient
     _session: requests.Session
     token_expiry: Optional[datetime] = None
     COMPLIANCE_ACCOUNT_TYPE_ID = 14
@@ -60,7 +61,8 @@ class BCCarbonRegistryAPIClient:
             cls._instance.api_url = settings.BCCR_API_URL.rstrip("/") if settings.BCCR_API_URL else None
             cls._instance.client_id = settings.BCCR_CLIENT_ID
             cls._instance.client_secret = settings.BCCR_CLIENT_SECRET
-            cls._instance._session = requests.Session()
+            cls._instance._http_client = OutboundHttpClient("BCCR")
+            cls._instance._session = cls._instance._http_client.session
             logger.info(
                 f'Initializing BCCarbonRegistryAPIClient for clientID {cls._instance.client_id} to connect to {cls._instance.api_url}'
             )
@@ -146,7 +148,7 @@ class BCCarbonRegistryAPIClient:
         # exclude_none=True to remove None values (Cause issues when sending None values when filtering)
         data_dict = data.model_dump(exclude_none=True) if data else None
         try:
-            response = self._session.request(method=method, url=url, headers=headers, json=data_dict, params=params)
+            response = self._http_client.request(method, url, headers=headers, json=data_dict, params=params)
             response.raise_for_status()
             response_json = response.json()
             if response_model:
@@ -2,6 +2,7 @@ import logging
 from typing import Dict, Any, Optional, cast
 import requests
 from django.conf import settings
+from service.http.outbound_http_client import OutboundHttpClient
 
 from .schema import (
     ClientResponse,
@@ -45,6 +46,11 @@ class ELicensingAPIClient:
     INVOICE_ENDPOINT = "/invoice"
     INTEREST_RATES_ENDPOINT = "/interestRates"
 
+    # Connect fast so an unreachable service doesn't hold a worker; invoice and fee calls can be slow to respond
+    REQUEST_TIMEOUT = (5, 30)
+
+    http_client: OutboundHttpClient
+
     def __new__(cls) -> 'ELicensingAPIClient':
         """Singleton pattern to ensure only one instance of ELicensingAPIClient is created"""
         if cls._instance is None:
@@ -57,6 +63,7 @@ class ELicensingAPIClient:
             # Ensure these are strings
             cls._instance.base_url = cast(str, base_url)
             cls._instance.auth_token = cast(str, token)
+            cls._instance.http_client = OutboundHttpClient("eLicensing")
 
             logger.info(f'Initializing ELicensingAPIClient to connect to {cls._instance.base_url}')
         return cls._instance
@@ -91,15 +98,18 @@ class ELicensingAPIClient:
         url = f"{self.base_url}{endpoint}"
         headers = self._get_headers()
 
+        if method not in ('GET', 'POST', 'PUT'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, params=params, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, headers=headers, json=data, timeout=30)
-            elif method == 'PUT':
-                response = requests.put(url, headers=headers, json=data, timeout=30)
+                response = self.http_client.request(
+                    method, url, headers=headers, params=params, timeout=self.REQUEST_TIMEOUT
+                )
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                response = self.http_client.request(
+                    method, url, headers=headers, json=data, timeout=self.REQUEST_TIMEOUT
+                )
 
             logger.info(f"eLicensing API {method} request to {endpoint} - Status: {response.status_code}")
 
@@ -1,6 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Type, TypeVar
 from compliance.enums import ComplianceInvoiceTypes
 from compliance.service.elicensing.elicensing_api_client import ELicensingAPIClient
+from compliance.service.elicensing.schema import InvoiceFee, InvoiceQueryResponse
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Model, Q, QuerySet
 from compliance.models import (
     ElicensingClientOperator,
     ElicensingInvoice,
@@ -22,8 +27,26 @@ from rls.utils.manager import RlsManager
 
 logger = logging.getLogger(__name__)
 
+M = TypeVar("M", bound=Model)
+
 elicensing_api_client = ELicensingAPIClient()
 
+# On-demand refreshes are throttled to once per invoice in this window
+REFRESH_THROTTLE = timedelta(seconds=900)
+# The scheduled bulk refresh skips invoices that a request path refreshed more recently than this
+BULK_REFRESH_SKIP_WINDOW = timedelta(minutes=5)
+# Number of invoices whose records are written per transaction by the bulk refresh
+BULK_REFRESH_BATCH_SIZE = 100
+
+SYNCED_FEE_DESCRIPTIONS = [
+    CompliancePenalty.PenaltyType.LATE_SUBMISSION,
+    CompliancePenalty.PenaltyType.AUTOMATIC_OVERDUE,
+    'Automatic Overdue Penalty',
+    'GGEAPAR Interest',
+]
+# Quarantine incorrectly applied receipt number in elicensing. This is a temporary fix & should be removed during the work in ticket 468 when the more permanent fix for distributions is applied.
+QUARANTINED_RECEIPT_NUMBERS = ['R998167']
+
 
 class ElicensingDataRefreshService:
     """
@@ -82,7 +105,7 @@ class ElicensingDataRefreshService:
         # Limit calls successive calls to refresh an invoice from the elicensing API to once per 15mins
         if (
             invoice.last_refreshed is not None
-            and (invoice.last_refreshed > timezone.now() - timedelta(seconds=900))
+            and (invoice.last_refreshed > timezone.now() - REFRESH_THROTTLE)
             and not force_refresh
         ):
             return RefreshWrapperReturn(data_is_fresh=True, invoice=invoice)
@@ -120,35 +143,16 @@ class ElicensingDataRefreshService:
             invoice_record, _ = ElicensingInvoice.objects.update_or_create(
                 elicensing_client_operator=client_operator,
                 invoice_number=invoice_response.invoiceNumber,
-                defaults={
-                    "due_date": date.fromisoformat(invoice_response.invoicePaymentDueDate),
-                    "outstanding_balance": Decimal(invoice_response.invoiceOutstandingBalance).quantize(
-                        Decimal("0.00")
-                    ),
-                    "invoice_fee_balance": Decimal(invoice_response.invoiceFeeBalance).quantize(Decimal("0.00")),
-                    "invoice_interest_balance": Decimal(invoice_response.invoiceInterestBalance).quantize(
-                        Decimal("0.00")
-                    ),
-                    "last_refreshed": timezone.now(),
-                },
+                defaults=cls._invoice_values(invoice_response),
             )
             for fee in invoice_response.fees:
-                if 'GGIRCA Compliance Obligation' in fee.description or fee.description in [
-                    CompliancePenalty.PenaltyType.LATE_SUBMISSION,
-                    CompliancePenalty.PenaltyType.AUTOMATIC_OVERDUE,
-                    'Automatic Overdue Penalty',
-                    'GGEAPAR Interest',
-                ]:
+                if cls._is_synced_fee(fee.description):
                     fee_record, _ = ElicensingLineItem.objects.update_or_create(
                         elicensing_invoice=invoice_record,
                         object_id=fee.feeObjectId,
                         guid=fee.feeGUID,
                         line_item_type=ElicensingLineItem.LineItemType.FEE,
-                        defaults={
-                            "fee_date": date.fromisoformat(fee.feeDate),
-                            "description": fee.description,
-                            "base_amount": Decimal(fee.baseAmount).quantize(Decimal("0.00")),
-                        },
+                        defaults=cls._fee_values(fee),
                     )
                     cls._process_fee_payments(fee_record, fee.payments)
                     cls._process_fee_adjustments(
@@ -158,17 +162,11 @@ class ElicensingDataRefreshService:
     @classmethod
     def _process_fee_payments(cls, fee_record: ElicensingLineItem, payments: list) -> None:
         for payment in payments:
-            # Quarantine incorrectly applied receipt number in elicensing. This is a temporary fix & should be removed during the work in ticket 468 when the more permanent fix for distributions is applied.
-            if payment.receiptNumber != 'R998167':
+            if payment.receiptNumber not in QUARANTINED_RECEIPT_NUMBERS:
                 ElicensingPayment.objects.update_or_create(
                     elicensing_line_item=fee_record,
                     payment_object_id=payment.paymentObjectId,
-                    defaults={
-                        "received_date": date.fromisoformat(payment.receivedDate),
-                        "amount": Decimal(payment.amount).quantize(Decimal("0.00")),
-                        "method": payment.method,
-                        "receipt_number": payment.receiptNumber,
-                    },
+                    defaults=cls._payment_values(payment),
                 )
 
     @classmethod
@@ -176,13 +174,7 @@ class ElicensingDataRefreshService:
         cls, fee_record: ElicensingLineItem, adjustments: list, supplementary_compliance_report_version_id: int | None
     ) -> None:
         for adjustment in adjustments:
-            adjustment_defaults = {
-                "amount": Decimal(adjustment.amount).quantize(Decimal("0.00")),
-                "adjustment_date": date.fromisoformat(adjustment.date),
-                "reason": adjustment.reason,
-                "type": adjustment.type,
-                "comment": adjustment.comment,
-            }
+            adjustment_defaults = cls._adjustment_values(adjustment)
             if supplementary_compliance_report_version_id:
                 adjustment_defaults["supplementary_compliance_report_version_id"] = (
                     supplementary_compliance_report_version_id
@@ -194,6 +186,242 @@ class ElicensingDataRefreshService:
                 defaults=adjustment_defaults,
             )
 
+    @staticmethod
+    def _is_synced_fee(description: str) -> bool:
+        return 'GGIRCA Compliance Obligation' in description or description in SYNCED_FEE_DESCRIPTIONS
+
+    @staticmethod
+    def _invoice_values(invoice_response: InvoiceQueryResponse) -> Dict[str, Any]:
+        return {
+            "due_date": date.fromisoformat(invoice_response.invoicePaymentDueDate),
+            "outstanding_balance": Decimal(invoice_response.invoiceOutstandingBalance).quantize(Decimal("0.00")),
+            "invoice_fee_balance": Decimal(invoice_response.invoiceFeeBalance).quantize(Decimal("0.00")),
+            "invoice_interest_balance": Decimal(invoice_response.invoiceInterestBalance).quantize(Decimal("0.00")),
+            "last_refreshed": timezone.now(),
+        }
+
+    @staticmethod
+    def _fee_values(fee: Any) -> Dict[str, Any]:
+        return {
+            "fee_date": date.fromisoformat(fee.feeDate),
+            "description": fee.description,
+            "base_amount": Decimal(fee.baseAmount).quantize(Decimal("0.00")),
+        }
+
+    @staticmethod
+    def _payment_values(payment: Any) -> Dict[str, Any]:
+        return {
+            "received_date": date.fromisoformat(payment.receivedDate),
+            "amount": Decimal(payment.amount).quantize(Decimal("0.00")),
+            "method": payment.method,
+            "receipt_number": payment.receiptNumber,
+        }
+
+    @staticmethod
+    def _adjustment_values(adjustment: Any) -> Dict[str, Any]:
+        return {
+            "amount": Decimal(adjustment.amount).quantize(Decimal("0.00")),
+            "adjustment_date": date.fromisoformat(adjustment.date),
+            "reason": adjustment.reason,
+            "type": adjustment.type,
+            "comment": adjustment.comment,
+        }
+
+    @classmethod
+    def refresh_open_invoices(cls, max_workers: Optional[int] = None) -> int:
+        """
+        Scheduled bulk refresh of every invoice that can still change in eLicensing, so the on-demand refresh in
+        request paths finds fresh data instead of waiting on the eLicensing API.
+
+        Open invoices (an outstanding balance, or an obligation/penalty that is still accruing) that were not
+        refreshed in the last few minutes are fetched from eLicensing concurrently, then their invoice, line item,
+        payment and adjustment records are upserted in bulk, one transaction per batch of invoices.
+        An invoice that fails to fetch or to save is logged and left for the next run.
+
+        Args:
+            max_workers: Number of concurrent eLicensing requests. Defaults to the eLicensing connection pool size.
+
+        Returns:
+            The number of invoices refreshed.
+        """
+        max_workers = max_workers or settings.OUTBOUND_HTTP_POOL_MAXSIZE.get("eLicensing", 10)
+        with RlsManager.bypass_rls():
+            invoices = list(cls._open_invoices_to_refresh())
+        if not invoices:
+            return 0
+
+        # Worker threads only talk to eLicensing; all database work happens on this thread
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="elicensing-refresh") as executor:
+            responses = list(executor.map(cls._fetch_invoice, invoices))
+        fetched = [(invoice, response) for invoice, response in zip(invoices, responses) if response is not None]
+
+        refreshed = 0
+        for start in range(0, len(fetched), BULK_REFRESH_BATCH_SIZE):
+            batch = fetched[start : start + BULK_REFRESH_BATCH_SIZE]
+            try:
+                cls._bulk_upsert_invoice_data(batch)
+                refreshed += len(batch)
+            except Exception as e:  # noqa: E722
+                logger.error(f"Failed to save refreshed eLicensing invoice batch, saving invoices one by one: {str(e)}")
+                for item in batch:
+                    try:
+                        cls._bulk_upsert_invoice_data([item])
+                        refreshed += 1
+                    except Exception as e:  # noqa: E722
+                        logger.error(f"Failed to save refreshed eLicensing invoice {item[0].invoice_number}: {str(e)}")
+
+        logger.info(f"Refreshed {refreshed} of {len(invoices)} open eLicensing invoices")
+        return refreshed
+
+    @staticmethod
+    def _open_invoices_to_refresh() -> Iterable[ElicensingInvoice]:
+        accruing = ComplianceObligation.PenaltyStatus.ACCRUING
+        return (
+            ElicensingInvoice.objects.filter(
+                is_void=False, last_refreshed__lt=timezone.now() - BULK_REFRESH_SKIP_WINDOW
+            )
+            .filter(
+                Q(outstanding_balance__gt=0)
+                | Q(compliance_obligation__penalty_status=accruing)
+                | Q(compliance_penalty__compliance_obligation__penalty_status=accruing)
+            )
+            .select_related("elicensing_client_operator")
+            .order_by("last_refreshed")
+        )
+
+    @staticmethod
+    def _fetch_invoice(invoice: ElicensingInvoice) -> Optional[InvoiceQueryResponse]:
+        try:
+            return elicensing_api_client.query_invoice(
+                client_id=invoice.elicensing_client_operator.client_object_id, invoice_number=invoice.invoice_number
+            )
+        except Exception as e:  # noqa: E722
+            logger.error(f"Failed to fetch eLicensing invoice {invoice.invoice_number}: {str(e)}")
+            return None
+
+    @classmethod
+    @transaction.atomic
+    def _bulk_upsert_invoice_data(cls, batch: List[Tuple[ElicensingInvoice, InvoiceQueryResponse]]) -> None:
+        """
+        Write the fetched eLicensing data for a batch of invoices with a fixed number of queries, matching
+        existing rows on the same keys that `refresh_data_by_invoice` uses for `update_or_create`.
+        """
+        with RlsManager.bypass_rls():
+            invoices = []
+            synced_fees: List[Tuple[ElicensingInvoice, InvoiceFee]] = []
+            for invoice, response in batch:
+                for field, value in cls._invoice_values(response).items():
+                    setattr(invoice, field, value)
+                invoices.append(invoice)
+                synced_fees.extend((invoice, fee) for fee in response.fees if cls._is_synced_fee(fee.description))
+            ElicensingInvoice.objects.bulk_update(
+                invoices,
+                [
+                    "due_date",
+                    "outstanding_balance",
+                    "invoice_fee_balance",
+                    "invoice_interest_balance",
+                    "last_refreshed",
+                ],
+            )
+
+            fee_records = cls._bulk_upsert(
+                ElicensingLineItem,
+                existing=ElicensingLineItem.objects.filter(
+                    elicensing_invoice__in=invoices, line_item_type=ElicensingLineItem.LineItemType.FEE
+                ),
+                key=lambda item: (item.elicensing_invoice_id, item.object_id, str(item.guid)),
+                rows=[
+                    (
+                        (invoice.id, int(fee.feeObjectId), str(fee.feeGUID)),
+                        dict(
+                            elicensing_invoice=invoice,
+                            object_id=int(fee.feeObjectId),
+                            guid=fee.feeGUID,
+                            line_item_type=ElicensingLineItem.LineItemType.FEE,
+                        ),
+                        cls._fee_values(fee),
+                    )
+                    for invoice, fee in synced_fees
+                ],
+            )
+
+            fee_record_by_key = {
+                (record.elicensing_invoice_id, record.object_id, str(record.guid)): record for record in fee_records
+            }
+            payment_rows: List[Tuple[Hashable, Dict[str, Any], Dict[str, Any]]] = []
+            adjustment_rows: List[Tuple[Hashable, Dict[str, Any], Dict[str, Any]]] = []
+            for invoice, fee in synced_fees:
+                fee_record = fee_record_by_key[(invoice.id, int(fee.feeObjectId), str(fee.feeGUID))]
+                payment_rows.extend(
+                    (
+                        (fee_record.id, int(payment.paymentObjectId)),
+                        dict(elicensing_line_item=fee_record, payment_object_id=int(payment.paymentObjectId)),
+                        cls._payment_values(payment),
+                    )
+                    for payment in fee.payments
+                    if payment.receiptNumber not in QUARANTINED_RECEIPT_NUMBERS
+                )
+                adjustment_rows.extend(
+                    (
+                        (fee_record.id, int(adjustment.adjustmentObjectId)),
+                        dict(
+                            elicensing_line_item=fee_record,
+                            adjustment_object_id=int(adjustment.adjustmentObjectId),
+                        ),
+                        cls._adjustment_values(adjustment),
+                    )
+                    for adjustment in fee.adjustments
+                )
+
+            fee_record_ids = [record.id for record in fee_records]
+            cls._bulk_upsert(
+                ElicensingPayment,
+                existing=ElicensingPayment.objects.filter(elicensing_line_item_id__in=fee_record_ids),
+                key=lambda payment: (payment.elicensing_line_item_id, payment.payment_object_id),
+                rows=payment_rows,
+            )
+            cls._bulk_upsert(
+                ElicensingAdjustment,
+                existing=ElicensingAdjustment.objects.filter(elicensing_line_item_id__in=fee_record_ids),
+                key=lambda adjustment: (adjustment.elicensing_line_item_id, adjustment.adjustment_object_id),
+                rows=adjustment_rows,
+            )
+
+    @staticmethod
+    def _bulk_upsert(
+        model: Type[M],
+        existing: QuerySet[M],
+        key: Callable[[M], Hashable],
+        rows: List[Tuple[Hashable, Dict[str, Any], Dict[str, Any]]],
+    ) -> List[M]:
+        """
+        `update_or_create` for many rows: `rows` are (key, lookup fields, default fields). Rows whose key matches an
+        existing record update it, the rest are inserted; repeated keys update the same record.
+        Returns the records in row order (one per distinct key).
+        """
+        records_by_key = {key(record): record for record in existing}
+        to_create: Dict[Hashable, M] = {}
+        to_update: Dict[Hashable, M] = {}
+        update_fields: Set[str] = set()
+        for row_key, lookup, defaults in rows:
+            record = records_by_key.get(row_key)
+            if record is None:
+                record = model(**lookup)
+                records_by_key[row_key] = record
+                to_create[row_key] = record
+            elif row_key not in to_create:
+                to_update[row_key] = record
+                update_fields.update(defaults)
+            for field, value in defaults.items():
+                setattr(record, field, value)
+
+        if to_create:
+            model._default_manager.bulk_create(to_create.values())
+        if to_update:
+            model._default_manager.bulk_update(to_update.values(), sorted(update_fields))
+        return list({row_key: records_by_key[row_key] for row_key, _, _ in rows}.values())
+
     @staticmethod
     def get_last_refreshed_metadata(
         refresh_result: RefreshWrapperReturn,
@@ -7,10 +7,10 @@ from django.db.models import Prefetch, QuerySet, OuterRef, Subquery
 from typing import Dict, Any, List, Optional, Tuple, Generator
 from decimal import ROUND_HALF_UP, Decimal
 from django.utils import timezone
-from compliance.constants import CLEAN_BC_LOGO_COMPLIANCE_INVOICE
+from compliance.constants import CLEAN_BC_LOGO_COMPLIANCE_INVOICE, COMPLIANCE_REPORT_VERSION_PDF_SCOPE
 from ninja import Query
 from service.data_access_service.user_service import UserDataAccessService
-from service.pdf.pdf_generator_service import PDFGeneratorService
+from service.pdf.pdf_generator_service import PDFGeneratorService, PendingPdfRender
 from compliance.service.compliance_report_version_service import ComplianceReportVersionService
 from compliance.models import ComplianceChargeRate
 from compliance.service.exceptions import ComplianceInvoiceError
@@ -45,7 +45,7 @@ from compliance.schema.elicensing_invoice import ElicensingInvoiceFilterSchema
 class ElicensingInvoiceService:
     @classmethod
     def create_pdf_response(
-        cls, pdf: Tuple[Generator[bytes, None, None], str, int] | Dict[str, Any]
+        cls, pdf: Tuple[Generator[bytes, None, None], str, int] | PendingPdfRender | Dict[str, Any]
     ) -> StreamingHttpResponse:
         # If result is an error dictionary, stream it back with status 400
         if isinstance(pdf, dict) and "errors" in pdf:
@@ -56,6 +56,11 @@ class ElicensingInvoiceService:
                 status=400,
             )
 
+        # A background render was started; the client polls for it with the render id
+        if isinstance(pdf, PendingPdfRender):
+            payload = json.dumps({"render_id": pdf.render_id, "status": "pending"}).encode("utf-8")
+            return StreamingHttpResponse(streaming_content=iter([payload]), content_type="application/json", status=202)
+
         # Otherwise, unpack the PDF generator, filename, and total size
         pdf_generator, filename, total_size = pdf
 
@@ -134,15 +139,17 @@ class ElicensingInvoiceService:
     def generate_obligation_invoice_pdf(
         cls,
         compliance_report_version_id: int,
-    ) -> Tuple[Generator[bytes, None, None], str, int] | Dict[str, Any]:
+        background: bool = False,
+    ) -> Tuple[Generator[bytes, None, None], str, int] | PendingPdfRender | Dict[str, Any]:
         """
         Generates a PDF invoice for compliance obligation.
 
         Args:
             compliance_report_version_id: ID of the compliance report version.
+            background: Render the PDF in the background if it isn't cached (see PDFGeneratorService.generate_pdf).
 
         Returns:
-            - On success: Tuple (PDF generator, filename, total_size_in_bytes).
+            - On success: Tuple (PDF generator, filename, total_size_in_bytes), or a PendingPdfRender.
             - On error: Custom ComplianceInvoiceError
         """
         try:
@@ -229,6 +236,10 @@ class ElicensingInvoiceService:
                 template_name="invoice.html",
                 context=context,
                 filename=filename,
+                background=background,
+                scope=COMPLIANCE_REPORT_VERSION_PDF_SCOPE.format(
+                    compliance_report_version_id=compliance_report_version_id
+                ),
             )
 
         except Exception as exc:
@@ -243,15 +254,17 @@ class ElicensingInvoiceService:
     def generate_automatic_overdue_penalty_invoice_pdf(
         cls,
         compliance_report_version_id: int,
-    ) -> Tuple[Generator[bytes, None, None], str, int] | Dict[str, Any]:
+        background: bool = False,
+    ) -> Tuple[Generator[bytes, None, None], str, int] | PendingPdfRender | Dict[str, Any]:
         """
         Generates a PDF invoice for compliance obligation's automatic penalty.
 
         Args:
             compliance_report_version_id: ID of the compliance report version.
+            background: Render the PDF in the background if it isn't cached (see PDFGeneratorService.generate_pdf).
 
         Returns:
-            - On success: Tuple (PDF generator, filename, total_size_in_bytes).
+            - On success: Tuple (PDF generator, filename, total_size_in_bytes), or a PendingPdfRender.
             - On error: Custom ComplianceInvoiceError
         """
         try:
@@ -310,6 +323,10 @@ class ElicensingInvoiceService:
                 template_name="automatic_overdue_penalty_invoice.html",
                 context=context,
                 filename=filename,
+                background=background,
+                scope=COMPLIANCE_REPORT_VERSION_PDF_SCOPE.format(
+                    compliance_report_version_id=compliance_report_version_id
+                ),
             )
 
         except Exception as exc:
@@ -324,7 +341,8 @@ class ElicensingInvoiceService:
     def generate_late_submission_penalty_invoice_pdf(
         cls,
         compliance_report_version_id: int,
-    ) -> Tuple[Generator[bytes, None, None], str, int] | Dict[str, Any]:
+        background: bool = False,
+    ) -> Tuple[Generator[bytes, None, None], str, int] | PendingPdfRender | Dict[str, Any]:
         """Generates a PDF invoice for a compliance obligation's late submission penalty.
 
         This mirrors generate_automatic_overdue_penalty_invoice_pdf but targets the
@@ -376,6 +394,10 @@ class ElicensingInvoiceService:
                 template_name="automatic_overdue_penalty_invoice.html",
                 context=context,
                 filename=filename,
+                background=background,
+                scope=COMPLIANCE_REPORT_VERSION_PDF_SCOPE.format(
+                    compliance_report_version_id=compliance_report_version_id
+                ),
             )
 
         except Exception as exc:
@@ -3,9 +3,9 @@ from typing import Dict, Any, Tuple, Generator
 from django.utils import timezone
 from compliance.service.elicensing.elicensing_data_refresh_service import ElicensingDataRefreshService
 from compliance.service.exceptions import ComplianceInvoiceError
-from service.pdf.pdf_generator_service import PDFGeneratorService
+from service.pdf.pdf_generator_service import PDFGeneratorService, PendingPdfRender
 from compliance.enums import ComplianceInvoiceTypes
-from compliance.constants import CLEAN_BC_LOGO_COMPLIANCE_INVOICE
+from compliance.constants import CLEAN_BC_LOGO_COMPLIANCE_INVOICE, COMPLIANCE_REPORT_VERSION_PDF_SCOPE
 
 # Type ignore for weasyprint since it lacks stubs
 
@@ -20,16 +20,18 @@ class PaymentInstructionsService:
         cls,
         compliance_report_version_id: int,
         invoice_type: ComplianceInvoiceTypes = ComplianceInvoiceTypes.OBLIGATION,
-    ) -> Tuple[Generator[bytes, None, None], str, int]:
+        background: bool = False,
+    ) -> Tuple[Generator[bytes, None, None], str, int] | PendingPdfRender:
         """
         Generate a PDF payment instructions and return a generator that yields chunks of the PDF data.
 
         Args:
             compliance_report_version_id: ID of the compliance summary
             invoice_type: The type of invoice to use (obligation or penalty)
+            background: Render the PDF in the background if it isn't cached (see PDFGeneratorService.generate_pdf)
 
         Returns:
-            Tuple of (PDF data generator, filename, total_size_in_bytes)
+            Tuple of (PDF data generator, filename, total_size_in_bytes), or a PendingPdfRender
         """
         try:
             context = PaymentInstructionsService._prepare_payment_instructions_context(
@@ -41,6 +43,10 @@ class PaymentInstructionsService:
                 template_name="payment_instructions.html",
                 context=context,
                 filename=filename,
+                background=background,
+                scope=COMPLIANCE_REPORT_VERSION_PDF_SCOPE.format(
+                    compliance_report_version_id=compliance_report_version_id
+                ),
             )
 
         except Exception as exc:
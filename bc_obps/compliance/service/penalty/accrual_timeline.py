@@ -0,0 +1,68 @@
+# bc_obps/compliance/service/penalty/accrual_timeline.py
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, List, Optional, Tuple
+from compliance.models import ElicensingAdjustment, ElicensingInvoice, ElicensingPayment
+
+ZERO_DOLLARS = Decimal("0.00")
+
+
+@dataclass(frozen=True)
+class TransactionTimeline:
+    """
+    Running totals of dated amounts, ordered by date.
+
+    `total_before(cutoff)` returns the same value as `Sum('amount')` filtered on `date < cutoff`,
+    without going back to the database for every day of an accrual period.
+    """
+
+    dates: Tuple[date, ...]
+    running_totals: Tuple[Decimal, ...]
+
+    @classmethod
+    def from_amounts(cls, dated_amounts: Iterable[Tuple[Optional[date], Decimal]]) -> "TransactionTimeline":
+        # Undated rows never satisfy a `date < cutoff` filter, so they are left out of the timeline
+        ordered = sorted((d, amount) for d, amount in dated_amounts if d is not None)
+        dates: List[date] = []
+        running_totals: List[Decimal] = []
+        total = ZERO_DOLLARS
+        for transaction_date, amount in ordered:
+            total += amount
+            if dates and dates[-1] == transaction_date:
+                running_totals[-1] = total
+            else:
+                dates.append(transaction_date)
+                running_totals.append(total)
+        return cls(dates=tuple(dates), running_totals=tuple(running_totals))
+
+    def total_before(self, cutoff_date: date) -> Decimal:
+        index = bisect_left(self.dates, cutoff_date)
+        return self.running_totals[index - 1] if index else ZERO_DOLLARS
+
+
+@dataclass(frozen=True)
+class InvoiceAccrualTimeline:
+    """Payments and adjustments of one eLicensing invoice, loaded with one query each."""
+
+    payments: TransactionTimeline
+    adjustments: TransactionTimeline
+
+    @classmethod
+    def for_invoice(cls, invoice: ElicensingInvoice) -> "InvoiceAccrualTimeline":
+        payments = ElicensingPayment.objects.filter(elicensing_line_item__elicensing_invoice=invoice).values_list(
+            'received_date', 'amount'
+        )
+        adjustments = ElicensingAdjustment.objects.filter(elicensing_line_item__elicensing_invoice=invoice).values_list(
+            'adjustment_date', 'amount'
+        )
+        return cls(
+            payments=TransactionTimeline.from_amounts(payments),
+            adjustments=TransactionTimeline.from_amounts(adjustments),
+        )
+
+    def outstanding_base(self, base: Decimal, cutoff_date: date) -> Decimal:
+        """The obligation base less payments plus adjustments made before `cutoff_date`."""
+        return base - self.payments.total_before(cutoff_date) + self.adjustments.total_before(cutoff_date)
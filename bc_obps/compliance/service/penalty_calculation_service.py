@@ -26,6 +26,7 @@ from compliance.service.elicensing.elicensing_api_client import (
     InvoiceCreationRequest,
 )
 from compliance.service.elicensing.schema import FeeCreationItem
+from compliance.service.penalty.accrual_timeline import InvoiceAccrualTimeline
 from compliance.enums import ComplianceInvoiceTypes
 from django.db import transaction
 from dataclasses import dataclass
@@ -370,14 +371,14 @@ class PenaltyCalculationService:
         days_late = max(0, (last_calculation_day - accrual_start_date).days + 1)
         current_date = accrual_start_date
         total_penalty = Decimal('0.00')
+        # Load payments and adjustments once instead of aggregating them for every late day
+        timeline = InvoiceAccrualTimeline.for_invoice(invoice)
 
         accumulated_penalty_list = []
 
         for _ in range(1, days_late + 1):
-            payments = cls.sum_payments_before_date(invoice, current_date)
-            adjustments = cls.sum_adjustments_before_date(invoice, current_date)
             penalty_amount = max(
-                Decimal('0'), (base - payments + adjustments) * daily_penalty_rate
+                Decimal('0'), timeline.outstanding_base(base, current_date) * daily_penalty_rate
             )  # max of 0 to prevent negative penalty accrual edge case
             daily_compounding = (accumulated_penalty + accumulated_compounding) * daily_penalty_rate
             accumulated_penalty += penalty_amount
@@ -585,7 +586,11 @@ class PenaltyCalculationService:
         return compliance_penalty_record
 
     @classmethod
-    def _get_rate_for_date(cls, date_to_check: date) -> Decimal:
+    def _get_rate_for_date(cls, date_to_check: date, rate_cache: Dict[date, Decimal] | None = None) -> Decimal:
+        """
+        Daily prime + 3% rate for a date. Pass `rate_cache` when calculating a series of days so the annual
+        rate for each quarterly reference date is only fetched once.
+        """
         m = date_to_check.month
         y = date_to_check.year
         match m:
@@ -598,10 +603,15 @@ class PenaltyCalculationService:
             case 10 | 11 | 12:
                 reference_date = date(y, 9, 15)
 
-        annual_rate = ElicensingInterestRate.objects.get(
-            start_date__lte=reference_date,
-            end_date__gte=reference_date,
-        ).interest_rate
+        if rate_cache is not None and reference_date in rate_cache:
+            annual_rate = rate_cache[reference_date]
+        else:
+            annual_rate = ElicensingInterestRate.objects.get(
+                start_date__lte=reference_date,
+                end_date__gte=reference_date,
+            ).interest_rate
+            if rate_cache is not None:
+                rate_cache[reference_date] = annual_rate
 
         days_in_year = Decimal("366") if calendar.isleap(date_to_check.year) else Decimal("365")
 
@@ -642,6 +652,8 @@ class PenaltyCalculationService:
         invoice = refresh_result.invoice
         days_late = max(0, (last_calculation_day - accrual_start_date).days + 1)
         current_date = accrual_start_date
+        timeline = InvoiceAccrualTimeline.for_invoice(invoice)
+        rate_cache: Dict[date, Decimal] = {}
 
         accumulated_penalty_list = []
 
@@ -654,11 +666,8 @@ class PenaltyCalculationService:
                 accumulated_compounding += monthly_compounding
                 uncompounded_penalty = Decimal('0.00')
 
-            daily_rate = cls._get_rate_for_date(current_date)
-            payments = cls.sum_payments_before_date(invoice, current_date)
-            adjustments = cls.sum_adjustments_before_date(invoice, current_date)
-
-            outstanding_base = base - payments + adjustments
+            daily_rate = cls._get_rate_for_date(current_date, rate_cache)
+            outstanding_base = timeline.outstanding_base(base, current_date)
             principal_for_interest = outstanding_base + accumulated_compounding
             penalty_amount = max(
                 Decimal('0'), principal_for_interest * daily_rate
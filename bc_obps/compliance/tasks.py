@@ -1,4 +1,5 @@
 from compliance.service.compliance_adjustment_service import ComplianceAdjustmentService
+from compliance.service.elicensing.elicensing_data_refresh_service import ElicensingDataRefreshService
 from compliance.service.elicensing.elicensing_interest_rate_service import ElicensingInterestRateService
 from compliance.service.elicensing.elicensing_obligation_service import ElicensingObligationService
 from compliance.service.automated_process.automated_process_service import AutomatedProcessService
@@ -18,6 +19,7 @@ from compliance.emails import (
 from task_scheduler.service.retry_task.factories import create_retryable
 from task_scheduler.service.scheduled_task.dataclass import ScheduledTaskConfig
 from service.email.email_service import EmailService
+from service.pdf.pdf_generator_service import PDFGeneratorService
 from compliance.service.penalty_calculation_service import PenaltyCalculationService
 import logging
 
@@ -140,6 +142,22 @@ SCHEDULED_TASKS = [
         schedule_minute=0,
         tag="elicensing",
     ),
+    # Keeps open invoices fresher than the 15 minute on-demand refresh throttle,
+    # so dashboard and penalty requests rarely have to wait on eLicensing
+    ScheduledTaskConfig(
+        func=ElicensingDataRefreshService.refresh_open_invoices,
+        schedule_type="minutes",
+        schedule_interval=10,
+        tag="elicensing",
+    ),
+    # The compliance PDFs (invoices, payment instructions) are cached by content, so old renders pile up
+    ScheduledTaskConfig(
+        func=PDFGeneratorService.delete_expired_renders,
+        schedule_type="daily",
+        schedule_hour=3,
+        schedule_minute=30,
+        tag="pdf_cache",
+    ),
     ScheduledTaskConfig(
         func=ElicensingObligationService.generate_invoices_for_current_period,
         schedule_type="daily",
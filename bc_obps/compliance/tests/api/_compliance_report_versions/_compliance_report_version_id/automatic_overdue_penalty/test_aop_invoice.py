@@ -45,7 +45,9 @@ class TestGenerateComplianceReportVersionPenaltyInvoice(CommonTestSetup):
         # Assert
         assert response.status_code == 200
 
-        mock_generate_automatic_overdue_penalty_invoice_pdf.assert_called_once_with(compliance_report_version.id)
+        mock_generate_automatic_overdue_penalty_invoice_pdf.assert_called_once_with(
+            compliance_report_version.id, background=False
+        )
         mock_create_pdf_response.assert_called_once_with((ANY, 'invoice.pdf', 12))
 
     @patch(
@@ -77,4 +79,6 @@ class TestGenerateComplianceReportVersionPenaltyInvoice(CommonTestSetup):
 
         # Assert
         assert response.status_code == 400
-        mock_generate_automatic_overdue_penalty_invoice_pdf.assert_called_once_with(compliance_report_version.id)
+        mock_generate_automatic_overdue_penalty_invoice_pdf.assert_called_once_with(
+            compliance_report_version.id, background=False
+        )
@@ -50,7 +50,9 @@ class TestGenerateComplianceReportVersionLateSubmissionPenaltyInvoice(CommonTest
         # Assert
         assert response.status_code == 200
 
-        mock_generate_late_submission_penalty_invoice_pdf.assert_called_once_with(compliance_report_version.id)
+        mock_generate_late_submission_penalty_invoice_pdf.assert_called_once_with(
+            compliance_report_version.id, background=False
+        )
         mock_create_pdf_response.assert_called_once_with((ANY, "invoice.pdf", 12))
 
     @patch(
@@ -82,4 +84,6 @@ class TestGenerateComplianceReportVersionLateSubmissionPenaltyInvoice(CommonTest
 
         # Assert
         assert response.status_code == 400
-        mock_generate_late_submission_penalty_invoice_pdf.assert_called_once_with(compliance_report_version.id)
+        mock_generate_late_submission_penalty_invoice_pdf.assert_called_once_with(
+            compliance_report_version.id, background=False
+        )
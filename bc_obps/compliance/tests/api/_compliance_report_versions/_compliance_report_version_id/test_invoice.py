@@ -37,7 +37,7 @@ class TestGenerateComplianceReportVersionInvoice(CommonTestSetup):
         assert response["Content-Length"] == str(len(pdf_bytes))
         assert b"".join(response.streaming_content) == pdf_bytes
 
-        mock_generate_obligation_invoice_pdf.assert_called_once_with(compliance_report_version.id)
+        mock_generate_obligation_invoice_pdf.assert_called_once_with(compliance_report_version.id, background=False)
 
     @patch("compliance.service.elicensing_invoice_service.ElicensingInvoiceService.generate_obligation_invoice_pdf")
     def test_get_invoice_error_from_service(self, mock_generate_obligation_invoice_pdf):
@@ -72,4 +72,4 @@ class TestGenerateComplianceReportVersionInvoice(CommonTestSetup):
         parsed = json.loads(raw_bytes.decode("utf-8"))
         assert parsed == {"errors": {"unexpected_error": "Mocked: PDF generation failed"}}
 
-        mock_generate_obligation_invoice_pdf.assert_called_once_with(compliance_report_version.id)
+        mock_generate_obligation_invoice_pdf.assert_called_once_with(compliance_report_version.id, background=False)
@@ -0,0 +1,53 @@
+import json
+from unittest.mock import patch
+from registration.utils import custom_reverse_lazy
+from registration.tests.utils.helpers import CommonTestSetup, TestUtils
+from model_bakery.baker import make_recipe
+
+RENDER_ID = "a" * 64
+
+
+class TestGetComplianceReportVersionPdfRender(CommonTestSetup):
+    def _get(self, render_id: str):
+        operator = make_recipe("registration.tests.utils.operator")
+        TestUtils.authorize_current_user_as_operator_user(self, operator)
+        compliance_report_version = make_recipe(
+            "compliance.tests.utils.compliance_report_version",
+            compliance_report__report__operator=operator,
+            compliance_report__report__operation__operator=operator,
+        )
+        self.scope = f"compliance-report-versions/{compliance_report_version.id}"
+        return TestUtils.mock_get_with_auth_role(
+            self,
+            "industry_user",
+            custom_reverse_lazy(
+                "get_compliance_report_version_pdf_render",
+                kwargs={"compliance_report_version_id": compliance_report_version.id, "render_id": render_id},
+            ),
+        )
+
+    @patch("service.pdf.pdf_generator_service.PDFGeneratorService.get_rendered_pdf")
+    @patch("service.pdf.pdf_generator_service.PDFGeneratorService.get_render_status", return_value="ready")
+    def test_streams_rendered_pdf(self, mock_get_render_status, mock_get_rendered_pdf):
+        mock_get_rendered_pdf.return_value = (iter([b"%PDF content"]), "invoice.pdf", 12)
+
+        response = self._get(RENDER_ID)
+
+        assert response.status_code == 200
+        assert response["Content-Disposition"] == 'attachment; filename="invoice.pdf"'
+        assert b"".join(response.streaming_content) == b"%PDF content"
+        mock_get_render_status.assert_called_once_with(RENDER_ID, self.scope)
+        mock_get_rendered_pdf.assert_called_once_with(RENDER_ID, self.scope)
+
+    @patch("service.pdf.pdf_generator_service.PDFGeneratorService.get_render_status", return_value="pending")
+    def test_pending_render_returns_202(self, mock_get_render_status):
+        response = self._get(RENDER_ID)
+
+        assert response.status_code == 202
+        assert json.loads(b"".join(response.streaming_content)) == {"render_id": RENDER_ID, "status": "pending"}
+
+    def test_unknown_render_returns_404(self):
+        response = self._get(RENDER_ID)
+
+        assert response.status_code == 404
+        assert response.json() == {"message": "Not Found"}
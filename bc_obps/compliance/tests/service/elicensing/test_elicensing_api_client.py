@@ -147,7 +147,7 @@ class TestELicensingAPIClient:
             'Accept': 'application/json',
         }
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.get')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_make_request_get(self, mock_get, mock_settings):
         """Test the _make_request method with GET"""
         # Reset the singleton instance for testing
@@ -162,15 +162,19 @@ class TestELicensingAPIClient:
         client = ELicensingAPIClient()
         response = client._make_request('/test', method='GET', params={'param': 'value'})
 
-        # Check that requests.get was called correctly
+        # Check that the GET request was sent correctly
         mock_get.assert_called_once_with(
-            'https://test-api.example.com/test', headers=client._get_headers(), params={'param': 'value'}, timeout=30
+            method='GET',
+            url='https://test-api.example.com/test',
+            headers=client._get_headers(),
+            params={'param': 'value'},
+            timeout=(5, 30),
         )
 
         # Check that we got the expected response
         assert response == mock_response
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.post')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_make_request_post(self, mock_post, mock_settings):
         """Test the _make_request method with POST"""
         # Reset the singleton instance for testing
@@ -185,15 +189,19 @@ class TestELicensingAPIClient:
         client = ELicensingAPIClient()
         response = client._make_request('/test', method='POST', data={'data': 'test'})
 
-        # Check that requests.post was called correctly
+        # Check that the POST request was sent correctly
         mock_post.assert_called_once_with(
-            'https://test-api.example.com/test', headers=client._get_headers(), json={'data': 'test'}, timeout=30
+            method='POST',
+            url='https://test-api.example.com/test',
+            headers=client._get_headers(),
+            json={'data': 'test'},
+            timeout=(5, 30),
         )
 
         # Check that we got the expected response
         assert response == mock_response
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.put')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_make_request_put(self, mock_put, mock_settings):
         """Test the _make_request method with PUT"""
         # Reset the singleton instance for testing
@@ -208,15 +216,19 @@ class TestELicensingAPIClient:
         client = ELicensingAPIClient()
         response = client._make_request('/test', method='PUT', data={'data': 'test'})
 
-        # Check that requests.put was called correctly
+        # Check that the PUT request was sent correctly
         mock_put.assert_called_once_with(
-            'https://test-api.example.com/test', headers=client._get_headers(), json={'data': 'test'}, timeout=30
+            method='PUT',
+            url='https://test-api.example.com/test',
+            headers=client._get_headers(),
+            json={'data': 'test'},
+            timeout=(5, 30),
         )
 
         # Check that we got the expected response
         assert response == mock_response
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.get')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_make_request_error_handling_json(self, mock_get, mock_settings):
         """Test error handling in _make_request with JSON error response"""
         # Reset the singleton instance for testing
@@ -234,7 +246,7 @@ class TestELicensingAPIClient:
         # Check that we got the expected response
         assert response == mock_response
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.get')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_make_request_error_handling_text(self, mock_get, mock_settings):
         """Test error handling in _make_request with text error response"""
         # Reset the singleton instance for testing
@@ -253,7 +265,7 @@ class TestELicensingAPIClient:
         # Check that we got the expected response
         assert response == mock_response
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.get')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_make_request_connection_error(self, mock_get, mock_settings):
         """Test connection error handling in _make_request"""
         # Reset the singleton instance for testing
@@ -268,7 +280,7 @@ class TestELicensingAPIClient:
         with pytest.raises(requests.RequestException):
             client._make_request('/test', method='GET')
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.post')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_create_client_success(
         self, mock_post, mock_settings, client_creation_request, client_creation_response_data
     ):
@@ -285,9 +297,10 @@ class TestELicensingAPIClient:
         client = ELicensingAPIClient()
         response = client.create_client(client_creation_request)
 
-        # Check that requests.post was called correctly
+        # Check that the POST request was sent correctly
         mock_post.assert_called_once_with(
-            'https://test-api.example.com/client',
+            method='POST',
+            url='https://test-api.example.com/client',
             headers=client._get_headers(),
             json={
                 'clientGUID': client_creation_request.clientGUID,
@@ -303,14 +316,14 @@ class TestELicensingAPIClient:
                 'bcCompanySocietyNumber': client_creation_request.bcCompanySocietyNumber,
                 'country': client_creation_request.country,
             },
-            timeout=30,
+            timeout=(5, 30),
         )
 
         # Check that we got the expected response
         assert response.clientObjectId == client_creation_response_data['clientObjectId']
         assert response.clientGUID == client_creation_response_data['clientGUID']
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.get')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_query_client_success(self, mock_get, mock_settings, client_response_data):
         """Test the query_client method success case"""
         # Reset the singleton instance for testing
@@ -325,12 +338,13 @@ class TestELicensingAPIClient:
         client = ELicensingAPIClient()
         response = client.query_client('test-id')
 
-        # Check that requests.get was called correctly
+        # Check that the GET request was sent correctly
         mock_get.assert_called_once_with(
-            'https://test-api.example.com/client/test-id',
+            method='GET',
+            url='https://test-api.example.com/client/test-id',
             headers=client._get_headers(),
             params=None,
-            timeout=30,
+            timeout=(5, 30),
         )
 
         # Check that we got the expected response
@@ -343,7 +357,7 @@ class TestELicensingAPIClient:
         assert response.postalCode == client_response_data['postalCode']
         assert response.email == client_response_data['email']
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.get')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_query_client_error(self, mock_get, mock_settings):
         """Test the query_client method error case"""
         # Reset the singleton instance for testing
@@ -362,7 +376,7 @@ class TestELicensingAPIClient:
         with pytest.raises(requests.HTTPError):
             client.query_client('test-id')
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.post')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_create_fees_success(self, mock_post, mock_settings, fee_creation_request, fee_response_data):
         """Test the create_fees method success case"""
         # Reset the singleton instance for testing
@@ -377,9 +391,10 @@ class TestELicensingAPIClient:
         client = ELicensingAPIClient()
         response = client.create_fees('test-id', fee_creation_request)
 
-        # Check that requests.post was called correctly
+        # Check that the POST request was sent correctly
         mock_post.assert_called_once_with(
-            'https://test-api.example.com/client/test-id/fees',
+            method='POST',
+            url='https://test-api.example.com/client/test-id/fees',
             headers=client._get_headers(),
             json={
                 'fees': [
@@ -394,7 +409,7 @@ class TestELicensingAPIClient:
                     for fee in fee_creation_request.fees
                 ]
             },
-            timeout=30,
+            timeout=(5, 30),
         )
 
         # Check that we got the expected response
@@ -410,7 +425,7 @@ class TestELicensingAPIClient:
             assert actual_fee.feeAmount == expected_fee['feeAmount']
             assert actual_fee.feeDate == expected_fee['feeDate']
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.post')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_create_fees_error(self, mock_post, mock_settings, fee_creation_request):
         """Test the create_fees method with error response"""
         # Reset the singleton instance for testing
@@ -429,7 +444,7 @@ class TestELicensingAPIClient:
         with pytest.raises(requests.HTTPError):
             client.create_fees('test-id', fee_creation_request)
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.post')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_create_invoice_success(self, mock_post, mock_settings, invoice_creation_request, invoice_response_data):
         """Test the create_invoice method success case"""
         # Reset the singleton instance for testing
@@ -444,16 +459,17 @@ class TestELicensingAPIClient:
         client = ELicensingAPIClient()
         response = client.create_invoice('test-id', invoice_creation_request)
 
-        # Check that requests.post was called correctly
+        # Check that the POST request was sent correctly
         mock_post.assert_called_once_with(
-            'https://test-api.example.com/client/test-id/invoice',
+            method='POST',
+            url='https://test-api.example.com/client/test-id/invoice',
             headers=client._get_headers(),
             json={
                 'paymentDueDate': invoice_creation_request.paymentDueDate,
                 'businessAreaCode': invoice_creation_request.businessAreaCode,
                 'fees': invoice_creation_request.fees,
             },
-            timeout=30,
+            timeout=(5, 30),
         )
 
         # Check that we got the expected response
@@ -462,7 +478,7 @@ class TestELicensingAPIClient:
         assert response.clientGUID == invoice_response_data['clientGUID']
         assert response.invoiceNumber == invoice_response_data['invoiceNumber']
 
-    @patch('compliance.service.elicensing.elicensing_api_client.requests.post')
+    @patch('service.http.outbound_http_client.requests.Session.request')
     def test_create_invoice_error(self, mock_post, mock_settings, invoice_creation_request):
         """Test the create_invoice method with error response"""
         # Reset the singleton instance for testing
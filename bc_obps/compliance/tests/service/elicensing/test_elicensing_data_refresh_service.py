@@ -1,5 +1,6 @@
 from unittest.mock import patch, MagicMock
 from compliance.models import ElicensingLineItem, ElicensingInvoice, ElicensingPayment, ElicensingAdjustment
+from compliance.models.compliance_obligation import ComplianceObligation
 from compliance.models.compliance_penalty import CompliancePenalty
 from compliance.service.elicensing.elicensing_data_refresh_service import (
     ElicensingDataRefreshService,
@@ -15,7 +16,6 @@ from compliance.enums import ComplianceInvoiceTypes
 from compliance.dataclass import RefreshWrapperReturn
 from common.utils import format_timestamp_en_ca
 
-
 pytestmark = pytest.mark.django_db
 
 ELICENSING_SERVICE_PATH = "compliance.service.elicensing"
@@ -345,3 +345,211 @@ class TestElicensingOperatorService:
         # Assert
         assert metadata["data_is_fresh"] is False
         assert metadata["last_refreshed_display"] == ""
+
+
+def _invoice_response(
+    invoice_number, client_object_id, outstanding_balance='100.00', fee_description=None, object_id_type=int
+):
+    # The eLicensing API returns object ids as strings
+    return InvoiceQueryResponse(
+        clientObjectId=client_object_id,
+        clientGUID="00000000-0000-0000-0000-000000000000",
+        invoiceNumber=invoice_number,
+        invoicePaymentDueDate="2025-11-30",
+        invoiceOutstandingBalance=Decimal(outstanding_balance),
+        invoiceFeeBalance=Decimal(outstanding_balance),
+        invoiceInterestBalance=Decimal('0.00'),
+        fees=[
+            InvoiceFee(
+                feeObjectId=object_id_type(10),
+                feeGUID="00000000-0000-0000-0000-000000000010",
+                businessAreaCode='asdf',
+                feeDate="2025-11-30",
+                description=fee_description or "2024 GGIRCA Compliance Obligation",
+                baseAmount=Decimal('200.00'),
+                taxTotal=Decimal('0'),
+                adjustmentTotal=Decimal('0'),
+                taxAdjustmentTotal=Decimal('0'),
+                paymentBaseAmount=Decimal('0'),
+                paymentTotal=Decimal('0'),
+                invoiceNumber=invoice_number,
+                payments=[
+                    Payment(
+                        paymentObjectId=object_id_type(20),
+                        receivedDate='2025-11-30',
+                        depositDate='2025-11-30',
+                        amount=Decimal('50.00'),
+                        cashHandlingArea='1',
+                        referenceNumber='1',
+                        method='EFT/Wire - OBPS',
+                        receiptNumber='R192883',
+                    ),
+                    Payment(
+                        paymentObjectId=object_id_type(21),
+                        receivedDate='2025-11-30',
+                        depositDate='2025-11-30',
+                        amount=Decimal('999.00'),
+                        cashHandlingArea='1',
+                        referenceNumber='1',
+                        method='EFT/Wire - OBPS',
+                        receiptNumber='R998167',
+                    ),
+                ],
+                adjustments=[
+                    FeeAdjustment(
+                        adjustmentObjectId=object_id_type(30),
+                        adjustmentTotal=Decimal('50.00'),
+                        amount=Decimal('50.00'),
+                        date='2025-11-30',
+                        reason=ElicensingAdjustment.Reason.COMPLIANCE_UNITS_APPLIED,
+                        type='adj',
+                    )
+                ],
+            ),
+            InvoiceFee(
+                feeObjectId=object_id_type(11),
+                feeGUID="00000000-0000-0000-0000-000000000011",
+                businessAreaCode='asdf',
+                feeDate="2025-11-30",
+                description="Interest",
+                baseAmount=Decimal('5.00'),
+                taxTotal=Decimal('0'),
+                adjustmentTotal=Decimal('0'),
+                taxAdjustmentTotal=Decimal('0'),
+                paymentBaseAmount=Decimal('0'),
+                paymentTotal=Decimal('0'),
+                invoiceNumber=invoice_number,
+            ),
+        ],
+    )
+
+
+def _synced_records(invoice):
+    fees = ElicensingLineItem.objects.filter(elicensing_invoice=invoice)
+    return {
+        'fees': sorted(fees.values_list('object_id', 'guid', 'description', 'base_amount')),
+        'payments': sorted(
+            ElicensingPayment.objects.filter(elicensing_line_item__in=fees).values_list(
+                'payment_object_id', 'amount', 'receipt_number'
+            )
+        ),
+        'adjustments': sorted(
+            ElicensingAdjustment.objects.filter(elicensing_line_item__in=fees).values_list(
+                'adjustment_object_id', 'amount', 'reason'
+            )
+        ),
+    }
+
+
+class TestRefreshOpenInvoices:
+    """Tests for the scheduled bulk refresh of open invoices"""
+
+    @staticmethod
+    def _stale_invoice(**kwargs):
+        return make_recipe(
+            'compliance.tests.utils.elicensing_invoice', last_refreshed=timezone.now() - timedelta(hours=1), **kwargs
+        )
+
+    @staticmethod
+    def _respond_from(invoices_by_number, **response_kwargs):
+        def query_invoice(client_id, invoice_number):
+            invoice = invoices_by_number[invoice_number]
+            return _invoice_response(
+                invoice_number, invoice.elicensing_client_operator.client_object_id, **response_kwargs
+            )
+
+        return query_invoice
+
+    def test_refreshes_only_open_stale_invoices(self, mock_query_invoice):
+        open_invoice = self._stale_invoice(invoice_number='open')
+        accruing_invoice = self._stale_invoice(invoice_number='accruing', outstanding_balance=Decimal('0.00'))
+        make_recipe(
+            'compliance.tests.utils.compliance_obligation',
+            elicensing_invoice=accruing_invoice,
+            penalty_status=ComplianceObligation.PenaltyStatus.ACCRUING,
+        )
+        self._stale_invoice(invoice_number='paid', outstanding_balance=Decimal('0.00'))
+        self._stale_invoice(invoice_number='void', is_void=True)
+        make_recipe('compliance.tests.utils.elicensing_invoice', invoice_number='fresh', last_refreshed=timezone.now())
+        mock_query_invoice.side_effect = self._respond_from(
+            {'open': open_invoice, 'accruing': accruing_invoice}, outstanding_balance='75.00'
+        )
+
+        refreshed = ElicensingDataRefreshService.refresh_open_invoices(max_workers=2)
+
+        assert refreshed == 2
+        assert sorted(call.kwargs['invoice_number'] for call in mock_query_invoice.call_args_list) == [
+            'accruing',
+            'open',
+        ]
+        open_invoice.refresh_from_db()
+        assert open_invoice.outstanding_balance == Decimal('75.00')
+        assert open_invoice.last_refreshed > timezone.now() - timedelta(minutes=1)
+
+    def test_bulk_refresh_matches_single_invoice_refresh(self, mock_query_invoice):
+        single_invoice = self._stale_invoice(invoice_number='single')
+        bulk_invoice = self._stale_invoice(invoice_number='bulk')
+        # An existing line item and payment are updated in place rather than duplicated
+        existing_fee = make_recipe(
+            'compliance.tests.utils.elicensing_line_item',
+            elicensing_invoice=bulk_invoice,
+            object_id=10,
+            guid="00000000-0000-0000-0000-000000000010",
+            fee_date='2025-01-01',
+            base_amount=Decimal('1.00'),
+        )
+        make_recipe(
+            'compliance.tests.utils.elicensing_payment',
+            elicensing_line_item=existing_fee,
+            payment_object_id=20,
+            amount=Decimal('1.00'),
+        )
+        invoices = {'single': single_invoice, 'bulk': bulk_invoice}
+        mock_query_invoice.side_effect = self._respond_from(invoices)
+
+        ElicensingDataRefreshService.refresh_data_by_invoice(
+            client_operator_id=single_invoice.elicensing_client_operator_id, invoice_number='single'
+        )
+        single_invoice.last_refreshed = timezone.now() - timedelta(hours=1)
+        single_invoice.save()
+        ElicensingDataRefreshService.refresh_open_invoices()
+
+        assert _synced_records(bulk_invoice) == _synced_records(single_invoice)
+        assert _synced_records(bulk_invoice)['payments'] == [(20, Decimal('50.00'), 'R192883')]
+        assert ElicensingLineItem.objects.filter(elicensing_invoice=bulk_invoice).get().id == existing_fee.id
+
+    def test_bulk_refresh_matches_existing_rows_on_string_object_ids(self, mock_query_invoice):
+        invoice = self._stale_invoice(invoice_number='open')
+        mock_query_invoice.side_effect = self._respond_from({'open': invoice}, object_id_type=str)
+
+        ElicensingDataRefreshService.refresh_open_invoices()
+        synced = _synced_records(invoice)
+        invoice.last_refreshed = timezone.now() - timedelta(hours=1)
+        invoice.save()
+        ElicensingDataRefreshService.refresh_open_invoices()
+
+        assert _synced_records(invoice) == synced
+        assert synced['payments'] == [(20, Decimal('50.00'), 'R192883')]
+        assert synced['adjustments'] == [(30, Decimal('50.00'), ElicensingAdjustment.Reason.COMPLIANCE_UNITS_APPLIED)]
+        assert ElicensingPayment.objects.filter(elicensing_line_item__elicensing_invoice=invoice).count() == 1
+        assert ElicensingAdjustment.objects.filter(elicensing_line_item__elicensing_invoice=invoice).count() == 1
+
+    def test_failed_fetch_does_not_block_other_invoices(self, mock_query_invoice):
+        failing_invoice = self._stale_invoice(invoice_number='failing')
+        working_invoice = self._stale_invoice(invoice_number='working')
+        respond = self._respond_from({'working': working_invoice}, outstanding_balance='10.00')
+
+        def query_invoice(client_id, invoice_number):
+            if invoice_number == 'failing':
+                raise ValueError("Failed to parse API response")
+            return respond(client_id, invoice_number)
+
+        mock_query_invoice.side_effect = query_invoice
+
+        assert ElicensingDataRefreshService.refresh_open_invoices() == 1
+
+        failing_last_refreshed = failing_invoice.last_refreshed
+        failing_invoice.refresh_from_db()
+        working_invoice.refresh_from_db()
+        assert failing_invoice.last_refreshed == failing_last_refreshed
+        assert working_invoice.outstanding_balance == Decimal('10.00')
@@ -0,0 +1,172 @@
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from unittest.mock import patch
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from compliance.dataclass import RefreshWrapperReturn
+from compliance.models import CompliancePenaltyRate
+from compliance.service.penalty.accrual_timeline import InvoiceAccrualTimeline, TransactionTimeline
+from compliance.service.penalty_calculation_service import PenaltyCalculationService
+
+REFRESH_WRAPPER_PATH = (
+    'compliance.service.elicensing.elicensing_data_refresh_service.'
+    'ElicensingDataRefreshService.refresh_data_wrapper_by_compliance_report_version_id'
+)
+
+
+class TestTransactionTimeline:
+    def test_total_before_matches_strictly_earlier_dates(self):
+        timeline = TransactionTimeline.from_amounts(
+            [
+                (date(2025, 12, 5), Decimal("50.00")),
+                (date(2025, 12, 1), Decimal("100.00")),
+                (date(2025, 12, 5), Decimal("-20.00")),
+                (None, Decimal("999.00")),
+            ]
+        )
+
+        assert timeline.total_before(date(2025, 12, 1)) == Decimal("0.00")
+        assert timeline.total_before(date(2025, 12, 2)) == Decimal("100.00")
+        assert timeline.total_before(date(2025, 12, 5)) == Decimal("100.00")
+        assert timeline.total_before(date(2025, 12, 6)) == Decimal("130.00")
+
+    def test_empty_timeline(self):
+        timeline = TransactionTimeline.from_amounts([])
+        assert timeline.total_before(date(2030, 1, 1)) == Decimal("0.00")
+
+
+@pytest.mark.django_db
+class TestPenaltyAccrualTimelineMatchesPerDayAggregates:
+    """
+    Differential check of the timeline-based accrual against the previous per-day aggregate queries,
+    across a set of invoices with different payment and adjustment histories.
+    """
+
+    ACCRUAL_START = date(2025, 12, 1)
+    FINAL_ACCRUAL = date(2026, 12, 31)
+
+    INVOICE_FIXTURES = [
+        [],
+        [("payment", date(2025, 11, 25), "300000.00")],
+        [("payment", date(2025, 12, 1), "200000.00"), ("adjustment", date(2025, 12, 5), "50000.00")],
+        [
+            ("payment", date(2025, 12, 15), "123456.78"),
+            ("payment", date(2026, 1, 15), "200000.01"),
+            ("adjustment", date(2026, 2, 1), "-30000.00"),
+            ("adjustment", None, "10000.00"),
+        ],
+        [("payment", date(2026, 6, 30), "1000000.00")],
+        [("payment", date(2025, 12, 10), "1500000.00")],
+    ]
+
+    def setup_method(self):
+        CompliancePenaltyRate.objects.filter(is_current_rate=True).delete()
+        self.penalty_rate = baker.make_recipe("compliance.tests.utils.compliance_penalty_rate", is_current_rate=True)
+        baker.make_recipe(
+            "compliance.tests.utils.elicensing_interest_rate",
+            start_date=date(2025, 1, 1),
+            end_date=date(2026, 12, 31),
+            interest_rate=Decimal("0.0725"),
+            is_current_rate=True,
+        )
+
+    def _make_invoice(self, transactions):
+        invoice = baker.make_recipe(
+            "compliance.tests.utils.elicensing_invoice",
+            due_date=date(2025, 11, 30),
+            invoice_interest_balance=Decimal("0.00"),
+        )
+        line_item = baker.make_recipe(
+            "compliance.tests.utils.elicensing_line_item",
+            elicensing_invoice=invoice,
+            base_amount=Decimal("1000000.00"),
+        )
+        for kind, transaction_date, amount in transactions:
+            if kind == "payment":
+                baker.make_recipe(
+                    "compliance.tests.utils.elicensing_payment",
+                    elicensing_line_item=line_item,
+                    amount=Decimal(amount),
+                    received_date=transaction_date,
+                )
+            else:
+                baker.make_recipe(
+                    "compliance.tests.utils.elicensing_adjustment",
+                    elicensing_line_item=line_item,
+                    amount=Decimal(amount),
+                    adjustment_date=transaction_date,
+                )
+        return invoice
+
+    def _legacy_daily_penalties(self, invoice, base):
+        """The original accrual loop, aggregating payments and adjustments in the database for each day."""
+        rate = self.penalty_rate.rate
+        accumulated_penalty = Decimal('0.00')
+        accumulated_compounding = Decimal('0.00')
+        rows = []
+        current_date = self.ACCRUAL_START
+        while current_date <= self.FINAL_ACCRUAL:
+            payments = PenaltyCalculationService.sum_payments_before_date(invoice, current_date)
+            adjustments = PenaltyCalculationService.sum_adjustments_before_date(invoice, current_date)
+            penalty_amount = max(Decimal('0'), (base - payments + adjustments) * rate)
+            daily_compounding = (accumulated_penalty + accumulated_compounding) * rate
+            accumulated_penalty += penalty_amount
+            accumulated_compounding += daily_compounding
+            rows.append(
+                (
+                    penalty_amount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
+                    daily_compounding.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
+                    accumulated_penalty.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
+                    accumulated_compounding.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
+                )
+            )
+            current_date += timedelta(days=1)
+        return rows
+
+    @patch(REFRESH_WRAPPER_PATH)
+    @pytest.mark.parametrize("transactions", INVOICE_FIXTURES)
+    def test_automatic_overdue_penalty_matches_to_the_cent(self, mock_refresh_data, transactions):
+        invoice = self._make_invoice(transactions)
+        obligation = baker.make_recipe(
+            "compliance.tests.utils.compliance_obligation", fee_amount_dollars=Decimal("1000000.00")
+        )
+        mock_refresh_data.return_value = RefreshWrapperReturn(data_is_fresh=True, invoice=invoice)
+
+        with CaptureQueriesContext(connection) as context:
+            result = PenaltyCalculationService.calculate_penalty(obligation, self.ACCRUAL_START, self.FINAL_ACCRUAL)
+
+        expected = self._legacy_daily_penalties(invoice, obligation.fee_amount_dollars)
+        actual = [
+            (row.daily_penalty, row.daily_compounded, row.accumulated_penalty, row.accumulated_compounded)
+            for row in result.daily_accumulated_list
+        ]
+        assert actual == expected
+        # Rate lookup plus one query each for payments and adjustments, regardless of the 396 accrual days
+        assert len(context.captured_queries) <= 3
+
+    @patch(REFRESH_WRAPPER_PATH)
+    def test_late_submission_penalty_queries_do_not_scale_with_days(self, mock_refresh_data):
+        invoice = self._make_invoice(self.INVOICE_FIXTURES[3])
+        obligation = baker.make_recipe(
+            "compliance.tests.utils.compliance_obligation", fee_amount_dollars=Decimal("1000000.00")
+        )
+        mock_refresh_data.return_value = RefreshWrapperReturn(data_is_fresh=True, invoice=invoice)
+
+        with CaptureQueriesContext(connection) as context:
+            result = PenaltyCalculationService.calculate_late_submission_penalty(
+                obligation=obligation, accrual_start_date=self.ACCRUAL_START, final_accrual_date=self.FINAL_ACCRUAL
+            )
+
+        assert len(result.daily_accumulated_list) == (self.FINAL_ACCRUAL - self.ACCRUAL_START).days + 1
+        # Payments, adjustments and one interest rate lookup per quarterly reference date
+        assert len(context.captured_queries) <= 2 + 5
+
+    def test_outstanding_base_uses_payments_and_adjustments_before_cutoff(self):
+        invoice = self._make_invoice(self.INVOICE_FIXTURES[2])
+        timeline = InvoiceAccrualTimeline.for_invoice(invoice)
+
+        assert timeline.outstanding_base(Decimal("1000000.00"), date(2025, 12, 1)) == Decimal("1000000.00")
+        assert timeline.outstanding_base(Decimal("1000000.00"), date(2025, 12, 2)) == Decimal("800000.00")
+        assert timeline.outstanding_base(Decimal("1000000.00"), date(2025, 12, 6)) == Decimal("850000.00")
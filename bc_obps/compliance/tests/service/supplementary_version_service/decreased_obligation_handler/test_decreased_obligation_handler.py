@@ -1,6 +1,7 @@
 from decimal import Decimal
 import pytest
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from model_bakery import baker
 from compliance.models import ComplianceReportVersion, ElicensingInvoice
 from compliance.models.compliance_report_version_manual_handling import ComplianceReportVersionManualHandling
@@ -132,7 +133,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle__when_excess_emissions_decrease__returns_true(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('800'),
@@ -154,7 +155,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle__when_excess_emissions_drop_to_zero__returns_true(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('300'),
@@ -176,7 +177,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle__when_excess_emissions_remain_zero_returns__false(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('0'),
@@ -221,7 +222,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         mock_get_rate.return_value = Decimal("80.00")
         mock_is_credit_usage_over_cap.return_value = True
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('800.0000'),
@@ -288,7 +289,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         mock_sum_already_applied.return_value = ZERO_DECIMAL  # nothing pre-applied since anchor
 
         # prev=900t, new=600t → delta -300t → refund $24,000
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('900.0000'),
@@ -391,7 +392,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         mock_sum_already_applied.return_value = ZERO_DECIMAL
 
         # prev=900t, new=600t → delta -300t → refund $24,000
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('900.0000'),
@@ -491,7 +492,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         mock_sum_already_applied.return_value = ZERO_DECIMAL
 
         # prev=900t excess, new=0t excess + 100t credited
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('900.0000'),
@@ -590,7 +591,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         mock_collect_unpaid.return_value = []  # explicit
         mock_sum_invoice_cash.return_value = Decimal("2000.00")  # CASH present
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('900.0000'),
@@ -661,7 +662,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
             ElicensingInvoice.objects.none()
         )  # no previous_invoices found in fallback
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('900.0000'),
@@ -712,7 +713,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         # Arrange
         mock_get_rate.return_value = Decimal("80.00")  # $80/t
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('800.0000'),
@@ -802,7 +803,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         # Arrange
         mock_get_rate.return_value = Decimal("80.00")  # $80/t
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500.0000'),
@@ -893,7 +894,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         """
         mock_get_rate.return_value = Decimal("80.00")  # $80/t
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('800.0000'),
@@ -973,7 +974,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         """
         mock_get_rate.return_value = Decimal("80.00")  # $80/t
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500.0000'),
@@ -1054,7 +1055,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         """
         mock_get_rate.return_value = Decimal("80.00")  # $80/t
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('800.0000'),
@@ -1134,7 +1135,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         """
         mock_get_rate.return_value = Decimal("80.00")
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('900.0000'),
@@ -1211,7 +1212,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         """
         mock_get_rate.return_value = Decimal("80.00")  # $80/t
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev_summary = baker.make_recipe(
                 "reporting.tests.utils.report_compliance_summary",
                 excess_emissions=Decimal("900.0000"),
@@ -1321,7 +1322,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         """
         mock_get_rate.return_value = Decimal("80.00")
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('820.0000'),
@@ -1397,7 +1398,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         """
         mock_get_rate.return_value = Decimal("80.00")
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('900.0000'),
@@ -1470,7 +1471,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         """
         mock_get_rate.return_value = Decimal("80.00")  # $80/t
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('600.0000'),
@@ -1542,7 +1543,7 @@ class TestDecreasedObligationHandler(BaseSupplementaryVersionServiceTest):
             'compliance.tests.utils.compliance_report', report=self.report, compliance_period_id=1
         )
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('800.0000'),
@@ -2,6 +2,7 @@ from decimal import Decimal
 from unittest.mock import MagicMock
 import pytest
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from model_bakery import baker
 from compliance.models import ComplianceEarnedCredit, ComplianceReportVersion
 from reporting.models import ReportVersion
@@ -70,7 +71,7 @@ class TestDecreasedCreditHandler(BaseSupplementaryVersionServiceTest):
     )
     def test_can_handle_decreased_credits(self, issuance_status):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -107,7 +108,7 @@ class TestDecreasedCreditHandler(BaseSupplementaryVersionServiceTest):
         assert result is True
 
     def test_can_handle_returns_false_when_no_previous_credit(self):
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 credited_emissions=Decimal('600'),
@@ -148,7 +149,7 @@ class TestDecreasedCreditHandler(BaseSupplementaryVersionServiceTest):
             False  # otherwise, the CREDITS_NOT_ISSUED status will be caught by the superceded handler
         )
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -209,7 +210,7 @@ class TestDecreasedCreditHandler(BaseSupplementaryVersionServiceTest):
     )
     def test_handle_decreased_credits_success_when_credits_requested(self, issuance_status):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -260,7 +261,7 @@ class TestDecreasedCreditHandler(BaseSupplementaryVersionServiceTest):
         self,
     ):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -307,7 +308,7 @@ class TestDecreasedCreditHandler(BaseSupplementaryVersionServiceTest):
         assert original_credit_record.issuance_status == ComplianceEarnedCredit.IssuanceStatus.CREDITS_NOT_ISSUED
 
     def test_handle_approved_prior_credit_marks_manual_handling_and_keeps_approved_credit(self):
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             prev = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 credited_emissions=Decimal('600'),
@@ -344,7 +345,7 @@ class TestDecreasedCreditHandler(BaseSupplementaryVersionServiceTest):
     def test_can_handle_multiple_supplementary_reports(self):
         # Arrange
         # first supp report
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -2,6 +2,7 @@ from decimal import Decimal
 from unittest.mock import MagicMock
 import pytest
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from model_bakery import baker
 from compliance.models import ComplianceEarnedCredit, ComplianceReportVersion
 from reporting.models import ReportVersion
@@ -69,7 +70,7 @@ class TestIncreasedCreditHandler(BaseSupplementaryVersionServiceTest):
     )
     def test_can_handle_all_statuses(self, issuance_status):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -106,7 +107,7 @@ class TestIncreasedCreditHandler(BaseSupplementaryVersionServiceTest):
     def test_can_handle_multiple_supplementary_reports(self):
         # Arrange
         # first supp report
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -176,7 +177,7 @@ class TestIncreasedCreditHandler(BaseSupplementaryVersionServiceTest):
             False  # otherwise, the CREDITS_NOT_ISSUED status will be caught by the superceded handler
         )
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -229,7 +230,7 @@ class TestIncreasedCreditHandler(BaseSupplementaryVersionServiceTest):
 
     def test_handle_increased_credits_success_when_credits_approved(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -286,7 +287,7 @@ class TestIncreasedCreditHandler(BaseSupplementaryVersionServiceTest):
     )
     def test_handle_increased_credits_success_when_credits_not_approved(self, issuance_status):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -335,7 +336,7 @@ class TestIncreasedCreditHandler(BaseSupplementaryVersionServiceTest):
 
     def test_handle_increased_credits_success_when_credits_not_requested(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
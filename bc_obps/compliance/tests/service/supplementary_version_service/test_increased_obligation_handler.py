@@ -1,6 +1,7 @@
 from decimal import Decimal
 import pytest
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from model_bakery import baker
 from compliance.models import ComplianceReportVersion
 from unittest.mock import MagicMock, patch
@@ -30,7 +31,7 @@ def mock_handle_integration():
 class TestIncreasedObligationHandler(BaseSupplementaryVersionServiceTest):
     def test_can_handle_increased_obligation(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
@@ -51,7 +52,7 @@ class TestIncreasedObligationHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle_zero_to_positive(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('0'),
@@ -76,7 +77,7 @@ class TestIncreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         self, mock_create_obligation, mock_handle_integration
     ):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
@@ -128,7 +129,7 @@ class TestIncreasedObligationHandler(BaseSupplementaryVersionServiceTest):
         self, mock_create_obligation, mock_handle_integration
     ):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
@@ -177,7 +178,7 @@ class TestIncreasedObligationHandler(BaseSupplementaryVersionServiceTest):
 
     def test_handle_calculates_correct_excess_emission_delta(self, mock_create_obligation, mock_handle_integration):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('200'),
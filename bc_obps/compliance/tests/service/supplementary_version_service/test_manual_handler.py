@@ -1,6 +1,7 @@
 from decimal import Decimal
 import pytest
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from model_bakery import baker
 from compliance.models import ComplianceReportVersion, ComplianceReportVersionManualHandling
 from compliance.service.supplementary_version_service.manual_handler import ManualHandler
@@ -12,7 +13,7 @@ pytestmark = pytest.mark.django_db(transaction=True)
 class TestManualHandler(BaseSupplementaryVersionServiceTest):
     def test_can_handle_report_that_previously_required_manual_handling(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
@@ -57,7 +58,7 @@ class TestManualHandler(BaseSupplementaryVersionServiceTest):
 
     def test_cannot_handle_report_that_did_not_previously_require_manual_handling(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
@@ -95,7 +96,7 @@ class TestManualHandler(BaseSupplementaryVersionServiceTest):
 
     def test_handle_creates_compliance_report_version(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
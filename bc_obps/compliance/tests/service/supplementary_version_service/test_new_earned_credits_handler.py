@@ -2,6 +2,7 @@ from decimal import Decimal
 from unittest.mock import MagicMock
 import pytest
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from model_bakery import baker
 from compliance.models import ComplianceEarnedCredit, ComplianceReportVersion
 from unittest.mock import patch
@@ -73,7 +74,7 @@ def mock_create_earned_credits():
 class TestNewEarnedCreditsHandler(BaseSupplementaryVersionServiceTest):
     def test_can_handle_new_earned_credits_no_previous_record(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -103,7 +104,7 @@ class TestNewEarnedCreditsHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle_returns_false_when_previous_has_earned_credit_record(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -139,7 +140,7 @@ class TestNewEarnedCreditsHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle_returns_false_when_previous_has_credited_emissions(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -168,7 +169,7 @@ class TestNewEarnedCreditsHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle_previous_below_one_credited_emissions(self):
         # 0 < previous.credited_emissions < 1 fell through all handlers.
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -206,7 +207,7 @@ class TestNewEarnedCreditsHandler(BaseSupplementaryVersionServiceTest):
         # service must route to NewEarnedCreditsHandler
         # when previous had 0 < credited_emissions < 1 (no earned credit record ever issued).
         mock_superceded_can_handle.return_value = False
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -250,7 +251,7 @@ class TestNewEarnedCreditsHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle_returns_false_when_new_has_no_credited_emissions(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -279,7 +280,7 @@ class TestNewEarnedCreditsHandler(BaseSupplementaryVersionServiceTest):
 
     def test_handle_creates_new_earned_credits_record(self, mock_create_earned_credits):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -325,7 +326,7 @@ class TestNewEarnedCreditsHandler(BaseSupplementaryVersionServiceTest):
     ):
         mock_superceded_can_handle.return_value = False
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
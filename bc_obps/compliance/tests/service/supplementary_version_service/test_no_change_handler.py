@@ -1,6 +1,7 @@
 from decimal import Decimal
 import pytest
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from model_bakery import baker
 from compliance.models import ComplianceReportVersion
 from compliance.service.supplementary_version_service.no_change_handler import NoChangeHandler
@@ -13,7 +14,7 @@ pytestmark = pytest.mark.django_db(transaction=True)
 class TestNoChangeHandler(BaseSupplementaryVersionServiceTest):
     def test_handle_no_change_success(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
@@ -54,7 +55,7 @@ class TestNoChangeHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle_no_change_handler_unchanged_credited_emissions(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -74,7 +75,7 @@ class TestNoChangeHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle_no_change_handler_unchanged_excess_emissions(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('100'),
@@ -2,6 +2,7 @@ from decimal import Decimal
 from unittest.mock import MagicMock, patch
 import pytest
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from model_bakery import baker
 from compliance.models import ComplianceEarnedCredit, ComplianceReportVersion, ComplianceReportVersionManualHandling
 from compliance.service.supplementary_version_service.service import SupplementaryVersionService
@@ -86,7 +87,7 @@ class TestSupplementaryVersionService(BaseSupplementaryVersionServiceTest):
         mock_capture_sentry_exception,
     ):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
@@ -159,7 +160,7 @@ class TestSupplementaryVersionService(BaseSupplementaryVersionServiceTest):
         mock_capture_sentry_exception,
     ):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
@@ -215,7 +216,7 @@ class TestSupplementaryVersionService(BaseSupplementaryVersionServiceTest):
         mock_capture_sentry_exception,
     ):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('800'),
@@ -309,7 +310,7 @@ class TestSupplementaryVersionService(BaseSupplementaryVersionServiceTest):
         mock_increased_credit_can_handle.return_value = False
         mock_decreased_credit_can_handle.return_value = False
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('0'),
@@ -378,7 +379,7 @@ class TestSupplementaryVersionService(BaseSupplementaryVersionServiceTest):
         mock_logger,
     ):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('500'),
@@ -1,6 +1,7 @@
 from decimal import Decimal
 import pytest
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from model_bakery import baker
 from compliance.models import ComplianceEarnedCredit, ComplianceReportVersion
 from reporting.models import ReportVersion
@@ -58,7 +59,7 @@ def mock_handle_integration():
 class TestSupercededHandler(BaseSupplementaryVersionServiceTest):
     def test_can_handle_superceded_credits(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -95,7 +96,7 @@ class TestSupercededHandler(BaseSupplementaryVersionServiceTest):
 
     def test_does_not_handle_issued_requested_credits(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -134,7 +135,7 @@ class TestSupercededHandler(BaseSupplementaryVersionServiceTest):
 
     def test_can_handle_superceded_obligation(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('600'),
@@ -169,7 +170,7 @@ class TestSupercededHandler(BaseSupplementaryVersionServiceTest):
 
     def test_does_not_handle_obligations_with_invoices(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('600'),
@@ -229,7 +230,7 @@ class TestSupercededHandler(BaseSupplementaryVersionServiceTest):
         )
         report_version_3 = baker.make_recipe('reporting.tests.utils.report_version', report=report)
 
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             initial_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('600'),
@@ -287,7 +288,7 @@ class TestSupercededHandler(BaseSupplementaryVersionServiceTest):
 
     def test_handle_supercede_credits_success(self):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=0,
@@ -334,7 +335,7 @@ class TestSupercededHandler(BaseSupplementaryVersionServiceTest):
         run_on_commit_immediately,
     ):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('800'),
@@ -382,7 +383,7 @@ class TestSupercededHandler(BaseSupplementaryVersionServiceTest):
         mock_handle_integration,
     ):
         # Arrange
-        with pgtrigger.ignore('reporting.ReportComplianceSummary:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportComplianceSummary')):
             self.previous_summary = baker.make_recipe(
                 'reporting.tests.utils.report_compliance_summary',
                 excess_emissions=Decimal('800'),
@@ -1,6 +1,7 @@
 import logging
 
 import pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 import pytest
 from model_bakery import baker
 
@@ -23,7 +24,7 @@ pytestmark = pytest.mark.django_db
 class TestComplianceManualHandlingServiceGet:
     def test_get_manual_handling_by_report_version_returns_record(self):
         # Arrange
-        with pgtrigger.ignore("reporting.ReportComplianceSummary:immutable_report_version"):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris("reporting.ReportComplianceSummary")):
             crv = baker.make_recipe("compliance.tests.utils.compliance_report_version")
 
         manual = baker.make_recipe(
@@ -45,7 +46,7 @@ class TestComplianceManualHandlingServiceGet:
 
     def test_get_manual_handling_by_report_version_returns_none_when_missing(self):
         # Arrange
-        with pgtrigger.ignore("reporting.ReportComplianceSummary:immutable_report_version"):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris("reporting.ReportComplianceSummary")):
             crv = baker.make_recipe("compliance.tests.utils.compliance_report_version")
 
         # Act
@@ -57,7 +58,7 @@ class TestComplianceManualHandlingServiceGet:
 
 class TestComplianceManualHandlingServiceAnalystUpdate:
     def _make_crv_with_manual_handling(self) -> ComplianceReportVersion:
-        with pgtrigger.ignore("reporting.ReportComplianceSummary:immutable_report_version"):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris("reporting.ReportComplianceSummary")):
             crv = baker.make_recipe("compliance.tests.utils.compliance_report_version")
 
         baker.make_recipe(
@@ -122,7 +123,7 @@ class TestComplianceManualHandlingServiceAnalystUpdate:
 
     def test_analyst_cannot_edit_after_director_resolved(self):
         # Arrange
-        with pgtrigger.ignore("reporting.ReportComplianceSummary:immutable_report_version"):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris("reporting.ReportComplianceSummary")):
             crv = baker.make_recipe("compliance.tests.utils.compliance_report_version")
 
         baker.make_recipe(
@@ -148,7 +149,7 @@ class TestComplianceManualHandlingServiceAnalystUpdate:
 
 class TestComplianceManualHandlingServiceDirectorUpdate:
     def _make_crv_with_manual_handling(self) -> ComplianceReportVersion:
-        with pgtrigger.ignore("reporting.ReportComplianceSummary:immutable_report_version"):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris("reporting.ReportComplianceSummary")):
             crv = baker.make_recipe("compliance.tests.utils.compliance_report_version")
 
         baker.make_recipe(
@@ -205,7 +206,7 @@ class TestComplianceManualHandlingServiceDirectorUpdate:
 class TestComplianceManualHandlingServiceUnauthorized:
     def test_non_cas_user_cannot_update(self):
         # Arrange
-        with pgtrigger.ignore("reporting.ReportComplianceSummary:immutable_report_version"):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris("reporting.ReportComplianceSummary")):
             crv = baker.make_recipe("compliance.tests.utils.compliance_report_version")
 
         baker.make_recipe(
@@ -9,6 +9,7 @@ from unittest.mock import patch
 from model_bakery.baker import make_recipe
 
 from compliance.service.elicensing_invoice_service import ElicensingInvoiceService
+from service.pdf.pdf_generator_service import PendingPdfRender
 from compliance.models import (
     ComplianceChargeRate,
     ElicensingInvoice,
@@ -405,6 +406,12 @@ class TestElicensingInvoiceService:
         assert response["Content-Disposition"] == 'attachment; filename="invoice_INV-001_20250601.pdf"'
         assert response["Content-Length"] == '2048'
 
+    def test_create_pdf_response_pending_render(self):
+        response = ElicensingInvoiceService.create_pdf_response(PendingPdfRender(render_id="a" * 64))
+
+        assert response.status_code == 202
+        assert json.loads(b"".join(response.streaming_content)) == {"render_id": "a" * 64, "status": "pending"}
+
     def test_get_elicensing_invoice_for_dashboard_for_irc_user(
         self,
     ):
@@ -1,6 +1,6 @@
 from uuid import UUID
 from registration.models.facility_designated_operation_timeline import FacilityDesignatedOperationTimeline
-from registration.utils import CustomPagination
+from registration.utils import KeysetPagination
 from service.facility_designated_operation_timeline_service import FacilityDesignatedOperationTimelineService
 from registration.schema import (
     FacilityDesignatedOperationTimelineFilterSchema,
@@ -27,7 +27,7 @@ from ninja import Query
     The endpoint allows authorized users to view and sort facilities associated to an operation filtered by various criteria such as facility name, type, and bcghg_id.""",
     auth=authorize("approved_authorized_roles"),
 )
-@paginate(CustomPagination)
+@paginate(KeysetPagination)
 def list_facilities_by_operation_id(
     request: HttpRequest,
     operation_id: UUID,
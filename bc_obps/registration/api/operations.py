@@ -19,7 +19,7 @@ from service.error_service.custom_codes_4xx import custom_codes_4xx
 from ninja import File, Query, UploadedFile
 from django.db.models import QuerySet
 from ninja.pagination import paginate
-from registration.utils import CustomPagination
+from registration.utils import KeysetPagination
 from registration.models.operation_designated_operator_timeline import OperationDesignatedOperatorTimeline
 
 ##### GET #####
@@ -31,7 +31,7 @@ from registration.models.operation_designated_operator_timeline import Operation
     tags=OPERATION_TAGS,
     auth=authorize("approved_authorized_roles"),
 )
-@paginate(CustomPagination)
+@paginate(KeysetPagination)
 def list_operations(
     request: HttpRequest,
     filters: OperationTimelineFilterSchema = Query(...),
@@ -10,7 +10,7 @@ from registration.schema import (
 from service.transfer_event_service import TransferEventService
 from common.permissions import authorize
 from django.http import HttpRequest
-from registration.utils import CustomPagination
+from registration.utils import KeysetPagination
 from registration.constants import TRANSFER_EVENT_TAGS
 from ninja.pagination import paginate
 from registration.api.router import router
@@ -28,7 +28,7 @@ from common.api.utils import get_current_user_guid
     The endpoint allows authorized users to view and sort transfer events filtered by various criteria such as operation, facility, and status.""",
     auth=authorize("authorized_irc_user"),
 )
-@paginate(CustomPagination)
+@paginate(KeysetPagination, unique_fields=("id", "facilities__id"))
 def list_transfer_events(
     request: HttpRequest,
     filters: TransferEventFilterSchema = Query(...),
@@ -45,6 +45,7 @@ class RegistrationTableNames(Enum):
     PARENT_OPERATOR = "parent_operator"
     PARTNER_OPERATOR = "partner_operator"
     REGULATED_PRODUCT = "regulated_product"
+    SHARED_CACHE = "shared_cache"
     USER = "user"
     USER_OPERATOR = "user_operator"
     WELL_AUTHORIZATION_NUMBER = "well_authorization_number"
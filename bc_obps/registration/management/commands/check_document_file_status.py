@@ -1,12 +1,12 @@
-from itertools import chain
+from collections import Counter
 import logging
 import sys
-from typing import Iterable
 from common.management.commands.custom_migrate import has_unapplied_migrations
 from common.models.scanned_file_storage_mixin import ScannedFileStorageMixin
 from django.core.management.base import BaseCommand
 from registration.models import Document
 import time
+from typing import Iterator, List, Type
 from reporting.models.report_attachment import ReportAttachment
 from service.error_service.handle_exception import ExceptionHandler
 
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
     help = "Check the status of the malware scans unscanned documents every -d seconds, -r times. Accounts for processing time."
+    workers = 8
+    batch_size = 500
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -31,6 +33,20 @@ class Command(BaseCommand):
             help="Delay between scans in seconds.",
             default=30,
         )
+        parser.add_argument(
+            "-w",
+            "--workers",
+            type=int,
+            help="Number of files whose bucket is looked up concurrently.",
+            default=8,
+        )
+        parser.add_argument(
+            "-b",
+            "--batch-size",
+            type=int,
+            help="Number of documents synced, and saved, together.",
+            default=500,
+        )
 
     def _wait_for_migrations(self, timeout: int = 900) -> None:
         if has_unapplied_migrations():
@@ -60,6 +76,8 @@ class Command(BaseCommand):
 
             REPETITIONS = options["repetitions"]
             REPEAT_DELAY = options["repeat_delay"]
+            self.workers = options["workers"]
+            self.batch_size = options["batch_size"]
 
             logger.info("Starting check_document_file_status")
 
@@ -77,6 +95,21 @@ class Command(BaseCommand):
             ExceptionHandler.capture_sentry_exception(e, "document_file_status_error")
             raise e
 
+    def _unscanned_batches(self, model: Type[ScannedFileStorageMixin]) -> Iterator[List[ScannedFileStorageMixin]]:
+        """
+        Yields the unscanned records in batches of `batch_size`, paging on the primary key so only one batch is loaded
+        at a time.
+        """
+        unscanned = model._default_manager.filter(status=ScannedFileStorageMixin.FileStatus.UNSCANNED).order_by("pk")
+        last_pk = None
+        while True:
+            page = unscanned if last_pk is None else unscanned.filter(pk__gt=last_pk)
+            batch = list(page[: self.batch_size])
+            if not batch:
+                return
+            yield batch
+            last_pk = batch[-1].pk
+
     def _run_check_loop(self, run_forever: bool, repetitions: int, repeat_delay: int) -> None:
         start_time = int(time.time())
         iteration = 0
@@ -102,18 +135,22 @@ class Command(BaseCommand):
             time.sleep(sleep_duration)
 
             try:
-                unscanned_models: Iterable[ScannedFileStorageMixin] = chain(
-                    Document.objects.filter(status=ScannedFileStorageMixin.FileStatus.UNSCANNED).iterator(),
-                    ReportAttachment.objects.filter(status=ScannedFileStorageMixin.FileStatus.UNSCANNED).iterator(),
-                )
-
                 counter = 0
-                for model in unscanned_models:
-                    counter += 1
-                    logger.info(f"Checking status of model {model._meta.object_name} with id: {model.id}")
-                    model.sync_file_status()
-
-                logger.info(self.style.SUCCESS(f"Checked {counter} documents"))
+                status_counts: Counter = Counter()
+                for model in (Document, ReportAttachment):
+                    logger.info(f"Checking status of unscanned {model._meta.object_name} records")
+                    for batch in self._unscanned_batches(model):
+                        counter += len(batch)
+                        status_counts.update(
+                            ScannedFileStorageMixin.sync_file_statuses(batch, max_workers=self.workers)
+                        )
+
+                logger.info(
+                    self.style.SUCCESS(
+                        f"Checked {counter} documents: "
+                        + ", ".join(f"{count} {status.label}" for status, count in status_counts.items())
+                    )
+                )
 
             except Exception as e:
                 logger.warning(self.style.NOTICE(f"Error checking status of documents: {e}"))
@@ -53,7 +53,8 @@ class CurrentUserMiddleware:
 
         if not user:
             try:
-                user = User.objects.get(user_guid=user_guid)
+                # app_role is cached with the user since RlsMiddleware reads it on every request
+                user = User.objects.select_related("app_role").get(user_guid=user_guid)
                 cache.set(cache_key, user, 300)  # Cache for 5 minutes
             except User.DoesNotExist:
                 pass  # Gracefully handle the case where the user does not exist
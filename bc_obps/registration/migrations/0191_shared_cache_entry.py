@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registration', '0190_V5_18_1'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SharedCacheEntry',
+            fields=[
+                (
+                    'cache_key',
+                    models.CharField(
+                        db_comment='The cache key, including the prefix that versions it',
+                        max_length=255,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ('value', models.TextField(db_comment='The cached value, pickled and base64 encoded')),
+                ('expires', models.DateTimeField(db_comment='When the entry expires', db_index=True)),
+            ],
+            options={
+                'db_table': 'erc"."shared_cache',
+                'db_table_comment': "Cache entries shared by every worker and pod, in the layout of Django's database cache. Rows can be deleted at any time.",
+            },
+        ),
+    ]
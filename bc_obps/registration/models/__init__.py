@@ -27,6 +27,7 @@ from .operation_designated_operator_timeline import OperationDesignatedOperatorT
 from .well_authorization_number import WellAuthorizationNumber
 from .event import ClosureEvent, TemporaryShutdownEvent, TransferEvent, RestartEvent
 from .bc_greenhouse_gas_id import BcGreenhouseGasId
+from .shared_cache_entry import SharedCacheEntry
 
 __all__ = [
     "Address",
@@ -52,6 +53,7 @@ __all__ = [
     "ParentOperator",
     "PartnerOperator",
     "RegulatedProduct",
+    "SharedCacheEntry",
     "Activity",
     "TimeStampedModel",
     "UserAndContactCommonInfo",
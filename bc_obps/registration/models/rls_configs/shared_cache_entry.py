@@ -0,0 +1,12 @@
+from typing import Dict, List
+from registration.enums.enums import RegistrationTableNames
+from rls.enums import RlsRoles, RlsOperations
+from rls.utils.helpers import generate_rls_grants
+
+
+class Rls:
+    # No application role is granted access: the cached values are pickled (an entry written by a request could run
+    # code wherever it's unpickled) and include other users' records. The cache reads and writes the table on its own
+    # connection, as the database owner (see bc_obps.db_routers.SharedCacheRouter).
+    role_grants_mapping: Dict[RlsRoles, List[RlsOperations]] = {}
+    grants = generate_rls_grants(role_grants_mapping, RegistrationTableNames.SHARED_CACHE)
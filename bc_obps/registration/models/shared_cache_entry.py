@@ -0,0 +1,25 @@
+from common.models import BaseModel
+from django.db import models
+from registration.models.rls_configs.shared_cache_entry import Rls as SharedCacheEntryRls
+
+
+class SharedCacheEntry(BaseModel):
+    """
+    Entries of the cache tier shared by every worker and pod (see `bc_obps.cache_backends.TieredCache`).
+    Rows are read and written by Django's DatabaseCache, never through this model.
+    """
+
+    # No history needed, rows are a cache of data that lives elsewhere
+    cache_key = models.CharField(
+        max_length=255,
+        primary_key=True,
+        db_comment="The cache key, including the prefix that versions it",
+    )
+    value = models.TextField(db_comment="The cached value, pickled and base64 encoded")
+    expires = models.DateTimeField(db_index=True, db_comment="When the entry expires")
+
+    class Meta:
+        db_table_comment = "Cache entries shared by every worker and pod, in the layout of Django's database cache. Rows can be deleted at any time."
+        db_table = 'erc"."shared_cache'
+
+    Rls = SharedCacheEntryRls
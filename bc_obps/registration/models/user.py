@@ -1,5 +1,5 @@
 import typing
-from django.db import models
+from django.db import models, transaction
 from common.enums import Schemas
 from registration.constants import USER_CACHE_PREFIX
 from registration.enums.enums import RegistrationTableNames
@@ -75,9 +75,18 @@ class User(UserAndContactCommonInfo, TimeStampedModel):
         """
         Override the save method to clear the cache when the user is saved.
         """
+        super().save(*args, **kwargs)
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """
+        Removes the user cached by CurrentUserMiddleware (e.g. after a role change), in every worker.
+        It's removed again once the transaction commits, since a concurrent request may have cached the user as it
+        was before the change was committed.
+        """
         cache_key = f"{USER_CACHE_PREFIX}{self.user_guid}"
         cache.delete(cache_key)
-        super().save(*args, **kwargs)
+        transaction.on_commit(lambda: cache.delete(cache_key))
 
     def __str__(self) -> str:
         return f"{self.user_guid} - {self.email} - {self.app_role.role_name}"
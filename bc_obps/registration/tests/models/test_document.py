@@ -1,3 +1,8 @@
+from unittest.mock import MagicMock, patch
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from common.models.scanned_file_storage_mixin import ScannedFileStorageMixin
 from common.tests.utils.helpers import BaseTestCase
 from model_bakery.baker import make_recipe
 from registration.models import Document
@@ -24,3 +29,61 @@ class DocumentModelTest(BaseTestCase):
         long_file_name = "ten_chars " * 90 + ".longextension"
         document = make_recipe("registration.tests.utils.document", file=long_file_name)
         self.assertEqual(document.file.name, long_file_name)
+
+    def test_sync_file_statuses_saves_one_update_per_status(self):
+        clean, quarantined, unscanned, other_clean = [
+            make_recipe("registration.tests.utils.document", file=f"{name}.pdf")
+            for name in ("clean", "quarantined", "unscanned", "other_clean")
+        ]
+        storage = MagicMock()
+        storage.get_file_buckets.return_value = {
+            "clean.pdf": "Clean",
+            "quarantined.pdf": "Quarantined",
+            "unscanned.pdf": "Unscanned",
+            "other_clean.pdf": "Clean",
+        }
+
+        with (
+            patch("common.models.scanned_file_storage_mixin.default_storage", storage),
+            CaptureQueriesContext(connection) as context,
+        ):
+            status_counts = ScannedFileStorageMixin.sync_file_statuses(
+                [clean, quarantined, unscanned, other_clean], max_workers=2
+            )
+
+        storage.get_file_buckets.assert_called_once_with(
+            ["clean.pdf", "quarantined.pdf", "unscanned.pdf", "other_clean.pdf"], max_workers=2
+        )
+        assert status_counts == {
+            ScannedFileStorageMixin.FileStatus.CLEAN: 2,
+            ScannedFileStorageMixin.FileStatus.QUARANTINED: 1,
+            ScannedFileStorageMixin.FileStatus.UNSCANNED: 1,
+        }
+        # pgtrigger.ignore prefixes the statements with the triggers to ignore
+        assert len([query for query in context.captured_queries if 'UPDATE "erc"."document"' in query["sql"]]) == 2
+        assert dict(
+            Document.objects.filter(id__in=[clean.id, quarantined.id, unscanned.id, other_clean.id]).values_list(
+                "file", "status"
+            )
+        ) == {
+            "clean.pdf": "Clean",
+            "quarantined.pdf": "Quarantined",
+            "unscanned.pdf": "Unscanned",
+            "other_clean.pdf": "Clean",
+        }
+
+    def test_sync_file_statuses_raises_for_missing_files_after_saving_the_others(self):
+        clean, missing = [
+            make_recipe("registration.tests.utils.document", file=f"{name}.pdf") for name in ("clean", "missing")
+        ]
+        storage = MagicMock()
+        storage.get_file_buckets.return_value = {"clean.pdf": "Clean", "missing.pdf": None}
+
+        with patch("common.models.scanned_file_storage_mixin.default_storage", storage):
+            with pytest.raises(FileNotFoundError, match="missing.pdf"):
+                ScannedFileStorageMixin.sync_file_statuses([clean, missing])
+
+        clean.refresh_from_db()
+        missing.refresh_from_db()
+        assert clean.status == ScannedFileStorageMixin.FileStatus.CLEAN
+        assert missing.status == ScannedFileStorageMixin.FileStatus.UNSCANNED
@@ -99,6 +99,7 @@ class OperationModelTest(BaseTestCase):
             ("designated_operators", "operation designated operator timeline", None, None),
             ("facilities", "facility", None, None),
             ("report", "report", None, None),
+            ("reporting_dashboard_reports", "reporting dashboard report", None, None),
             ("registration_purpose", "registration purpose", 1000, None),
             ("opted_in_operation", "opted in operation", None, None),
             ("transfer_events", "transfer event", None, None),
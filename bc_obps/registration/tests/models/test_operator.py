@@ -64,6 +64,7 @@ class OperatorModelTest(BaseTestCase):
             ("user_operators", "user operator", None, 2),
             ("operation_designated_operators", "operation designated operator timeline", None, None),
             ("report", "report", None, None),
+            ("reporting_dashboard_reports", "reporting dashboard report", None, None),
             ("contacts", "contact", None, None),
             ("parent_operators", "parent operator", None, None),
             ("partner_operators", "partner operator", None, None),
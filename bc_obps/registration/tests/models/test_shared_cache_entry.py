@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+from common.tests.utils.helpers import BaseTestCase
+from registration.models import SharedCacheEntry
+
+
+class SharedCacheEntryTest(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_object = SharedCacheEntry.objects.create(
+            cache_key="test:1:key",
+            value="gASVBAAAAAAAAACMAXaULg==",
+            expires=datetime(9999, 12, 31, tzinfo=timezone.utc),
+        )
+        cls.field_data = [
+            ("cache_key", "cache key", 255, None),
+            ("value", "value", None, None),
+            ("expires", "expires", None, None),
+        ]
@@ -3,14 +3,23 @@ from model_bakery import baker
 from common.permissions import raise_401_if_user_not_authorized
 from registration.models import User, UserOperator, AppRole
 from registration.models.operation import Operation
+from registration.models.contact import Contact
+from registration.schema import TransferEventFilterSchema
 from registration.utils import (
+    KeysetPagination,
     is_document_scan_complete,
     update_model_instance,
     generate_useful_error,
 )
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from ninja.errors import HttpError
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from ninja.errors import HttpError, ValidationError as NinjaValidationError
 from django.test import RequestFactory, TestCase, override_settings
+from model_bakery.baker import make_recipe
+from service.transfer_event_service import TransferEventService
 from registration.tests.utils.bakers import user_operator_baker
 from service.tests.operation_service.test_operation_service import set_up_valid_mock_operation
 
@@ -242,3 +251,104 @@ class TestDocumentScanStatus:
         operation = set_up_valid_mock_operation(Operation.Purposes.OPTED_IN_OPERATION, document_scan_status="Clean")
 
         assert is_document_scan_complete(operation) is True
+
+
+class TestKeysetPagination(TestCase):
+    def setUp(self):
+        operators = make_recipe("registration.tests.utils.operator", _quantity=2)
+        # Sort keys with duplicates and nulls
+        for index in range(11):
+            make_recipe(
+                "registration.tests.utils.contact",
+                operator=operators[index % 2] if index % 3 else None,
+                position_title=f"Title {index % 4}",
+            )
+        self.request = RequestFactory().get("/")
+
+    def paginate(self, queryset, pagination=None, **kwargs):
+        pagination = pagination or KeysetPagination(page_size=3)
+        return pagination.paginate_queryset(queryset, KeysetPagination.Input(**kwargs), self.request)
+
+    def walk(self, queryset, pagination=None):
+        rows, cursor, pages = [], None, 0
+        while True:
+            page = self.paginate(queryset, pagination, cursor=cursor)
+            rows.extend(page["items"])
+            pages += 1
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return rows, pages
+
+    def test_cursors_walk_every_row_in_order(self):
+        for ordering in [
+            ("operator_id", "position_title"),
+            ("-operator_id", "position_title"),
+            ("position_title", "-operator_id"),
+            (F("operator_id").desc(), "-position_title"),
+        ]:
+            queryset = Contact.objects.order_by(*ordering)
+
+            rows, pages = self.walk(queryset)
+
+            assert [row.id for row in rows] == list(queryset.order_by(*ordering, "id").values_list("id", flat=True))
+            assert pages == 4
+
+    def test_page_number_falls_back_to_offset_and_returns_a_cursor(self):
+        queryset = Contact.objects.order_by("position_title")
+        ids = list(queryset.order_by("position_title", "id").values_list("id", flat=True))
+
+        page_2 = self.paginate(queryset, page=2)
+        page_3 = self.paginate(queryset, cursor=page_2["next_cursor"])
+
+        assert [row.id for row in page_2["items"]] == ids[3:6]
+        assert [row.id for row in page_3["items"]] == ids[6:9]
+        assert page_2["count"] == 11
+
+    def test_values_querysets_with_multi_valued_sort_keys(self):
+        operation = make_recipe("registration.tests.utils.operation")
+        for _ in range(3):
+            make_recipe("registration.tests.utils.transfer_event", operation=operation)
+        for _ in range(2):
+            make_recipe(
+                "registration.tests.utils.transfer_event",
+                facilities=make_recipe("registration.tests.utils.facility", operation=operation, _quantity=2),
+            )
+        queryset = TransferEventService.list_transfer_events("status", "desc", TransferEventFilterSchema())
+
+        rows, _ = self.walk(queryset, KeysetPagination(page_size=2, unique_fields=("id", "facilities__id")))
+
+        assert [(row["id"], row["facilities__id"]) for row in rows] == [
+            (row["id"], row["facilities__id"]) for row in queryset.order_by("-status", "id", "facilities__id")
+        ]
+        assert len(rows) == 7
+
+    def test_rejects_invalid_cursors(self):
+        cursor = self.paginate(Contact.objects.order_by("position_title"))["next_cursor"]
+
+        with pytest.raises(NinjaValidationError):
+            self.paginate(Contact.objects.order_by("position_title"), cursor=cursor[:-1] + "x")
+        # A cursor of another sort order
+        with pytest.raises(NinjaValidationError):
+            self.paginate(Contact.objects.order_by("-position_title"), cursor=cursor)
+
+    def test_count_modes(self):
+        queryset = Contact.objects.order_by("position_title")
+        cache.clear()
+
+        assert self.paginate(queryset, count_mode="none")["count"] is None
+        assert isinstance(self.paginate(queryset, count_mode="estimate")["count"], int)
+        assert self.paginate(queryset, count_mode="cached")["count"] == 11
+        with CaptureQueriesContext(connection) as context:
+            assert self.paginate(queryset, count_mode="cached")["count"] == 11
+        # Only the page query
+        assert len(context.captured_queries) == 1
+
+    def test_streams_all_rows_without_pagination(self):
+        page = KeysetPagination(page_size=3).paginate_queryset(
+            Contact.objects.order_by("id"), KeysetPagination.Input(), self.request, paginate_result=False
+        )
+
+        assert not isinstance(page["items"], list)
+        assert [row.id for row in page["items"]] == list(Contact.objects.order_by("id").values_list("id", flat=True))
+        assert page["count"] == 11
+        assert page["next_cursor"] is None
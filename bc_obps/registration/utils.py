@@ -1,12 +1,20 @@
+import hashlib
+import json
 import logging
-from typing import Any, Dict, Iterable, Optional, TypeVar, Union
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, TypeVar, Union
+from uuid import UUID
 
 from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError, models
-from django.db.models import QuerySet
+from django.db.models import F, OrderBy, Q, QuerySet
 from django.http import HttpRequest
 from django.urls import reverse_lazy
+from ninja import Field, Schema
 from ninja.errors import ValidationError as NinjaValidationError
 from ninja.pagination import PageNumberPagination
 from ninja.types import DictStrAny
@@ -107,14 +115,178 @@ class CustomPagination(PageNumberPagination):
         **params: Any,
     ) -> Any:
         paginate_result = params.get('paginate_result', True)
-        page_size = self.page_size if paginate_result else queryset.count()
-        offset = (pagination.page - 1) * page_size
+        if not paginate_result:
+            return {"items": stream_rows(queryset), "count": self._items_count(queryset)}
+        offset = (pagination.page - 1) * self.page_size
         return {
-            "items": queryset[offset : offset + page_size],
+            "items": queryset[offset : offset + self.page_size],
             "count": self._items_count(queryset),
         }  # noqa: E203
 
 
+STREAM_CHUNK_SIZE = 2000
+
+
+def stream_rows(queryset: Union[QuerySet, List[Any]]) -> Iterable[Any]:
+    """
+    All the rows of a queryset, fetched from the database in chunks without filling the queryset's result cache
+    (the unpaginated mode of the paginated endpoints).
+    The response is not streamed: ninja still validates every row against the response schema before rendering it.
+    """
+    if isinstance(queryset, QuerySet):
+        return queryset.iterator(chunk_size=STREAM_CHUNK_SIZE)
+    return queryset
+
+
+class KeysetPagination(CustomPagination):
+    """
+    Keyset (cursor) pagination: a page starts after the sort key of the last row of the previous page, so deep pages
+    are as fast as the first one instead of scanning every skipped row with OFFSET.
+
+    The queryset's ordering is completed with unique_fields, so the sort key of a row is unique and pages are stable
+    while rows are added. The next_cursor of a page is an opaque signed token to pass as `cursor` to get the next page.
+    Without a cursor, `page` is used with offset pagination, for clients that jump to a page number.
+
+    count_mode picks how the total count is computed:
+    - exact: a count query (default)
+    - cached: an exact count, cached for COUNT_CACHE_TIMEOUT seconds per user and query
+    - estimate: the planner's estimate of the number of rows, without running the query
+    - none: no count
+    """
+
+    COUNT_CACHE_TIMEOUT = 60
+    CURSOR_SALT = "registration.utils.KeysetPagination"
+
+    class Input(Schema):
+        cursor: Optional[str] = None
+        page: int = Field(1, ge=1)
+        count_mode: Literal["exact", "cached", "estimate", "none"] = "exact"
+
+    class Output(Schema):
+        items: List[Any]
+        count: Optional[int]
+        next_cursor: Optional[str]
+
+    def __init__(self, unique_fields: Tuple[str, ...] = ("pk",), **kwargs: Any) -> None:
+        self.unique_fields = unique_fields
+        super().__init__(**kwargs)
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        pagination: Input,  # type: ignore[override]
+        request: HttpRequest,
+        **params: Any,
+    ) -> Any:
+        count = self._get_count(queryset, pagination.count_mode, request)
+        if not params.get('paginate_result', True):
+            return {"items": stream_rows(queryset), "count": count, "next_cursor": None}
+
+        sort_keys = self._get_sort_keys(queryset)
+        keyset_queryset = queryset.annotate(**{alias: F(field) for alias, (field, _) in sort_keys.items()}).order_by(
+            *(f"-{alias}" if descending else alias for alias, (_, descending) in sort_keys.items())
+        )
+
+        if pagination.cursor:
+            rows = list(keyset_queryset.filter(self._after(sort_keys, pagination.cursor))[: self.page_size + 1])
+        else:
+            offset = (pagination.page - 1) * self.page_size
+            rows = list(keyset_queryset[offset : offset + self.page_size + 1])  # noqa: E203
+
+        items = rows[: self.page_size]
+        next_cursor = self._encode_cursor(sort_keys, items[-1]) if len(rows) > self.page_size else None
+        return {"items": items, "count": count, "next_cursor": next_cursor}
+
+    def _get_sort_keys(self, queryset: QuerySet) -> Dict[str, Tuple[str, bool]]:
+        """The sort keys of the queryset, by annotation alias: (field, descending)"""
+        sort_keys: Dict[str, Tuple[str, bool]] = {}
+        pk_name = queryset.model._meta.pk.name
+
+        def add(field: str, descending: bool) -> None:
+            field = pk_name if field == "pk" else field
+            if field not in (key_field for key_field, _ in sort_keys.values()):
+                # Fields are annotated to be filtered on the same joins as the ordering, including multi-valued ones
+                sort_keys[f"keyset_{len(sort_keys)}"] = (field, descending)
+
+        for order in queryset.query.order_by or queryset.model._meta.ordering:
+            if isinstance(order, str) and order != "?":
+                add(order.lstrip("-"), order.startswith("-"))
+            elif (
+                isinstance(order, OrderBy)
+                and isinstance(order.expression, F)
+                and not order.nulls_first
+                and not order.nulls_last
+            ):
+                add(order.expression.name, order.descending)
+            else:
+                raise ValueError(f"Keyset pagination can't sort by {order}")
+        for field in self.unique_fields:
+            add(field, False)
+        return sort_keys
+
+    def _after(self, sort_keys: Dict[str, Tuple[str, bool]], cursor: str) -> Q:
+        """
+        Rows after the cursor's sort key. Postgres sorts nulls last in ascending order and first in descending order.
+        """
+        try:
+            payload = signing.loads(cursor, salt=self.CURSOR_SALT)
+        except signing.BadSignature as e:
+            raise NinjaValidationError([{"cursor": "Invalid Cursor"}]) from e
+        if payload.get("keys") != [[field, descending] for field, descending in sort_keys.values()]:
+            # The cursor was made for another sort order
+            raise NinjaValidationError([{"cursor": "Invalid Cursor"}])
+
+        condition = Q(pk__in=[])
+        equal_to_cursor = Q()
+        for alias, value in zip(sort_keys, payload["values"]):
+            descending = sort_keys[alias][1]
+            if value is None:
+                after = Q(**{f"{alias}__isnull": False}) if descending else None
+                equal = Q(**{f"{alias}__isnull": True})
+            else:
+                after = (
+                    Q(**{f"{alias}__lt": value})
+                    if descending
+                    else Q(**{f"{alias}__gt": value}) | Q(**{f"{alias}__isnull": True})
+                )
+                equal = Q(**{alias: value})
+            if after is not None:
+                condition |= equal_to_cursor & after
+            equal_to_cursor &= equal
+        return condition
+
+    def _encode_cursor(self, sort_keys: Dict[str, Tuple[str, bool]], row: Any) -> str:
+        def to_json(value: Any) -> Any:
+            if isinstance(value, (datetime, date, time)):
+                return value.isoformat()
+            if isinstance(value, (UUID, Decimal)):
+                return str(value)
+            return value
+
+        values = [to_json(row[alias] if isinstance(row, dict) else getattr(row, alias)) for alias in sort_keys]
+        return signing.dumps(
+            {"keys": [[field, descending] for field, descending in sort_keys.values()], "values": values},
+            salt=self.CURSOR_SALT,
+            compress=True,
+        )
+
+    def _get_count(self, queryset: QuerySet, count_mode: str, request: HttpRequest) -> Optional[int]:
+        if count_mode == "none":
+            return None
+        if count_mode == "estimate":
+            plan = json.loads(queryset.order_by().explain(format="json"))
+            return int(plan[0]["Plan"]["Plan Rows"])
+        if count_mode == "cached":
+            # Row level security filters rows by user, so counts are cached per user
+            sql, sql_params = queryset.query.sql_with_params()
+            user = getattr(request, "current_user", None)
+            query_hash = hashlib.sha256(repr((getattr(user, "user_guid", None), sql, sql_params)).encode()).hexdigest()
+            return cache.get_or_set(
+                f"keyset_pagination_count:{query_hash}", lambda: self._items_count(queryset), self.COUNT_CACHE_TIMEOUT
+            )
+        return self._items_count(queryset)
+
+
 def is_document_scan_complete(operation: Operation) -> bool:
     # If we're in the local environment, we don't hit GCS; we use local file storage (see settings.py)
     ENVIRONMENT = settings.ENVIRONMENT
@@ -6,7 +6,7 @@ from reporting.constants import EMISSIONS_REPORT_TAGS
 from reporting.schema.generic import Message
 from reporting.schema.report_activity_data import ReportActivityDataIn
 from reporting.service.report_activity_load_service import ReportActivityLoadService
-from reporting.service.report_activity_save_service import ReportActivitySaveService
+from reporting.service.report_activity_bulk_save_service import ReportActivityBulkSaveService
 from service.error_service.custom_codes_4xx import custom_codes_4xx
 from .router import router
 from reporting.api.permissions import approved_industry_user_report_version_composite_auth
@@ -29,7 +29,7 @@ def save_report_activity_data(
 
     user_guid = get_current_user_guid(request)
 
-    service = ReportActivitySaveService(version_id, facility_id, activity_id, user_guid)
+    service = ReportActivityBulkSaveService(version_id, facility_id, activity_id, user_guid)
     service.save(payload.activity_data)
 
     return load_report_activity_data(request, version_id, facility_id, activity_id)
@@ -49,6 +49,6 @@ def load_report_activity_data(
     activity_id: int,
 ) -> Tuple[Literal[200], dict]:
 
-    data = ReportActivityLoadService.load(version_id, facility_id, activity_id)
+    data = ReportActivityLoadService.load(version_id, facility_id, activity_id, use_raw_data=True)
 
     return 200, data
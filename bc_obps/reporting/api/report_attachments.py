@@ -7,7 +7,7 @@ from django.db.models import QuerySet
 from django.http import HttpRequest
 from ninja import File, Form, Query, UploadedFile
 from ninja.pagination import paginate
-from registration.utils import CustomPagination
+from registration.utils import KeysetPagination
 from reporting.constants import EMISSIONS_REPORT_TAGS
 from reporting.schema.generic import Message
 from reporting.schema.report_attachment import (
@@ -101,7 +101,7 @@ def get_report_attachment_url(request: HttpRequest, version_id: int, file_id: in
     description="""Returns the list of all attachments for all reports.""",
     auth=authorize("authorized_irc_user"),
 )
-@paginate(CustomPagination)
+@paginate(KeysetPagination)
 def get_all_attachments(
     request: HttpRequest,
     filters: InternalReportAttachmentFilterSchema = Query(...),
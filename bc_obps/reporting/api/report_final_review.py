@@ -3,10 +3,12 @@ from uuid import UUID
 from common.permissions import authorize
 
 from django.http import HttpRequest
+from ninja.responses import Response
 from service.error_service.custom_codes_4xx import custom_codes_4xx
 from reporting.constants import EMISSIONS_REPORT_TAGS
 from reporting.schema.generic import Message
 from service.report_version_service import ReportVersionService
+from reporting.service.report_version_snapshot_service import ReportVersionSnapshotService
 from ..models import (
     ReportVersion,
     FacilityReport,
@@ -22,7 +24,13 @@ from .router import router
     description="Fetch final review data for a given report version ID.",
     auth=authorize("approved_authorized_roles"),
 )
-def get_report_final_review_data(request: HttpRequest, version_id: int) -> tuple[Literal[200], ReportVersion]:
+def get_report_final_review_data(
+    request: HttpRequest, version_id: int
+) -> tuple[Literal[200], ReportVersion] | Response:
+    # Submitted versions are served from their snapshot, already serialized
+    snapshot_data = ReportVersionSnapshotService.get_snapshot_data(version_id)
+    if snapshot_data is not None:
+        return Response(snapshot_data["final_review"])
     # Fetch the report version data
     report_version = ReportVersionService.fetch_full_report_version(version_id, prefetch_full_facility_report=False)
     return 200, report_version
@@ -35,9 +43,14 @@ def get_report_final_review_data(request: HttpRequest, version_id: int) -> tuple
     description="Fetch only the facility_report data for the given report version and facility id (final review format).",
     auth=authorize("approved_authorized_roles"),
 )
-def get_report_version_facility_report(request: HttpRequest, version_id: int, facility_id: str) -> FacilityReport:
+def get_report_version_facility_report(
+    request: HttpRequest, version_id: int, facility_id: str
+) -> FacilityReport | Response:
     """
     Returns the facility_report data for the given report version and facility id, in the same format as the final review API.
     """
     facility_uuid = UUID(facility_id)
+    facility_report_data = ReportVersionSnapshotService.get_facility_report_data(version_id, facility_uuid)
+    if facility_report_data is not None:
+        return Response(facility_report_data)
     return FacilityReport.objects.get(report_version_id=version_id, facility=facility_uuid)
@@ -4,10 +4,9 @@ from service.error_service.custom_codes_4xx import custom_codes_4xx
 from reporting.constants import EMISSIONS_REPORT_TAGS
 from reporting.schema.generic import Message
 from ..models import ReportVersion
-from ..schema.report_final_review import ReviewChangesVersionSchema
 from .router import router
 from .permissions import approved_industry_user_report_version_composite_auth
-from service.report_version_service import ReportVersionService
+from reporting.service.report_version_snapshot_service import ReportVersionSnapshotService
 from reporting.service.review_changes_service.report_review_changes_service import ReportReviewChangesService
 
 
@@ -22,11 +21,12 @@ def get_report_version_diff_data(request: HttpRequest, version_id: int) -> tuple
     """
     Returns the diff data between the given report version and the latest previous version for the same report_id.
     The compare_version_id parameter is removed; this endpoint only compares with the latest previous version.
+    Submitted versions are read from their snapshots instead of being serialized again.
     """
-    current_version = ReportVersionService.fetch_full_report_version(version_id, prefetch_full_facility_report=True)
+    report_id = ReportVersion.objects.values_list("report_id", flat=True).get(id=version_id)
 
     previous_version_id = (
-        ReportVersion.objects.filter(report_id=current_version.report_id, id__lt=current_version.id)
+        ReportVersion.objects.filter(report_id=report_id, id__lt=version_id)
         .order_by("-id")
         .values_list("id", flat=True)
         .first()
@@ -35,11 +35,8 @@ def get_report_version_diff_data(request: HttpRequest, version_id: int) -> tuple
     if not previous_version_id:
         return 200, {"message": "No previous report version found for the given report_id."}
 
-    previous_version = ReportVersionService.fetch_full_report_version(
-        previous_version_id, prefetch_full_facility_report=True
-    )
-    current_data = ReviewChangesVersionSchema.from_orm(current_version).dict()
-    previous_data = ReviewChangesVersionSchema.from_orm(previous_version).dict()
+    current_data = ReportVersionSnapshotService.get_review_changes_data(version_id)
+    previous_data = ReportVersionSnapshotService.get_review_changes_data(previous_version_id)
 
     changed = ReportReviewChangesService.get_report_version_diff_changes(previous_data, current_data)
 
@@ -4,6 +4,7 @@ from enum import Enum
 class ReportingTableNames(Enum):
     ACTIVITY_JSON_SCHEMA = 'activity_json_schema'
     ACTIVITY_SOURCE_TYPE_JSON_SCHEMA = 'activity_source_type_json_schema'
+    ACTIVITY_VALIDATION_SCHEMA = 'activity_validation_schema'
     CONFIGURATION_ELEMENT = 'configuration_element'
     CONFIGURATION = 'configuration'
     CUSTOM_METHODOLOGY_SCHEMA = 'custom_methodology_schema'
@@ -44,7 +45,9 @@ class ReportingTableNames(Enum):
     REPORT_VERIFICATION_VISIT = 'report_verification_visit'
     REPORT_VERIFICATION = 'report_verification'
     REPORT_VERSION = 'report_version'
+    REPORT_VERSION_SNAPSHOT = 'report_version_snapshot'
     REPORT = 'report'
+    REPORTING_DASHBOARD_REPORT = 'reporting_dashboard_report'
     REPORTING_FIELD = 'reporting_field'
     REPORTING_YEAR = 'reporting_year'
     SOURCE_TYPE = 'source_type'
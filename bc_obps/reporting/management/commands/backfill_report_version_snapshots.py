@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from reporting.service.report_version_snapshot_service import ReportVersionSnapshotService
+
+
+class Command(BaseCommand):
+    help = "Save the snapshots of the submitted report versions that don't have one of the current format"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rebuild', action='store_true', help='Save the snapshots of every submitted report version again'
+        )
+
+    def handle(self, *args, **options):
+        count = ReportVersionSnapshotService.backfill_snapshots(rebuild=options['rebuild'])
+        self.stdout.write(self.style.SUCCESS(f"Saved {count} report version snapshots"))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+from reporting.service.compliance_service import ComplianceService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the saved compliance summaries of a reporting year and list the ones that differ'
+
+    def add_arguments(self, parser):
+        parser.add_argument('reporting_year', type=int, help='The reporting year of the compliance summaries')
+
+    def handle(self, *args, **options):
+        reporting_year = options['reporting_year']
+        stale = ComplianceService.find_stale_compliance_summaries(reporting_year)
+        for report_version_id, differences in sorted(stale.items()):
+            details = ", ".join(f"{field}: {saved!r} != {live!r}" for field, (saved, live) in differences.items())
+            self.stdout.write(f"Report version {report_version_id}: {details}")
+
+        if stale:
+            raise CommandError(
+                f"{len(stale)} compliance summaries of {reporting_year} differ from the recomputed compliance data"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"The compliance summaries of {reporting_year} match the recomputed compliance data")
+        )
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from reporting.service.reporting_dashboard_service import ReportingDashboardService
+
+
+class Command(BaseCommand):
+    help = 'Compare the reporting dashboard read model with the report tables, and optionally fix or rebuild it'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fix', action='store_true', help='Refresh the rows that differ from the report tables')
+        parser.add_argument(
+            '--rebuild', action='store_true', help='Refresh the rows of every report (e.g. after a bulk data change)'
+        )
+
+    def handle(self, *args, **options):
+        if options.get('rebuild'):
+            count = ReportingDashboardService.rebuild_dashboard_reports()
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt the reporting dashboard rows of {count} reports"))
+            return
+
+        stale = ReportingDashboardService.find_stale_dashboard_reports()
+        for report_id, differences in sorted(stale.items()):
+            details = ", ".join(f"{field}: {stored!r} != {live!r}" for field, (stored, live) in differences.items())
+            self.stdout.write(f"Report {report_id}: {details}")
+
+        if not stale:
+            self.stdout.write(self.style.SUCCESS("The reporting dashboard is in sync with the report tables"))
+        elif options.get('fix'):
+            ReportingDashboardService.refresh_dashboard_reports(stale.keys())
+            self.stdout.write(self.style.SUCCESS(f"Refreshed the reporting dashboard rows of {len(stale)} reports"))
+        else:
+            raise CommandError(f"{len(stale)} reporting dashboard rows are out of sync, run with --fix to refresh them")
@@ -6,6 +6,7 @@ from reporting.service.report_sign_off_service import (
     ReportSignOffData,
 )
 from reporting.service.report_submission_service import ReportSubmissionService
+from reporting.service.reporting_dashboard_service import ReportingDashboardService
 
 from .report_verification import create_report_verification
 from .report_attachments import create_report_verification_statement_attachment
@@ -68,3 +69,5 @@ def _submit(report_version: ReportVersion, submitting_user: UUID):
         "reporting.ReportVersion:set_updated_audit_columns",
     ):
         ReportVersion.objects.filter(id=submitted.id).update(updated_at=FIXED_SNAPSHOT_TIMESTAMP)
+    # Bulk updates don't send signals, so the dashboard row is refreshed explicitly
+    ReportingDashboardService.refresh_dashboard_reports([submitted.report_id])
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from reporting.models.report_version import ReportVersion
+from reporting.service.report_validation.activity_schema_validator_cache import ActivitySchemaValidatorCache
+from reporting.service.report_validation.validators.report_activity_json_validation import warm_validation_cache
+
+
+class Command(BaseCommand):
+    help = 'Build the activity validation schemas needed to submit every draft report version'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--clear', action='store_true', help='Delete all cached schemas first (e.g. after a configuration change)'
+        )
+
+    def handle(self, *args, **options):
+        if options.get('clear'):
+            ActivitySchemaValidatorCache.clear()
+            self.stdout.write("Cleared cached activity validation schemas")
+
+        draft_versions = ReportVersion.objects.filter(status=ReportVersion.ReportVersionStatus.Draft)
+        visited = warm_validation_cache(draft_versions)
+        self.stdout.write(self.style.SUCCESS(f"Warmed activity validation schemas for {visited} raw activities"))
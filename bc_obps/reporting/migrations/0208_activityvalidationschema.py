@@ -0,0 +1,35 @@
+# Generated by Django 5.2.16 on 2026-10-18 17:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0207_V5_18_1'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityValidationSchema',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                (
+                    'cache_key',
+                    models.CharField(
+                        db_comment='Identifies the schema: configuration, activity, selected source types and methodology/property flags',
+                        max_length=1000,
+                        unique=True,
+                    ),
+                ),
+                (
+                    'json_schema',
+                    models.JSONField(db_comment='The activity form schema, converted for draft 2020-12 validation'),
+                ),
+            ],
+            options={
+                'db_table': 'erc"."activity_validation_schema',
+                'db_table_comment': 'Cache of activity json schemas prepared for report validation. Rows are derived from the reporting configuration and are cleared whenever migrations are applied.',
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.16 on 2026-10-18 18:40
+
+import django.db.models.fields.json
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Adding the generated column computes it for every existing report emission, so no separate backfill is needed.
+    """
+
+    dependencies = [
+        ('reporting', '0208_activityvalidationschema'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='reportemission',
+            managers=[],
+        ),
+        migrations.AddField(
+            model_name='reportemission',
+            name='equivalent_emission',
+            field=models.GeneratedField(
+                db_comment='The CO2 equivalent emission (equivalentEmission in json_data), in tCO2e. Generated by the database from json_data',
+                db_persist=True,
+                expression=django.db.models.functions.comparison.Cast(
+                    django.db.models.fields.json.KeyTextTransform('equivalentEmission', 'json_data'),
+                    output_field=models.DecimalField(decimal_places=4, max_digits=20),
+                ),
+                output_field=models.DecimalField(decimal_places=4, max_digits=20),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='reportemission',
+            index=models.Index(fields=['report_version', 'equivalent_emission'], name='report_emission_version_eq_idx'),
+        ),
+    ]
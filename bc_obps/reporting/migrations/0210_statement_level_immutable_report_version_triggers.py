@@ -0,0 +1,1419 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:29
+
+import pgtrigger.compiler
+import pgtrigger.migrations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0209_reportemission_equivalent_emission'),
+    ]
+
+    operations = [
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='facilityreport',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportactivity',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportadditionaldata',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportattachment',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportattachmentconfirmation',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportcompliancesummary',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportcompliancesummaryproduct',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportelectricityimportdata',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportemission',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportemissionallocation',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportfuel',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportmethodology',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportnewentrant',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportnewentrantemission',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportnewentrantproduction',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportnonattributableemissions',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportoperation',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportoperationrepresentative',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportpersonresponsible',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportproduct',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportproductemissionallocation',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportrawactivitydata',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportsignoff',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportsourcetype',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportunit',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportverification',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.RemoveTrigger(
+            model_name='reportverificationvisit',
+            name='immutable_report_version',
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='facilityreport',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'facilityreport record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='0311531878aeb0e5be72fdd06eed10acbc7400e4',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_449e9',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."facility_report',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='facilityreport',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'facilityreport record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='7fde559ffc8e1a7f2252cc03fee42c7f03530098',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_7ad1a',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."facility_report',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='facilityreport',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'facilityreport record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='c7c7f730f5f5fdd9f75e2d104ff279a5ee41a2b2',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_8df61',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."facility_report',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportactivity',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportactivity record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='d94506590a2ca8c63e2bd6b51ab857ef90b82842',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_826c9',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_activity',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportactivity',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportactivity record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='a5ead659cdfb22659fe5d29f64b21500dd01f308',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_0d033',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_activity',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportactivity',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportactivity record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='261c3b45430d72a20c0a6c453fa2c0ec28abfedb',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_63d16',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_activity',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportadditionaldata',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportadditionaldata record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='3aba1562a25d81c44d3c9659e35f17fbaf8f127b',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_305f8',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_additional_data',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportadditionaldata',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportadditionaldata record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='be7ec8463309f742c048670782e2d33fe2e880ff',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_218d2',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_additional_data',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportadditionaldata',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportadditionaldata record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='e594ba8bc8602ce63cd230d34625bd84b18d1840',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_25f7b',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_additional_data',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportattachment',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportattachment record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='e32f7a4407e7af8c09136b05b7b3e4353c16bd2e',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_a3476',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_attachment',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportattachment',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportattachment record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='da8e05a05ac40c9e3e7e1f6e8b77b930affa3d54',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_ad8a3',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_attachment',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportattachment',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportattachment record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='cf663a6a4fe4b8b242bb2246d506593b94cf5993',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_19877',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_attachment',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportattachmentconfirmation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportattachmentconfirmation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='08bb5610fed56b8995682e971af60cf87f5e9da2',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_d7fb1',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_attachment_confirmation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportattachmentconfirmation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportattachmentconfirmation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='b305bfb90c3d1e9086f4ee35eca9d2395e6b07b8',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_e5f29',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_attachment_confirmation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportattachmentconfirmation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportattachmentconfirmation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='8001e3dfb2a1d8987237f248c1f4921807d8b6a2',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_f3be7',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_attachment_confirmation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportcompliancesummary',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportcompliancesummary record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='68368baa8bce222ca8de385f19e8591df4f13a52',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_3c69a',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_compliance_summary',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportcompliancesummary',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportcompliancesummary record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='ce2374de87d1f0642f02590e30bd3eeae42c5cd5',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_2214e',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_compliance_summary',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportcompliancesummary',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportcompliancesummary record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='106a8bf1e660e2d71fc242b8cdf596f292e6329b',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_b4baa',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_compliance_summary',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportcompliancesummaryproduct',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportcompliancesummaryproduct record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='ed119513afc332ec9fa6b272da7a4484677fd1fd',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_4e395',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_compliance_summary_product',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportcompliancesummaryproduct',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportcompliancesummaryproduct record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='581ece4437cce7e8778387d12a5d8d3fa7a77ab0',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_22351',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_compliance_summary_product',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportcompliancesummaryproduct',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportcompliancesummaryproduct record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='42c16b610d8c6e62aef25fa2d26772091121b186',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_04f78',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_compliance_summary_product',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportelectricityimportdata',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportelectricityimportdata record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='56e5860b2f9a294494bda92af06371ca88986479',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_e937e',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_electricity_import_data',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportelectricityimportdata',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportelectricityimportdata record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='c3715ce8f7b1bb218f959cc5fb591fc758616b5e',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_b8d6a',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_electricity_import_data',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportelectricityimportdata',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportelectricityimportdata record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='90e5b8f6a7bb6105d9c87a47e5a6d5c8849fac2f',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_2ec54',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_electricity_import_data',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportemission',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportemission record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='f8d7ed9ca1d56d981b814f0523e5593ca930beb6',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_49191',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_emission',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportemission',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportemission record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='1c1655dc1aa64c45c45d31dbebffe2934b34c53e',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_2ddce',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_emission',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportemission',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportemission record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='6f6a3f2fb85c3947ae7255208edc9785c2c07765',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_4d1f6',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_emission',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportemissionallocation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportemissionallocation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='d51c73e8609542d1f5de714fd7b833b47a39acc9',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_c9283',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_emission_allocation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportemissionallocation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportemissionallocation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='1c7c1cb7f4810e3849512019573198a650d8cac5',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_185e1',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_emission_allocation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportemissionallocation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportemissionallocation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='16ca0550f206ef921ac507042379e15259e18819',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_39857',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_emission_allocation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportfuel',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportfuel record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='38a31b703db32c0f29e46a469bc99036babf6ae4',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_87a40',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_fuel',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportfuel',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportfuel record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='21f91fa0e3ab8c6592bb7c14dae9244e5083aff2',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_eeb62',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_fuel',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportfuel',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportfuel record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='971595940f51bec8ebe45ab76a457e6e79d86126',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_37beb',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_fuel',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportmethodology',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportmethodology record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='da805388d8edb55ad5569b2deb2762cf54442930',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_7ff7f',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_methodology',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportmethodology',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportmethodology record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='b10563e2b1cbc4e8d41c63098ae51ba78744e498',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_28c45',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_methodology',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportmethodology',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportmethodology record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='643ffa2f14fdb3de971f5f3714b6042bb4e05f77',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_bda87',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_methodology',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnewentrant',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportnewentrant record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='a322a9506eae95b3b60db51f79ca3b84b9a4cef7',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_4f053',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_new_entrant',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnewentrant',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportnewentrant record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='6684d97bf2ee701579a73c4d2882da50f4499265',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_3d127',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_new_entrant',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnewentrant',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportnewentrant record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='40c8cf3ff51ee01c1b095a79443845e32701a1aa',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_d38a3',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_new_entrant',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnewentrantemission',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."report_new_entrant" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select report_new_entrant_id from new_rows)\n                ) then\n                    raise exception \'reportnewentrantemission record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='0684d67a30ac19382e82210c2f41731e292c5689',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_b6bdd',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_new_entrant_emission',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnewentrantemission',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."report_new_entrant" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select report_new_entrant_id from old_rows union select report_new_entrant_id from new_rows)\n                ) then\n                    raise exception \'reportnewentrantemission record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='b5ece2e3303c03a67336b5d6a269e17e6013f837',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_d1f36',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_new_entrant_emission',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnewentrantemission',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."report_new_entrant" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select report_new_entrant_id from old_rows)\n                ) then\n                    raise exception \'reportnewentrantemission record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='c945d321ddbddcf39ac5d1a892204b41fada10c9',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_106da',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_new_entrant_emission',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnewentrantproduction',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."report_new_entrant" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select report_new_entrant_id from new_rows)\n                ) then\n                    raise exception \'reportnewentrantproduction record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='20a41dd697f8469079c174f7ff49277bcebf7aea',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_7c258',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_new_entrant_production',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnewentrantproduction',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."report_new_entrant" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select report_new_entrant_id from old_rows union select report_new_entrant_id from new_rows)\n                ) then\n                    raise exception \'reportnewentrantproduction record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='dd3b15ea20c808a862c35d155a4f232132fc175e',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_ab7a1',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_new_entrant_production',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnewentrantproduction',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."report_new_entrant" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select report_new_entrant_id from old_rows)\n                ) then\n                    raise exception \'reportnewentrantproduction record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='5896d22a9aee52e5c31336ca95156bdd0179d277',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_245d7',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_new_entrant_production',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnonattributableemissions',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportnonattributableemissions record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='a686dde09d7d031aa93c671a8711854f9fcad6fe',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_2f537',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_non_attributable_emissions',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnonattributableemissions',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportnonattributableemissions record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='f6e1adc776efdb82455513a173c6a11ecf5d0aad',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_abe09',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_non_attributable_emissions',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportnonattributableemissions',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportnonattributableemissions record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='9193db2bfef31fdcff21dde18cf08ad44c62c512',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_93c85',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_non_attributable_emissions',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportoperation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportoperation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='322bc2cb21b63e8ccd37fa6147674556182aa0f0',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_21fcc',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_operation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportoperation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportoperation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='54b86cc574b6246bb99c1d8cbdf39bc4a05fc266',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_ff29d',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_operation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportoperation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportoperation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='f33d87e597c4ada95488461975b5367a26d02588',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_51664',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_operation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportoperationrepresentative',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportoperationrepresentative record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='738e114749dc3a7b2fa09938448cf5c9daa45b18',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_a5d88',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_operation_representative',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportoperationrepresentative',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportoperationrepresentative record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='4fe9745dc610e9bb85870044cd88bf8b19e3e98b',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_053cf',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_operation_representative',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportoperationrepresentative',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportoperationrepresentative record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='9cc7a5943f0c7c61db4bb53692a23c9f9292bea4',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_afb25',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_operation_representative',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportpersonresponsible',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportpersonresponsible record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='6a507124ade347e0947aae13faffbff484a23de7',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_74108',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_person_responsible',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportpersonresponsible',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportpersonresponsible record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='fcc62aa0b0fb336698c5758c492d47e377c08b00',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_600b4',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_person_responsible',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportpersonresponsible',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportpersonresponsible record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='625bd1344eda994a5589b0c81e6bcfbf9f51c757',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_b14b8',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_person_responsible',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportproduct',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportproduct record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='4ba516bb83dbb01ea59426b1456409df44d11022',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_9b13e',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_product',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportproduct',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportproduct record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='9e3a5368c9d7de382a14092f5c972a4bf10e0e03',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_8b312',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_product',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportproduct',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportproduct record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='2dae748d25eb8a8e205fe1dcacc0423dd810942a',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_e53fa',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_product',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportproductemissionallocation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportproductemissionallocation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='0e49cb00044a8d8ba325660fb7178dbc17f66d85',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_5ad87',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_product_emission_allocation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportproductemissionallocation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportproductemissionallocation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='199d4958f0cb957f96fb8319007fafb0fd4a1310',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_3916b',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_product_emission_allocation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportproductemissionallocation',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportproductemissionallocation record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='f5d5093affdb98f0d7b9e3bde31bfbce223fac40',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_97e57',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_product_emission_allocation',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportrawactivitydata',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."facility_report" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select facility_report_id from new_rows)\n                ) then\n                    raise exception \'reportrawactivitydata record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='86f485ef73aed0eb773d9a369d2cc0028e72513e',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_0af65',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_raw_activity_data',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportrawactivitydata',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."facility_report" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select facility_report_id from old_rows union select facility_report_id from new_rows)\n                ) then\n                    raise exception \'reportrawactivitydata record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='a7b13fd767d81278079915f85767efc94cd4287e',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_b8a1e',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_raw_activity_data',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportrawactivitydata',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."facility_report" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select facility_report_id from old_rows)\n                ) then\n                    raise exception \'reportrawactivitydata record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='00ee506d78495f0a96dfed76568cca2bcd7b38d0',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_56acb',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_raw_activity_data',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportsignoff',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportsignoff record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='ecf1bd375680c9b9a5a799e1d64a3032807197c6',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_c6a7d',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_sign_off',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportsignoff',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportsignoff record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='7c8e90abe0d5c6c3fa2e9e69a759f672dee95546',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_a8e94',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_sign_off',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportsignoff',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportsignoff record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='f14fc9c12156ea834c94dd3d9e25a8b74f81903d',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_6296b',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_sign_off',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportsourcetype',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportsourcetype record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='e3cc1c568bdb4f138827d772b1943600399a8e61',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_1cb8b',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_source_type',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportsourcetype',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportsourcetype record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='5808904312a0cc04cadee39432d3fe33af1e7686',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_1f180',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_source_type',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportsourcetype',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportsourcetype record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='0e9cde92c23aa44dbdf84ac6ea6e22828ea99355',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_cfaa2',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_source_type',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportunit',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportunit record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='4d670dd6ea41be2f890129b4134d67668cc11009',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_2d414',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_unit',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportunit',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportunit record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='7fedd8f1b19e2613c17cbcc029967643a08678eb',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_6e8cb',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_unit',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportunit',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportunit record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='1c2ad0dc117f7fd7da82ba94508ee86aa2f1dc4d',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_1f301',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_unit',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportverification',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportverification record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='1bb71cbd9c3beb0c832e5213624b24e287f97d9c',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_bc338',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_verification',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportverification',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)\n                ) then\n                    raise exception \'reportverification record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='6428727246ac1f107838775234075fb695b46860',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_daa88',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_verification',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportverification',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    where rel1.status=\'Submitted\'\n                    and rel1.id in (select report_version_id from old_rows)\n                ) then\n                    raise exception \'reportverification record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='c2db96f8d3bb8cfed90c310332b75ba62fcc2ce1',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_09d9b',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_verification',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportverificationvisit',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_insert',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."report_verification" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select report_verification_id from new_rows)\n                ) then\n                    raise exception \'reportverificationvisit record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='29a371955e846415303d3c9b156c4e018d3cb031',
+                    level='STATEMENT',
+                    operation='INSERT',
+                    pgid='pgtrigger_immutable_report_version_insert_944ad',
+                    referencing='REFERENCING NEW TABLE AS new_rows ',
+                    table='erc"."report_verification_visit',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportverificationvisit',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_update',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."report_verification" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select report_verification_id from old_rows union select report_verification_id from new_rows)\n                ) then\n                    raise exception \'reportverificationvisit record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='6b138b7b299edf2cb05cbcc916365b98d8416282',
+                    level='STATEMENT',
+                    operation='UPDATE',
+                    pgid='pgtrigger_immutable_report_version_update_4177c',
+                    referencing='REFERENCING OLD TABLE AS old_rows  NEW TABLE AS new_rows ',
+                    table='erc"."report_verification_visit',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='reportverificationvisit',
+            trigger=pgtrigger.compiler.Trigger(
+                name='immutable_report_version_delete',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func='\n            begin\n                if exists (\n                    select 1\n                    from "erc"."report_version" rel1\n                    join "erc"."report_verification" rel2 on rel2.report_version_id=rel1.id\n                    where rel1.status=\'Submitted\'\n                    and rel2.id in (select report_verification_id from old_rows)\n                ) then\n                    raise exception \'reportverificationvisit record is immutable after a report version has been submitted\';\n                end if;\n\n                return null;\n            end;\n            ',
+                    hash='c5ad79dc4c4007973f5adadd4675e0454e471596',
+                    level='STATEMENT',
+                    operation='DELETE',
+                    pgid='pgtrigger_immutable_report_version_delete_17191',
+                    referencing='REFERENCING OLD TABLE AS old_rows ',
+                    table='erc"."report_verification_visit',
+                    when='AFTER',
+                ),
+            ),
+        ),
+    ]
@@ -0,0 +1,168 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Concat
+
+
+def populate_reporting_dashboard_reports(apps, schema_editor):
+    """Same rows as ReportingDashboardService.rebuild_dashboard_reports(), with the historical models"""
+    Report = apps.get_model('reporting', 'Report')
+    ReportVersion = apps.get_model('reporting', 'ReportVersion')
+    ReportingDashboardReport = apps.get_model('reporting', 'ReportingDashboardReport')
+
+    latest_version = ReportVersion.objects.filter(report_id=OuterRef("id")).order_by("-id")
+    rows = Report.objects.annotate(
+        latest_version_id=Subquery(latest_version.values("id")[:1]),
+        first_version_id=Subquery(
+            ReportVersion.objects.filter(report_id=OuterRef("id")).order_by("id").values("id")[:1]
+        ),
+        latest_status=Subquery(latest_version.values("status")[:1]),
+        latest_updated_at=Subquery(latest_version.values("updated_at")[:1]),
+        latest_updated_by=Subquery(
+            latest_version.annotate(
+                full_name=Concat(F("updated_by__first_name"), Value(" "), F("updated_by__last_name"))
+            ).values("full_name")[:1]
+        ),
+        latest_operation_name=Subquery(latest_version.values("report_operation__operation_name")[:1]),
+    ).order_by("id")
+    ReportingDashboardReport.objects.bulk_create(
+        (
+            ReportingDashboardReport(
+                report_id=report.id,
+                operation_id=report.operation_id,
+                operator_id=report.operator_id,
+                reporting_year_id=report.reporting_year_id,
+                report_version_id=report.latest_version_id,
+                first_report_version_id=report.first_version_id,
+                report_status=report.latest_status,
+                report_updated_at=report.latest_updated_at,
+                report_submitted_by=report.latest_updated_by,
+                operation_name=report.latest_operation_name,
+            )
+            for report in rows.iterator(chunk_size=1000)
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('registration', '0190_V5_18_1'),
+        ('reporting', '0210_statement_level_immutable_report_version_triggers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportingDashboardReport',
+            fields=[
+                (
+                    'report',
+                    models.OneToOneField(
+                        db_comment='The report summarized by this row. Foreign key to the erc.report table',
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='dashboard_report',
+                        serialize=False,
+                        to='reporting.report',
+                    ),
+                ),
+                (
+                    'report_status',
+                    models.CharField(
+                        blank=True,
+                        db_comment='The status of the latest version of the report',
+                        max_length=1000,
+                        null=True,
+                    ),
+                ),
+                (
+                    'report_updated_at',
+                    models.DateTimeField(
+                        blank=True, db_comment='When the latest version of the report was last updated', null=True
+                    ),
+                ),
+                (
+                    'report_submitted_by',
+                    models.CharField(
+                        blank=True,
+                        db_comment='The full name of the user who last updated the latest version of the report',
+                        max_length=2001,
+                        null=True,
+                    ),
+                ),
+                (
+                    'operation_name',
+                    models.CharField(
+                        blank=True,
+                        db_comment='The operation name reported in the latest version of the report',
+                        max_length=1000,
+                        null=True,
+                    ),
+                ),
+                (
+                    'first_report_version',
+                    models.ForeignKey(
+                        blank=True,
+                        db_comment='The first version of the report',
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name='+',
+                        to='reporting.reportversion',
+                    ),
+                ),
+                (
+                    'operation',
+                    models.ForeignKey(
+                        db_comment='The operation of the report. Foreign key to the erc.operation table',
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name='reporting_dashboard_reports',
+                        to='registration.operation',
+                    ),
+                ),
+                (
+                    'operator',
+                    models.ForeignKey(
+                        db_comment='The operator of the report. Foreign key to the erc.operator table',
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name='reporting_dashboard_reports',
+                        to='registration.operator',
+                    ),
+                ),
+                (
+                    'report_version',
+                    models.ForeignKey(
+                        blank=True,
+                        db_comment='The latest version of the report',
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name='+',
+                        to='reporting.reportversion',
+                    ),
+                ),
+                (
+                    'reporting_year',
+                    models.ForeignKey(
+                        db_comment='The reporting year of the report. Foreign key to the erc.reporting_year table',
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name='reporting_dashboard_reports',
+                        to='reporting.reportingyear',
+                    ),
+                ),
+            ],
+            options={
+                'db_table': 'erc"."reporting_dashboard_report',
+                'db_table_comment': 'Read model of the reporting dashboard, with the latest version data of each report. Derived from the report, report_version and report_operation tables.',
+                'indexes': [
+                    models.Index(
+                        fields=['operation', 'reporting_year', 'operator'], name='dashboard_report_operation_idx'
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_reporting_dashboard_reports, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0211_reporting_dashboard_report'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportVersionSnapshot',
+            fields=[
+                (
+                    'report_version',
+                    models.OneToOneField(
+                        db_comment='The submitted report version serialized in this snapshot. Foreign key to the erc.report_version table',
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='snapshot',
+                        serialize=False,
+                        to='reporting.reportversion',
+                    ),
+                ),
+                (
+                    'format_version',
+                    models.PositiveSmallIntegerField(
+                        db_comment='Version of the serialization format; snapshots of another format are ignored until rebuilt'
+                    ),
+                ),
+                (
+                    'data',
+                    models.BinaryField(
+                        db_comment='The final review and review changes serializations of the report version, as zlib-compressed json'
+                    ),
+                ),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_comment='When the snapshot was saved')),
+            ],
+            options={
+                'db_table': 'erc"."report_version_snapshot',
+                'db_table_comment': "Compressed serialization of each submitted report version, saved on submission. Derived from the report version data, which can't change once submitted.",
+            },
+        ),
+    ]
@@ -49,6 +49,9 @@ from .report_compliance_summary_product import ReportComplianceSummaryProduct
 from .report_attachment_confirmation import ReportAttachmentConfirmation
 from .expected_value_range_fuel_amount import ExpectedValueRangeFuelAmount
 from .expected_value_range_methodology_field import ExpectedValueRangeMethodologyField
+from .activity_validation_schema import ActivityValidationSchema
+from .reporting_dashboard_report import ReportingDashboardReport
+from .report_version_snapshot import ReportVersionSnapshot
 
 __all__ = [
     "ReportDataBaseModel",
@@ -99,4 +102,7 @@ __all__ = [
     "ReportAttachmentConfirmation",
     "ExpectedValueRangeFuelAmount",
     "ExpectedValueRangeMethodologyField",
+    "ActivityValidationSchema",
+    "ReportingDashboardReport",
+    "ReportVersionSnapshot",
 ]
@@ -0,0 +1,23 @@
+from common.models import BaseModel
+from django.db import models
+from reporting.models.rls_configs.activity_validation_schema import Rls as ActivityValidationSchemaRls
+
+
+class ActivityValidationSchema(BaseModel):
+    """Draft 2020-12 activity schemas prepared for submit-time validation, shared by every worker and pod"""
+
+    # No history needed, rows are a derived cache and are rebuilt from the configuration on demand
+    cache_key = models.CharField(
+        max_length=1000,
+        unique=True,
+        db_comment="Identifies the schema: configuration, activity, selected source types and methodology/property flags",
+    )
+    json_schema = models.JSONField(
+        db_comment="The activity form schema, converted for draft 2020-12 validation",
+    )
+
+    class Meta:
+        db_table_comment = "Cache of activity json schemas prepared for report validation. Rows are derived from the reporting configuration and are cleared whenever migrations are applied."
+        db_table = 'erc"."activity_validation_schema'
+
+    Rls = ActivityValidationSchemaRls
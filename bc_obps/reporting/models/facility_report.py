@@ -3,7 +3,7 @@ from registration.models import Activity
 from registration.models.facility import Facility
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models import ReportVersion
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.facility_report import Rls as FacilityReportRls
 
 
@@ -63,7 +63,7 @@ class FacilityReport(TimeStampedModel):
         ]
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = FacilityReportRls
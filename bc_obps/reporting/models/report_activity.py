@@ -3,7 +3,7 @@ from registration.models.activity import Activity
 from reporting.models.activity_json_schema import ActivityJsonSchema
 from reporting.models.facility_report import FacilityReport
 from reporting.models.report_data_base_model import ReportDataBaseModel
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_activity import Rls as ReportActivityRls
 
 
@@ -40,7 +40,7 @@ class ReportActivity(ReportDataBaseModel):
         ]
         triggers = [
             *ReportDataBaseModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportActivityRls
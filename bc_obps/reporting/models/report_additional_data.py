@@ -1,7 +1,7 @@
 from django.db import models
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models.report_version import ReportVersion
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_additional_data import Rls as ReportAdditionalDataRls
 
 
@@ -43,7 +43,7 @@ class ReportAdditionalData(TimeStampedModel):
         app_label = "reporting"
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportAdditionalDataRls
@@ -5,7 +5,7 @@ from django.db.models import CharField, FileField, ForeignKey
 from django.db.models.fields.files import FieldFile
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models.report_version import ReportVersion
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_attachment import Rls as ReportAttachmentRls
 
 FOLDER_NAME = "report_attachments/%Y/"
@@ -56,7 +56,7 @@ class ReportAttachment(TimeStampedModel, ScannedFileStorageMixin):
         ]
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportAttachmentRls
@@ -2,7 +2,7 @@ from django.db import models
 from reporting.models import ReportVersion
 from reporting.models.rls_configs.report_compliance_summary import Rls as ReportComplianceSummaryRls
 from registration.models.time_stamped_model import TimeStampedModel
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 
 
 class ReportComplianceSummary(TimeStampedModel):
@@ -67,7 +67,7 @@ class ReportComplianceSummary(TimeStampedModel):
         db_table = 'erc"."report_compliance_summary'
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportComplianceSummaryRls
@@ -3,7 +3,7 @@ from registration.models import RegulatedProduct
 from reporting.models import ReportVersion, ReportComplianceSummary
 from reporting.models.rls_configs.report_compliance_summary_product import Rls as ReportComplianceSummaryProductRls
 from registration.models.time_stamped_model import TimeStampedModel
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 
 
 class ReportComplianceSummaryProduct(TimeStampedModel):
@@ -81,7 +81,7 @@ class ReportComplianceSummaryProduct(TimeStampedModel):
         db_table = 'erc"."report_compliance_summary_product'
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportComplianceSummaryProductRls
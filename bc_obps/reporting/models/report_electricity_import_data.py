@@ -1,7 +1,7 @@
 from django.db import models
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models.report_version import ReportVersion
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.electricity_import_data import Rls as ReportElectricityImportDataRls
 
 
@@ -69,7 +69,7 @@ class ReportElectricityImportData(TimeStampedModel):
         db_table_comment = "Table storing Electricity Import Data for the reporting system"
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -8,26 +8,11 @@ from django.db.models import Q, DecimalField
 from django.db.models.fields.json import KeyTextTransform
 from django.db.models.functions import Cast
 from reporting.models.report_unit import ReportUnit
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_emission import Rls as ReportEmissionRls
 
 
-class AnnotateEmissionsManager(models.Manager):
-    def get_queryset(self):  # type: ignore
-        return (
-            super()
-            .get_queryset()
-            .annotate(
-                emission=Cast(
-                    KeyTextTransform("equivalentEmission", "json_data"),
-                    output_field=DecimalField(max_digits=20, decimal_places=4),
-                )
-            )
-        )
-
-
 class ReportEmission(ReportDataBaseModel):
-    objects_with_decimal_emissions = AnnotateEmissionsManager()
     gas_type = models.ForeignKey(
         GasType,
         on_delete=models.PROTECT,
@@ -60,6 +45,17 @@ class ReportEmission(ReportDataBaseModel):
         EmissionCategory,
         related_name="+",
     )
+    # Computed by the database from json_data whenever the row is written, so aggregates read a stored column instead
+    # of parsing and casting the json of every row
+    equivalent_emission = models.GeneratedField(
+        expression=Cast(
+            KeyTextTransform("equivalentEmission", "json_data"),
+            output_field=DecimalField(max_digits=20, decimal_places=4),
+        ),
+        output_field=DecimalField(max_digits=20, decimal_places=4),
+        db_persist=True,
+        db_comment="The CO2 equivalent emission (equivalentEmission in json_data), in tCO2e. Generated by the database from json_data",
+    )
 
     class Meta(ReportDataBaseModel.Meta):
         db_table_comment = "A table to store the reported emission-specific data, in a JSON format"
@@ -72,9 +68,12 @@ class ReportEmission(ReportDataBaseModel):
                 violation_error_message="An emission record must belong to either a fuel, a unit, or none, but not both",
             )
         ]
+        indexes = [
+            models.Index(fields=["report_version", "equivalent_emission"], name="report_emission_version_eq_idx"),
+        ]
         triggers = [
             *ReportDataBaseModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportEmissionRls
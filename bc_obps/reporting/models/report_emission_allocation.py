@@ -3,7 +3,7 @@ from django.db.models import Q
 from reporting.models import report_version
 from reporting.models.facility_report import FacilityReport
 from registration.models.time_stamped_model import TimeStampedModel
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_emission_allocation import (
     Rls as ReportEmissionAllocationRls,
 )
@@ -66,7 +66,7 @@ class ReportEmissionAllocation(TimeStampedModel):
         ]
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportEmissionAllocationRls
@@ -3,7 +3,7 @@ from reporting.models.fuel_type import FuelType
 from reporting.models.report_data_base_model import ReportDataBaseModel
 from reporting.models.report_source_type import ReportSourceType
 from reporting.models.report_unit import ReportUnit
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_fuel import Rls as ReportFuelRls
 
 
@@ -35,7 +35,7 @@ class ReportFuel(ReportDataBaseModel):
         app_label = "reporting"
         triggers = [
             *ReportDataBaseModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportFuelRls
@@ -2,7 +2,7 @@ from django.db import models
 from reporting.models.report_data_base_model import ReportDataBaseModel
 from reporting.models.report_emission import ReportEmission
 from reporting.models.methodology import Methodology
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_methodology import Rls as ReportMethodologyRls
 
 
@@ -27,7 +27,7 @@ class ReportMethodology(ReportDataBaseModel):
         app_label = "reporting"
         triggers = [
             *ReportDataBaseModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportMethodologyRls
@@ -2,7 +2,7 @@ from django.db import models
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models import EmissionCategory, ReportVersion
 from reporting.models.report_new_entrant import ReportNewEntrant
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_new_entrant_emission import Rls as ReportNewEntrantEmissionRls
 
 
@@ -46,7 +46,7 @@ class ReportNewEntrantEmission(TimeStampedModel):
         ]
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger("report_new_entrant__report_version"),
+            *immutable_report_version_statement_triggers("report_new_entrant__report_version"),
         ]
 
     Rls = ReportNewEntrantEmissionRls
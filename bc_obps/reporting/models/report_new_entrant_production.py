@@ -3,7 +3,7 @@ from registration.models import RegulatedProduct
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models.report_new_entrant import ReportNewEntrant
 from reporting.models.report_version import ReportVersion
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_new_entrant_production import Rls as ReportNewEntrantProductionRls
 
 
@@ -47,7 +47,7 @@ class ReportNewEntrantProduction(TimeStampedModel):
 
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger("report_new_entrant__report_version"),
+            *immutable_report_version_statement_triggers("report_new_entrant__report_version"),
         ]
 
     Rls = ReportNewEntrantProductionRls
@@ -3,7 +3,7 @@ from registration.models import TimeStampedModel
 from reporting.models import ReportVersion, FacilityReport
 from reporting.models.emission_category import EmissionCategory
 from reporting.models.gas_type import GasType
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_non_attributable_emission import Rls as ReportNonAttributableEmissionRls
 
 
@@ -42,7 +42,7 @@ class ReportNonAttributableEmissions(TimeStampedModel):
         app_label = "reporting"
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportNonAttributableEmissionRls
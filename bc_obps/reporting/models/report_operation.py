@@ -2,7 +2,7 @@ from django.db import models
 from registration.models import Activity, RegulatedProduct
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models.report_version import ReportVersion
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_operation import Rls as ReportOperationRls
 
 
@@ -74,7 +74,7 @@ class ReportOperation(TimeStampedModel):
         app_label = "reporting"
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportOperationRls
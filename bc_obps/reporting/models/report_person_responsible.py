@@ -3,7 +3,7 @@ from django.db import models
 from registration.models.time_stamped_model import TimeStampedModel
 from registration.models.user_and_contact_common_info import UserAndContactCommonInfo
 from reporting.models.report_version import ReportVersion
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_person_responsible import Rls as ReportPersonResponsibleRls
 
 
@@ -51,7 +51,7 @@ class ReportPersonResponsible(UserAndContactCommonInfo, TimeStampedModel):
         app_label = "reporting"
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportPersonResponsibleRls
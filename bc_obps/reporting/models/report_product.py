@@ -7,7 +7,7 @@ from registration.models.regulated_product import RegulatedProduct
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models.facility_report import FacilityReport
 from reporting.models.report_version import ReportVersion
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_product import Rls as ReportProductRls
 
 
@@ -110,7 +110,7 @@ class ReportProduct(TimeStampedModel):
         ]
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportProductRls
@@ -120,6 +120,14 @@ class ReportProduct(TimeStampedModel):
         """
         Override the save method to validate the reporting year.
         """
+        self.validate_reporting_year_production_data()
+        super().save(*args, **kwargs)
+
+    @typing.no_type_check
+    def validate_reporting_year_production_data(self) -> None:
+        """
+        Check that the production data the reporting year requires has been reported.
+        """
         if self.report_version.report.reporting_year_id == 2024 and self.production_data_apr_dec is None:
             raise ValidationError("Apr-Dec production data needs to be reported for reporting year 2024.")
         elif (
@@ -131,4 +139,3 @@ class ReportProduct(TimeStampedModel):
             raise ValidationError(
                 "Opted-in operations whose final reporting year is 2025 must report Jan-Mar production data for reporting year 2025."
             )
-        super().save(*args, **kwargs)
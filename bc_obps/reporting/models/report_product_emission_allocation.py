@@ -1,6 +1,6 @@
 from django.db import models
 from reporting.models import report_version
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models.emission_category import EmissionCategory
 from reporting.models.report_product import ReportProduct
@@ -60,7 +60,7 @@ class ReportProductEmissionAllocation(TimeStampedModel):
         ]
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportProductEmissionAllocationRls
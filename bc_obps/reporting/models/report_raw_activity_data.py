@@ -7,7 +7,7 @@ from registration.models.time_stamped_model import TimeStampedModel
 from registration.models.activity import Activity
 from reporting.models.report_version import ReportVersion
 from reporting.models.facility_report import FacilityReport
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_raw_activity_data import Rls as ReportRawActivityDataRls
 
 
@@ -55,7 +55,7 @@ class ReportRawActivityData(TimeStampedModel):
         ]
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger("facility_report__report_version"),
+            *immutable_report_version_statement_triggers("facility_report__report_version"),
         ]
 
     Rls = ReportRawActivityDataRls
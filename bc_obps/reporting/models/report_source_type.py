@@ -2,7 +2,7 @@ from django.db import models
 from reporting.models import ActivitySourceTypeJsonSchema, ReportDataBaseModel
 from reporting.models.report_activity import ReportActivity
 from reporting.models.source_type import SourceType
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_source_type import Rls as ReportSourceTypeRls
 
 
@@ -38,7 +38,7 @@ class ReportSourceType(ReportDataBaseModel):
         ]
         triggers = [
             *ReportDataBaseModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportSourceTypeRls
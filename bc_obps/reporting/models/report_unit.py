@@ -1,7 +1,7 @@
 from django.db import models
 from reporting.models.report_data_base_model import ReportDataBaseModel
 from reporting.models.report_source_type import ReportSourceType
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_unit import Rls as ReportUnitRls
 
 
@@ -30,7 +30,7 @@ class ReportUnit(ReportDataBaseModel):
         app_label = "reporting"
         triggers = [
             *ReportDataBaseModel.Meta.triggers,
-            immutable_report_version_trigger(),
+            *immutable_report_version_statement_triggers(),
         ]
 
     Rls = ReportUnitRls
@@ -2,7 +2,7 @@ from django.db import models
 from django.db.models import Q
 from registration.models.time_stamped_model import TimeStampedModel
 from reporting.models.report_verification import ReportVerification
-from reporting.models.triggers import immutable_report_version_trigger
+from reporting.models.triggers import immutable_report_version_statement_triggers
 from reporting.models.rls_configs.report_verification_visit import Rls as ReportVerificationVisitRls
 
 
@@ -60,7 +60,7 @@ class ReportVerificationVisit(TimeStampedModel):
         ]
         triggers = [
             *TimeStampedModel.Meta.triggers,
-            immutable_report_version_trigger("report_verification__report_version"),
+            *immutable_report_version_statement_triggers("report_verification__report_version"),
         ]
 
     Rls = ReportVerificationVisitRls
@@ -0,0 +1,33 @@
+from django.db import models
+from common.models.base_model import BaseModel
+from reporting.models.report_version import ReportVersion
+from reporting.models.rls_configs.report_version_snapshot import Rls as ReportVersionSnapshotRls
+
+
+class ReportVersionSnapshot(BaseModel):
+    """
+    The serialized data of a submitted report version, as returned by the final review and diff-data endpoints.
+    Submitted versions are immutable, so it's saved once on submission instead of being recomputed on every read.
+    """
+
+    report_version = models.OneToOneField(
+        ReportVersion,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="snapshot",
+        db_comment="The submitted report version serialized in this snapshot. Foreign key to the erc.report_version table",
+    )
+    format_version = models.PositiveSmallIntegerField(
+        db_comment="Version of the serialization format; snapshots of another format are ignored until rebuilt",
+    )
+    data = models.BinaryField(
+        db_comment="The final review and review changes serializations of the report version, as zlib-compressed json",
+    )
+    created_at = models.DateTimeField(auto_now_add=True, db_comment="When the snapshot was saved")
+
+    class Meta:
+        db_table_comment = "Compressed serialization of each submitted report version, saved on submission. Derived from the report version data, which can't change once submitted."
+        db_table = 'erc"."report_version_snapshot'
+        app_label = 'reporting'
+
+    Rls = ReportVersionSnapshotRls
@@ -0,0 +1,92 @@
+from django.db import models
+from common.models.base_model import BaseModel
+from registration.models.operation import Operation
+from registration.models.operator import Operator
+from reporting.models.report import Report
+from reporting.models.report_version import ReportVersion
+from reporting.models.reporting_year import ReportingYear
+from reporting.models.rls_configs.reporting_dashboard_report import Rls as ReportingDashboardReportRls
+
+
+class ReportingDashboardReport(BaseModel):
+    """
+    Read model of the reporting dashboard: the latest version data of each report, so the dashboard doesn't compute it
+    with subqueries for every operation. Rows are refreshed by ReportingDashboardService when the report, its versions
+    or its report operations are saved.
+    """
+
+    report = models.OneToOneField(
+        Report,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="dashboard_report",
+        db_comment="The report summarized by this row. Foreign key to the erc.report table",
+    )
+    operation = models.ForeignKey(
+        Operation,
+        on_delete=models.DO_NOTHING,
+        related_name="reporting_dashboard_reports",
+        db_comment="The operation of the report. Foreign key to the erc.operation table",
+    )
+    operator = models.ForeignKey(
+        Operator,
+        on_delete=models.DO_NOTHING,
+        related_name="reporting_dashboard_reports",
+        db_comment="The operator of the report. Foreign key to the erc.operator table",
+    )
+    reporting_year = models.ForeignKey(
+        ReportingYear,
+        on_delete=models.DO_NOTHING,
+        related_name="reporting_dashboard_reports",
+        db_comment="The reporting year of the report. Foreign key to the erc.reporting_year table",
+    )
+    # Versions are deleted without waiting for the row to be refreshed, hence no database constraint
+    report_version = models.ForeignKey(
+        ReportVersion,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name="+",
+        db_comment="The latest version of the report",
+    )
+    first_report_version = models.ForeignKey(
+        ReportVersion,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name="+",
+        db_comment="The first version of the report",
+    )
+    report_status = models.CharField(
+        max_length=1000, null=True, blank=True, db_comment="The status of the latest version of the report"
+    )
+    report_updated_at = models.DateTimeField(
+        null=True, blank=True, db_comment="When the latest version of the report was last updated"
+    )
+    report_submitted_by = models.CharField(
+        max_length=2001,
+        null=True,
+        blank=True,
+        db_comment="The full name of the user who last updated the latest version of the report",
+    )
+    operation_name = models.CharField(
+        max_length=1000,
+        null=True,
+        blank=True,
+        db_comment="The operation name reported in the latest version of the report",
+    )
+
+    class Meta:
+        db_table_comment = "Read model of the reporting dashboard, with the latest version data of each report. Derived from the report, report_version and report_operation tables."
+        db_table = 'erc"."reporting_dashboard_report'
+        app_label = 'reporting'
+        indexes = [
+            models.Index(
+                fields=["operation", "reporting_year", "operator"],
+                name="dashboard_report_operation_idx",
+            ),
+        ]
+
+    Rls = ReportingDashboardReportRls
@@ -1,4 +1,6 @@
+import typing
 from common.models import BaseModel
+from django.core.cache import cache
 from django.db import models
 from reporting.models.rls_configs.reporting_field import Rls as ReportingFieldRls
 from common.models.triggers import immutable_slug_trigger
@@ -40,3 +42,11 @@ class ReportingField(BaseModel):
         triggers = [immutable_slug_trigger()]
 
     Rls = ReportingFieldRls
+
+    @typing.no_type_check
+    def save(self, *args, **kwargs):
+        """
+        Override the save method to clear the cached display titles of the review changes when a field is saved.
+        """
+        cache.delete('reporting_field_display_titles')
+        super().save(*args, **kwargs)
@@ -0,0 +1,15 @@
+from reporting.enums.enums import ReportingTableNames
+from rls.enums import RlsRoles, RlsOperations
+from rls.utils.helpers import generate_rls_grants
+
+
+class Rls:
+    # Any role can trigger report validation, which populates the cache on a miss
+    role_grants_mapping = {
+        RlsRoles.INDUSTRY_USER: [RlsOperations.SELECT, RlsOperations.INSERT],
+        RlsRoles.CAS_DIRECTOR: [RlsOperations.SELECT, RlsOperations.INSERT],
+        RlsRoles.CAS_ADMIN: [RlsOperations.SELECT, RlsOperations.INSERT],
+        RlsRoles.CAS_ANALYST: [RlsOperations.SELECT, RlsOperations.INSERT],
+        RlsRoles.CAS_VIEW_ONLY: [RlsOperations.SELECT, RlsOperations.INSERT],
+    }
+    grants = generate_rls_grants(role_grants_mapping, ReportingTableNames.ACTIVITY_VALIDATION_SCHEMA)
@@ -0,0 +1,20 @@
+from reporting.enums.enums import ReportingTableNames
+from rls.enums import RlsRoles, RlsOperations
+from rls.utils.helpers import generate_rls_grants
+
+
+class Rls:
+    # Snapshots are saved when industry users submit a report
+    role_grants_mapping = {
+        RlsRoles.INDUSTRY_USER: [
+            RlsOperations.SELECT,
+            RlsOperations.INSERT,
+            RlsOperations.UPDATE,
+            RlsOperations.DELETE,
+        ],
+        RlsRoles.CAS_DIRECTOR: [RlsOperations.SELECT],
+        RlsRoles.CAS_ADMIN: [RlsOperations.SELECT],
+        RlsRoles.CAS_ANALYST: [RlsOperations.SELECT],
+        RlsRoles.CAS_VIEW_ONLY: [RlsOperations.SELECT],
+    }
+    grants = generate_rls_grants(role_grants_mapping, ReportingTableNames.REPORT_VERSION_SNAPSHOT)
@@ -55,68 +55,90 @@ def get_sql_relation_alias_generator() -> Iterator[str]:
         yield f"rel{str(i)}"
 
 
-def immutable_report_version_trigger(
-    orm_path_to_version: str = "report_version",
-) -> pgtrigger.Trigger:
+IMMUTABLE_REPORT_VERSION_STATEMENT_OPERATIONS = [
+    # (trigger name, operation, referencing, transition tables holding the touched rows)
+    ("immutable_report_version_insert", pgtrigger.Insert, pgtrigger.Referencing(new="new_rows"), ["new_rows"]),
+    (
+        "immutable_report_version_update",
+        pgtrigger.Update,
+        pgtrigger.Referencing(old="old_rows", new="new_rows"),
+        ["old_rows", "new_rows"],
+    ),
+    ("immutable_report_version_delete", pgtrigger.Delete, pgtrigger.Referencing(old="old_rows"), ["old_rows"]),
+]
+
+IMMUTABLE_REPORT_VERSION_TRIGGER_NAMES = [name for name, *_ in IMMUTABLE_REPORT_VERSION_STATEMENT_OPERATIONS]
+
+
+def immutable_report_version_trigger_uris(model_uri: str) -> list[str]:
     """
-    Function to generate an immutable report version trigger based on a django-style traversal path.
+    The pgtrigger URIs of the immutable report version statement triggers of a model, to ignore them all.
+    Example: pgtrigger.ignore(*immutable_report_version_trigger_uris("reporting.ReportOperation"))
+    """
+    return [f"{model_uri}:{name}" for name in IMMUTABLE_REPORT_VERSION_TRIGGER_NAMES]
+
 
-    Default argument assumes a single-step foreign key to the report_version table.
+def immutable_report_version_statement_triggers(
+    orm_path_to_version: str = "report_version",
+) -> list[pgtrigger.Trigger]:
+    """
+    Triggers making the records of a model immutable once their report version is submitted, based on a
+    django-style traversal path to the report version (by default a single-step foreign key to report_version).
+    Each distinct parent record touched by an insert, update or delete statement is checked once, using the
+    statement's transition tables, instead of walking up to the report version for every row. Bulk clones and
+    (cascade) deletes of large report versions rely on this.
+
+    PostgreSQL only allows transition tables on AFTER triggers with a single operation, so this returns one trigger
+    per operation. Raising in an AFTER trigger still aborts the whole statement.
     """
 
     if not orm_path_to_version.endswith("report_version"):
         raise ValueError("The immutable report version trigger path should point at the erc.report_version table")
 
     relation_alias_generator = get_sql_relation_alias_generator()
-
-    relations = [
-        *[(table, next(relation_alias_generator)) for table in reversed(orm_path_to_version.split("__"))],
-        ("current_table", next(relation_alias_generator)),
-    ]
+    relations = [(table, next(relation_alias_generator)) for table in reversed(orm_path_to_version.split("__"))]
 
     sql = ""
-
-    for index, relation in enumerate(relations):
-        (prev_table, prev_rel_id) = relations[index - 1] if index > 0 else (None, None)
-        (table, rel_id) = relation
-
+    for index, (table, rel_id) in enumerate(relations):
         if index == 0:
             sql += f"""
-                select {rel_id}.status into status
-                from "erc"."{table}" {rel_id}"""
-        elif index == len(relations) - 1:
-            # Leaving {meta.db_table} in the func template will let django-pgtrigger reflect which one is the current table
-            # when building the trigger, instead of having the user need to specify it
-            #
-            # https://django-pgtrigger.readthedocs.io/en/4.13.3/cookbook/#model-properties-in-the-func
-
-            # We coalesce new.prev_table_id and old.prev_table_id because on insert we don't have old.prev_table_id, and on delete we don't have new.prev_table_id.
-            # They will be the same value because the report_version has a trigger that prevents changing the id.
-            sql += f"""
-                where {prev_rel_id}.id=coalesce(new.{prev_table}_id, old.{prev_table}_id)"""
+                    select 1
+                    from "erc"."{table}" {rel_id}"""
         else:
+            prev_table, prev_rel_id = relations[index - 1]
             sql += f"""
-                join "erc"."{table}" {rel_id} on {rel_id}.{prev_table}_id={prev_rel_id}.id"""
-
-    return pgtrigger.Trigger(
-        name="immutable_report_version",
-        operation=pgtrigger.Operations(pgtrigger.Update, pgtrigger.Insert, pgtrigger.Delete),
-        when=pgtrigger.Before,
-        func=pgtrigger.Func(
-            """
-            declare
-                status text;
-            begin"""
-            + sql
-            + """
-                limit 1;
-
-                if status='Submitted' then
-                    raise exception '{meta.model_name} record is immutable after a report version has been submitted';
+                    join "erc"."{table}" {rel_id} on {rel_id}.{prev_table}_id={prev_rel_id}.id"""
+
+    # The column of the current table pointing at the last relation of the path
+    parent_table, parent_rel_id = relations[-1]
+    triggers = []
+    for name, operation, referencing, transition_tables in IMMUTABLE_REPORT_VERSION_STATEMENT_OPERATIONS:
+        touched_parents = " union ".join(
+            f"select {parent_table}_id from {transition_table}" for transition_table in transition_tables
+        )
+        triggers.append(
+            pgtrigger.Trigger(
+                name=name,
+                level=pgtrigger.Statement,
+                referencing=referencing,
+                operation=operation,
+                when=pgtrigger.After,
+                func=pgtrigger.Func(
+                    """
+            begin
+                if exists ("""
+                    + sql
+                    + f"""
+                    where {relations[0][1]}.status='Submitted'
+                    and {parent_rel_id}.id in ({touched_parents})
+                ) then
+                    raise exception '{{meta.model_name}} record is immutable after a report version has been submitted';
                 end if;
 
-                return coalesce(new, old);
+                return null;
             end;
             """
-        ),
-    )
+                ),
+            )
+        )
+    return triggers
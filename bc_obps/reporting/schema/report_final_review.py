@@ -302,6 +302,12 @@ class FacilityReportSchema(ModelSchema):
 
     @staticmethod
     def resolve_emission_summary(obj: FacilityReport) -> Optional[Any]:
+        # Set when the totals of all the facility reports were loaded at once, see ReviewChangesVersionSchema
+        emission_category_totals = getattr(obj, "emission_category_totals", None)
+        if emission_category_totals is not None:
+            return EmissionCategoryService.transform_category_totals_to_summary_form_data(
+                emission_category_totals.as_dict()
+            )
         return EmissionCategoryService.get_facility_emission_summary_form_data(obj.id)
 
     @staticmethod
@@ -492,4 +498,10 @@ class ReviewChangesVersionSchema(BaseReportVersionSchema):
 
     @staticmethod
     def resolve_facility_reports(obj: ReportVersion) -> Dict[str, FacilityReport]:
-        return {facility.facility_name: facility for facility in obj.facility_reports.all()}
+        facility_reports = list(obj.facility_reports.all())
+        totals = EmissionCategoryService.get_category_totals_by_facility_reports(
+            facility_report.id for facility_report in facility_reports
+        )
+        for facility_report in facility_reports:
+            facility_report.emission_category_totals = totals[facility_report.id]  # type: ignore[attr-defined]
+        return {facility.facility_name: facility for facility in facility_reports}
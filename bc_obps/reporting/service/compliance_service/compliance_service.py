@@ -1,16 +1,11 @@
 from reporting.models.report_emission import ReportEmission
 from reporting.models.report_product import ReportProduct
-from reporting.models import ReportVersion
-from reporting.models.product_emission_intensity import ProductEmissionIntensity
+from reporting.models import ReportVersion, ReportingYear
 from reporting.models.emission_category import EmissionCategory
 from reporting.service.compliance_service.emission_allocation import (
+    REPORTING_ONLY_CATEGORY_IDS,
     get_emissions_from_only_funny_category_13,
     get_fog_emissions,
-    get_reporting_only_allocated,
-)
-from reporting.service.compliance_service.industrial_process import (
-    compute_industrial_process_emissions,
-    get_allocated_emissions_by_report_product_emission_category,
 )
 from reporting.service.compliance_service.parameters import (
     ComplianceParameters,
@@ -19,16 +14,18 @@ from reporting.service.compliance_service.parameters import (
 from reporting.models import ReportComplianceSummary, ReportComplianceSummaryProduct
 from registration.models import RegulatedProduct, Operation
 from decimal import Decimal
-from django.db.models import Sum
-from typing import Dict, List, Optional
+from django.db.models import QuerySet, Sum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from django.db import transaction
 from dataclasses import dataclass
 
 from reporting.service.compliance_service.regulatory_values import (
+    RegulatoryParameterSnapshot,
     RegulatoryValues,
     get_industry_regulatory_values,
-    get_product_regulatory_values_override,
+    get_regulatory_parameter_snapshot,
 )
+from reporting.service.compliance_service.product_compliance_inputs import load_product_compliance_inputs
 from reporting.service.utils import round_using_appropriate_strategy
 from reporting.service.report_operation_opt_out_service import (
     ReportOperationOptOutService,
@@ -107,11 +104,11 @@ class ComplianceService:
 
     @staticmethod
     def get_emissions_attributable_for_reporting(report_version_id: int) -> Decimal:
-        records = ReportEmission.objects_with_decimal_emissions.filter(
+        records = ReportEmission.objects.filter(
             report_version_id=report_version_id,
             emission_categories__category_type="basic",
         )
-        attributable_sum = records.aggregate(emission_sum=Sum("emission"))
+        attributable_sum = records.aggregate(emission_sum=Sum("equivalent_emission"))
 
         return attributable_sum["emission_sum"] or Decimal("0")
 
@@ -120,15 +117,7 @@ class ComplianceService:
         records = ReportProduct.objects.filter(
             report_version_id=report_version_id,
         )
-        annual_production_sum = records.aggregate(production_sum=Sum("annual_production"))
-        jan_mar_sum = records.aggregate(production_sum=Sum("production_data_jan_mar"))
-        apr_dec_sum = records.aggregate(production_sum=Sum("production_data_apr_dec"))
-
-        return {
-            "annual_amount": annual_production_sum["production_sum"] or Decimal("0"),
-            "jan_mar": jan_mar_sum["production_sum"] or Decimal("0"),
-            "apr_dec": apr_dec_sum["production_sum"] or Decimal("0"),
-        }
+        return ComplianceService._aggregate_production_totals(records)
 
     @staticmethod
     def get_report_product_aggregated_totals(report_version_id: int, product_id: int) -> Dict[str, Decimal]:
@@ -136,15 +125,17 @@ class ComplianceService:
             report_version_id=report_version_id,
             product_id=product_id,
         )
-        product_annual_amount_sum = records.aggregate(production_sum=Sum("annual_production"))
-        jan_mar_sum = records.aggregate(production_sum=Sum("production_data_jan_mar"))
-        apr_dec_sum = records.aggregate(production_sum=Sum("production_data_apr_dec"))
+        return ComplianceService._aggregate_production_totals(records)
 
-        return {
-            "annual_amount": product_annual_amount_sum["production_sum"] or Decimal("0"),
-            "jan_mar": jan_mar_sum["production_sum"] or Decimal("0"),
-            "apr_dec": apr_dec_sum["production_sum"] or Decimal("0"),
-        }
+    @staticmethod
+    def _aggregate_production_totals(records: QuerySet[ReportProduct]) -> Dict[str, Decimal]:
+        # One aggregate query for the three production totals
+        totals = records.aggregate(
+            annual_amount=Sum("annual_production"),
+            jan_mar=Sum("production_data_jan_mar"),
+            apr_dec=Sum("production_data_apr_dec"),
+        )
+        return {key: value or Decimal("0") for key, value in totals.items()}
 
     @staticmethod
     def calculate_product_emission_limit(
@@ -197,17 +188,23 @@ class ComplianceService:
         return ProductionPeriod.ANNUAL
 
     @staticmethod
-    def get_calculated_compliance_data(report_version_id: int) -> ComplianceData:
+    def get_calculated_compliance_data(
+        report_version_id: int, snapshot: Optional[RegulatoryParameterSnapshot] = None
+    ) -> ComplianceData:
+        """
+        `snapshot` is the regulatory parameter snapshot of the report's reporting year, if it was already loaded
+        (e.g. to compute the compliance data of many reports of a year).
+        """
         # Fetch the ReportVersion once (bring in reporting_year and operation) to avoid extra queries
-        report_version_record = ReportVersion.objects.select_related("report__reporting_year", "report_operation").get(
-            pk=report_version_id
-        )
+        report_version_record = ReportVersion.objects.select_related(
+            "report__reporting_year", "report_operation__naics_code"
+        ).get(pk=report_version_id)
         # Determine whether Jan–Mar production data should be included
         include_jan_mar = ReportOperationOptOutService.should_include_jan_mar_production(report_version_record)
-        reporting_year = report_version_record.report.reporting_year.reporting_year
 
         # Get regulatory values (periods are global, but RF/TR will be applied per product)
-        industry_regulatory_values = get_industry_regulatory_values(report_version_record)
+        snapshot = snapshot or get_regulatory_parameter_snapshot(report_version_record.report.reporting_year)
+        industry_regulatory_values = get_industry_regulatory_values(report_version_record, snapshot)
         registration_purpose = report_version_record.report_operation.registration_purpose
 
         ##### Don't use schemas, use classes or dicts
@@ -224,32 +221,16 @@ class ComplianceService:
             report_version_record.report_operation.operation_opted_out_final_reporting_year or 0,
         )
 
-        report_products = (
-            ReportProduct.objects.order_by("product_id")
-            .filter(report_version_id=report_version_id, product__is_regulated=True)
-            .distinct("product_id")
-        )
+        # All product inputs are loaded with a fixed number of grouped queries, the limits are computed in memory
+        basic_category_ids = list(EmissionCategory.objects.filter(category_type="basic").values_list("id", flat=True))
         # Iterate on all products reported (by product ID)
-        for rp in report_products:
-            product_regulatory_values_override = get_product_regulatory_values_override(
-                report_version_record, rp.product_id
-            )
-            ei = ProductEmissionIntensity.objects.get(
-                product_id=rp.product_id,
-                # TEMPORAL CHECKS
-                valid_from__year__lte=reporting_year,
-                valid_to__year__gte=reporting_year,
-            ).product_weighted_average_emission_intensity
-
-            industrial_process = compute_industrial_process_emissions(rp)
-
-            production_totals = ComplianceService.get_report_product_aggregated_totals(report_version_id, rp.product_id)
-            allocated = get_allocated_emissions_by_report_product_emission_category(
-                report_version_id,
-                rp.product_id,
-                list(EmissionCategory.objects.filter(category_type="basic").values_list("id", flat=True)),
-            )
-            allocated_reporting_only = get_reporting_only_allocated(report_version_id, rp.product_id)
+        for product in load_product_compliance_inputs(report_version_record, snapshot):
+            product_regulatory_values_override = product.regulatory_values_override
+            ei = product.emission_intensity
+            industrial_process = product.industrial_process
+            production_totals = product.production_totals
+            allocated = product.allocated_to_categories(basic_category_ids)
+            allocated_reporting_only = product.allocated_to_categories(REPORTING_ONLY_CATEGORY_IDS)
             allocated_for_compliance = allocated - allocated_reporting_only
 
             # Calculate prorated_allocated limit (if applicable), depending on reporting year and operation criteria.
@@ -290,9 +271,9 @@ class ComplianceService:
             # Add product to list of products
             compliance_product_list.append(
                 ReportProductComplianceData(
-                    name=rp.product.name,
-                    unit=rp.product.unit,
-                    product_id=rp.product_id,
+                    name=product.name,
+                    unit=product.unit,
+                    product_id=product.product_id,
                     annual_production=production_totals["annual_amount"],
                     jan_mar_production=production_totals["jan_mar"] if include_jan_mar else None,
                     apr_dec_production=production_totals["apr_dec"],
@@ -362,6 +343,64 @@ class ComplianceService:
 
         return return_object
 
+    @staticmethod
+    def get_calculated_compliance_data_for_reporting_year(
+        reporting_year: int, report_version_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, ComplianceData]:
+        """
+        Computes the compliance data of many report versions of a reporting year (by default, every version with a
+        saved compliance summary), with a single load of the year's regulatory parameters.
+        Returns the compliance data by report version id.
+        """
+        report_versions = ReportVersion.objects.filter(report__reporting_year_id=reporting_year)
+        if report_version_ids is None:
+            report_versions = report_versions.filter(report_compliance_summary__isnull=False)
+        else:
+            report_versions = report_versions.filter(id__in=report_version_ids)
+
+        snapshot = get_regulatory_parameter_snapshot(ReportingYear.objects.get(reporting_year=reporting_year))
+        return {
+            report_version_id: ComplianceService.get_calculated_compliance_data(report_version_id, snapshot)
+            for report_version_id in report_versions.order_by("id").values_list("id", flat=True).distinct()
+        }
+
+    @staticmethod
+    def find_stale_compliance_summaries(reporting_year: int) -> Dict[int, Dict[str, Tuple[Any, Any]]]:
+        """
+        Recomputes the saved compliance summaries of a reporting year and compares them with the saved values, e.g.
+        after the regulatory parameters of the year were corrected.
+        Returns the differing fields as (saved, recomputed) pairs by report version id.
+        """
+        calculated = ComplianceService.get_calculated_compliance_data_for_reporting_year(reporting_year)
+        summaries = {
+            summary.report_version_id: summary
+            for summary in ReportComplianceSummary.objects.filter(report_version_id__in=calculated.keys())
+        }
+        saved_products: Dict[int, Dict[int, ReportComplianceSummaryProduct]] = {}
+        for saved_product in ReportComplianceSummaryProduct.objects.filter(report_version_id__in=calculated.keys()):
+            saved_products.setdefault(saved_product.report_version_id, {})[saved_product.product_id] = saved_product
+
+        stale: Dict[int, Dict[str, Tuple[Any, Any]]] = {}
+        for report_version_id, compliance_data in calculated.items():
+            differences: Dict[str, Tuple[Any, Any]] = {
+                field: (getattr(summaries[report_version_id], field), value)
+                for field, value in compliance_data.as_record_defaults().items()
+                if getattr(summaries[report_version_id], field) != value
+            }
+            products = saved_products.get(report_version_id, {})
+            for product in compliance_data.products:
+                saved = products.pop(product.product_id, None)
+                for field, value in product.as_record_defaults().items():
+                    saved_value = getattr(saved, field) if saved else None
+                    if saved_value != value:
+                        differences[f"product {product.product_id} {field}"] = (saved_value, value)
+            # Products saved with the summary that aren't regulated products of the report anymore
+            for product_id in products:
+                differences[f"product {product_id}"] = (product_id, None)
+            if differences:
+                stale[report_version_id] = differences
+        return stale
+
     @classmethod
     @transaction.atomic()
     def save_compliance_data(cls, report_version_id: int) -> None:
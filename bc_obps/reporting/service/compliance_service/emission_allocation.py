@@ -37,13 +37,13 @@ def get_emissions_from_only_funny_category_13(report_version_id: int) -> Decimal
     and subtract them from the total attributable for compliance,
     since they're not based on a single product and therefore are not allocated anywhere.
     """
-    records = ReportEmission.objects_with_decimal_emissions.filter(
+    records = ReportEmission.objects.filter(
         report_version_id=report_version_id,
         emission_categories__id=13,
     ).exclude(
         emission_categories__id__in=[10, 11, 12],
     )
-    return records.aggregate(emission_total=Sum("emission"))["emission_total"] or Decimal("0")
+    return records.aggregate(emission_total=Sum("equivalent_emission"))["emission_total"] or Decimal("0")
 
 
 def get_fog_emissions(report_version_id: int) -> Decimal:
@@ -71,36 +71,49 @@ def retrieve_pulp_and_paper_biogenic_emissions_split(report_version: ReportVersi
             return retrieve_pulp_and_paper_biogenic_emissions_split_default(report_version)
 
 
+INDUSTRIAL_PROCESS_CATEGORY_ID = 3
+PULP_AND_PAPER_NAICS_CODE_PREFIX = "322112"
+
+
 def compute_industrial_process_emissions(rp: ReportProduct) -> Decimal:
 
     industrial_process = get_allocated_emissions_by_report_product_emission_category(
-        rp.report_version_id, rp.product_id, [3]
-    )  # ID=3 is Industrial Emissions category
+        rp.report_version_id, rp.product_id, [INDUSTRIAL_PROCESS_CATEGORY_ID]
+    )
 
-    # Handle Pulp & Paper specific edge case:
-    # Subtract the sum of emissions that were categorized as industrial_process & (woody_biomass or other_excluded_biomass) from
-    # the industrial_process emission total attributed to the product "Pulp and paper: chemical pulp".
     ro = ReportOperation.objects.get(report_version_id=rp.report_version_id)
     if not ro.naics_code:
         raise ValueError(f"No NAICS code associated with report version {rp.report_version_id}")
-    if ro.naics_code.naics_code.startswith("322112") and rp.product.name in [
+    return adjust_industrial_process_emissions(
+        rp.report_version, ro.naics_code.naics_code, rp.product.name, industrial_process
+    )
+
+
+def adjust_industrial_process_emissions(
+    report_version: ReportVersion, naics_code: str, product_name: str, industrial_process: Decimal
+) -> Decimal:
+    """
+    Returns the industrial process emissions allocated to a product, minus the biogenic overlap for Pulp & Paper.
+    """
+    # Handle Pulp & Paper specific edge case:
+    # Subtract the sum of emissions that were categorized as industrial_process & (woody_biomass or other_excluded_biomass) from
+    # the industrial_process emission total attributed to the product "Pulp and paper: chemical pulp".
+    if naics_code.startswith(PULP_AND_PAPER_NAICS_CODE_PREFIX) and product_name in [
         "Pulp and paper: chemical pulp",
         "Pulp and paper: lime recovered by kiln",
     ]:
-        biogenic_emissions_split = retrieve_pulp_and_paper_biogenic_emissions_split(rp.report_version)
+        biogenic_emissions_split = retrieve_pulp_and_paper_biogenic_emissions_split(report_version)
         overlapping_industrial_process_emissions = (
-            EmissionCategoryService.get_industrial_process_excluded_biomass_overlap_by_report_version(
-                rp.report_version.id
-            )
+            EmissionCategoryService.get_industrial_process_excluded_biomass_overlap_by_report_version(report_version.id)
         )
 
-        if rp.product.name == "Pulp and paper: chemical pulp":
+        if product_name == "Pulp and paper: chemical pulp":
             return (
                 industrial_process
                 - overlapping_industrial_process_emissions * biogenic_emissions_split.chemical_pulp_ratio
             )
 
-        if rp.product.name == "Pulp and paper: lime recovered by kiln":
+        if product_name == "Pulp and paper: lime recovered by kiln":
             return (
                 industrial_process
                 - overlapping_industrial_process_emissions * biogenic_emissions_split.lime_recovered_by_kiln_ratio
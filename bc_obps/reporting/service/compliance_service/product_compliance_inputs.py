@@ -0,0 +1,109 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+
+from django.db.models import Sum
+from reporting.models.report_product import ReportProduct
+from reporting.models.report_product_emission_allocation import ReportProductEmissionAllocation
+from reporting.models.report_version import ReportVersion
+from reporting.service.compliance_service.industrial_process import (
+    INDUSTRIAL_PROCESS_CATEGORY_ID,
+    adjust_industrial_process_emissions,
+)
+from reporting.service.compliance_service.regulatory_values import (
+    RegulatoryParameterSnapshot,
+    RegulatoryValuesOverride,
+    get_regulatory_parameter_snapshot,
+)
+
+
+@dataclass
+class ProductComplianceInputs:
+    """
+    Everything the compliance calculations need for one regulated product of a report version.
+    """
+
+    product_id: int
+    name: str
+    unit: str
+    production_totals: Dict[str, Decimal]
+    emission_intensity: Decimal
+    regulatory_values_override: RegulatoryValuesOverride
+    allocated_by_category: Dict[int, Decimal] = field(default_factory=dict)
+    industrial_process: Decimal = Decimal("0")
+
+    def allocated_to_categories(self, emission_category_ids: Iterable[int]) -> Decimal:
+        return sum(
+            (self.allocated_by_category.get(category_id, Decimal("0")) for category_id in emission_category_ids),
+            Decimal("0"),
+        )
+
+
+def load_product_compliance_inputs(
+    report_version: ReportVersion, snapshot: Optional[RegulatoryParameterSnapshot] = None
+) -> List[ProductComplianceInputs]:
+    """
+    Loads the production totals and allocated emissions of every regulated product in the report version, with one
+    grouped query each (instead of a set of queries per product). Emission intensities and regulatory value
+    overrides are read from the regulatory parameter snapshot of the reporting year.
+
+    `report_version` must have `report__reporting_year` and `report_operation__naics_code` loaded.
+    Products are returned in product id order.
+    """
+    naics_code = report_version.report_operation.naics_code
+    if naics_code is None:
+        raise ValueError(f"No NAICS code associated with report version {report_version.id}")
+
+    production_rows = (
+        ReportProduct.objects.filter(report_version_id=report_version.id, product__is_regulated=True)
+        .values("product_id", "product__name", "product__unit")
+        .annotate(
+            annual_amount=Sum("annual_production"),
+            jan_mar=Sum("production_data_jan_mar"),
+            apr_dec=Sum("production_data_apr_dec"),
+        )
+        .order_by("product_id")
+    )
+    if not production_rows:
+        return []
+    product_ids = [row["product_id"] for row in production_rows]
+    snapshot = snapshot or get_regulatory_parameter_snapshot(report_version.report.reporting_year)
+
+    allocated: Dict[int, Dict[int, Decimal]] = defaultdict(dict)
+    for allocation_row in (
+        ReportProductEmissionAllocation.objects.filter(
+            report_version_id=report_version.id, report_product__product_id__in=product_ids
+        )
+        .values("report_product__product_id", "emission_category_id")
+        .annotate(allocated_sum=Sum("allocated_quantity"))
+        .order_by()
+    ):
+        allocated[allocation_row["report_product__product_id"]][allocation_row["emission_category_id"]] = (
+            allocation_row["allocated_sum"]
+        )
+
+    products = []
+    for row in production_rows:
+        product_id = row["product_id"]
+        product = ProductComplianceInputs(
+            product_id=product_id,
+            name=row["product__name"],
+            unit=row["product__unit"],
+            production_totals={
+                "annual_amount": row["annual_amount"] or Decimal("0"),
+                "jan_mar": row["jan_mar"] or Decimal("0"),
+                "apr_dec": row["apr_dec"] or Decimal("0"),
+            },
+            emission_intensity=snapshot.get_emission_intensity(product_id),
+            regulatory_values_override=snapshot.get_regulatory_values_override(naics_code.id, product_id),
+            allocated_by_category=allocated[product_id],
+        )
+        product.industrial_process = adjust_industrial_process_emissions(
+            report_version,
+            naics_code.naics_code,
+            product.name,
+            product.allocated_to_categories([INDUSTRIAL_PROCESS_CATEGORY_ID]),
+        )
+        products.append(product)
+    return products
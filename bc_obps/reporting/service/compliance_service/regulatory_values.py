@@ -1,10 +1,20 @@
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, cast
 
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import CharField, QuerySet, Value
+from django.db.models.functions import MD5, Concat
 from reporting.models.naics_regulatory_override import NaicsRegulatoryOverride
 from reporting.models.naics_regulatory_value import NaicsRegulatoryValue
+from reporting.models.product_emission_intensity import ProductEmissionIntensity
 from reporting.models.report_operation import ReportOperation
 from reporting.models.report_version import ReportVersion
+from reporting.models.reporting_year import ReportingYear
+
+INITIAL_COMPLIANCE_PERIOD = 2024
 
 
 @dataclass
@@ -21,49 +31,207 @@ class RegulatoryValuesOverride:
     tightening_rate_override: Decimal | None = None
 
 
-def get_industry_regulatory_values(report_version: ReportVersion) -> RegulatoryValues:
+def _table_fingerprint(queryset: QuerySet, *fields: str) -> QuerySet:
+    """(table name, hash of the given fields of every row) of the queryset's table, as a one row queryset"""
+    parts: List[str | Value] = []
+    for field in ("id", *fields):
+        parts.extend([field, Value(":")])
+    return cast(
+        QuerySet,
+        queryset.order_by()
+        .annotate(table=Value(queryset.model._meta.db_table, output_field=CharField()))
+        .values("table")
+        .annotate(
+            fingerprint=MD5(StringAgg(Concat(*parts[:-1], output_field=CharField()), delimiter=",", ordering="id"))
+        )
+        .values_list("table", "fingerprint"),
+    )
+
+
+@dataclass(frozen=True)
+class RegulatoryParameterSnapshot:
     """
-    Returns the regulatory values setup for the industry, for a specific report version.
-    If specific exemptions exist for some products, this method won't be reflecting them.
+    The regulatory parameters that apply to a reporting year, indexed in memory so the compliance calculations of
+    every report of the year can read them without queries:
+    - reduction factor and tightening rate of each NAICS code,
+    - reduction factor and tightening rate overrides, keyed by (NAICS code, regulated product),
+    - production weighted average emission intensity (PWAEI) of each regulated product.
+    Values are tuples of every row matching the year, so lookups raise the same errors as the queries they replace.
     """
+
+    reporting_year: int
+    reporting_window: Tuple[datetime, datetime]
+    fingerprint: str
+    industry_values: Mapping[int, Tuple[Tuple[Decimal, Decimal], ...]]
+    overrides: Mapping[Tuple[int, int], Tuple[Tuple[Decimal, Decimal], ...]]
+    emission_intensities: Mapping[int, Tuple[Decimal, ...]]
+
+    @staticmethod
+    def current_fingerprint() -> str:
+        """A hash of the regulatory configuration tables, which changes whenever a row is added, edited or deleted"""
+        rows = _table_fingerprint(
+            NaicsRegulatoryValue.objects.all(),
+            "naics_code_id",
+            "reduction_factor",
+            "tightening_rate",
+            "valid_from",
+            "valid_to",
+        ).union(
+            _table_fingerprint(
+                NaicsRegulatoryOverride.objects.all(),
+                "naics_code_id",
+                "regulated_product_id",
+                "reduction_factor",
+                "tightening_rate",
+                "valid_from",
+                "valid_to",
+            ),
+            _table_fingerprint(
+                ProductEmissionIntensity.objects.all(),
+                "product_id",
+                "product_weighted_average_emission_intensity",
+                "valid_from",
+                "valid_to",
+            ),
+            all=True,
+        )
+        return ",".join(fingerprint or "" for _, fingerprint in sorted(rows))
+
+    @classmethod
+    def build(cls, reporting_year: ReportingYear, fingerprint: str) -> "RegulatoryParameterSnapshot":
+        # Same temporal filters as the per report lookups: values must apply through the whole reporting window,
+        # emission intensities to the reporting year
+        in_reporting_window = {
+            "valid_from__lte": reporting_year.reporting_window_start,
+            "valid_to__gte": reporting_year.reporting_window_end,
+        }
+        industry_values: Dict[int, List[Tuple[Decimal, Decimal]]] = {}
+        for naics_code_id, reduction_factor, tightening_rate in (
+            NaicsRegulatoryValue.objects.filter(**in_reporting_window)
+            .order_by("id")
+            .values_list("naics_code_id", "reduction_factor", "tightening_rate")
+        ):
+            industry_values.setdefault(naics_code_id, []).append((reduction_factor, tightening_rate))
+
+        overrides: Dict[Tuple[int, int], List[Tuple[Decimal, Decimal]]] = {}
+        for naics_code_id, regulated_product_id, reduction_factor, tightening_rate in (
+            NaicsRegulatoryOverride.objects.filter(**in_reporting_window)
+            .order_by("id")
+            .values_list("naics_code_id", "regulated_product_id", "reduction_factor", "tightening_rate")
+        ):
+            overrides.setdefault((naics_code_id, regulated_product_id), []).append((reduction_factor, tightening_rate))
+
+        emission_intensities: Dict[int, List[Decimal]] = {}
+        for product_id, intensity in (
+            ProductEmissionIntensity.objects.filter(
+                valid_from__year__lte=reporting_year.reporting_year,
+                valid_to__year__gte=reporting_year.reporting_year,
+            )
+            .order_by("id")
+            .values_list("product_id", "product_weighted_average_emission_intensity")
+        ):
+            emission_intensities.setdefault(product_id, []).append(intensity)
+
+        return cls(
+            reporting_year=reporting_year.reporting_year,
+            reporting_window=(reporting_year.reporting_window_start, reporting_year.reporting_window_end),
+            fingerprint=fingerprint,
+            industry_values=MappingProxyType({key: tuple(values) for key, values in industry_values.items()}),
+            overrides=MappingProxyType({key: tuple(values) for key, values in overrides.items()}),
+            emission_intensities=MappingProxyType({key: tuple(values) for key, values in emission_intensities.items()}),
+        )
+
+    def get_industry_regulatory_values(self, naics_code_id: int) -> RegulatoryValues:
+        # Same errors as NaicsRegulatoryValue.objects.get()
+        values = self.industry_values.get(naics_code_id, ())
+        if not values:
+            raise NaicsRegulatoryValue.DoesNotExist("NaicsRegulatoryValue matching query does not exist.")
+        if len(values) > 1:
+            raise NaicsRegulatoryValue.MultipleObjectsReturned(
+                f"get() returned more than one NaicsRegulatoryValue -- it returned {len(values)}!"
+            )
+        reduction_factor, tightening_rate = values[0]
+        return RegulatoryValues(
+            initial_compliance_period=INITIAL_COMPLIANCE_PERIOD,
+            compliance_period=self.reporting_year,
+            reduction_factor=reduction_factor,
+            tightening_rate=tightening_rate,
+        )
+
+    def get_regulatory_values_override(self, naics_code_id: int, regulated_product_id: int) -> RegulatoryValuesOverride:
+        values = self.overrides.get((naics_code_id, regulated_product_id), ())
+        if len(values) > 1:
+            raise NaicsRegulatoryOverride.MultipleObjectsReturned(
+                f"More than one regulatory override for product {regulated_product_id}"
+            )
+        if not values:
+            return RegulatoryValuesOverride()
+        reduction_factor, tightening_rate = values[0]
+        return RegulatoryValuesOverride(
+            reduction_factor_override=reduction_factor, tightening_rate_override=tightening_rate
+        )
+
+    def get_emission_intensity(self, product_id: int) -> Decimal:
+        intensities = self.emission_intensities.get(product_id, ())
+        if not intensities:
+            raise ProductEmissionIntensity.DoesNotExist(
+                f"No emission intensity for product {product_id} in {self.reporting_year}"
+            )
+        if len(intensities) > 1:
+            raise ProductEmissionIntensity.MultipleObjectsReturned(
+                f"Multiple emission intensities for product {product_id} in {self.reporting_year}"
+            )
+        return intensities[0]
+
+
+# Reporting year -> snapshot of its regulatory parameters, shared by the threads of the process
+_snapshots: Dict[int, RegulatoryParameterSnapshot] = {}
+
+
+def get_regulatory_parameter_snapshot(reporting_year: ReportingYear) -> RegulatoryParameterSnapshot:
+    """
+    The regulatory parameters of the reporting year, rebuilt only when the configuration tables or the reporting
+    window changed. Checking for changes is a single cheap query; pass the snapshot along to compute many reports
+    without checking again.
+    """
+    fingerprint = RegulatoryParameterSnapshot.current_fingerprint()
+    snapshot = _snapshots.get(reporting_year.reporting_year)
+    if (
+        snapshot is None
+        or snapshot.fingerprint != fingerprint
+        or snapshot.reporting_window != (reporting_year.reporting_window_start, reporting_year.reporting_window_end)
+    ):
+        # The snapshot is immutable, so concurrent requests can share it; a race only builds it twice
+        snapshot = RegulatoryParameterSnapshot.build(reporting_year, fingerprint)
+        _snapshots[reporting_year.reporting_year] = snapshot
+    return snapshot
+
+
+def _get_naics_code_id(report_version: ReportVersion) -> int:
     naics_code_id = ReportOperation.objects.get(report_version_id=report_version.id).naics_code_id
     if naics_code_id is None:
         raise ValueError(f"No NAICS code associated with report version {report_version.id}")
-    compliance_year = report_version.report.reporting_year.reporting_year
+    return naics_code_id
 
-    regulatory_values = NaicsRegulatoryValue.objects.get(
-        naics_code_id=naics_code_id,
-        valid_from__lte=report_version.report.reporting_year.reporting_window_start,
-        valid_to__gte=report_version.report.reporting_year.reporting_window_end,
-    )
 
-    return RegulatoryValues(
-        initial_compliance_period=2024,
-        compliance_period=compliance_year,
-        reduction_factor=regulatory_values.reduction_factor,
-        tightening_rate=regulatory_values.tightening_rate,
-    )
+def get_industry_regulatory_values(
+    report_version: ReportVersion, snapshot: Optional[RegulatoryParameterSnapshot] = None
+) -> RegulatoryValues:
+    """
+    Returns the regulatory values setup for the industry, for a specific report version.
+    If specific exemptions exist for some products, this method won't be reflecting them.
+    """
+    naics_code_id = _get_naics_code_id(report_version)
+    snapshot = snapshot or get_regulatory_parameter_snapshot(report_version.report.reporting_year)
+    return snapshot.get_industry_regulatory_values(naics_code_id)
 
 
 def get_product_regulatory_values_override(
-    report_version: ReportVersion, regulated_product_id: int
+    report_version: ReportVersion, regulated_product_id: int, snapshot: Optional[RegulatoryParameterSnapshot] = None
 ) -> RegulatoryValuesOverride:
     """
     Returns the product-specific regulatory values, defaulting to the industry values if no exception exists.
     """
-    naics_code_id = ReportOperation.objects.get(report_version_id=report_version.id).naics_code_id
-    if naics_code_id is None:
-        raise ValueError(f"No NAICS code associated with report version {report_version.id}")
-    try:
-        regulatory_values_overrides = NaicsRegulatoryOverride.objects.get(
-            naics_code_id=naics_code_id,
-            regulated_product_id=regulated_product_id,
-            valid_from__lte=report_version.report.reporting_year.reporting_window_start,
-            valid_to__gte=report_version.report.reporting_year.reporting_window_end,
-        )
-        return RegulatoryValuesOverride(
-            reduction_factor_override=regulatory_values_overrides.reduction_factor,
-            tightening_rate_override=regulatory_values_overrides.tightening_rate,
-        )
-    except NaicsRegulatoryOverride.DoesNotExist:
-        return RegulatoryValuesOverride()
+    naics_code_id = _get_naics_code_id(report_version)
+    snapshot = snapshot or get_regulatory_parameter_snapshot(report_version.report.reporting_year)
+    return snapshot.get_regulatory_values_override(naics_code_id, regulated_product_id)
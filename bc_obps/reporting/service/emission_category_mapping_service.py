@@ -1,75 +1,136 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+from django.contrib.postgres.aggregates import StringAgg
+from django.db.models import CharField, Value
+from django.db.models.functions import MD5, Concat
 from registration.models.activity import Activity
+from reporting.models.emission_category import EmissionCategory
 from reporting.models.report_emission import ReportEmission
 from reporting.models.report_fuel import ReportFuel
 from reporting.models.report_source_type import ReportSourceType
 from reporting.models.emission_category_mapping import EmissionCategoryMapping
 
+# Fuel classification -> name of the fuel_excluded category it maps to
+FUEL_EXCLUDED_CATEGORY_NAMES = {
+    'Woody Biomass': 'CO2 emissions from excluded woody biomass',
+    'Other Exempted Biomass': 'Other emissions from excluded biomass',
+    'Exempted Non-biomass': 'Emissions from excluded non-biomass',
+}
+WOODY_BIOMASS_CLASSIFICATION = 'Woody Biomass'
 
-class EmissionCategoryMappingService:
+# (activity id, source type id, emission category type, fuel classification)
+MappingKey = Tuple[int, int, str, Optional[str]]
+
+
+@dataclass(frozen=True)
+class EmissionCategoryMappingIndex:
     """
-    Service that applies an emission category to an emission based on the reported activity, source_type and in the case of fuel_excluded categories, fuel_classification
+    The emission category mapping table, indexed in memory to resolve the categories of emissions without queries.
+    Emission category ids are keyed by (activity, source type, category type, fuel classification); the fuel
+    classification is only set for fuel_excluded categories.
     """
 
+    fingerprint: str
+    category_ids: Mapping[MappingKey, Tuple[int, ...]]
+    # (activity id, source type id) pairs that have any fuel_excluded category
+    fuel_excluded_source_types: FrozenSet[Tuple[int, int]]
+    pulp_and_paper_activity_ids: FrozenSet[int]
+
     @staticmethod
-    def apply_emission_categories(
-        report_source_type: ReportSourceType,
-        report_fuel: ReportFuel | None,
-        report_emission: ReportEmission,
-        methodology_data: dict,
-    ) -> None:
-        categories_set = []
-        activity_id = report_source_type.report_activity.activity.id
-        source_type_id = report_source_type.source_type.id
-        basic = EmissionCategoryMapping.objects.get(
-            activity_id=activity_id, source_type_id=source_type_id, emission_category__category_type='basic'
-        ).emission_category.id
-        categories_set.append(basic)
-
-        if report_fuel:
-            fuel_classification = report_fuel.fuel_type.classification
-            fuel_excluded = EmissionCategoryMapping.objects.filter(
-                activity_id=activity_id, source_type_id=source_type_id, emission_category__category_type='fuel_excluded'
-            )
-            if fuel_excluded:
-                if fuel_classification == 'Woody Biomass':
-                    categories_set.append(
-                        fuel_excluded.get(
-                            emission_category__category_name='CO2 emissions from excluded woody biomass'
-                        ).emission_category.id
-                    )
-                if fuel_classification == 'Other Exempted Biomass':
-                    categories_set.append(
-                        fuel_excluded.get(
-                            emission_category__category_name='Other emissions from excluded biomass'
-                        ).emission_category.id
+    def current_fingerprint() -> str:
+        """A hash of the mapping table, which changes whenever mappings are reloaded or edited."""
+        return (
+            EmissionCategoryMapping.objects.aggregate(
+                fingerprint=MD5(
+                    StringAgg(
+                        Concat(
+                            "id",
+                            Value(":"),
+                            "activity_id",
+                            Value(":"),
+                            "source_type_id",
+                            Value(":"),
+                            "emission_category_id",
+                            output_field=CharField(),
+                        ),
+                        delimiter=",",
+                        ordering="id",
                     )
-                if fuel_classification == 'Exempted Non-biomass':
-                    categories_set.append(
-                        fuel_excluded.get(
-                            emission_category__category_name='Emissions from excluded non-biomass'
-                        ).emission_category.id
-                    )
-        other = EmissionCategoryMapping.objects.filter(
-            activity_id=activity_id, source_type_id=source_type_id, emission_category__category_type='other_excluded'
-        ).first()
+                )
+            )["fingerprint"]
+            or ""
+        )
+
+    @classmethod
+    def build(cls, fingerprint: str) -> "EmissionCategoryMappingIndex":
+        classifications = {name: classification for classification, name in FUEL_EXCLUDED_CATEGORY_NAMES.items()}
+        category_ids: Dict[MappingKey, List[int]] = {}
+        for mapping in EmissionCategoryMapping.objects.select_related("emission_category").order_by("id"):
+            category = mapping.emission_category
+            fuel_classification = (
+                classifications.get(category.category_name)
+                if category.category_type == EmissionCategory.EmissionCategoryType.FUEL_EXCLUDED
+                else None
+            )
+            key = (mapping.activity_id, mapping.source_type_id, category.category_type, fuel_classification)
+            category_ids.setdefault(key, []).append(category.id)
+
+        return cls(
+            fingerprint=fingerprint,
+            category_ids=MappingProxyType({key: tuple(ids) for key, ids in category_ids.items()}),
+            fuel_excluded_source_types=frozenset(
+                (activity_id, source_type_id)
+                for activity_id, source_type_id, category_type, _ in category_ids
+                if category_type == EmissionCategory.EmissionCategoryType.FUEL_EXCLUDED
+            ),
+            pulp_and_paper_activity_ids=frozenset(
+                Activity.objects.filter(slug='pulp_and_paper').values_list("id", flat=True)
+            ),
+        )
+
+    def get_emission_category_ids(
+        self, activity_id: int, source_type_id: int, fuel_classification: Optional[str], methodology_data: dict
+    ) -> List[int]:
+        """
+        The categories of an emission reported under the activity and source type, for a fuel of the given
+        classification (None if the emission has no fuel).
+        """
+        categories = [self._get_one(activity_id, source_type_id, EmissionCategory.EmissionCategoryType.BASIC)]
+
+        if (
+            fuel_classification in FUEL_EXCLUDED_CATEGORY_NAMES
+            and (activity_id, source_type_id) in self.fuel_excluded_source_types
+        ):
+            categories.append(
+                self._get_one(
+                    activity_id,
+                    source_type_id,
+                    EmissionCategory.EmissionCategoryType.FUEL_EXCLUDED,
+                    fuel_classification,
+                )
+            )
 
+        other = self.category_ids.get(
+            (activity_id, source_type_id, EmissionCategory.EmissionCategoryType.OTHER_EXCLUDED, None)
+        )
         if other:
-            categories_set.append(other.emission_category.id)
-        if EmissionCategoryMappingService.is_pulp_and_paper_woody_biomass(activity_id, methodology_data):
-            categories_set.append(
-                EmissionCategoryMapping.objects.get(
-                    activity_id=activity_id,
-                    source_type_id=source_type_id,
-                    emission_category__category_name='CO2 emissions from excluded woody biomass',
-                ).emission_category.id
+            categories.append(other[0])
+
+        if self.is_pulp_and_paper_woody_biomass(activity_id, methodology_data):
+            categories.append(
+                self._get_one(
+                    activity_id,
+                    source_type_id,
+                    EmissionCategory.EmissionCategoryType.FUEL_EXCLUDED,
+                    WOODY_BIOMASS_CLASSIFICATION,
+                )
             )
 
-        report_emission.emission_categories.set(categories_set)
+        return list(dict.fromkeys(categories))
 
-    @staticmethod
-    def is_pulp_and_paper_woody_biomass(activity_id: int, methodology_data: dict) -> bool:
-        activity = Activity.objects.filter(id=activity_id).first()
-        if activity and activity.slug == 'pulp_and_paper':
+    def is_pulp_and_paper_woody_biomass(self, activity_id: int, methodology_data: dict) -> bool:
+        if activity_id in self.pulp_and_paper_activity_ids:
             if methodology_data['methodology'] in ['Solids-HHV', 'Solids-CC']:
                 return True
             elif methodology_data['methodology'] in [
@@ -79,3 +140,106 @@ class EmissionCategoryMappingService:
                 if methodology_data.get('isWoodyBiomass', False):
                     return True
         return False
+
+    def _get_one(
+        self, activity_id: int, source_type_id: int, category_type: str, fuel_classification: Optional[str] = None
+    ) -> int:
+        # Same errors as EmissionCategoryMapping.objects.get()
+        category_ids = self.category_ids.get((activity_id, source_type_id, category_type, fuel_classification), ())
+        if not category_ids:
+            raise EmissionCategoryMapping.DoesNotExist("EmissionCategoryMapping matching query does not exist.")
+        if len(category_ids) > 1:
+            raise EmissionCategoryMapping.MultipleObjectsReturned(
+                f"get() returned more than one EmissionCategoryMapping -- it returned {len(category_ids)}!"
+            )
+        return category_ids[0]
+
+
+class EmissionCategoryMappingService:
+    """
+    Service that applies an emission category to an emission based on the reported activity, source_type and in the case of fuel_excluded categories, fuel_classification
+    """
+
+    _index: Optional[EmissionCategoryMappingIndex] = None
+
+    @classmethod
+    def get_mapping_index(cls) -> EmissionCategoryMappingIndex:
+        """
+        The mapping index, rebuilt only when the mapping table changed (e.g. fixtures were reloaded).
+        Checking for changes is a single cheap query.
+        """
+        fingerprint = EmissionCategoryMappingIndex.current_fingerprint()
+        index = cls._index
+        if index is None or index.fingerprint != fingerprint:
+            # The index is immutable, so concurrent requests can share it; a race only builds it twice
+            index = EmissionCategoryMappingIndex.build(fingerprint)
+            cls._index = index
+        return index
+
+    @classmethod
+    def get_emission_category_ids(
+        cls,
+        report_source_type: ReportSourceType,
+        report_fuel: ReportFuel | None,
+        methodology_data: dict,
+        index: Optional[EmissionCategoryMappingIndex] = None,
+    ) -> List[int]:
+        index = index or cls.get_mapping_index()
+        return index.get_emission_category_ids(
+            report_source_type.report_activity.activity_id,
+            report_source_type.source_type_id,
+            report_fuel.fuel_type.classification if report_fuel else None,
+            methodology_data,
+        )
+
+    @classmethod
+    def apply_emission_categories(
+        cls,
+        report_source_type: ReportSourceType,
+        report_fuel: ReportFuel | None,
+        report_emission: ReportEmission,
+        methodology_data: dict,
+        index: Optional[EmissionCategoryMappingIndex] = None,
+    ) -> None:
+        """
+        Sets the categories of one emission. Callers applying categories to many emissions should fetch the index
+        once with `get_mapping_index` and pass it in, since fetching it checks the whole mapping table for changes.
+        """
+        report_emission.emission_categories.set(
+            cls.get_emission_category_ids(report_source_type, report_fuel, methodology_data, index)
+        )
+
+    @staticmethod
+    def set_emission_categories(emission_category_ids: Mapping[int, Iterable[int]]) -> None:
+        """
+        Sets the categories of many emissions (emission id -> category ids) at once: stale category rows are removed
+        with one delete and missing ones added with one bulk insert.
+        """
+        through_model = ReportEmission.emission_categories.through
+        wanted = {
+            (emission_id, category_id)
+            for emission_id, category_ids in emission_category_ids.items()
+            for category_id in category_ids
+        }
+        existing = {
+            row["id"]: (row["reportemission_id"], row["emissioncategory_id"])
+            for row in through_model.objects.filter(reportemission_id__in=emission_category_ids.keys()).values(
+                "id", "reportemission_id", "emissioncategory_id"
+            )
+        }
+
+        stale_ids = [row_id for row_id, pair in existing.items() if pair not in wanted]
+        if stale_ids:
+            through_model.objects.filter(id__in=stale_ids).delete()
+        missing = wanted - set(existing.values())
+        if missing:
+            through_model.objects.bulk_create(
+                [
+                    through_model(reportemission_id=emission_id, emissioncategory_id=category_id)
+                    for emission_id, category_id in sorted(missing)
+                ]
+            )
+
+    @classmethod
+    def is_pulp_and_paper_woody_biomass(cls, activity_id: int, methodology_data: dict) -> bool:
+        return cls.get_mapping_index().is_pulp_and_paper_woody_biomass(activity_id, methodology_data)
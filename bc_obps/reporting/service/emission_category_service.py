@@ -1,11 +1,68 @@
 from reporting.models import EmissionCategory
 from reporting.models.report_emission import ReportEmission
 from decimal import Decimal
-from django.db.models import Sum, OuterRef, Subquery
-from typing import Dict, List
+from dataclasses import dataclass, field
+import operator
+from functools import reduce
+from django.db.models import Exists, F, OuterRef, Q, QuerySet, Sum
+from typing import Any, Dict, Iterable, List, Mapping
 
 # Fugitive, venting non-useful, fuel_excluded, other_excluded
 REPORTING_ONLY_CATEGORY_IDS = [2, 7, 10, 11, 12, 13, 14]
+EMISSION_CATEGORY_IDS = list(range(1, 15))
+BASIC_CATEGORY_IDS = list(range(1, 10))
+INDUSTRIAL_PROCESS_CATEGORY_ID = 3
+WOODY_BIOMASS_CATEGORY_ID = 10
+# Woody biomass, other excluded biomass
+EXCLUDED_BIOMASS_CATEGORY_IDS = [10, 11]
+
+# Keys of the category totals dict, by emission category id
+CATEGORY_TOTAL_KEYS = {
+    1: 'flaring',
+    2: 'fugitive',
+    3: 'industrial_process',
+    4: 'onsite',
+    5: 'stationary',
+    6: 'venting_useful',
+    7: 'venting_non_useful',
+    8: 'waste',
+    9: 'wastewater',
+    10: 'woody_biomass',
+    11: 'excluded_biomass',
+    12: 'excluded_non_biomass',
+    13: 'lfo_excluded',
+}
+
+
+@dataclass(frozen=True)
+class EmissionCategoryTotals:
+    """
+    Emission totals of a facility report or report version, by emission category id.
+    An emission with several categories counts towards each of them, but only once towards reporting_only.
+    """
+
+    by_category: Dict[int, Decimal] = field(default_factory=dict)
+    reporting_only: Decimal = Decimal(0)
+    industrial_process_excluded_biomass_overlap: Decimal = Decimal(0)
+
+    def category_total(self, emission_category_id: int) -> Decimal:
+        return self.by_category.get(emission_category_id, Decimal(0))
+
+    @property
+    def attributable_for_reporting(self) -> Decimal:
+        return sum((self.category_total(category_id) for category_id in BASIC_CATEGORY_IDS), Decimal(0))
+
+    @property
+    def attributable_for_threshold(self) -> Decimal:
+        return self.attributable_for_reporting - self.category_total(WOODY_BIOMASS_CATEGORY_ID)
+
+    def as_dict(self) -> Dict[str, Decimal | int]:
+        return {
+            **{key: self.category_total(category_id) for category_id, key in CATEGORY_TOTAL_KEYS.items()},
+            'attributable_for_reporting': self.attributable_for_reporting,
+            'attributable_for_threshold': self.attributable_for_threshold,
+            'reporting_only': self.reporting_only,
+        }
 
 
 class EmissionCategoryService:
@@ -19,179 +76,122 @@ class EmissionCategoryService:
 
     @staticmethod
     def get_total_emissions_by_emission_category(facility_report_id: int, emission_category_id: int) -> Decimal | int:
-        records = ReportEmission.objects_with_decimal_emissions.filter(
+        records = ReportEmission.objects.filter(
             report_source_type__report_activity__facility_report_id=facility_report_id,
             emission_categories__id=emission_category_id,
         )
-        category_sum = records.aggregate(emission_sum=Sum('emission'))
+        category_sum = records.aggregate(emission_sum=Sum('equivalent_emission'))
 
         return category_sum['emission_sum'] or 0
 
     @staticmethod
     def get_reporting_only_emissions(facility_report_id: int) -> Decimal | int:
 
-        records = ReportEmission.objects_with_decimal_emissions.filter(
+        records = ReportEmission.objects.filter(
             report_source_type__report_activity__facility_report_id=facility_report_id,
             emission_categories__id__in=REPORTING_ONLY_CATEGORY_IDS,
         ).distinct()
 
-        total_reporting_only = records.aggregate(emission_sum=Sum('emission'))
+        total_reporting_only = records.aggregate(emission_sum=Sum('equivalent_emission'))
         return total_reporting_only['emission_sum'] or 0
 
     @classmethod
     def get_all_category_totals(cls, facility_report_id: int) -> Dict[str, Decimal | int]:
-        # BASIC
-        flaring_total = EmissionCategoryService.get_total_emissions_by_emission_category(facility_report_id, 1)
-        fugitive_total = EmissionCategoryService.get_total_emissions_by_emission_category(facility_report_id, 2)
-        industrial_process_total = EmissionCategoryService.get_total_emissions_by_emission_category(
-            facility_report_id, 3
-        )
-        onsite_transportation_total = EmissionCategoryService.get_total_emissions_by_emission_category(
-            facility_report_id, 4
-        )
-        stationary_combustion_total = EmissionCategoryService.get_total_emissions_by_emission_category(
-            facility_report_id, 5
-        )
-        venting_useful_total = EmissionCategoryService.get_total_emissions_by_emission_category(facility_report_id, 6)
-        venting_non_useful_total = EmissionCategoryService.get_total_emissions_by_emission_category(
-            facility_report_id, 7
-        )
-        waste_total = EmissionCategoryService.get_total_emissions_by_emission_category(facility_report_id, 8)
-        wastewater_total = EmissionCategoryService.get_total_emissions_by_emission_category(facility_report_id, 9)
-        # FUEL EXCLUDED
-        woody_biomass_total = EmissionCategoryService.get_total_emissions_by_emission_category(facility_report_id, 10)
-        excluded_biomass_total = EmissionCategoryService.get_total_emissions_by_emission_category(
-            facility_report_id, 11
-        )
-        excluded_non_biomass_total = EmissionCategoryService.get_total_emissions_by_emission_category(
-            facility_report_id, 12
-        )
-        # OTHER EXCLUDED
-        lfo_excluded_total = EmissionCategoryService.get_total_emissions_by_emission_category(facility_report_id, 13)
-
-        # ATTRIBUTABLE EMISSIONS
-        attributable_for_reporting = (
-            flaring_total
-            + fugitive_total
-            + industrial_process_total
-            + onsite_transportation_total
-            + stationary_combustion_total
-            + venting_useful_total
-            + venting_non_useful_total
-            + waste_total
-            + wastewater_total
-        )
-        attributable_for_threshold = attributable_for_reporting - woody_biomass_total
-        reporting_only = EmissionCategoryService.get_reporting_only_emissions(facility_report_id)
-
-        return {
-            'flaring': flaring_total,
-            'fugitive': fugitive_total,
-            'industrial_process': industrial_process_total,
-            'onsite': onsite_transportation_total,
-            'stationary': stationary_combustion_total,
-            'venting_useful': venting_useful_total,
-            'venting_non_useful': venting_non_useful_total,
-            'waste': waste_total,
-            'wastewater': wastewater_total,
-            'woody_biomass': woody_biomass_total,
-            'excluded_biomass': excluded_biomass_total,
-            'excluded_non_biomass': excluded_non_biomass_total,
-            'lfo_excluded': lfo_excluded_total,
-            'attributable_for_reporting': attributable_for_reporting,
-            'attributable_for_threshold': attributable_for_threshold,
-            'reporting_only': reporting_only,
-        }
+        return cls.get_category_totals_by_facility_report(facility_report_id).as_dict()
 
     # Methods by version (below) work for SFO and LFO total summaries, but not for summaries for individual facilities of an LFO
     @staticmethod
     def get_total_emissions_by_emission_category_and_version(
         version_id: int, emission_category_id: int
     ) -> Decimal | int:
-        records = ReportEmission.objects_with_decimal_emissions.filter(
+        records = ReportEmission.objects.filter(
             report_version_id=version_id,
             emission_categories__id=emission_category_id,
         )
-        category_sum = records.aggregate(emission_sum=Sum('emission'))
+        category_sum = records.aggregate(emission_sum=Sum('equivalent_emission'))
 
         return category_sum['emission_sum'] or 0
 
     @staticmethod
     def get_reporting_only_emissions_by_version(version_id: int) -> Decimal | int:
-        records = ReportEmission.objects_with_decimal_emissions.filter(
+        records = ReportEmission.objects.filter(
             report_version_id=version_id,
             emission_categories__id__in=REPORTING_ONLY_CATEGORY_IDS,
         ).distinct()
 
-        total_reporting_only = records.aggregate(emission_sum=Sum('emission'))
+        total_reporting_only = records.aggregate(emission_sum=Sum('equivalent_emission'))
         return total_reporting_only['emission_sum'] or 0
 
+    @classmethod
+    def get_all_category_totals_by_version(cls, version_id: int) -> Dict[str, Decimal | int]:
+        return cls.get_category_totals_by_report_version(version_id).as_dict()
+
+    # Rollups: every category total, the reporting-only total and the industrial process / excluded biomass overlap
+    # in a single grouped query
+    @classmethod
+    def get_category_totals_by_facility_report(cls, facility_report_id: int) -> EmissionCategoryTotals:
+        return cls.get_category_totals_by_facility_reports([facility_report_id])[facility_report_id]
+
+    @classmethod
+    def get_category_totals_by_facility_reports(
+        cls, facility_report_ids: Iterable[int]
+    ) -> Dict[int, EmissionCategoryTotals]:
+        """
+        Totals for many facility reports at once (e.g. all the facilities of an LFO), keyed by facility report id.
+        Facility reports without emissions get zero totals.
+        """
+        facility_report_ids = list(facility_report_ids)
+        return cls._rollup(
+            ReportEmission.objects.filter(
+                report_source_type__report_activity__facility_report_id__in=facility_report_ids
+            ),
+            "report_source_type__report_activity__facility_report_id",
+            facility_report_ids,
+        )
+
+    @classmethod
+    def get_category_totals_by_report_version(cls, version_id: int) -> EmissionCategoryTotals:
+        return cls._rollup(
+            ReportEmission.objects.filter(report_version_id=version_id),
+            "report_version_id",
+            [version_id],
+        )[version_id]
+
     @staticmethod
-    def get_all_category_totals_by_version(version_id: int) -> Dict[str, Decimal | int]:
-        totals = EmissionCategory.objects.annotate(
-            total=Subquery(
-                ReportEmission.objects_with_decimal_emissions.filter(
-                    report_version_id=version_id, emission_categories__id=OuterRef("id")
-                )
-                .values("emission_categories__id")
-                .annotate(emission_sum=Sum("emission"))
-                .values("emission_sum")[:1]
+    def _rollup(
+        emissions: QuerySet[ReportEmission], group_by: str, group_ids: List[int]
+    ) -> Dict[int, EmissionCategoryTotals]:
+        # An emission can have several categories, and must be counted once in the reporting-only and overlap totals,
+        # so each sum is filtered on whether the emission has any of the categories rather than joining them
+        emission_categories = ReportEmission.emission_categories.through.objects.filter(
+            reportemission_id=OuterRef("pk")
+        )
+
+        def emission_sum(*category_id_sets: List[int]) -> Sum:
+            """Sum of the emissions that have one of the categories of each set."""
+            filters = [Exists(emission_categories.filter(emissioncategory_id__in=ids)) for ids in category_id_sets]
+            return Sum("equivalent_emission", filter=reduce(operator.and_, map(Q, filters)))
+
+        rows: Iterable[Mapping[str, Any]] = (
+            emissions.values(group_id=F(group_by))
+            .annotate(
+                **{f"category_{category_id}": emission_sum([category_id]) for category_id in EMISSION_CATEGORY_IDS},
+                reporting_only=emission_sum(REPORTING_ONLY_CATEGORY_IDS),
+                overlap=emission_sum([INDUSTRIAL_PROCESS_CATEGORY_ID], EXCLUDED_BIOMASS_CATEGORY_IDS),
             )
-        ).values("id", "total")
-        totals_dict = {t["id"]: t["total"] or Decimal(0) for t in list(totals)}
-
-        # BASIC
-        flaring_total = totals_dict[1]
-        fugitive_total = totals_dict[2]
-        industrial_process_total = totals_dict[3]
-        onsite_transportation_total = totals_dict[4]
-        stationary_combustion_total = totals_dict[5]
-        venting_useful_total = totals_dict[6]
-        venting_non_useful_total = totals_dict[7]
-        waste_total = totals_dict[8]
-        wastewater_total = totals_dict[9]
-
-        # FUEL EXCLUDED
-        woody_biomass_total = totals_dict[10]
-        excluded_biomass_total = totals_dict[11]
-        excluded_non_biomass_total = totals_dict[12]
-
-        # OTHER EXCLUDED
-        lfo_excluded_total = totals_dict[13]
-
-        # ATTRIBUTABLE EMISSIONS
-        attributable_for_reporting = (
-            flaring_total
-            + fugitive_total
-            + industrial_process_total
-            + onsite_transportation_total
-            + stationary_combustion_total
-            + venting_useful_total
-            + venting_non_useful_total
-            + waste_total
-            + wastewater_total
+            .order_by()
         )
-        attributable_for_threshold = attributable_for_reporting - woody_biomass_total
-        reporting_only = EmissionCategoryService.get_reporting_only_emissions_by_version(version_id)
 
-        return {
-            'flaring': flaring_total,
-            'fugitive': fugitive_total,
-            'industrial_process': industrial_process_total,
-            'onsite': onsite_transportation_total,
-            'stationary': stationary_combustion_total,
-            'venting_useful': venting_useful_total,
-            'venting_non_useful': venting_non_useful_total,
-            'waste': waste_total,
-            'wastewater': wastewater_total,
-            'woody_biomass': woody_biomass_total,
-            'excluded_biomass': excluded_biomass_total,
-            'excluded_non_biomass': excluded_non_biomass_total,
-            'lfo_excluded': lfo_excluded_total,
-            'attributable_for_reporting': attributable_for_reporting,
-            'attributable_for_threshold': attributable_for_threshold,
-            'reporting_only': reporting_only,
-        }
+        totals = {group_id: EmissionCategoryTotals() for group_id in group_ids}
+        for row in rows:
+            totals[row["group_id"]] = EmissionCategoryTotals(
+                by_category={
+                    category_id: row[f"category_{category_id}"] or Decimal(0) for category_id in EMISSION_CATEGORY_IDS
+                },
+                reporting_only=row["reporting_only"] or Decimal(0),
+                industrial_process_excluded_biomass_overlap=row["overlap"] or Decimal(0),
+            )
+        return totals
 
     @classmethod
     def transform_category_totals_to_summary_form_data(cls, emission_totals: Dict[str, Decimal | int]) -> dict:
@@ -235,26 +235,10 @@ class EmissionCategoryService:
     # This is used in handling exceptions for pulp & paper emission reporting & compliance calculation
     @classmethod
     def get_industrial_process_excluded_biomass_overlap_by_facility(cls, facility_report_id: int) -> Decimal:
-        industrial_process_records = ReportEmission.objects_with_decimal_emissions.filter(
-            emission_categories__id=3,
-            report_source_type__report_activity__facility_report_id=facility_report_id,
-        )
-        woody_biomass_overlap_records = industrial_process_records.filter(emission_categories__id=10)
-        other_biomass_overlap_records = industrial_process_records.filter(emission_categories__id=11)
-        overlapping_records = woody_biomass_overlap_records.union(other_biomass_overlap_records)
-        total_overlapping_emissions = overlapping_records.aggregate(emission_sum=Sum('emission'))
-        return total_overlapping_emissions['emission_sum'] or Decimal(0)
+        return cls.get_category_totals_by_facility_report(
+            facility_report_id
+        ).industrial_process_excluded_biomass_overlap
 
     @classmethod
     def get_industrial_process_excluded_biomass_overlap_by_report_version(cls, report_version_id: int) -> Decimal:
-        industrial_process_records = ReportEmission.objects_with_decimal_emissions.filter(
-            emission_categories__id=3,
-            report_version_id=report_version_id,
-        )
-
-        woody_biomass_overlap_records = industrial_process_records.filter(emission_categories__id=10)
-        other_biomass_overlap_records = industrial_process_records.filter(emission_categories__id=11)
-        overlapping_records = woody_biomass_overlap_records.union(other_biomass_overlap_records)
-        total_overlapping_emissions = overlapping_records.aggregate(emission_sum=Sum('emission'))
-
-        return total_overlapping_emissions['emission_sum'] or Decimal(0)
+        return cls.get_category_totals_by_report_version(report_version_id).industrial_process_excluded_biomass_overlap
@@ -0,0 +1,472 @@
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, TypeVar
+from django.db import transaction
+from django.db.models import ForeignKey, Model, Q, QuerySet
+from common.constants import AUDIT_FIELDS
+from common.exceptions import UserError
+from reporting.models.activity_source_type_json_schema import ActivitySourceTypeJsonSchema
+from reporting.models.fuel_type import FuelType
+from reporting.models.gas_type import GasType
+from reporting.models.methodology import Methodology
+from reporting.models.report_activity import ReportActivity
+from reporting.models.report_data_base_model import ReportDataBaseModel
+from reporting.models.report_emission import ReportEmission
+from reporting.models.report_fuel import ReportFuel
+from reporting.models.report_methodology import ReportMethodology
+from reporting.models.report_source_type import ReportSourceType
+from reporting.models.report_unit import ReportUnit
+from reporting.models.source_type import SourceType
+from reporting.service.emission_category_mapping_service import EmissionCategoryMappingService
+from reporting.service.report_activity_save_service import ReportActivitySaveService
+from reporting.service.utils import exclude_keys, retrieve_ids, round_using_appropriate_strategy
+
+M = TypeVar("M", bound=ReportDataBaseModel)
+
+# Report data tables in parent -> child order, with the path from each table to its report activity
+REPORT_DATA_MODELS: List[Tuple[Type[ReportDataBaseModel], Optional[str]]] = [
+    (ReportSourceType, "report_activity"),
+    (ReportUnit, "report_source_type__report_activity"),
+    (ReportFuel, "report_source_type__report_activity"),
+    (ReportEmission, "report_source_type__report_activity"),
+    # Methodologies are never deleted on their own, only along with their emission
+    (ReportMethodology, None),
+]
+
+
+class LookupTable:
+    """
+    Rows of a lookup table (source types, fuel types...) indexed by a non-unique field.
+    `get` raises the same exceptions as `Model.objects.get(field=value)`.
+    """
+
+    def __init__(self, queryset: QuerySet, field: str):
+        self.model = queryset.model
+        self.rows: Dict[Any, List[Model]] = defaultdict(list)
+        for row in queryset:
+            self.rows[getattr(row, field)].append(row)
+
+    def get(self, value: Any) -> Any:
+        rows = self.rows.get(value, [])
+        if not rows:
+            raise self.model.DoesNotExist(f"{self.model._meta.object_name} matching query does not exist.")
+        if len(rows) > 1:
+            raise self.model.MultipleObjectsReturned(
+                f"get() returned more than one {self.model._meta.object_name} -- it returned {len(rows)}!"
+            )
+        return rows[0]
+
+
+class ReportActivityBulkSaveService(ReportActivitySaveService):
+    """
+    Saves an activity form like ReportActivitySaveService, with a constant number of queries per table instead of
+    a set of queries per source type, unit, fuel and emission:
+    - the lookup tables (source types, schemas, fuel types, gas types and methodologies) are loaded once
+    - the incoming json tree is diffed in memory against the existing report data rows of the activity
+    - the changes are written with one delete, one bulk_create and one bulk_update per table
+    - emission categories are resolved from the in-memory mapping index and added with one bulk insert
+
+    The json tree is walked in the same order and validated with the same errors as ReportActivitySaveService, and
+    rows are created in the same order, so both services give the same result.
+    """
+
+    @transaction.atomic()
+    def save(self, data: dict) -> ReportActivity:
+        report_activity = self.save_report_activity(data)
+        # Avoids a query per emission when applying emission categories
+        report_activity.activity = self.activity
+
+        if "sourceTypes" in data:
+            self._lookups = self._load_lookups(data["sourceTypes"])
+            self._existing = self._load_existing_rows(report_activity, data["sourceTypes"])
+            self._to_delete: Dict[Type[ReportDataBaseModel], Set[int]] = defaultdict(set)
+            self._to_create: Dict[Type[ReportDataBaseModel], List[ReportDataBaseModel]] = defaultdict(list)
+            self._to_update: Dict[Type[ReportDataBaseModel], Dict[int, ReportDataBaseModel]] = defaultdict(dict)
+            self._updated_fields: Dict[Type[ReportDataBaseModel], Set[str]] = defaultdict(set)
+            self._emission_categories: List[Tuple[ReportSourceType, Optional[ReportFuel], ReportEmission, dict]] = []
+
+            self._delete_missing(ReportSourceType, {"report_activity_id": report_activity.id}, data["sourceTypes"])
+            for source_type_key in data["sourceTypes"]:
+                self._diff_source_type(report_activity, source_type_key, data["sourceTypes"][source_type_key])
+
+            self._write_changes()
+
+        # Save raw data after processing source types
+        self.save_raw_data(data)
+
+        return report_activity
+
+    def _load_lookups(self, source_types_data: dict) -> Dict[Type[Model], LookupTable]:
+        source_type_keys = list(source_types_data)
+        fuel_names: Set[str] = set()
+        gas_types: Set[str] = set()
+        methodologies: Set[str] = set()
+        for fuel_data, emission_data in self._iter_nodes(source_types_data):
+            if fuel_data is not None:
+                fuel_type_data = fuel_data.get("fuelType")
+                if isinstance(fuel_type_data, dict) and isinstance(fuel_type_data.get("fuelName"), str):
+                    fuel_names.add(fuel_type_data["fuelName"])
+            if emission_data is not None:
+                if isinstance(emission_data.get("gasType"), str):
+                    gas_types.add(emission_data["gasType"])
+                methodology_data = emission_data.get("methodology")
+                if isinstance(methodology_data, dict) and isinstance(methodology_data.get("methodology"), str):
+                    methodologies.add(methodology_data["methodology"])
+
+        return {
+            SourceType: LookupTable(SourceType.objects.filter(json_key__in=source_type_keys), "json_key"),
+            ActivitySourceTypeJsonSchema: LookupTable(
+                ActivitySourceTypeJsonSchema.objects.filter(
+                    activity=self.activity,
+                    source_type__json_key__in=source_type_keys,
+                    valid_from__valid_from__lte=self.valid_date,
+                    valid_to__valid_to__gte=self.valid_date,
+                ),
+                "source_type_id",
+            ),
+            FuelType: LookupTable(FuelType.objects.filter(name__in=fuel_names), "name"),
+            GasType: LookupTable(GasType.objects.filter(chemical_formula__in=gas_types), "chemical_formula"),
+            Methodology: LookupTable(Methodology.objects.filter(name__in=methodologies), "name"),
+        }
+
+    @staticmethod
+    def _iter_nodes(source_types_data: dict) -> Iterable[Tuple[Optional[dict], Optional[dict]]]:
+        """
+        Yields the (fuel, None) and (None, emission) nodes of a json tree, skipping over malformed parts;
+        those are reported by the validation while diffing.
+        """
+
+        def as_list(value: Any) -> List[dict]:
+            return [node for node in value if isinstance(node, dict)] if isinstance(value, list) else []
+
+        def emissions_of(node: dict) -> Iterable[Tuple[Optional[dict], Optional[dict]]]:
+            for emission_data in as_list(node.get("emissions")):
+                yield None, emission_data
+
+        def fuels_of(node: dict) -> Iterable[Tuple[Optional[dict], Optional[dict]]]:
+            for fuel_data in as_list(node.get("fuels")):
+                yield fuel_data, None
+                yield from emissions_of(fuel_data)
+
+        for source_type_data in source_types_data.values():
+            if not isinstance(source_type_data, dict):
+                continue
+            for unit_data in as_list(source_type_data.get("units")):
+                yield from fuels_of(unit_data)
+                yield from emissions_of(unit_data)
+            yield from fuels_of(source_type_data)
+            yield from emissions_of(source_type_data)
+
+    def _load_existing_rows(
+        self, report_activity: ReportActivity, source_types_data: dict
+    ) -> Dict[Type[ReportDataBaseModel], Dict[int, Any]]:
+        """
+        The report data rows of the activity, plus any other row referenced by id in the json tree
+        (ReportActivitySaveService looks rows up by id only).
+        """
+        ids: Dict[Type[ReportDataBaseModel], Set[int]] = defaultdict(set)
+        ids[ReportSourceType].update(retrieve_ids(source_types_data))
+        for source_type_data in source_types_data.values():
+            if not isinstance(source_type_data, dict):
+                continue
+            for unit_data in source_type_data.get("units") or []:
+                if isinstance(unit_data, dict) and unit_data.get("id") is not None:
+                    ids[ReportUnit].add(unit_data["id"])
+        for fuel_data, emission_data in self._iter_nodes(source_types_data):
+            if fuel_data is not None and fuel_data.get("id") is not None:
+                ids[ReportFuel].add(fuel_data["id"])
+            if emission_data is not None:
+                if emission_data.get("id") is not None:
+                    ids[ReportEmission].add(emission_data["id"])
+                methodology_data = emission_data.get("methodology")
+                if isinstance(methodology_data, dict) and methodology_data.get("id") is not None:
+                    ids[ReportMethodology].add(methodology_data["id"])
+
+        existing: Dict[Type[ReportDataBaseModel], Dict[int, Any]] = {}
+        for model, activity_path in REPORT_DATA_MODELS:
+            condition = Q(id__in=ids[model])
+            if activity_path:
+                condition |= Q(**{activity_path: report_activity})
+            existing[model] = model._default_manager.filter(condition).in_bulk()
+        return existing
+
+    def _is_deleted(self, model: Type[ReportDataBaseModel], row: Any) -> bool:
+        """Whether a row was deleted, directly or through the deletion of one of its parents."""
+        if row.id in self._to_delete[model]:
+            return True
+        parents: List[Tuple[Type[ReportDataBaseModel], Optional[int]]] = []
+        if model is ReportMethodology:
+            parents = [(ReportEmission, row.report_emission_id)]
+        elif model is not ReportSourceType:
+            parents = [
+                (ReportSourceType, row.report_source_type_id),
+                (ReportUnit, getattr(row, "report_unit_id", None)),
+                (ReportFuel, getattr(row, "report_fuel_id", None)),
+            ]
+        return any(
+            parent_id is not None
+            and parent_id in self._existing[parent_model]
+            and self._is_deleted(parent_model, self._existing[parent_model][parent_id])
+            for parent_model, parent_id in parents
+        )
+
+    def _delete_missing(
+        self, model: Type[ReportDataBaseModel], parent_filter: Dict[str, Any], data: dict | list[dict]
+    ) -> None:
+        """
+        In-memory equivalent of `model.objects.filter(**parent_filter).exclude(id__in=retrieve_ids(data)).delete()`.
+        """
+        if any(value is None for value in parent_filter.values()):
+            # The parent was just created, so it has no rows to delete
+            return
+        kept_ids = set(retrieve_ids(data))
+        for row in self._existing[model].values():
+            if row.id not in kept_ids and all(getattr(row, field) == value for field, value in parent_filter.items()):
+                self._to_delete[model].add(row.id)
+
+    def _upsert(
+        self,
+        model: Type[M],
+        row_id: Optional[int],
+        matches_lookup: Callable[[M], bool],
+        create: Callable[[], M],
+        defaults: Dict[str, Any],
+    ) -> M:
+        """
+        In-memory equivalent of `model.objects.update_or_create(id=row_id, ..., create_defaults=..., defaults=...)`.
+        """
+        row: Optional[M] = self._existing[model].get(row_id) if row_id is not None else None
+        if row is not None and not self._is_deleted(model, row) and matches_lookup(row):
+            changed = False
+            for field_name, value in defaults.items():
+                field = model._meta.get_field(field_name)
+                if isinstance(field, ForeignKey):
+                    changed |= getattr(row, field.attname) != value.pk
+                else:
+                    changed |= getattr(row, field_name) != value
+                setattr(row, field_name, value)
+            if changed:
+                self._to_update[model][row.pk] = row
+                self._updated_fields[model].update(defaults)
+            return row
+
+        row = create()
+        if row_id is not None:
+            row.pk = row_id
+        self._to_create[model].append(row)
+        return row
+
+    def _diff_source_type(self, report_activity: ReportActivity, source_type_slug: str, source_type_data: dict) -> None:
+        source_type = self._lookups[SourceType].get(source_type_slug)
+        json_data = exclude_keys(source_type_data, ["units", "fuels", "emissions", "id"])
+        json_base_schema = self._lookups[ActivitySourceTypeJsonSchema].get(source_type.id)
+
+        if json_base_schema.has_unit and "units" not in source_type_data:
+            raise UserError(f"Source type {source_type_slug} is expecting unit data")
+        elif not json_base_schema.has_unit and json_base_schema.has_fuel and "fuels" not in source_type_data:
+            raise UserError(f"Source type {source_type_slug} is expecting fuel data")
+        elif not json_base_schema.has_unit and not json_base_schema.has_fuel and "emissions" not in source_type_data:
+            raise UserError(f"Source type {source_type_slug} is expecting emission data")
+
+        report_source_type = self._upsert(
+            ReportSourceType,
+            source_type_data.get("id"),
+            lambda row: (
+                row.report_version_id == self.facility_report.report_version_id
+                and row.report_activity_id == report_activity.id
+                and row.source_type_id == source_type.id
+            ),
+            lambda: ReportSourceType(
+                report_version=self.facility_report.report_version,
+                report_activity=report_activity,
+                source_type=source_type,
+                json_data=json_data,
+                activity_source_type_base_schema=json_base_schema,
+            ),
+            {"json_data": json_data},
+        )
+        # Cached for the emission category mapping
+        report_source_type.report_activity = report_activity
+        report_source_type.source_type = source_type
+
+        if json_base_schema.has_unit:
+            self._delete_missing(
+                ReportUnit, {"report_source_type_id": report_source_type.id}, source_type_data["units"]
+            )
+            for unit_data in source_type_data["units"]:
+                self._diff_unit(report_source_type, json_base_schema, unit_data)
+        elif json_base_schema.has_fuel:
+            self._delete_missing(
+                ReportFuel, {"report_source_type_id": report_source_type.id}, source_type_data["fuels"]
+            )
+            for fuel_data in source_type_data["fuels"]:
+                self._diff_fuel(report_source_type, None, fuel_data)
+        else:
+            self._delete_missing(
+                ReportEmission, {"report_source_type_id": report_source_type.id}, source_type_data["emissions"]
+            )
+            for emission_data in source_type_data["emissions"]:
+                self._diff_emission(report_source_type, None, None, emission_data)
+
+    def _diff_unit(
+        self, report_source_type: ReportSourceType, json_base_schema: ActivitySourceTypeJsonSchema, unit_data: dict
+    ) -> None:
+        json_data = exclude_keys(unit_data, ["fuels", "emissions", "id", "type"])
+        report_unit_type = unit_data.get("type", ReportUnit.ReportUnitType.UNIT)
+
+        if json_base_schema.has_fuel and "fuels" not in unit_data:
+            raise UserError("Unit is expecting fuel data")
+        elif not json_base_schema.has_fuel and "emissions" not in unit_data:
+            raise UserError("Unit is expecting emissions data")
+
+        report_unit = self._upsert(
+            ReportUnit,
+            unit_data.get("id"),
+            lambda row: True,
+            lambda: ReportUnit(
+                json_data=json_data,
+                report_source_type=report_source_type,
+                report_version=self.facility_report.report_version,
+                type=report_unit_type,
+            ),
+            {"json_data": json_data, "type": report_unit_type},
+        )
+
+        parent_filter = {"report_source_type_id": report_source_type.id, "report_unit_id": report_unit.id}
+        if json_base_schema.has_fuel:
+            self._delete_missing(ReportFuel, parent_filter, unit_data["fuels"])
+            for fuel_data in unit_data["fuels"]:
+                self._diff_fuel(report_source_type, report_unit, fuel_data)
+        else:
+            self._delete_missing(ReportEmission, parent_filter, unit_data["emissions"])
+            for emission_data in unit_data["emissions"]:
+                self._diff_emission(report_source_type, report_unit, None, emission_data)
+
+    def _diff_fuel(self, report_source_type: ReportSourceType, report_unit: ReportUnit | None, fuel_data: dict) -> None:
+        json_data = exclude_keys(fuel_data, ["emissions", "fuelType", "id"])
+
+        fuel_type_data = fuel_data.get("fuelType")
+        if not isinstance(fuel_type_data, dict):
+            raise UserError("Fuel Name is required")
+
+        fuel_name = fuel_type_data.get("fuelName")
+        if not fuel_name:
+            raise UserError("Fuel Name is required")
+
+        if "annualFuelAmount" not in fuel_data:
+            raise UserError("Annual Fuel Amount is required")
+
+        if "emissions" not in fuel_data:
+            raise UserError("Fuel is expecting emission data")
+
+        fuel_type = self._lookups[FuelType].get(fuel_name)
+
+        report_fuel = self._upsert(
+            ReportFuel,
+            fuel_data.get("id"),
+            lambda row: True,
+            lambda: ReportFuel(
+                json_data=json_data,
+                report_source_type=report_source_type,
+                report_version=self.facility_report.report_version,
+                fuel_type=fuel_type,
+                report_unit=report_unit,
+            ),
+            {"json_data": json_data, "fuel_type": fuel_type},
+        )
+
+        self._delete_missing(
+            ReportEmission,
+            {"report_source_type_id": report_source_type.id, "report_fuel_id": report_fuel.id},
+            fuel_data["emissions"],
+        )
+        for emission_data in fuel_data["emissions"]:
+            self._diff_emission(report_source_type, None, report_fuel, emission_data)
+
+    def _diff_emission(
+        self,
+        report_source_type: ReportSourceType,
+        report_unit: ReportUnit | None,
+        report_fuel: ReportFuel | None,
+        emission_data: dict,
+    ) -> None:
+        json_data = exclude_keys(emission_data, ["gasType", "id", "methodology"])
+        gas_type = self._lookups[GasType].get(emission_data["gasType"])
+        has_2024_reporting_year = self.facility_report.report_version.report.reporting_year_id == 2024
+        # Set equivalent emission value (emission * gwp)
+        equivalent_emission = round_using_appropriate_strategy(
+            json_data["emission"] * gas_type.gwp, has_2024_reporting_year
+        )
+        json_data["equivalentEmission"] = float(equivalent_emission)
+
+        # updated emission_data to include the calculated equivalent emission
+        emission_data["equivalentEmission"] = float(equivalent_emission)
+
+        if "methodology" not in emission_data:
+            raise UserError("Emission is expecting methodology data")
+
+        report_emission = self._upsert(
+            ReportEmission,
+            emission_data.get("id"),
+            lambda row: True,
+            lambda: ReportEmission(
+                json_data=json_data,
+                report_source_type=report_source_type,
+                report_version=self.facility_report.report_version,
+                gas_type=gas_type,
+                report_fuel=report_fuel,
+                report_unit=report_unit,
+            ),
+            {"json_data": json_data, "gas_type": gas_type},
+        )
+        self._emission_categories.append(
+            (report_source_type, report_fuel, report_emission, emission_data["methodology"])
+        )
+
+        methodology_data = emission_data["methodology"]
+        methodology_json_data = exclude_keys(methodology_data, ["methodology", "id"])
+        methodology = self._lookups[Methodology].get(methodology_data["methodology"])
+        self._upsert(
+            ReportMethodology,
+            methodology_data.get("id"),
+            lambda row: True,
+            lambda: ReportMethodology(
+                methodology=methodology,
+                json_data=methodology_json_data,
+                report_version=self.facility_report.report_version,
+                report_emission=report_emission,
+            ),
+            {"json_data": methodology_json_data, "methodology": methodology},
+        )
+
+    @staticmethod
+    def _clean(rows: Iterable[Model]) -> None:
+        """
+        The field validation BaseModel.save runs; foreign keys are skipped since they come from rows loaded or
+        created by this service.
+        """
+        for row in rows:
+            row.clean_fields(exclude=[*AUDIT_FIELDS, *(f.name for f in row._meta.fields if f.is_relation)])
+
+    def _write_changes(self) -> None:
+        for model, _ in REPORT_DATA_MODELS:
+            if self._to_delete[model]:
+                model._default_manager.filter(pk__in=self._to_delete[model]).delete()
+
+        for model, _ in REPORT_DATA_MODELS:
+            if self._to_update[model]:
+                rows = list(self._to_update[model].values())
+                self._clean(rows)
+                model._default_manager.bulk_update(rows, sorted(self._updated_fields[model]))
+            if self._to_create[model]:
+                self._clean(self._to_create[model])
+                model._default_manager.bulk_create(self._to_create[model])
+
+        mapping_index = EmissionCategoryMappingService.get_mapping_index()
+        EmissionCategoryMappingService.set_emission_categories(
+            {
+                report_emission.id: EmissionCategoryMappingService.get_emission_category_ids(
+                    report_source_type, report_fuel, methodology_data, mapping_index
+                )
+                for report_source_type, report_fuel, report_emission, methodology_data in self._emission_categories
+            }
+        )
@@ -1,30 +1,203 @@
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
+from django.db.models import CharField, Prefetch, QuerySet, Value
+from django.db.models.functions import Coalesce, Concat
 from reporting.models.report_activity import ReportActivity
+from reporting.models.report_emission import ReportEmission
+from reporting.models.report_fuel import ReportFuel
+from reporting.models.report_methodology import ReportMethodology
+from reporting.models.report_raw_activity_data import ReportRawActivityData
+from reporting.models.report_source_type import ReportSourceType
+from reporting.models.report_unit import ReportUnit
 from reporting.service.report_activity_serializers import ReportActivitySerializer
 
+FUEL_TYPE_SEPARATOR = "\x1f"
+
+# (model name, id) -> what the serializer reads from related tables for that row (the fuel type of fuels)
+TreeRows = Dict[Tuple[str, int], Optional[str]]
+
 
 class ReportActivityLoadService:
     @classmethod
-    def load(cls, report_version_id: int, facility_id: UUID, activity_id: int) -> dict:
+    def load(cls, report_version_id: int, facility_id: UUID, activity_id: int, use_raw_data: bool = False) -> dict:
         """
         Loads the report activity data from the database structure into a json dictionary.
         If the ReportActivity record is not found, it means this is the first load of the
         form and we can safely return an empty object.
+
+        With use_raw_data, the stored raw activity data is returned instead when it is in sync with the database
+        structure, which takes two queries and skips serialization.
         """
+        if use_raw_data:
+            raw_data = cls.load_raw_data_if_in_sync(report_version_id, facility_id, activity_id)
+            if raw_data is not None:
+                return raw_data
+
         try:
-            r = ReportActivity.objects.prefetch_related(
-                "facility_report",
-                "reportsourcetype_records",
-                "reportsourcetype_records__reportunit_records",
-                "reportsourcetype_records__reportfuel_records",
-                "reportsourcetype_records__reportemission_records",
-                "reportsourcetype_records__reportemission_records__report_methodology",
-                "reportsourcetype_records__reportunit_records__reportfuel_records",
-                "reportsourcetype_records__reportunit_records__reportfuel_records__reportemission_records",
-                "reportsourcetype_records__reportunit_records__reportfuel_records__reportemission_records__report_methodology",
-            ).get(
+            # Every relation read by the serializers is prefetched, so the number of queries doesn't depend on the
+            # number of source types, units, fuels and emissions
+            r = ReportActivity.objects.prefetch_related(*cls.get_serializer_prefetches()).get(
                 report_version_id=report_version_id, facility_report__facility_id=facility_id, activity_id=activity_id
             )
             return ReportActivitySerializer.serialize(r)
         except ReportActivity.DoesNotExist:
             return {}
+
+    @staticmethod
+    def get_serializer_prefetches() -> List[str | Prefetch]:
+        emissions = ReportEmission.objects.select_related("gas_type", "report_methodology__methodology")
+        fuels = ReportFuel.objects.select_related("fuel_type")
+        return [
+            Prefetch(
+                "reportsourcetype_records",
+                queryset=ReportSourceType.objects.select_related("source_type", "activity_source_type_base_schema"),
+            ),
+            "reportsourcetype_records__reportunit_records",
+            Prefetch("reportsourcetype_records__reportfuel_records", queryset=fuels),
+            Prefetch("reportsourcetype_records__reportemission_records", queryset=emissions),
+            Prefetch("reportsourcetype_records__reportunit_records__reportfuel_records", queryset=fuels),
+            Prefetch(
+                "reportsourcetype_records__reportunit_records__reportfuel_records__reportemission_records",
+                queryset=emissions,
+            ),
+            Prefetch("reportsourcetype_records__reportunit_records__reportemission_records", queryset=emissions),
+        ]
+
+    @classmethod
+    def load_raw_data_if_in_sync(cls, report_version_id: int, facility_id: UUID, activity_id: int) -> Optional[dict]:
+        """
+        Returns the raw activity data, shaped like the serialized activity, if it is known to match the database
+        structure; None otherwise. It matches when:
+        - every record in the raw data has an id, and these are exactly the ids of the activity's records,
+        - no record was changed after the raw data was saved,
+        - the fuel types in the raw data are the ones of the fuel records.
+        The save services write the records and the raw data in the same transaction, so this holds after a form was
+        loaded and saved again without adding records.
+        """
+        raw_activity_data = (
+            ReportRawActivityData.objects.filter(
+                report_version_id=report_version_id, facility_report__facility_id=facility_id, activity_id=activity_id
+            )
+            .annotate(changed_at=Coalesce("updated_at", "created_at"))
+            .first()
+        )
+        if raw_activity_data is None or not isinstance(raw_activity_data.json_data.get("id"), int):
+            return None
+
+        raw_rows: TreeRows = {}
+        serialized = cls._collect_raw_rows(raw_activity_data.json_data, raw_rows)
+        if serialized is None:
+            return None
+
+        report_activity_id = raw_activity_data.json_data["id"]
+        changed_at = raw_activity_data.changed_at
+        db_rows: TreeRows = {}
+        for model_name, row_id, row_changed_at, detail in cls._get_tree_rows(
+            report_activity_id, report_version_id, facility_id, activity_id
+        ):
+            if row_changed_at is None or changed_at is None or row_changed_at > changed_at:
+                return None
+            db_rows[(model_name, row_id)] = detail
+
+        return serialized if db_rows == raw_rows else None
+
+    @staticmethod
+    def _get_tree_rows(
+        report_activity_id: int, report_version_id: int, facility_id: UUID, activity_id: int
+    ) -> QuerySet:
+        """(model name, id, last change, fuel type) of every record of the activity, in one query"""
+
+        def rows(queryset: QuerySet, detail: Any = Value(None, output_field=CharField())) -> QuerySet:
+            return queryset.order_by().values_list(
+                Value(queryset.model.__name__, output_field=CharField()),
+                "id",
+                Coalesce("updated_at", "created_at"),
+                detail,
+            )
+
+        fuel_type = Concat(
+            "fuel_type__name",
+            Value(FUEL_TYPE_SEPARATOR),
+            "fuel_type__unit",
+            Value(FUEL_TYPE_SEPARATOR),
+            "fuel_type__classification",
+            output_field=CharField(),
+        )
+        return rows(
+            ReportActivity.objects.filter(
+                id=report_activity_id,
+                report_version_id=report_version_id,
+                facility_report__facility_id=facility_id,
+                activity_id=activity_id,
+            )
+        ).union(
+            rows(ReportSourceType.objects.filter(report_activity_id=report_activity_id)),
+            rows(ReportUnit.objects.filter(report_source_type__report_activity_id=report_activity_id)),
+            rows(ReportFuel.objects.filter(report_source_type__report_activity_id=report_activity_id), fuel_type),
+            rows(ReportEmission.objects.filter(report_source_type__report_activity_id=report_activity_id)),
+            rows(
+                ReportMethodology.objects.filter(
+                    report_emission__report_source_type__report_activity_id=report_activity_id
+                )
+            ),
+            all=True,
+        )
+
+    @classmethod
+    def _collect_raw_rows(cls, data: dict, raw_rows: TreeRows) -> Optional[dict]:
+        """
+        Collects the records referenced in raw activity data, and returns the data shaped like the serialized activity.
+        Returns None if a record has no id, or the data isn't shaped like the serialized activity.
+        """
+
+        def add(model_name: str, node: dict, detail: Optional[str] = None) -> bool:
+            if not isinstance(node.get("id"), int):
+                return False
+            raw_rows[(model_name, node["id"])] = detail
+            return True
+
+        def emissions(nodes: list) -> bool:
+            return all(
+                add("ReportEmission", emission)
+                and "gasType" in emission
+                and isinstance(emission.get("methodology"), dict)
+                and "methodology" in emission["methodology"]
+                and add("ReportMethodology", emission["methodology"])
+                for emission in nodes
+            )
+
+        def fuels(nodes: list) -> bool:
+            for fuel in nodes:
+                fuel_type = fuel.get("fuelType")
+                if not isinstance(fuel_type, dict) or set(fuel_type) != {"fuelName", "fuelUnit", "fuelClassification"}:
+                    return False
+                # Same as the fuel type concatenation of _get_tree_rows, where nulls are empty strings
+                detail = FUEL_TYPE_SEPARATOR.join(
+                    str(fuel_type[key] or "") for key in ("fuelName", "fuelUnit", "fuelClassification")
+                )
+                if not (add("ReportFuel", fuel, detail) and emissions(fuel.get("emissions", []))):
+                    return False
+            return True
+
+        add("ReportActivity", data)
+        serialized = {**data, "sourceTypes": {}}
+        for json_key, source_type in data.get("sourceTypes", {}).items():
+            if not add("ReportSourceType", source_type):
+                return None
+            units = []
+            for unit in source_type.get("units", []):
+                if not add("ReportUnit", unit):
+                    return None
+                # The unit type isn't part of the serialized unit
+                units.append({key: value for key, value in unit.items() if key != "type"})
+            if not (
+                fuels(source_type.get("fuels", []))
+                and emissions(source_type.get("emissions", []))
+                and all(fuels(unit.get("fuels", [])) and emissions(unit.get("emissions", [])) for unit in units)
+            ):
+                return None
+            serialized["sourceTypes"][json_key] = {
+                **source_type,
+                **({"units": units} if "units" in source_type else {}),
+            }
+        return serialized
@@ -1,4 +1,5 @@
 import uuid
+from functools import cached_property
 from django.db import transaction
 from reporting.models.report_version import ReportVersion
 from service.utils.get_report_valid_date_from_version_id import get_report_valid_date_from_version_id
@@ -20,6 +21,7 @@ from reporting.models.report_unit import ReportUnit
 from reporting.models.source_type import SourceType
 from reporting.service.utils import exclude_keys, retrieve_ids, round_using_appropriate_strategy
 from reporting.service.emission_category_mapping_service import (
+    EmissionCategoryMappingIndex,
     EmissionCategoryMappingService,
 )
 from reporting.models.report_raw_activity_data import ReportRawActivityData
@@ -59,13 +61,34 @@ class ReportActivitySaveService:
         self.report_version = ReportVersion.objects.get(pk=report_version_id)
         self.valid_date = get_report_valid_date_from_version_id(self.report_version.id)
 
+    @cached_property
+    def mapping_index(self) -> EmissionCategoryMappingIndex:
+        """The emission category mapping index, fetched once for all the emissions of the activity."""
+        return EmissionCategoryMappingService.get_mapping_index()
+
     @transaction.atomic()
     def save(self, data: dict) -> ReportActivity:
+        report_activity = self.save_report_activity(data)
+
+        # Check if "sourceTypes" exists in the data before processing
+        if "sourceTypes" in data:
+            # Delete the existing report_source_types with an id not in the form_data (this means they've been deleted on the form)
+            ReportSourceType.objects.filter(report_activity=report_activity).exclude(
+                id__in=retrieve_ids(data["sourceTypes"])
+            ).delete()
+
+            for source_type_key in data["sourceTypes"]:
+                self.save_source_type(report_activity, source_type_key, data["sourceTypes"][source_type_key])
+
+        # Save raw data after processing source types
+        self.save_raw_data(data)
+
+        return report_activity
+
+    def save_report_activity(self, data: dict) -> ReportActivity:
         # Excluding the keys that are not part of the json_data
         activity_data = exclude_keys(data, ["sourceTypes", "id"])
 
-        # Save raw json data
-
         # Only one ReportActivity record per report_version/facility/activity should ever exist
         report_activity, _ = ReportActivity.objects.update_or_create(
             id=data.get("id"),
@@ -83,19 +106,6 @@ class ReportActivitySaveService:
             defaults={"json_data": activity_data},
         )
 
-        # Check if "sourceTypes" exists in the data before processing
-        if "sourceTypes" in data:
-            # Delete the existing report_source_types with an id not in the form_data (this means they've been deleted on the form)
-            ReportSourceType.objects.filter(report_activity=report_activity).exclude(
-                id__in=retrieve_ids(data["sourceTypes"])
-            ).delete()
-
-            for source_type_key in data["sourceTypes"]:
-                self.save_source_type(report_activity, source_type_key, data["sourceTypes"][source_type_key])
-
-        # Save raw data after processing source types
-        self.save_raw_data(data)
-
         return report_activity
 
     def save_source_type(
@@ -284,7 +294,7 @@ class ReportActivitySaveService:
             defaults={"json_data": json_data, "gas_type": gas_type},
         )
         EmissionCategoryMappingService.apply_emission_categories(
-            report_source_type, report_fuel, report_emission, emission_data["methodology"]
+            report_source_type, report_fuel, report_emission, emission_data["methodology"], self.mapping_index
         )
 
         self.save_methodology(report_emission, emission_data["methodology"])
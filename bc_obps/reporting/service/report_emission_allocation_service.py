@@ -239,14 +239,12 @@ class ReportEmissionAllocationService:
             dict: emission_category_id -> {category_name, total_category_allocations, emission_category_type}
         """
         emission_categories = EmissionCategory.objects.all()
+        category_totals = EmissionCategoryService.get_category_totals_by_facility_report(facility_report_id)
         emission_categories_totals = {}
         for category in emission_categories:
-            emission_total = EmissionCategoryService.get_total_emissions_by_emission_category(
-                facility_report_id, category.pk
-            )
             emission_categories_totals[category.pk] = {
                 "category_name": category.category_name,
-                "total_category_allocations": emission_total,
+                "total_category_allocations": category_totals.category_total(category.pk),
                 "emission_category_type": category.category_type,
             }
 
@@ -9,6 +9,7 @@ from reporting.signals.signals import report_submitted
 from common.lib import pgtrigger
 from django.db import transaction
 from reporting.service.compliance_service import ComplianceService
+from reporting.service.report_version_snapshot_service import ReportVersionSnapshotService
 from reporting.service.report_validation.report_validation_tags import ValidationTags
 
 
@@ -49,6 +50,10 @@ class ReportSubmissionService:
         report_version.status = ReportVersion.ReportVersionStatus.Submitted
         report_version.save()
 
+        # Freeze the serialized version, so the final review and diff endpoints don't recompute it on every read.
+        # It's saved after the submission commits, so the serializations don't hold the submission's locks.
+        ReportVersionSnapshotService.save_snapshot_on_commit(version_id)
+
         # Send a signal that the report has been submitted
         report_submitted.send(sender=ReportSubmissionService, version_id=version_id, user_guid=user_guid)
 
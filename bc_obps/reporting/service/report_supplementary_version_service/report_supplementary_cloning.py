@@ -1,9 +1,11 @@
-import copy
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, TypeVar
 
 from django.core.files.storage import default_storage
+from django.db import models
 from django.forms import model_to_dict
 
+from common.constants import AUDIT_FIELDS
+
 from reporting.service.emission_category_mapping_service import EmissionCategoryMappingService
 from reporting.models import (
     FacilityReport,
@@ -28,12 +30,54 @@ from reporting.models import (
     ReportSourceType,
     ReportUnit,
     ReportVerification,
+    ReportVerificationVisit,
     ReportVersion,
 )
 
 from django.db.models import Q
 from registration.models import Contact
 
+M = TypeVar("M", bound=models.Model)
+
+BULK_CLONE_BATCH_SIZE = 1000
+
+
+def bulk_clone_rows(model: type[M], rows: Iterable[M], remap: Callable[[M], None]) -> Dict[int, M]:
+    """
+    Insert a copy of each row with one `bulk_create` per batch and return the copies keyed by the original id.
+    `remap` receives each row (still holding its original foreign key ids) and points it at its new parents.
+    Each copy goes through the field and `clean` validation `BaseModel.save` runs; foreign keys are skipped since
+    they point at rows cloned here, and unique constraints are left to the database.
+    """
+    clones_by_old_id: Dict[int, M] = {}
+    for row in rows:
+        old_id = row.pk
+        remap(row)
+        row.pk = None
+        row._state.adding = True
+        row.clean_fields(exclude=[*AUDIT_FIELDS, *(f.name for f in row._meta.fields if f.is_relation)])
+        row.clean()
+        clones_by_old_id[old_id] = row
+    model._default_manager.bulk_create(list(clones_by_old_id.values()), batch_size=BULK_CLONE_BATCH_SIZE)
+    return clones_by_old_id
+
+
+def bulk_clone_m2m(relation: Any, clones_by_old_id: Dict[int, Any]) -> None:
+    """Copy the many-to-many links of the original rows onto their clones; `relation` is the model's m2m descriptor."""
+    through = relation.through
+    source_field = relation.field.m2m_field_name()
+    target_field = relation.field.m2m_reverse_field_name()
+    links = through._default_manager.filter(**{f"{source_field}_id__in": clones_by_old_id.keys()}).values_list(
+        f"{source_field}_id", f"{target_field}_id"
+    )
+    through._default_manager.bulk_create(
+        [
+            through(**{f"{source_field}_id": clones_by_old_id[source_id].pk, f"{target_field}_id": target_id})
+            for source_id, target_id in links
+        ],
+        batch_size=BULK_CLONE_BATCH_SIZE,
+    )
+
 
 def clone_report_version_operation(old_report_version: ReportVersion, new_report_version: ReportVersion) -> None:
     # Retrieve the original operation from the old report version
@@ -54,14 +98,15 @@ def clone_report_version_operation(old_report_version: ReportVersion, new_report
 
 
 def clone_report_version_representatives(old_report_version: ReportVersion, new_report_version: ReportVersion) -> None:
-    # Retrieve all ReportOperationRepresentative instances associated with the old report version
-    representatives_to_clone = ReportOperationRepresentative.objects.filter(report_version=old_report_version)
-
-    # Clone each representative instance for the new report version
-    for representative_to_clone in representatives_to_clone:
-        representative_to_clone.pk = None  # Reset primary key to create a new instance
-        representative_to_clone.report_version = new_report_version
-        representative_to_clone.save()
+    # Clone all ReportOperationRepresentative instances associated with the old report version in one insert
+    def to_new_version(representative: ReportOperationRepresentative) -> None:
+        representative.report_version = new_report_version
+
+    bulk_clone_rows(
+        ReportOperationRepresentative,
+        ReportOperationRepresentative.objects.filter(report_version=old_report_version),
+        to_new_version,
+    )
 
 
 def clone_report_version_person_responsible(
@@ -171,11 +216,11 @@ def clone_report_version_verification(old_report_version: ReportVersion, new_rep
     verification_to_clone.report_version = new_report_version
     verification_to_clone.save()
 
-    # Clone each associated ReportVerificationVisit for the new verification
-    for visit in old_visits:
-        visit.pk = None
+    # Clone the associated ReportVerificationVisit instances for the new verification
+    def to_new_verification(visit: ReportVerificationVisit) -> None:
         visit.report_verification = verification_to_clone
-        visit.save()
+
+    bulk_clone_rows(ReportVerificationVisit, old_visits, to_new_verification)
 
 
 def clone_report_version_attachments(old_report_version: ReportVersion, new_report_version: ReportVersion) -> None:
@@ -192,313 +237,204 @@ def clone_report_version_attachments(old_report_version: ReportVersion, new_repo
 
 
 def clone_report_version_facilities(old_report_version: ReportVersion, new_report_version: ReportVersion) -> None:
-    # Retrieve all FacilityReport instances associated with the old report version.
-    facility_reports_to_clone = FacilityReport.objects.filter(report_version=old_report_version)
-
-    for facility_report_to_clone in facility_reports_to_clone:
-        activities = facility_report_to_clone.activities.all()
-        # Use a deep copy so that the original instance (with its relationships) is preserved.
-        cloned_facility_report = copy.deepcopy(facility_report_to_clone)
-        cloned_facility_report.pk = None  # Reset the primary key.
-        cloned_facility_report.report_version = new_report_version  # Set the new report version.
-        cloned_facility_report.is_completed = False
-        cloned_facility_report.save()
-
-        cloned_facility_report.activities.set(activities)
-
-        clone_report_version_facility_activities(facility_report_to_clone, cloned_facility_report)
-        clone_report_version_facility_non_attributable_emissions(
-            old_report_version, new_report_version, facility_report_to_clone, cloned_facility_report
-        )
-        clone_report_version_facility_product_data(
-            old_report_version, new_report_version, facility_report_to_clone, cloned_facility_report
-        )
+    """
+    Clone every facility report of `old_report_version`, with its activities, source types, units, fuels,
+    emissions, methodologies, non-attributable emissions and product allocations, into `new_report_version`.
 
+    Each table is read once and written with `bulk_create`, so the number of queries depends on the number of
+    tables rather than the size of the report. Old-to-new id maps carry the parent/child links down the tree.
+    """
+    new_version_id = new_report_version.id
 
-def clone_report_version_facility_activities(
-    old_facility_report: FacilityReport, new_facility_report: FacilityReport
-) -> None:
-    # Retrieve and clone each ReportActivity for the new facility report.
-    for report_activity in ReportActivity.objects.filter(facility_report=old_facility_report):
-        clone_report_version_facility_activity(report_activity, new_facility_report)
-
-
-def clone_report_version_facility_activity(
-    old_report_activity_to_clone: ReportActivity, new_facility_report: FacilityReport
-) -> ReportActivity:
-    # Create a deep copy of the old activity so that the original remains unchanged.
-    cloned_report_activity = copy.deepcopy(old_report_activity_to_clone)
-    # Reset the primary key so that Django creates a new record.
-    cloned_report_activity.pk = None
-    # Update the foreign keys to point to the new report and facility.
-    cloned_report_activity.report_version = new_facility_report.report_version
-    cloned_report_activity.facility_report = new_facility_report
-    cloned_report_activity.save()
-
-    # Clone the related ReportRawActivityData record for the activity
-    clone_activity_raw_json_data(old_report_activity_to_clone, new_facility_report)
-
-    # Clone each related ReportSourceType associated with the old activity
-    for old_source_type_to_clone in ReportSourceType.objects.filter(report_activity=old_report_activity_to_clone):
-        clone_activity_source_type(old_source_type_to_clone, cloned_report_activity)
-
-    return cloned_report_activity
-
-
-def clone_activity_raw_json_data(old_activity_to_clone: ReportActivity, new_facility_report: FacilityReport) -> None:
-    try:
-        old_raw_data = ReportRawActivityData.objects.get(
-            facility_report=old_activity_to_clone.facility_report,
-            activity=old_activity_to_clone.activity,
-        )
-    except ReportRawActivityData.DoesNotExist:
-        return
+    def to_new_version(row: models.Model) -> None:
+        row.report_version_id = new_version_id  # type: ignore[attr-defined]
 
-    cloned_raw_data = copy.deepcopy(old_raw_data)
-    cloned_raw_data.pk = None  # Reset the primary key so a new record is created.
-    cloned_raw_data.facility_report = new_facility_report  # Update the relationship to the new facility report.
-    cloned_raw_data.report_version = (  # Update the relationship to the new report version.
-        new_facility_report.report_version
-    )
-    cloned_raw_data.save()
-
-
-def clone_activity_source_type(old_source_type_to_clone: ReportSourceType, new_activity: ReportActivity) -> None:
-    # Clone ReportSourceType using a deep copy.
-    cloned_source_type = copy.deepcopy(old_source_type_to_clone)
-    cloned_source_type.pk = None
-    cloned_source_type.report_version = new_activity.report_version
-    cloned_source_type.report_activity = new_activity
-    cloned_source_type.save()
-
-    # Clone additional related data based on the schema.
-    if old_source_type_to_clone.activity_source_type_base_schema.has_unit:
-        clone_source_type_units(old_source_type_to_clone, cloned_source_type)
-    elif old_source_type_to_clone.activity_source_type_base_schema.has_fuel:
-        clone_source_type_fuels(old_source_type_to_clone, cloned_source_type)
-    else:
-        clone_source_type_emissions(old_source_type_to_clone, cloned_source_type)
-
-
-def clone_source_type_units(old_source_type_to_clone: ReportSourceType, new_source_type: ReportSourceType) -> None:
-    # Clone each ReportUnit related to the source type.
-    old_units_to_clone = ReportUnit.objects.filter(report_source_type=old_source_type_to_clone)
-    for old_unit_to_clone in old_units_to_clone:
-        cloned_unit = copy.deepcopy(old_unit_to_clone)
-        cloned_unit.pk = None
-        cloned_unit.report_version = new_source_type.report_version
-        cloned_unit.report_source_type = new_source_type
-        cloned_unit.save()
-
-        if old_source_type_to_clone.activity_source_type_base_schema.has_fuel:
-            clone_unit_fuels(old_source_type_to_clone, new_source_type, old_unit_to_clone, cloned_unit)
-        else:
-            clone_unit_emissions(old_source_type_to_clone, new_source_type, old_unit_to_clone, cloned_unit)
-
-
-def clone_source_type_fuels(old_source_type_to_clone: ReportSourceType, new_source_type: ReportSourceType) -> None:
-    # Clone ReportFuel instances that are directly related to the source type (with no associated unit).
-    old_fuels_to_clone = ReportFuel.objects.filter(
-        report_source_type=old_source_type_to_clone, report_unit__isnull=True
-    )
-    for old_fuel_to_clone in old_fuels_to_clone:
-        cloned_fuel = copy.deepcopy(old_fuel_to_clone)
-        cloned_fuel.pk = None
-        cloned_fuel.report_version = new_source_type.report_version
-        cloned_fuel.report_source_type = new_source_type
-        cloned_fuel.save()
-        clone_fuel_emissions(old_source_type_to_clone, new_source_type, old_fuel_to_clone, cloned_fuel)
-
-
-def clone_unit_fuels(
-    old_source_type_to_clone: ReportSourceType,
-    new_source_type: ReportSourceType,
-    old_unit_to_clone: ReportUnit,
-    new_unit: ReportUnit,
-) -> None:
-    # Clone ReportFuel instances associated with the given unit.
-    old_fuels_to_clone = ReportFuel.objects.filter(
-        report_source_type=old_source_type_to_clone, report_unit=old_unit_to_clone
-    )
-    for old_fuel_to_clone in old_fuels_to_clone:
-        cloned_fuel = copy.deepcopy(old_fuel_to_clone)
-        cloned_fuel.pk = None
-        cloned_fuel.report_version = new_source_type.report_version
-        cloned_fuel.report_source_type = new_source_type
-        cloned_fuel.report_unit = new_unit
-        cloned_fuel.save()
-        clone_fuel_emissions(old_source_type_to_clone, new_source_type, old_fuel_to_clone, cloned_fuel, new_unit)
-
-
-def _clone_emission_common_fields(
-    old_emission_to_clone: ReportEmission,
-    report_version: ReportVersion,
-    new_source_type: ReportSourceType,
-    new_unit: Optional[ReportUnit] = None,
-    new_fuel: Optional[ReportFuel] = None,
-) -> None:
-    # Clone a ReportEmission instance using deep copy.
-    cloned_emission = copy.deepcopy(old_emission_to_clone)
-    cloned_emission.pk = None
-    cloned_emission.report_version = report_version
-    cloned_emission.report_source_type = new_source_type
-    cloned_emission.report_unit = new_unit
-    cloned_emission.report_fuel = new_fuel
-    cloned_emission.save()
-
-    # Clone the many-to-many emission categories.
-    cloned_emission.emission_categories.set(old_emission_to_clone.emission_categories.all())
-
-    # Clone related methodology.
-    clone_emission_methodology(old_emission_to_clone, cloned_emission)
-
-
-def clone_source_type_emissions(old_source_type_to_clone: ReportSourceType, new_source_type: ReportSourceType) -> None:
-    # Clone ReportEmission instances that have no unit and no fuel.
-    old_emissions_to_clone = ReportEmission.objects.filter(
-        report_source_type=old_source_type_to_clone, report_unit__isnull=True, report_fuel__isnull=True
+    # Facility reports
+    def remap_facility_report(facility_report: FacilityReport) -> None:
+        to_new_version(facility_report)
+        facility_report.is_completed = False
+
+    facility_reports = bulk_clone_rows(
+        FacilityReport,
+        FacilityReport.objects.filter(report_version=old_report_version),
+        remap_facility_report,
     )
-    for old_emission_to_clone in old_emissions_to_clone:
-        _clone_emission_common_fields(
-            old_emission_to_clone,
-            report_version=new_source_type.report_version,
-            new_source_type=new_source_type,
-        )
+    bulk_clone_m2m(FacilityReport.activities, facility_reports)
 
+    # Activities, and their raw form data
+    def remap_to_facility_report(row: models.Model) -> None:
+        to_new_version(row)
+        row.facility_report_id = facility_reports[row.facility_report_id].pk  # type: ignore[attr-defined]
 
-def clone_unit_emissions(
-    old_source_type_to_clone: ReportSourceType,
-    new_source_type: ReportSourceType,
-    old_unit_to_clone: ReportUnit,
-    new_unit: ReportUnit,
-) -> None:
-    # Clone ReportEmission instances associated with a unit (and no fuel).
-    old_emissions_to_clone = ReportEmission.objects.filter(
-        report_source_type=old_source_type_to_clone, report_unit=old_unit_to_clone, report_fuel__isnull=True
+    report_activities = bulk_clone_rows(
+        ReportActivity,
+        ReportActivity.objects.filter(facility_report_id__in=facility_reports.keys()),
+        remap_to_facility_report,
+    )
+    # Raw data is only carried over for activities that have report data
+    cloned_activity_keys = {
+        (activity.facility_report_id, activity.activity_id) for activity in report_activities.values()
+    }
+    bulk_clone_rows(
+        ReportRawActivityData,
+        (
+            raw_data
+            for raw_data in ReportRawActivityData.objects.filter(facility_report_id__in=facility_reports.keys())
+            if (facility_reports[raw_data.facility_report_id].pk, raw_data.activity_id) in cloned_activity_keys
+        ),
+        remap_to_facility_report,
     )
-    for old_emission_to_clone in old_emissions_to_clone:
-        _clone_emission_common_fields(
-            old_emission_to_clone,
-            report_version=new_source_type.report_version,
-            new_source_type=new_source_type,
-            new_unit=new_unit,
-        )
 
+    # Source types
+    def remap_source_type(source_type: ReportSourceType) -> None:
+        to_new_version(source_type)
+        source_type.report_activity_id = report_activities[source_type.report_activity_id].pk
 
-def clone_fuel_emissions(
-    old_source_type_to_clone: ReportSourceType,
-    new_source_type: ReportSourceType,
-    old_fuel_to_clone: ReportFuel,
-    new_fuel: ReportFuel,
-    new_unit: Optional[ReportUnit] = None,
-) -> None:
-    # Clone ReportEmission instances associated with a fuel.
-    old_emissions_to_clone = ReportEmission.objects.filter(
-        report_source_type=old_source_type_to_clone, report_fuel=old_fuel_to_clone
-    )
-    for old_emission_to_clone in old_emissions_to_clone:
-        _clone_emission_common_fields(
-            old_emission_to_clone,
-            report_version=new_source_type.report_version,
-            new_source_type=new_source_type,
-            new_fuel=new_fuel,
-            new_unit=new_unit if old_emission_to_clone.report_unit else None,
+    old_source_types = list(
+        ReportSourceType.objects.filter(report_activity_id__in=report_activities.keys()).select_related(
+            "activity_source_type_base_schema"
         )
+    )
+    schema_by_source_type = {
+        source_type.id: source_type.activity_source_type_base_schema for source_type in old_source_types
+    }
+    source_types = bulk_clone_rows(ReportSourceType, old_source_types, remap_source_type)
+
+    # Units, for source types with units
+    def remap_unit(unit: ReportUnit) -> None:
+        to_new_version(unit)
+        unit.report_source_type_id = source_types[unit.report_source_type_id].pk
+
+    units = bulk_clone_rows(
+        ReportUnit,
+        (
+            unit
+            for unit in ReportUnit.objects.filter(report_source_type_id__in=source_types.keys())
+            if schema_by_source_type[unit.report_source_type_id].has_unit
+        ),
+        remap_unit,
+    )
 
+    # Fuels, under a unit when the source type has units and directly under the source type otherwise
+    def clones_fuel(fuel: ReportFuel) -> bool:
+        schema = schema_by_source_type[fuel.report_source_type_id]
+        if not schema.has_fuel:
+            return False
+        if schema.has_unit:
+            return fuel.report_unit_id in units
+        return fuel.report_unit_id is None
+
+    old_fuel_unit_ids: Dict[int, int | None] = {}
+
+    def remap_fuel(fuel: ReportFuel) -> None:
+        to_new_version(fuel)
+        old_fuel_unit_ids[fuel.id] = fuel.report_unit_id
+        fuel.report_source_type_id = source_types[fuel.report_source_type_id].pk
+        fuel.report_unit_id = units[fuel.report_unit_id].pk if fuel.report_unit_id else None
+
+    fuels = bulk_clone_rows(
+        ReportFuel,
+        (
+            fuel
+            for fuel in ReportFuel.objects.filter(report_source_type_id__in=source_types.keys())
+            if clones_fuel(fuel)
+        ),
+        remap_fuel,
+    )
 
-def clone_emission_methodology(old_emission_to_clone: ReportEmission, new_emission: ReportEmission) -> None:
-    # Clone each ReportMethodology related to the old emission.
-    old_methodologies_to_clone = ReportMethodology.objects.filter(report_emission=old_emission_to_clone)
-    for old_methodology_to_clone in old_methodologies_to_clone:
-        cloned_methodology = copy.deepcopy(old_methodology_to_clone)
-        cloned_methodology.pk = None
-        cloned_methodology.report_version = new_emission.report_version
-        cloned_methodology.report_emission = new_emission
-        cloned_methodology.save()
+    # Emissions, under the deepest of fuel, unit or source type that the source type's schema allows
+    def clones_emission(emission: ReportEmission) -> bool:
+        schema = schema_by_source_type[emission.report_source_type_id]
+        if schema.has_fuel:
+            return emission.report_fuel_id in fuels
+        if schema.has_unit:
+            return emission.report_fuel_id is None and emission.report_unit_id in units
+        return emission.report_fuel_id is None and emission.report_unit_id is None
+
+    def remap_emission(emission: ReportEmission) -> None:
+        to_new_version(emission)
+        new_unit_id = None
+        if emission.report_fuel_id:
+            # A fuel emission keeps a unit only if it had one, and takes its fuel's cloned unit
+            fuel_unit_id = old_fuel_unit_ids[emission.report_fuel_id]
+            if emission.report_unit_id and fuel_unit_id:
+                new_unit_id = units[fuel_unit_id].pk
+            emission.report_fuel_id = fuels[emission.report_fuel_id].pk
+        elif emission.report_unit_id:
+            new_unit_id = units[emission.report_unit_id].pk
+        emission.report_unit_id = new_unit_id
+        emission.report_source_type_id = source_types[emission.report_source_type_id].pk
+
+    emissions = bulk_clone_rows(
+        ReportEmission,
+        (
+            emission
+            for emission in ReportEmission.objects.filter(report_source_type_id__in=source_types.keys())
+            if clones_emission(emission)
+        ),
+        remap_emission,
+    )
+    bulk_clone_m2m(ReportEmission.emission_categories, emissions)
 
+    def remap_methodology(methodology: ReportMethodology) -> None:
+        to_new_version(methodology)
+        methodology.report_emission_id = emissions[methodology.report_emission_id].pk
 
-def clone_report_version_facility_non_attributable_emissions(
-    old_report_version: ReportVersion,
-    new_report_version: ReportVersion,
-    old_facility_report_to_clone: FacilityReport,
-    new_facility_report: FacilityReport,
-) -> None:
-    # Retrieve non-attributable emissions for the old facility report.
-    old_emissions_to_clone = ReportNonAttributableEmissions.objects.filter(
-        report_version=old_report_version, facility_report=old_facility_report_to_clone
+    bulk_clone_rows(
+        ReportMethodology,
+        ReportMethodology.objects.filter(report_emission_id__in=emissions.keys()),
+        remap_methodology,
     )
-    for old_emission_to_clone in old_emissions_to_clone:
-        cloned_emission = copy.deepcopy(old_emission_to_clone)
-        cloned_emission.pk = None
-        cloned_emission.report_version = new_report_version
-        cloned_emission.facility_report = new_facility_report
-        cloned_emission.save()
-        # Preserve the many-to-many gas type relationship.
-        cloned_emission.gas_type.set(old_emission_to_clone.gas_type.all())
-
 
-def clone_report_version_facility_product_data(
-    old_report_version: ReportVersion,
-    new_report_version: ReportVersion,
-    old_facility_report_to_clone: FacilityReport,
-    new_facility_report: FacilityReport,
-) -> None:
-    # Clone the parent ReportEmissionAllocation
-    emission_allocation_to_copy = ReportEmissionAllocation.objects.filter(
-        report_version_id=old_report_version,
-        facility_report=old_facility_report_to_clone,
-    ).first()
-    if emission_allocation_to_copy:
-        emission_allocation_to_copy.pk = None
-        emission_allocation_to_copy._state.adding = True
-        emission_allocation_to_copy.report_version = new_report_version
-        emission_allocation_to_copy.facility_report = new_facility_report
-        emission_allocation_to_copy.save()
-
-    # Retrieve ReportProduct entries for the old facility report.
-    old_report_products_to_clone = ReportProduct.objects.filter(
-        report_version=old_report_version, facility_report=old_facility_report_to_clone
+    # Non-attributable emissions
+    non_attributable_emissions = bulk_clone_rows(
+        ReportNonAttributableEmissions,
+        ReportNonAttributableEmissions.objects.filter(
+            report_version=old_report_version, facility_report_id__in=facility_reports.keys()
+        ),
+        remap_to_facility_report,
+    )
+    bulk_clone_m2m(ReportNonAttributableEmissions.gas_type, non_attributable_emissions)
+
+    # Product data and emission allocations
+    emission_allocations = bulk_clone_rows(
+        ReportEmissionAllocation,
+        ReportEmissionAllocation.objects.filter(
+            report_version=old_report_version, facility_report_id__in=facility_reports.keys()
+        ),
+        remap_to_facility_report,
+    )
+    new_emission_allocation_ids = {
+        allocation.facility_report_id: allocation.pk for allocation in emission_allocations.values()
+    }
+
+    def remap_product(product: ReportProduct) -> None:
+        remap_to_facility_report(product)
+        # The year checks `ReportProduct.save` runs read the report through the version, so share the loaded one
+        product.report_version = new_report_version
+        product.validate_reporting_year_production_data()
+
+    products = bulk_clone_rows(
+        ReportProduct,
+        ReportProduct.objects.filter(report_version=old_report_version, facility_report_id__in=facility_reports.keys()),
+        remap_product,
     )
-    for old_report_product_to_clone in old_report_products_to_clone:
-        cloned_report_product = copy.deepcopy(old_report_product_to_clone)
-        cloned_report_product.pk = None
-        cloned_report_product.report_version = new_report_version
-        cloned_report_product.facility_report = new_facility_report
-        cloned_report_product.save()
-        clone_report_version_facility_product_emission_allocations(
-            old_report_version=old_report_version,
-            new_report_version=new_report_version,
-            new_facility_report=new_facility_report,
-            old_report_product_to_clone=old_report_product_to_clone,
-            new_report_product=cloned_report_product,
-        )
 
+    def remap_product_allocation(allocation: ReportProductEmissionAllocation) -> None:
+        to_new_version(allocation)
+        new_product = products[allocation.report_product_id]
+        allocation.report_product_id = new_product.pk
+        allocation.report_emission_allocation_id = new_emission_allocation_ids.get(
+            new_product.facility_report_id, allocation.report_emission_allocation_id
+        )
 
-def clone_report_version_facility_product_emission_allocations(
-    old_report_version: ReportVersion,
-    new_report_version: ReportVersion,
-    new_facility_report: FacilityReport,
-    old_report_product_to_clone: ReportProduct,
-    new_report_product: ReportProduct,
-) -> None:
-    # Retrieve ReportProductEmissionAllocation entries for the old report product.
-    old_allocations_to_clone = ReportProductEmissionAllocation.objects.filter(
-        report_version_id=old_report_version,
-        report_product=old_report_product_to_clone,
+    bulk_clone_rows(
+        ReportProductEmissionAllocation,
+        ReportProductEmissionAllocation.objects.filter(
+            report_version=old_report_version, report_product_id__in=products.keys()
+        ),
+        remap_product_allocation,
     )
-    # Retrieve ReportEmissionAllocation
-    new_report_emission_allocation = ReportEmissionAllocation.objects.filter(
-        report_version_id=new_report_version,
-        facility_report=new_facility_report,
-    ).first()
-    for old_allocation_to_clone in old_allocations_to_clone:
-        cloned_product_allocation = copy.deepcopy(old_allocation_to_clone)
-        cloned_product_allocation.pk = None
-        cloned_product_allocation.report_version = new_report_version
-        if new_report_emission_allocation:
-            cloned_product_allocation.report_emission_allocation = new_report_emission_allocation
-        cloned_product_allocation.report_product = new_report_product
-        cloned_product_allocation.save()
 
 
 def reapply_emission_categories(report_version: ReportVersion) -> None:
@@ -508,6 +444,7 @@ def reapply_emission_categories(report_version: ReportVersion) -> None:
     have occurred in the database since the report was last updated.
     """
     report_emissions = ReportEmission.objects.filter(report_version=report_version).select_related("report_methodology")
+    mapping_index = EmissionCategoryMappingService.get_mapping_index()
 
     for report_emission in report_emissions:
         EmissionCategoryMappingService.apply_emission_categories(
@@ -515,6 +452,7 @@ def reapply_emission_categories(report_version: ReportVersion) -> None:
             report_fuel=report_emission.report_fuel if report_emission.report_fuel else None,
             report_emission=report_emission,
             methodology_data=model_to_dict(report_emission.report_methodology),
+            index=mapping_index,
         )
 
 
@@ -0,0 +1,146 @@
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Tuple
+import jsonschema
+from reporting.models.activity_validation_schema import ActivityValidationSchema
+
+logger = logging.getLogger(__name__)
+
+# Bump when the way schemas are prepared for validation changes, so stale shared rows are never reused
+SCHEMA_PREPARATION_VERSION = 1
+
+
+def enable_jsonschema_draft_2020_validation(schema: Any, validate_unevaluated_properties: bool = True) -> None:
+    """
+    RJSF uses draft-07 and doesn't support the `unevaluatedProperties` keyword.
+    This method replaces the `dependencies` keyword with `dependentSchemas` and adds
+    `unevaluatedProperties: False` to the schema where appropriate, to enable
+    validation with draft-2020-12.
+    """
+
+    if isinstance(schema, list):
+        for item in schema:
+            enable_jsonschema_draft_2020_validation(item, validate_unevaluated_properties)
+
+    if isinstance(schema, dict):
+        for key in schema:
+            enable_jsonschema_draft_2020_validation(schema[key], validate_unevaluated_properties)
+        # Schemas with complex schema dependencies recommended to not set this due to validation failure
+        # https://rjsf-team.github.io/react-jsonschema-form/docs/advanced-customization/internals/#json-schema-supporting-status
+        if validate_unevaluated_properties:
+            if "properties" in schema and schema.get("type") == "object":
+                schema["unevaluatedProperties"] = False
+
+        if "dependencies" in schema:
+            schema["dependentSchemas"] = schema.pop("dependencies")
+
+
+@dataclass(frozen=True)
+class ActivitySchemaKey:
+    """
+    Everything the built activity schema depends on. The reporting year stands in for the configuration, since
+    the configuration is selected from the report's valid date within that year.
+    """
+
+    reporting_year: int
+    activity_id: int
+    source_type_ids: Tuple[int, ...]
+    add_not_applicable_methodology: bool
+    validate_unevaluated_properties: bool
+
+    @classmethod
+    def build(
+        cls,
+        reporting_year: int,
+        activity_id: int,
+        source_type_ids: Iterable[int],
+        add_not_applicable_methodology: bool,
+        validate_unevaluated_properties: bool,
+    ) -> "ActivitySchemaKey":
+        return cls(
+            reporting_year=reporting_year,
+            activity_id=activity_id,
+            source_type_ids=tuple(sorted(set(source_type_ids))),
+            add_not_applicable_methodology=add_not_applicable_methodology,
+            validate_unevaluated_properties=validate_unevaluated_properties,
+        )
+
+    @property
+    def cache_key(self) -> str:
+        source_types = ",".join(str(source_type_id) for source_type_id in self.source_type_ids)
+        return (
+            f"v{SCHEMA_PREPARATION_VERSION}-{self.reporting_year}-{self.activity_id}-[{source_types}]"
+            f"-{int(self.add_not_applicable_methodology)}-{int(self.validate_unevaluated_properties)}"
+        )
+
+
+class ActivitySchemaValidatorCache:
+    """
+    Two-level cache of compiled activity validators.
+
+    - L1: compiled `Draft202012Validator` objects, per process.
+    - L2: the prepared draft 2020-12 schema in the `activity_validation_schema` table, shared by all workers and pods
+      and warmed at deploy time by the `warm_activity_validation_cache` command.
+
+    Schemas only change with the reporting configuration, which ships with migrations; `custom_migrate` clears
+    the shared table whenever migrations are applied.
+    """
+
+    _validators: Dict[str, jsonschema.Draft202012Validator] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_validator(
+        cls, key: ActivitySchemaKey, build_form_schema: Callable[[], str]
+    ) -> jsonschema.Draft202012Validator:
+        """
+        Return the validator for `key`, building the schema with `build_form_schema` only if no worker has built it
+        before. `build_form_schema` must return the FormBuilderService JSON string for the key.
+        """
+        cache_key = key.cache_key
+        validator = cls._validators.get(cache_key)
+        if validator is not None:
+            return validator
+
+        schema = cls._get_or_build_schema(key, build_form_schema)
+        validator = jsonschema.Draft202012Validator(schema)
+        with cls._lock:
+            cls._validators[cache_key] = validator
+        return validator
+
+    @classmethod
+    def _get_or_build_schema(cls, key: ActivitySchemaKey, build_form_schema: Callable[[], str]) -> Dict:
+        cache_key = key.cache_key
+        stored_schema = (
+            ActivityValidationSchema.objects.filter(cache_key=cache_key).values_list("json_schema", flat=True).first()
+        )
+        if stored_schema is not None:
+            return stored_schema  # type: ignore[no-any-return]
+
+        logger.debug(f"Building activity validation schema {cache_key}")
+        schema = json.loads(build_form_schema())["schema"]
+        enable_jsonschema_draft_2020_validation(schema, key.validate_unevaluated_properties)
+        # Another worker may have stored the same schema in the meantime; either copy is identical
+        ActivityValidationSchema.objects.bulk_create(
+            [ActivityValidationSchema(cache_key=cache_key, json_schema=schema)], ignore_conflicts=True
+        )
+        return schema  # type: ignore[no-any-return]
+
+    @classmethod
+    def contains(cls, key: ActivitySchemaKey) -> bool:
+        return (
+            key.cache_key in cls._validators
+            or ActivityValidationSchema.objects.filter(cache_key=key.cache_key).exists()
+        )
+
+    @classmethod
+    def clear_local(cls) -> None:
+        with cls._lock:
+            cls._validators.clear()
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.clear_local()
+        ActivityValidationSchema.objects.all().delete()
@@ -1,76 +1,109 @@
-import json
 import logging
-from typing import Any
+from typing import Dict
 import jsonschema
+from django.db.models import QuerySet
 from registration.models.activity import Activity
+from reporting.models.facility_report import FacilityReport
+from reporting.models.report_raw_activity_data import ReportRawActivityData
 from reporting.models.report_version import ReportVersion
 from reporting.models.source_type import SourceType
+from reporting.service.report_validation.activity_schema_validator_cache import (
+    ActivitySchemaKey,
+    ActivitySchemaValidatorCache,
+    enable_jsonschema_draft_2020_validation,
+)
 from reporting.service.report_validation.report_validation_error import (
     ErrorContext,
     ReportValidationError,
     ReportValidationErrorKey,
     Severity,
 )
-from service.form_builder_service import FormBuilderService
+from service.form_builder_service import FormBuilderService, adds_not_applicable_methodology
 from reporting.service.report_validation.report_validation_tags import ValidationTags
 
 logger = logging.getLogger(__name__)
 
 TAGS = [ValidationTags.REPORT_VALIDATION, ValidationTags.ON_SUBMIT]
 
+__all__ = ["enable_jsonschema_draft_2020_validation", "validate", "warm_validation_cache"]
 
-def enable_jsonschema_draft_2020_validation(schema: Any, validate_unevaluated_properties: bool = True) -> None:
-    """
-    RJSF uses draft-07 and doesn't support the `unevaluatedProperties` keyword.
-    This method replaces the `dependencies` keyword with `dependentSchemas` and adds
-    `unevaluatedProperties: False` to the schema where appropriate, to enable
-    validation with draft-2020-12.
-    """
 
-    if isinstance(schema, list):
-        for item in schema:
-            enable_jsonschema_draft_2020_validation(item, validate_unevaluated_properties)
+def _get_activity_validator(
+    report_version: ReportVersion,
+    facility_report: FacilityReport,
+    report_raw_activity: ReportRawActivityData,
+    source_type_ids_by_json_key: Dict[str, int],
+    alumina_activity_id: int,
+) -> jsonschema.Draft202012Validator:
+    source_type_ids = [
+        source_type_ids_by_json_key[json_key]
+        for json_key in report_raw_activity.json_data["sourceTypes"]
+        if json_key in source_type_ids_by_json_key
+    ]
+    schema_key = ActivitySchemaKey.build(
+        reporting_year=report_version.report.reporting_year_id,
+        activity_id=report_raw_activity.activity_id,
+        source_type_ids=source_type_ids,
+        add_not_applicable_methodology=adds_not_applicable_methodology(facility_report.facility_type),
+        validate_unevaluated_properties=report_raw_activity.activity_id != alumina_activity_id,
+    )
+    return ActivitySchemaValidatorCache.get_validator(
+        schema_key,
+        lambda: FormBuilderService.build_form_schema(
+            report_raw_activity.activity_id,
+            report_version.id,
+            source_type_ids,
+            str(facility_report.facility_id),
+        ),
+    )
 
-    if isinstance(schema, dict):
-        for key in schema:
-            enable_jsonschema_draft_2020_validation(schema[key], validate_unevaluated_properties)
-        # Schemas with complex schema dependencies recommended to not set this due to validation failure
-        # https://rjsf-team.github.io/react-jsonschema-form/docs/advanced-customization/internals/#json-schema-supporting-status
-        if validate_unevaluated_properties:
-            if "properties" in schema and schema.get("type") == "object":
-                schema["unevaluatedProperties"] = False
 
-        if "dependencies" in schema:
-            schema["dependentSchemas"] = schema.pop("dependencies")
+def warm_validation_cache(report_versions: QuerySet[ReportVersion]) -> int:
+    """
+    Build and store the validators needed by the given report versions, so that submitting them never builds a
+    schema. Returns the number of raw activities visited.
+    """
+    source_type_ids_by_json_key = dict(SourceType.objects.values_list("json_key", "id"))
+    alumina_activity = Activity.objects.get(slug='aluminum_production')
+    visited = 0
+    for report_version in report_versions.select_related("report"):
+        for facility_report in report_version.facility_reports.prefetch_related("reportrawactivitydata_records"):
+            for report_raw_activity in facility_report.reportrawactivitydata_records.all():
+                try:
+                    _get_activity_validator(
+                        report_version,
+                        facility_report,
+                        report_raw_activity,
+                        source_type_ids_by_json_key,
+                        alumina_activity.id,
+                    )
+                except Exception as e:
+                    # A schema that can't be built here will fail the same way at submit time; keep warming the rest
+                    logger.warning(f"Could not warm validation schema for raw activity {report_raw_activity.id}: {e}")
+                visited += 1
+    return visited
 
 
 def validate(report_version: ReportVersion) -> dict[str, ReportValidationError]:
     errors = {}
 
-    for facility_report in report_version.facility_reports.all():
+    facility_reports = report_version.facility_reports.select_related("facility").prefetch_related(
+        "reportrawactivitydata_records__activity"
+    )
+    source_type_ids_by_json_key = dict(SourceType.objects.values_list("json_key", "id"))
+    alumina_activity = Activity.objects.get(slug='aluminum_production')
+
+    for facility_report in facility_reports:
         for report_raw_activity in facility_report.reportrawactivitydata_records.all():
             data = report_raw_activity.json_data
-
-            source_type_json_keys = [source_type for source_type in data["sourceTypes"]]
-            source_type_ids = list(
-                SourceType.objects.filter(json_key__in=source_type_json_keys).values_list("id", flat=True)
-            )
-            alumina_activity = Activity.objects.get(slug='aluminum_production')
-
-            activity_schema = json.loads(
-                FormBuilderService.build_form_schema(
-                    report_raw_activity.activity_id,
-                    report_version.id,
-                    source_type_ids,
-                    str(facility_report.facility_id),
-                )
-            )["schema"]
-            enable_jsonschema_draft_2020_validation(
-                activity_schema, report_raw_activity.activity_id != alumina_activity.id
+            validator = _get_activity_validator(
+                report_version,
+                facility_report,
+                report_raw_activity,
+                source_type_ids_by_json_key,
+                alumina_activity.id,
             )
 
-            validator = jsonschema.Draft202012Validator(activity_schema)
-
             try:
                 validator.validate(data)
             except jsonschema.ValidationError as e:
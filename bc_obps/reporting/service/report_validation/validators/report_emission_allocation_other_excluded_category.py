@@ -37,11 +37,11 @@ def validate_facility_report(facility_report: FacilityReport) -> dict[str, Repor
 
     for cat in basic_categories:
         other_excluded_emission_total = (
-            ReportEmission.objects_with_decimal_emissions.select_related("report_source_type__report_activity")
+            ReportEmission.objects.select_related("report_source_type__report_activity")
             .filter(report_source_type__report_activity__facility_report_id=facility_report.id)
             .filter(emission_categories=cat)
             .filter(emission_categories__category_type="other_excluded")
-            .aggregate(Sum("emission"))['emission__sum']
+            .aggregate(Sum("equivalent_emission"))['equivalent_emission__sum']
         ) or Decimal("0")
 
         """
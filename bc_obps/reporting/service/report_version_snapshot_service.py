@@ -0,0 +1,141 @@
+import json
+import logging
+import zlib
+from typing import Any, Dict, Optional, Type, cast
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Q
+from ninja import Schema
+from ninja.responses import NinjaJSONEncoder
+from reporting.models.report_version import ReportVersion
+from reporting.models.report_version_snapshot import ReportVersionSnapshot
+from reporting.schema.report_final_review import FinalReviewVersionSchema, ReviewChangesVersionSchema
+from service.report_version_service import ReportVersionService
+
+logger = logging.getLogger(__name__)
+
+# Bump when the final review or review changes schemas change, so snapshots of the old format are rebuilt
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Report version fields that can still change once the version is submitted; they are read from the version row
+MUTABLE_FIELDS = ["is_latest_submitted"]
+
+
+class ReportVersionSnapshotService:
+    """
+    Service saving and reading the snapshots of submitted report versions: their final review and review changes
+    serializations, saved once on submission instead of being recomputed on every read.
+    """
+
+    @staticmethod
+    def _serialize(schema: Type[Schema], report_version: ReportVersion) -> Dict[str, Any]:
+        # Same json types as the endpoint responses, so snapshots and live data can be compared
+        return cast(
+            Dict[str, Any], json.loads(json.dumps(schema.from_orm(report_version).model_dump(), cls=NinjaJSONEncoder))
+        )
+
+    @classmethod
+    def serialize_final_review(cls, version_id: int) -> Dict[str, Any]:
+        report_version = ReportVersionService.fetch_full_report_version(version_id, prefetch_full_facility_report=False)
+        return cls._serialize(FinalReviewVersionSchema, report_version)
+
+    @classmethod
+    def serialize_review_changes(cls, version_id: int) -> Dict[str, Any]:
+        report_version = ReportVersionService.fetch_full_report_version(version_id, prefetch_full_facility_report=True)
+        return cls._serialize(ReviewChangesVersionSchema, report_version)
+
+    @classmethod
+    def save_snapshot(cls, version_id: int) -> ReportVersionSnapshot:
+        """Serializes the report version and saves (or replaces) its snapshot"""
+        data = {
+            "final_review": cls.serialize_final_review(version_id),
+            "review_changes": cls.serialize_review_changes(version_id),
+        }
+        snapshot, _ = ReportVersionSnapshot.objects.update_or_create(
+            report_version_id=version_id,
+            defaults={
+                "format_version": SNAPSHOT_FORMAT_VERSION,
+                "data": zlib.compress(json.dumps(data, sort_keys=True, separators=(",", ":")).encode()),
+            },
+        )
+        return snapshot
+
+    @classmethod
+    def save_snapshot_on_commit(cls, version_id: int) -> None:
+        """
+        Saves the snapshot once the current transaction commits, so the serializations don't hold its locks.
+        A failure is only logged: versions without a snapshot are serialized on read.
+        """
+
+        def save() -> None:
+            try:
+                cls.save_snapshot(version_id)
+            except Exception as e:
+                logger.error(f"Failed to save the snapshot of report version {version_id}: {e}")
+
+        transaction.on_commit(save)
+
+    @staticmethod
+    def get_snapshot_data(version_id: int) -> Optional[Dict[str, Any]]:
+        """
+        The serializations saved in the snapshot of the report version, with its current mutable fields.
+        None if the version has no snapshot of the current format.
+        """
+        row = (
+            ReportVersion.objects.filter(
+                id=version_id,
+                snapshot__format_version=SNAPSHOT_FORMAT_VERSION,
+            )
+            .values("snapshot__data", *MUTABLE_FIELDS)
+            .first()
+        )
+        if row is None:
+            return None
+        data: Dict[str, Any] = json.loads(zlib.decompress(row.pop("snapshot__data")))
+        for serialization in data.values():
+            serialization.update(row)
+        return data
+
+    @classmethod
+    def get_final_review_data(cls, version_id: int) -> Dict[str, Any]:
+        data = cls.get_snapshot_data(version_id)
+        return data["final_review"] if data else cls.serialize_final_review(version_id)
+
+    @classmethod
+    def get_review_changes_data(cls, version_id: int) -> Dict[str, Any]:
+        data = cls.get_snapshot_data(version_id)
+        return data["review_changes"] if data else cls.serialize_review_changes(version_id)
+
+    @classmethod
+    def get_facility_report_data(cls, version_id: int, facility_id: UUID) -> Optional[Dict[str, Any]]:
+        """The serialized facility report of the snapshot, None if the version has no snapshot of the current format"""
+        data = cls.get_snapshot_data(version_id)
+        if data is None:
+            return None
+        facility_reports = data["review_changes"]["facility_reports"].values()
+        return next(
+            (
+                facility_report
+                for facility_report in facility_reports
+                if facility_report["facility"] == str(facility_id)
+            ),
+            None,
+        )
+
+    @classmethod
+    def backfill_snapshots(cls, rebuild: bool = False) -> int:
+        """
+        Saves the snapshots of the submitted report versions that don't have one of the current format (or of every
+        submitted version, with rebuild). Returns the number of snapshots saved.
+        """
+        report_versions = ReportVersion.objects.filter(status=ReportVersion.ReportVersionStatus.Submitted)
+        if not rebuild:
+            report_versions = report_versions.filter(
+                Q(snapshot__isnull=True) | ~Q(snapshot__format_version=SNAPSHOT_FORMAT_VERSION)
+            )
+        count = 0
+        for version_id in report_versions.order_by("id").values_list("id", flat=True):
+            cls.save_snapshot(version_id)
+            count += 1
+        return count
@@ -1,17 +1,17 @@
 from uuid import UUID
 
-from django.db.models import OuterRef, QuerySet, Value, F, Subquery, Case, When, Q, CharField
+from django.db.models import FilteredRelation, OuterRef, QuerySet, Value, F, Subquery, Case, When, Q, CharField
 from django.db.models.functions import Concat, Coalesce
 from ninja import Query
 from registration.models.operation import Operation
-from reporting.models import ReportOperation
 from reporting.models.report import Report
 from reporting.models.report_version import ReportVersion
+from reporting.models.reporting_dashboard_report import ReportingDashboardReport
 from service.data_access_service.operation_designated_operator_timeline_service import (
     OperationDesignatedOperatorTimelineDataAccessService,
 )
 from service.data_access_service.user_service import UserDataAccessService
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 from reporting.schema.dashboard import (
     ReportingDashboardOperationFilterSchema,
     ReportingDashboardReportFilterSchema,
@@ -19,6 +19,19 @@ from reporting.schema.dashboard import (
 )
 from service.user_operator_service import UserOperatorService
 
+# Fields of ReportingDashboardReport derived from the report tables
+DASHBOARD_REPORT_FIELDS = [
+    "operation_id",
+    "operator_id",
+    "reporting_year_id",
+    "report_version_id",
+    "first_report_version_id",
+    "report_status",
+    "report_updated_at",
+    "report_submitted_by",
+    "operation_name",
+]
+
 
 class ReportingDashboardService:
     """
@@ -74,22 +87,10 @@ class ReportingDashboardService:
         user = UserDataAccessService.get_by_guid(user_guid)
         operator_id = UserOperatorService.get_current_user_approved_user_operator_or_raise(user).operator_id
 
-        # Related docs: https://docs.djangoproject.com/en/5.1/ref/models/expressions/#subquery-expressions
-        report_queryset = Report.objects.filter(
-            operation_id=OuterRef("id"),
-            reporting_year=reporting_year,
-        )
-
+        # The report data comes from the dashboard read model, joined on the report of the operation for the year
+        dashboard_report_condition = Q(reporting_dashboard_reports__reporting_year_id=reporting_year)
         if operator_id is not None:
-            report_queryset = report_queryset.filter(operator_id=operator_id)
-
-        report_subquery = (
-            report_queryset.annotate(latest_version_id=cls.latest_report_version_subquery.values("id"))
-            .annotate(latest_version_status=cls.latest_report_version_subquery.values("status"))
-            .annotate(latest_version_updated_at=cls.latest_report_version_subquery.values("updated_at"))
-            .annotate(latest_version_updated_by=cls.latest_report_version_subquery.values("full_name"))
-            .annotate(first_version_id=cls.first_report_version_subquery.values("id"))
-        )
+            dashboard_report_condition &= Q(reporting_dashboard_reports__operator_id=operator_id)
 
         # fetch operations that were owned during the reporting year, including both currently and previously owned operations (if an operation was transferred, the original owner still has reporting responsiblities for the last year of ownership)
         timeline = OperationDesignatedOperatorTimelineDataAccessService.get_operation_timeline_for_user(
@@ -110,22 +111,16 @@ class ReportingDashboardService:
             # Exclude operations that have opted-out effective before the specified reporting_year
             .exclude(opted_in_operation__final_reporting_year__lt=reporting_year)
             .annotate(
-                # the [:1] is necessary for the sorting and filters to work
-                report_id=Subquery(report_subquery.values("id")[:1]),
-                report_version_id=Subquery(report_subquery.values("latest_version_id")[:1]),
-                first_report_version_id=Subquery(report_subquery.values("first_version_id")[:1]),
-                report_status=Subquery(report_subquery.values("latest_version_status")[:1]),
-                report_updated_at=Subquery(report_subquery.values("latest_version_updated_at")[:1]),
-                report_submitted_by=Subquery(report_subquery.values("latest_version_updated_by")[:1]),
-                operation_name=Coalesce(
-                    Subquery(
-                        ReportOperation.objects.filter(
-                            report_version__report__operation_id=OuterRef("id"),
-                            report_version__report__reporting_year=reporting_year,
-                        ).values("operation_name")[:1]
-                    ),
-                    F("name"),
-                ),
+                dashboard_report=FilteredRelation("reporting_dashboard_reports", condition=dashboard_report_condition)
+            )
+            .annotate(
+                report_id=F("dashboard_report__report_id"),
+                report_version_id=F("dashboard_report__report_version_id"),
+                first_report_version_id=F("dashboard_report__first_report_version_id"),
+                report_status=F("dashboard_report__report_status"),
+                report_updated_at=F("dashboard_report__report_updated_at"),
+                report_submitted_by=F("dashboard_report__report_submitted_by"),
+                operation_name=Coalesce(F("dashboard_report__operation_name"), F("name")),
                 # we have different statuses on the frontend than in the db, so we need to create a custom sort key
                 report_status_sort_key=cls.report_status_sort_key,
             )
@@ -192,6 +187,81 @@ class ReportingDashboardService:
 
         return filters.filter(queryset).order_by(*sort_fields)
 
+    @classmethod
+    def get_live_dashboard_reports(cls, report_ids: Optional[Iterable[int]] = None) -> QuerySet[Report, Dict[str, Any]]:
+        """
+        The rows of the dashboard read model, computed from the report tables: dicts of report_id and
+        DASHBOARD_REPORT_FIELDS, for the given reports (all reports if None).
+        """
+        reports = Report.objects.all() if report_ids is None else Report.objects.filter(id__in=list(report_ids))
+        return (
+            reports.annotate(
+                report_version_id=cls.latest_report_version_subquery.values("id"),
+                first_report_version_id=cls.first_report_version_subquery.values("id"),
+                report_status=cls.latest_report_version_subquery.values("status"),
+                report_updated_at=cls.latest_report_version_subquery.values("updated_at"),
+                report_submitted_by=cls.latest_report_version_subquery.values("full_name"),
+                operation_name=cls.latest_report_version_subquery.values("operation_name"),
+            )
+            .values(*DASHBOARD_REPORT_FIELDS, report_id=F("id"))
+            .order_by("id")
+        )
+
+    @classmethod
+    def refresh_dashboard_reports(cls, report_ids: Iterable[int]) -> None:
+        """
+        Brings the dashboard read model rows of the reports in line with the report tables, in two queries.
+        Rows of reports that no longer exist are deleted.
+        """
+        report_ids = set(report_ids)
+        rows = [ReportingDashboardReport(**row) for row in cls.get_live_dashboard_reports(report_ids)]
+        if rows:
+            ReportingDashboardReport.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["report"],
+                update_fields=[field.removesuffix("_id") for field in DASHBOARD_REPORT_FIELDS],
+            )
+        deleted_report_ids = report_ids - {row.report_id for row in rows}
+        if deleted_report_ids:
+            ReportingDashboardReport.objects.filter(report_id__in=deleted_report_ids).delete()
+
+    @classmethod
+    def rebuild_dashboard_reports(cls, batch_size: int = 1000) -> int:
+        """Refreshes the dashboard read model rows of every report. Returns the number of reports."""
+        report_ids = list(Report.objects.order_by("id").values_list("id", flat=True))
+        for start in range(0, len(report_ids), batch_size):
+            cls.refresh_dashboard_reports(report_ids[start : start + batch_size])  # noqa: E203
+        return len(report_ids)
+
+    @classmethod
+    def find_stale_dashboard_reports(
+        cls, report_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, Dict[str, Tuple[Any, Any]]]:
+        """
+        Compares the dashboard read model with the report tables.
+        Returns the fields that differ for each report id, as (stored value, live value). Missing rows, and rows of
+        reports that no longer exist, have a stored or live value of None for every field.
+        """
+        report_ids = None if report_ids is None else list(report_ids)
+        stored_rows = ReportingDashboardReport.objects.all()
+        if report_ids is not None:
+            stored_rows = stored_rows.filter(report_id__in=report_ids)
+        stored = {row["report_id"]: row for row in stored_rows.values("report_id", *DASHBOARD_REPORT_FIELDS)}
+        live = {row["report_id"]: row for row in cls.get_live_dashboard_reports(report_ids)}
+
+        stale: Dict[int, Dict[str, Tuple[Any, Any]]] = {}
+        for report_id in stored.keys() | live.keys():
+            stored_row, live_row = stored.get(report_id, {}), live.get(report_id, {})
+            differences = {
+                field: (stored_row.get(field), live_row.get(field))
+                for field in DASHBOARD_REPORT_FIELDS
+                if stored_row.get(field) != live_row.get(field) or not stored_row or not live_row
+            }
+            if differences:
+                stale[report_id] = differences
+        return stale
+
     @classmethod
     def _get_sort_fields(cls, sort_field: Optional[str] = "id", sort_order: Optional[str] = "asc") -> list[str]:
         """
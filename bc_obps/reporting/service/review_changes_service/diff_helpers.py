@@ -1,7 +1,7 @@
-from typing import Any, Dict, List
+from typing import Any, Collection, Dict, List
 from deepdiff import DeepDiff
 from deepdiff.helper import NotPresent
-import re
+from deepdiff.path import stringify_element
 
 _DIFF_KWARGS: Dict[str, Any] = {
     "ignore_order": True,
@@ -10,6 +10,16 @@ _DIFF_KWARGS: Dict[str, Any] = {
     "threshold_to_diff_deeper": 0,
 }
 
+# Keys of the serialized report versions that always differ between versions, so they are never listed as changes
+NOISY_DIFF_KEYS = {
+    "report_version",
+    "is_supplementary_report",
+    "is_latest_submitted",
+    "status",
+}
+
+_QUOTE_STR = "'{}'"
+
 _CHANGE_TYPE_MAP: Dict[str, str] = {
     'values_changed': 'modified',
     'type_changes': 'modified',
@@ -22,6 +32,99 @@ _CHANGE_TYPE_MAP: Dict[str, str] = {
 }
 
 
+def remove_noisy_diff_keys(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: remove_noisy_diff_keys(child_value) for key, child_value in value.items() if key not in NOISY_DIFF_KEYS
+        }
+
+    if isinstance(value, list):
+        return [remove_noisy_diff_keys(item) for item in value]
+
+    return value
+
+
+def _key_path(key: Any) -> str:
+    # Same formatting as the DeepDiff paths
+    return f"[{stringify_element(key, quote_str=_QUOTE_STR)}]" if isinstance(key, str) else f"[{key!r}]"
+
+
+def _is_same(prev: Any, curr: Any) -> bool:
+    """
+    Whether the values are the same, ignoring the noisy keys. Lists in another order aren't the same here, although
+    DeepDiff finds no change between them.
+    """
+    if prev is curr:
+        return True
+    if type(prev) is not type(curr):
+        return False
+    if isinstance(prev, dict):
+        prev_keys = prev.keys() - NOISY_DIFF_KEYS
+        return prev_keys == curr.keys() - NOISY_DIFF_KEYS and all(_is_same(prev[key], curr[key]) for key in prev_keys)
+    if isinstance(prev, list):
+        # Lists in the same order are the common case; DeepDiff decides for the others
+        return len(prev) == len(curr) and all(_is_same(p, c) for p, c in zip(prev, curr))
+    return bool(prev == curr)
+
+
+def _change(field: str, old_value: Any, new_value: Any, change_type: str) -> Dict[str, Any]:
+    return {
+        "field": field,
+        "old_value": remove_noisy_diff_keys(old_value),
+        "new_value": remove_noisy_diff_keys(new_value),
+        "change_type": change_type,
+    }
+
+
+def diff_values(prev: Any, curr: Any, path: str = "root", excluded_paths: Collection[str] = ()) -> List[Dict[str, Any]]:
+    """
+    Changes between two serialized values, the same as DeepDiff's with _DIFF_KWARGS (without the noisy keys).
+
+    Dicts are the keyed collections of the serialized report (facilities by name, activities by name, products by
+    name, source types by slug...), so they are diffed key by key, and unchanged subtrees are skipped by comparing
+    them instead of hashing them. Lists are compared regardless of their order, so the lists that changed are left to
+    DeepDiff.
+    """
+    changes: List[Dict[str, Any]] = []
+    _collect_changes(prev, curr, path, excluded_paths, changes)
+    return changes
+
+
+def _collect_changes(prev: Any, curr: Any, path: str, excluded_paths: Collection[str], changes: List[dict]) -> None:
+    if path in excluded_paths or prev is curr:
+        return
+    if type(prev) is not type(curr):
+        changes.append(_change(path, prev, curr, "modified"))
+    elif isinstance(prev, dict):
+        # Same order as DeepDiff: added keys, removed keys, then the changes of the common keys
+        prev_keys = [key for key in prev if key not in NOISY_DIFF_KEYS]
+        curr_keys = [key for key in curr if key not in NOISY_DIFF_KEYS]
+        for key in curr_keys:
+            if key not in prev and path + _key_path(key) not in excluded_paths:
+                changes.append(_change(path + _key_path(key), None, curr[key], "added"))
+        for key in prev_keys:
+            if key not in curr and path + _key_path(key) not in excluded_paths:
+                changes.append(_change(path + _key_path(key), prev[key], None, "removed"))
+        for key in curr_keys:
+            if key in prev:
+                _collect_changes(prev[key], curr[key], path + _key_path(key), excluded_paths, changes)
+    elif isinstance(prev, list):
+        if not _is_same(prev, curr):
+            diff = DeepDiff(remove_noisy_diff_keys(prev), remove_noisy_diff_keys(curr), **_DIFF_KWARGS)
+            changes.extend(
+                _change(
+                    path + item.path()[4:],
+                    None if isinstance(item.t1, NotPresent) else item.t1,
+                    None if isinstance(item.t2, NotPresent) else item.t2,
+                    _CHANGE_TYPE_MAP.get(diff_key, 'modified'),
+                )
+                for diff_key, items in diff.items()
+                for item in items
+            )
+    elif prev != curr:
+        changes.append(_change(path, prev, curr, "modified"))
+
+
 def detect_renames(prev: Dict[str, dict], curr: Dict[str, dict]) -> List[Dict[str, Any]]:
     """
     Detect facilities with the same UUID but a different name key.
@@ -53,34 +156,11 @@ def diff_sections(prev: Dict[str, dict], curr: Dict[str, dict], path_root: str)
     changes = []
 
     for name in prev.keys() - curr.keys():
-        changes.append(
-            {"field": f"{path_root}['{name}']", "old_value": prev[name], "new_value": None, "change_type": "removed"}
-        )
+        changes.append(_change(f"{path_root}['{name}']", prev[name], None, "removed"))
 
     for name in curr.keys() - prev.keys():
-        changes.append(
-            {"field": f"{path_root}['{name}']", "old_value": None, "new_value": curr[name], "change_type": "added"}
-        )
+        changes.append(_change(f"{path_root}['{name}']", None, curr[name], "added"))
 
     for name in prev.keys() & curr.keys():
-        for diff_key, items in DeepDiff(prev[name], curr[name], **_DIFF_KWARGS).items():
-            changes = changes + [
-                {
-                    "field": f"{path_root}['{name}']{item.path()[4:]}",
-                    "old_value": None if isinstance(item.t1, NotPresent) else item.t1,
-                    "new_value": None if isinstance(item.t2, NotPresent) else item.t2,
-                    "change_type": _CHANGE_TYPE_MAP.get(diff_key, 'modified'),
-                }
-                for item in items
-            ]
+        changes.extend(diff_values(prev[name], curr[name], f"{path_root}['{name}']"))
     return changes
-
-
-def fix_facility_uuid_in_path(field: str, current: dict) -> str:
-    """Replace a facility UUID in a diff path with the human-readable facility name."""
-    m = re.match(r"root\['facility_reports'\]\['([^']+)'\]", field)
-    if m:
-        fac = current.get('facility_reports', {}).get(m.group(1))
-        if fac and 'facility_name' in fac:
-            return field.replace(f"['{m.group(1)}']", f"['{fac['facility_name']}']", 1)
-    return field
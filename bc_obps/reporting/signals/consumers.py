@@ -1,9 +1,11 @@
 import logging
 from typing import Type, Any
-from django.db.models import F
+from django.db.models import F, QuerySet
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from registration.signals.signals import operation_registration_purpose_changed
-from reporting.models import ReportVersion
+from reporting.models import Report, ReportOperation, ReportVersion
+from reporting.service.reporting_dashboard_service import ReportingDashboardService
 from service.report_version_service import ReportVersionService
 from service.reporting_year_service import ReportingYearService
 
@@ -46,3 +48,27 @@ def handle_registration_purpose_changed(sender: Type[Any], **kwargs: Any) -> Non
 
     logger.info("Deleting draft report version id=%s for operation_id=%s", version_id, operation_id)
     ReportVersionService.delete_report_version(version_id)
+
+
+@receiver(post_save, sender=Report)
+def refresh_dashboard_report_on_report_save(sender: Type[Report], instance: Report, **kwargs: Any) -> None:
+    ReportingDashboardService.refresh_dashboard_reports([instance.id])
+
+
+@receiver(post_save, sender=ReportVersion)
+@receiver(post_delete, sender=ReportVersion)
+def refresh_dashboard_report_on_report_version_change(
+    sender: Type[ReportVersion], instance: ReportVersion, **kwargs: Any
+) -> None:
+    origin = kwargs.get("origin")
+    if isinstance(origin, Report) or (isinstance(origin, QuerySet) and origin.model is Report):
+        # The versions are deleted with their report, and so is the dashboard row
+        return
+    ReportingDashboardService.refresh_dashboard_reports([instance.report_id])
+
+
+@receiver(post_save, sender=ReportOperation)
+def refresh_dashboard_report_on_report_operation_save(
+    sender: Type[ReportOperation], instance: ReportOperation, **kwargs: Any
+) -> None:
+    ReportingDashboardService.refresh_dashboard_reports([instance.report_version.report_id])
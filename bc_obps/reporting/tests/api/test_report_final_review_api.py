@@ -67,3 +67,29 @@ class TestReportFinalReviewApi(CommonTestSetup):
         data = response.json()
         assert data["facility_name"] == self.facility_report.facility_name
         assert data["facility_type"] == self.facility_report.facility_type
+
+    @patch("reporting.api.report_final_review.ReportVersionSnapshotService.get_snapshot_data")
+    @patch("service.report_version_service.ReportVersionService.fetch_full_report_version")
+    def test_get_report_final_review_data_is_served_from_the_snapshot(
+        self,
+        mock_fetch: MagicMock,
+        mock_get_snapshot_data: MagicMock,
+    ):
+        mock_get_snapshot_data.return_value = {
+            "final_review": {"report_type": "Annual Report", "is_latest_submitted": True},
+            "review_changes": {},
+        }
+
+        response = TestUtils.mock_get_with_auth_role(
+            self,
+            "industry_user",
+            custom_reverse_lazy(
+                "get_report_final_review_data",
+                kwargs={"version_id": self.report_version.id},
+            ),
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"report_type": "Annual Report", "is_latest_submitted": True}
+        mock_get_snapshot_data.assert_called_once_with(self.report_version.id)
+        mock_fetch.assert_not_called()
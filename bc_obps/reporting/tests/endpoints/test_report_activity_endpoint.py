@@ -53,7 +53,7 @@ class TestReportActivityEndpoint(CommonTestSetup):
 
     # SERVICE OUTPUT
     @patch("reporting.api.report_activity.load_report_activity_data")
-    @patch("reporting.service.report_activity_save_service.ReportActivitySaveService.save")
+    @patch("reporting.service.report_activity_bulk_save_service.ReportActivityBulkSaveService.save")
     def test_post_saves_then_calls_the_load_function(self, mock_service_save: MagicMock, mock_load_endpoint: MagicMock):
         """Test that the endpoint returns the service's output correctly"""
         # Arrange
@@ -0,0 +1,16 @@
+from common.tests.utils.helpers import BaseTestCase
+from reporting.models import ActivityValidationSchema
+
+
+class ActivityValidationSchemaTest(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_object = ActivityValidationSchema.objects.create(
+            cache_key="test-cache-key",
+            json_schema={"type": "object"},
+        )
+        cls.field_data = [
+            ("id", "ID", None, None),
+            ("cache_key", "cache key", 1000, None),
+            ("json_schema", "json schema", None, None),
+        ]
@@ -4,6 +4,8 @@ import pytest
 from registration.tests.constants import TIMESTAMP_COMMON_FIELDS
 from reporting.tests.utils.constants import REPORT_DATA_MODELS_COMMON_FIELDS
 from django.core.exceptions import ValidationError
+from decimal import Decimal
+from reporting.models.report_emission import ReportEmission
 from reporting.tests.utils.immutable_report_version import (
     assert_immutable_report_version,
 )
@@ -22,6 +24,7 @@ class ReportEmissionModelTest(BaseTestCase):
             ("report_unit", "report unit", None, None),
             ("report_methodology", "report methodology", None, None),
             ("emission_categories", "emission categories", None, 0),
+            ("equivalent_emission", "equivalent emission", None, None),
         ]
 
     def test_cannot_have_unit_and_fuel(self):
@@ -67,3 +70,32 @@ class ReportEmissionModelTest(BaseTestCase):
 
     def test_immutable_after_report_version_submitted(self):
         assert_immutable_report_version("reporting.tests.utils.report_emission")
+
+    def test_equivalent_emission_is_generated_from_json_data(self):
+        report_emission = make_recipe(
+            "reporting.tests.utils.report_emission", json_data={"equivalentEmission": 12.34567}
+        )
+        report_emission.refresh_from_db()
+        assert report_emission.equivalent_emission == Decimal("12.3457")
+
+        report_emission.json_data = {"equivalentEmission": 5}
+        report_emission.save()
+        report_emission.refresh_from_db()
+        assert report_emission.equivalent_emission == Decimal("5")
+
+        ReportEmission.objects.filter(id=report_emission.id).update(json_data={"emission": 1})
+        report_emission.refresh_from_db()
+        assert report_emission.equivalent_emission is None
+
+        # Bulk writes skip save(), the database still computes the column
+        clone = ReportEmission.objects.bulk_create(
+            [
+                ReportEmission(
+                    gas_type=report_emission.gas_type,
+                    report_source_type=report_emission.report_source_type,
+                    report_version=report_emission.report_version,
+                    json_data={"equivalentEmission": 7.5},
+                )
+            ]
+        )[0]
+        assert ReportEmission.objects.get(id=clone.id).equivalent_emission == Decimal("7.5")
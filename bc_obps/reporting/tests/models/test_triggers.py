@@ -1,69 +1,99 @@
-from django.test import SimpleTestCase
+from django.db import ProgrammingError, connection, transaction
+from django.test import SimpleTestCase, TestCase
+from model_bakery.baker import make_recipe
 import pgtrigger
 import pytest
-from reporting.models.triggers import immutable_report_version_trigger, no_overlapping_configuration_records_trigger
+from reporting.models.report_emission import ReportEmission
+from reporting.models.triggers import (
+    immutable_report_version_statement_triggers,
+    no_overlapping_configuration_records_trigger,
+)
+from reporting.tests.utils.immutable_report_version import IMMUTABLE_REPORT_ERROR_MESSAGE_MATCH
+
+
+class ImmutableReportVersionStatementTriggersTest(SimpleTestCase):
+    def test_generates_one_trigger_per_operation(self):
+        triggers = immutable_report_version_statement_triggers()
+
+        assert [trigger.name for trigger in triggers] == [
+            "immutable_report_version_insert",
+            "immutable_report_version_update",
+            "immutable_report_version_delete",
+        ]
+        assert [trigger.operation for trigger in triggers] == [pgtrigger.Insert, pgtrigger.Update, pgtrigger.Delete]
+        assert all(trigger.level == pgtrigger.Statement for trigger in triggers)
+        assert all(trigger.when == pgtrigger.After for trigger in triggers)
+        assert [(trigger.referencing.old, trigger.referencing.new) for trigger in triggers] == [
+            (None, "new_rows"),
+            ("old_rows", "new_rows"),
+            ("old_rows", None),
+        ]
 
-
-class ImmutableReportVersionTriggerTest(SimpleTestCase):
     def test_generates_sql_properly_for_main_case(self):
-        trigger = immutable_report_version_trigger()
+        update_trigger = immutable_report_version_statement_triggers()[1]
 
-        assert trigger.name == "immutable_report_version"
-        assert trigger.operation.operations == (pgtrigger.Update, pgtrigger.Insert, pgtrigger.Delete)
-        assert trigger.when == pgtrigger.Before
-        assert (
-            trigger.func.func
-            == """
-            declare
-                status text;
+        assert update_trigger.func.func == """
             begin
-                select rel1.status into status
-                from "erc"."report_version" rel1
-                where rel1.id=coalesce(new.report_version_id, old.report_version_id)
-                limit 1;
-
-                if status='Submitted' then
+                if exists (
+                    select 1
+                    from "erc"."report_version" rel1
+                    where rel1.status='Submitted'
+                    and rel1.id in (select report_version_id from old_rows union select report_version_id from new_rows)
+                ) then
                     raise exception '{meta.model_name} record is immutable after a report version has been submitted';
                 end if;
 
-                return coalesce(new, old);
+                return null;
             end;
             """
-        )
 
     def test_generates_sql_properly_for_custom_relation_path(self):
-        trigger = immutable_report_version_trigger("some_intermediate_model__report_version")
+        insert_trigger = immutable_report_version_statement_triggers("some_intermediate_model__report_version")[0]
 
-        assert trigger.name == "immutable_report_version"
-        assert trigger.operation.operations == (pgtrigger.Update, pgtrigger.Insert, pgtrigger.Delete)
-        assert trigger.when == pgtrigger.Before
-        assert (
-            trigger.func.func
-            == """
-            declare
-                status text;
+        assert insert_trigger.func.func == """
             begin
-                select rel1.status into status
-                from "erc"."report_version" rel1
-                join "erc"."some_intermediate_model" rel2 on rel2.report_version_id=rel1.id
-                where rel2.id=coalesce(new.some_intermediate_model_id, old.some_intermediate_model_id)
-                limit 1;
-
-                if status='Submitted' then
+                if exists (
+                    select 1
+                    from "erc"."report_version" rel1
+                    join "erc"."some_intermediate_model" rel2 on rel2.report_version_id=rel1.id
+                    where rel1.status='Submitted'
+                    and rel2.id in (select some_intermediate_model_id from new_rows)
+                ) then
                     raise exception '{meta.model_name} record is immutable after a report version has been submitted';
                 end if;
 
-                return coalesce(new, old);
+                return null;
             end;
             """
-        )
 
     def test_fails_if_not_for_report_version(self):
         with pytest.raises(
             ValueError,
             match="The immutable report version trigger path should point at the erc.report_version table",
         ):
-            immutable_report_version_trigger("random_model")
+            immutable_report_version_statement_triggers("random_model")
+
+
+class ImmutableReportVersionStatementTriggersDbTest(TestCase):
+    def test_bulk_statements_fail_if_any_report_version_is_submitted(self):
+        draft_emission = make_recipe("reporting.tests.utils.report_emission", report_version__status="Draft")
+        submitted_emission = make_recipe("reporting.tests.utils.report_emission", report_version__status="Draft")
+        submitted_emission.report_version.status = "Submitted"
+        submitted_emission.report_version.save()
+        emissions = ReportEmission.objects.filter(id__in=[draft_emission.id, submitted_emission.id])
+
+        with pytest.raises(ProgrammingError, match=IMMUTABLE_REPORT_ERROR_MESSAGE_MATCH), transaction.atomic():
+            emissions.update(json_data={"equivalentEmission": 1})
+
+        with pytest.raises(ProgrammingError, match=IMMUTABLE_REPORT_ERROR_MESSAGE_MATCH), transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'delete from "erc"."report_emission" where id = any(%s)',
+                    [[draft_emission.id, submitted_emission.id]],
+                )
+
+        assert emissions.filter(id=draft_emission.id).update(json_data={"equivalentEmission": 1}) == 1
+        assert emissions.count() == 2
 
 
 class NoOverlappingConfigurationRecordsTriggerTest(SimpleTestCase):
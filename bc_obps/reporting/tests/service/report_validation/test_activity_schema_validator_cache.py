@@ -0,0 +1,74 @@
+import json
+from unittest.mock import MagicMock
+import pytest
+from reporting.models import ActivityValidationSchema
+from reporting.service.report_validation.activity_schema_validator_cache import (
+    ActivitySchemaKey,
+    ActivitySchemaValidatorCache,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+class TestActivitySchemaValidatorCache:
+    def setup_method(self):
+        ActivitySchemaValidatorCache.clear_local()
+        self.key = ActivitySchemaKey.build(
+            reporting_year=2024,
+            activity_id=1,
+            source_type_ids=[3, 2, 3],
+            add_not_applicable_methodology=False,
+            validate_unevaluated_properties=True,
+        )
+        self.build_form_schema = MagicMock(
+            return_value=json.dumps(
+                {
+                    "schema": {
+                        "type": "object",
+                        "properties": {"name": {"type": "string"}},
+                        "dependencies": {"name": {"required": ["name"]}},
+                    }
+                }
+            )
+        )
+
+    def test_cache_key_is_independent_of_source_type_order(self):
+        other_key = ActivitySchemaKey.build(
+            reporting_year=2024,
+            activity_id=1,
+            source_type_ids=[2, 3],
+            add_not_applicable_methodology=False,
+            validate_unevaluated_properties=True,
+        )
+        assert self.key.cache_key == other_key.cache_key
+        assert self.key.cache_key.endswith("-2024-1-[2,3]-0-1")
+
+    def test_builds_once_and_stores_prepared_schema(self):
+        validator = ActivitySchemaValidatorCache.get_validator(self.key, self.build_form_schema)
+
+        assert ActivitySchemaValidatorCache.get_validator(self.key, self.build_form_schema) is validator
+        self.build_form_schema.assert_called_once()
+
+        stored = ActivitySchemaValidatorCache.contains(self.key)
+        assert stored
+        stored_schema = ActivityValidationSchema.objects.get(cache_key=self.key.cache_key).json_schema
+        # Stored schemas are already converted for draft 2020-12 validation
+        assert stored_schema["unevaluatedProperties"] is False
+        assert "dependentSchemas" in stored_schema and "dependencies" not in stored_schema
+
+    def test_new_process_uses_shared_schema(self):
+        ActivitySchemaValidatorCache.get_validator(self.key, self.build_form_schema)
+        ActivitySchemaValidatorCache.clear_local()
+
+        validator = ActivitySchemaValidatorCache.get_validator(self.key, self.build_form_schema)
+
+        self.build_form_schema.assert_called_once()
+        assert validator.is_valid({"name": "test"})
+        assert not validator.is_valid({"name": "test", "extra": 1})
+
+    def test_clear_removes_shared_schemas(self):
+        ActivitySchemaValidatorCache.get_validator(self.key, self.build_form_schema)
+
+        ActivitySchemaValidatorCache.clear()
+
+        assert not ActivitySchemaValidatorCache.contains(self.key)
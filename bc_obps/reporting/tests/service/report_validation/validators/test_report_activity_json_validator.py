@@ -9,14 +9,20 @@ from reporting.service.report_validation.report_validation_error import (
     ReportValidationErrorKey,
     Severity,
 )
+from reporting.service.report_validation.activity_schema_validator_cache import ActivitySchemaValidatorCache
 from reporting.service.report_validation.validators.report_activity_json_validation import (
     enable_jsonschema_draft_2020_validation,
     validate,
+    warm_validation_cache,
 )
+from reporting.models.report_version import ReportVersion
 
 
 @pytest.mark.django_db
 class TestReportActivityJsonValidator:
+    def setup_method(self):
+        ActivitySchemaValidatorCache.clear_local()
+
     def test_enable_jsonschema_draft_2020_validation(self):
         schema = {
             "type": "object",
@@ -330,3 +336,42 @@ class TestReportActivityJsonValidator:
             "unevaluatedProperties"
             not in schema["properties"]["test_prop"]["dependentSchemas"]["test_prop_1"]["properties"]["test_prop_2"]
         )
+
+    @patch("service.form_builder_service.FormBuilderService.build_form_schema")
+    def test_validate_reuses_cached_validator(self, mock_build_form_schema):
+        mock_build_form_schema.return_value = json.dumps(
+            {"schema": {"type": "object", "properties": {"sourceTypes": {"type": "object"}}}}
+        )
+        raw_activity_data = make_recipe(
+            "reporting.tests.utils.report_raw_activity_data",
+            activity__slug="test-activity",
+            json_data={"sourceTypes": {}},
+        )
+        report_version = raw_activity_data.facility_report.report_version
+
+        assert validate(report_version) == {}
+        assert validate(report_version) == {}
+        mock_build_form_schema.assert_called_once()
+
+        # A fresh worker (empty in-process cache) reads the shared schema instead of rebuilding it
+        ActivitySchemaValidatorCache.clear_local()
+        assert validate(report_version) == {}
+        mock_build_form_schema.assert_called_once()
+
+    @patch("service.form_builder_service.FormBuilderService.build_form_schema")
+    def test_warm_validation_cache_builds_schemas_ahead_of_submit(self, mock_build_form_schema):
+        mock_build_form_schema.return_value = json.dumps({"schema": {"type": "object"}})
+        raw_activity_data = make_recipe(
+            "reporting.tests.utils.report_raw_activity_data",
+            activity__slug="test-activity",
+            json_data={"sourceTypes": {}},
+        )
+        report_version = raw_activity_data.facility_report.report_version
+
+        visited = warm_validation_cache(ReportVersion.objects.filter(id=report_version.id))
+        assert visited == 1
+        mock_build_form_schema.assert_called_once()
+
+        ActivitySchemaValidatorCache.clear_local()
+        assert validate(report_version) == {}
+        mock_build_form_schema.assert_called_once()
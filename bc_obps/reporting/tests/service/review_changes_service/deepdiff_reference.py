@@ -0,0 +1,127 @@
+"""
+The previous implementation of ReportReviewChangesService.get_report_version_diff_changes, which runs DeepDiff over the
+whole serialized report versions. It's slow on large reports; the keyed diff is tested against it.
+"""
+
+import json
+import re
+from typing import Any, Dict, List
+from deepdiff import DeepDiff
+from deepdiff.helper import NotPresent
+
+from reporting.service.review_changes_service.diff_helpers import (
+    _CHANGE_TYPE_MAP,
+    _DIFF_KWARGS,
+    detect_renames,
+    remove_noisy_diff_keys,
+)
+from reporting.service.review_changes_service.report_review_changes_service import (
+    COMPLIANCE_PRODUCTS_ROOT,
+    _get_field_display_title,
+    _get_reporting_field_display_titles,
+    _is_false_positive_product_change,
+    _last_item_report_product_id,
+)
+
+
+def fix_facility_uuid_in_path(field: str, current: dict) -> str:
+    """Replace a facility UUID in a diff path with the human-readable facility name."""
+    m = re.match(r"root\['facility_reports'\]\['([^']+)'\]", field)
+    if m:
+        fac = current.get('facility_reports', {}).get(m.group(1))
+        if fac and 'facility_name' in fac:
+            return field.replace(f"['{m.group(1)}']", f"['{fac['facility_name']}']", 1)
+    return field
+
+
+def _deepdiff_sections(prev: Dict[str, dict], curr: Dict[str, dict], path_root: str) -> List[Dict[str, Any]]:
+    changes = []
+
+    for name in prev.keys() - curr.keys():
+        changes.append(
+            {"field": f"{path_root}['{name}']", "old_value": prev[name], "new_value": None, "change_type": "removed"}
+        )
+
+    for name in curr.keys() - prev.keys():
+        changes.append(
+            {"field": f"{path_root}['{name}']", "old_value": None, "new_value": curr[name], "change_type": "added"}
+        )
+
+    for name in prev.keys() & curr.keys():
+        for diff_key, items in DeepDiff(prev[name], curr[name], **_DIFF_KWARGS).items():
+            changes = changes + [
+                {
+                    "field": f"{path_root}['{name}']{item.path()[4:]}",
+                    "old_value": None if isinstance(item.t1, NotPresent) else item.t1,
+                    "new_value": None if isinstance(item.t2, NotPresent) else item.t2,
+                    "change_type": _CHANGE_TYPE_MAP.get(diff_key, 'modified'),
+                }
+                for item in items
+            ]
+    return changes
+
+
+def get_deepdiff_report_version_diff_changes(previous: dict, current: dict) -> List[Dict[str, Any]]:
+    previous, current = previous or {}, current or {}
+
+    previous = remove_noisy_diff_keys(previous)
+    current = remove_noisy_diff_keys(current)
+
+    field_display_titles = _get_reporting_field_display_titles()
+    changes: List[Dict[str, Any]] = []
+
+    # Facility reports
+    prev_facs: Dict[str, dict] = previous.get('facility_reports') or {}
+    curr_facs: Dict[str, dict] = current.get('facility_reports') or {}
+    changes.extend(detect_renames(prev_facs, curr_facs))
+    changes.extend(
+        change
+        for change in _deepdiff_sections(prev_facs, curr_facs, "root['facility_reports']")
+        if not _is_false_positive_product_change(change)
+    )
+
+    # edge case if only item is report_product_id after filtering false positives
+    if len(changes) == 1 and _last_item_report_product_id(changes[0]):
+        changes = []
+
+    for change in changes:
+        change["field_display_title"] = _get_field_display_title(change["field"], field_display_titles)
+
+    # Compliance products
+    prev_products = {
+        p['name']: p for p in (previous.get('report_compliance_summary') or {}).get('products', []) if p.get('name')
+    }
+    curr_products = {
+        p['name']: p for p in (current.get('report_compliance_summary') or {}).get('products', []) if p.get('name')
+    }
+
+    product_changes = _deepdiff_sections(prev_products, curr_products, COMPLIANCE_PRODUCTS_ROOT)
+    for change in product_changes:
+        change["field_display_title"] = _get_field_display_title(change["field"], field_display_titles)
+
+    changes.extend(product_changes)
+
+    # All remaining top-level fields
+    diff = DeepDiff(previous, current, exclude_regex_paths=[r".*?facility_reports.*"], **_DIFF_KWARGS)
+    for diff_key, items in diff.items():
+        changes = changes + [
+            {
+                "field": fix_facility_uuid_in_path(item.path(), current),
+                "field_display_title": _get_field_display_title(item.path(), field_display_titles),
+                "old_value": None if isinstance(item.t1, NotPresent) else item.t1,
+                "new_value": None if isinstance(item.t2, NotPresent) else item.t2,
+                "change_type": _CHANGE_TYPE_MAP.get(diff_key, 'modified'),
+            }
+            for item in items
+            if not item.path().startswith(COMPLIANCE_PRODUCTS_ROOT)
+        ]
+
+    return changes
+
+
+def sorted_changes(changes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    The changes in a canonical order. DeepDiff groups its results by change type in the iteration order of a set, which
+    varies between processes, so the two implementations list the same changes in different orders.
+    """
+    return sorted(changes, key=lambda change: json.dumps(change, sort_keys=True, default=str))
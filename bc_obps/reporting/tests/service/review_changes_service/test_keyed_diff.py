@@ -0,0 +1,188 @@
+import copy
+import random
+import uuid
+import pytest
+from reporting.tests.service.review_changes_service.deepdiff_reference import (
+    get_deepdiff_report_version_diff_changes,
+    sorted_changes,
+)
+from reporting.service.review_changes_service.diff_helpers import diff_values
+from reporting.service.review_changes_service.report_review_changes_service import ReportReviewChangesService
+
+pytestmark = pytest.mark.django_db
+
+
+def make_facility_report(rng: random.Random, name: str) -> dict:
+    products = [f"Product {i}" for i in range(rng.randint(1, 3))]
+    return {
+        "facility": str(uuid.UUID(int=rng.getrandbits(128))),
+        "facility_name": name,
+        "facility_type": rng.choice(["Single Facility Operation", "Large Facility"]),
+        "facility_bcghgid": f"2341{rng.randint(100, 999)}",
+        "activity_data": {
+            activity: {
+                "activity": activity,
+                "json_data": {
+                    "sourceTypes": {
+                        slug: {
+                            "units": [
+                                {
+                                    "gscUnitName": f"Unit {unit}",
+                                    "fuels": [
+                                        {
+                                            "fuelType": {"fuelName": "Natural Gas", "fuelUnit": "Sm3"},
+                                            "annualFuelAmount": rng.randint(1, 10000),
+                                            "emissions": [
+                                                {"gasType": gas, "emission": round(rng.uniform(0, 1000), 4)}
+                                                for gas in ("CO2", "CH4", "N2O")
+                                            ],
+                                        }
+                                    ],
+                                }
+                                for unit in range(rng.randint(1, 2))
+                            ]
+                        }
+                        for slug in ("gscFuelOrWasteWithContinuousEmissionsMonitoring", "fieldProcessVentGas")
+                    }
+                },
+            }
+            for activity in ("General stationary combustion", "Venting")
+        },
+        "report_products": {
+            product: {"product": product, "annual_production": rng.randint(1, 1000), "unit": "t"}
+            for product in products
+        },
+        "reportnonattributableemissions_records": [
+            {"activity": "Other", "source_type": "Flaring", "emission_category": "Fugitive", "gas_type": ["CO2"]}
+        ],
+        "emission_summary": {"attributable_for_reporting": "1234.5000", "excluded": "0.0000"},
+        "report_emission_allocation": {
+            "allocation_methodology": "Calculator",
+            "report_product_emission_allocations": [
+                {
+                    "emission_category_name": category,
+                    "products": [
+                        {"product_name": product, "allocated_quantity": "10.0000", "report_product_id": index}
+                        for index, product in enumerate(products)
+                    ],
+                }
+                for category in ("Flaring", "Venting - useful")
+            ],
+        },
+    }
+
+
+def make_report_version(rng: random.Random, facility_count: int) -> dict:
+    return {
+        "report_type": "Annual Report",
+        "is_latest_submitted": True,
+        "reason_for_change": None,
+        "status": "Submitted",
+        "reporting_year": 2024,
+        "is_supplementary_report": False,
+        "report_operation": {
+            "operator_legal_name": "Operator O'Brien Ltd.",
+            "operation_name": "Operation",
+            "activities": ["General stationary combustion", "Venting"],
+            "regulated_products": ["Product 0", "Product 1"],
+        },
+        "report_person_responsible": {"first_name": "Jane", "last_name": "Doe", "phone_number": "+16044011234"},
+        "report_compliance_summary": {
+            "emissions_attributable_for_compliance": "5000.0000",
+            "emission_limit": "4000.0000",
+            "products": [
+                {"name": f"Product {i}", "annual_production": "100.0000", "emission_intensity": "0.5000"}
+                for i in range(3)
+            ],
+        },
+        "report_new_entrant": [],
+        "report_electricity_import_data": [],
+        "operation_emission_summary": None,
+        "facility_reports": {
+            f"Facility {i}": make_facility_report(rng, f"Facility {i}") for i in range(facility_count)
+        },
+    }
+
+
+def _containers(value, containers):
+    if isinstance(value, (dict, list)):
+        containers.append(value)
+        for child in value.values() if isinstance(value, dict) else value:
+            _containers(child, containers)
+    return containers
+
+
+def mutate(rng: random.Random, report_version: dict) -> None:
+    """Applies a random edit, like the ones between two versions of a report"""
+    operation = rng.choice(["leaf", "leaf", "leaf", "add", "remove", "reorder", "rename", "noise"])
+    if operation == "rename" and report_version["facility_reports"]:
+        old_name = rng.choice(list(report_version["facility_reports"]))
+        facility_report = report_version["facility_reports"].pop(old_name)
+        facility_report["facility_name"] = f"{old_name} (renamed)"
+        report_version["facility_reports"][facility_report["facility_name"]] = facility_report
+        return
+    if operation == "noise":
+        report_version["status"] = "Draft"
+        report_version["is_supplementary_report"] = True
+        return
+
+    container = rng.choice(_containers(report_version, []))
+    keys = list(container) if isinstance(container, dict) else list(range(len(container)))
+    if operation == "reorder" and isinstance(container, list):
+        rng.shuffle(container)
+    elif operation == "add":
+        new_value = rng.choice([1, 2.5, "new", None, {"added": 1}, [1, 2]])
+        if isinstance(container, dict):
+            container[f"added_{rng.randint(0, 99)}"] = new_value
+        else:
+            container.append(copy.deepcopy(container[0]) if container and rng.random() < 0.5 else new_value)
+    elif operation == "remove" and keys:
+        del container[rng.choice(keys)]
+    elif keys:
+        key = rng.choice(keys)
+        value = container[key]
+        if isinstance(value, bool) or value is None:
+            container[key] = rng.choice([True, False, None, 0])
+        elif isinstance(value, int):
+            container[key] = rng.choice([value + 1, float(value), str(value)])
+        elif isinstance(value, float):
+            container[key] = round(value * rng.uniform(0.5, 1.5), 4)
+        elif isinstance(value, str):
+            container[key] = rng.choice([f"{value} changed", "O'Brien", None])
+
+
+class TestKeyedDiff:
+    def test_changes_are_the_same_as_deepdiffs_on_a_corpus_of_version_pairs(self):
+        rng = random.Random(2024)
+        for _ in range(200):
+            previous = make_report_version(rng, facility_count=rng.randint(1, 4))
+            current = copy.deepcopy(previous)
+            for _ in range(rng.randint(0, 6)):
+                mutate(rng, current)
+
+            changes = ReportReviewChangesService.get_report_version_diff_changes(previous, current)
+
+            assert sorted_changes(changes) == sorted_changes(
+                get_deepdiff_report_version_diff_changes(copy.deepcopy(previous), copy.deepcopy(current))
+            )
+
+    def test_inputs_are_not_modified(self):
+        rng = random.Random(1)
+        previous = make_report_version(rng, facility_count=2)
+        current = copy.deepcopy(previous)
+        current["facility_reports"]["Facility 0 (renamed)"] = current["facility_reports"].pop("Facility 0")
+        previous_copy, current_copy = copy.deepcopy(previous), copy.deepcopy(current)
+
+        ReportReviewChangesService.get_report_version_diff_changes(previous, current)
+
+        assert previous == previous_copy
+        assert current == current_copy
+
+    def test_diff_values_skips_noisy_keys_and_matches_deepdiff_paths(self):
+        previous = {"status": "Draft", "names": {"O'Brien": 1, "plain": 1}, "list": [1, 2], "number": 1}
+        current = {"status": "Submitted", "names": {"O'Brien": 2, "plain": 1}, "list": [2, 1], "number": 1.0}
+
+        assert diff_values(previous, current) == [
+            {"field": "root['names'][\"O'Brien\"]", "old_value": 1, "new_value": 2, "change_type": "modified"},
+            {"field": "root['number']", "old_value": 1, "new_value": 1.0, "change_type": "modified"},
+        ]
@@ -1,6 +1,11 @@
 import pytest
+from django.core.cache import cache
+from model_bakery import baker
+from reporting.models import ReportingField
 from reporting.service.review_changes_service.report_review_changes_service import (
+    REPORTING_FIELD_DISPLAY_TITLES_CACHE_KEY,
     ReportReviewChangesService,
+    _get_reporting_field_display_titles,
     _is_false_positive_product_change,
     _normalize_products,
     _get_field_display_title,
@@ -27,14 +32,6 @@ def mock_diff_sections(mocker):
     )
 
 
-@pytest.fixture
-def mock_fix_facility_uuid_in_path(mocker):
-    return mocker.patch(
-        f"{BASE_PATH}.fix_facility_uuid_in_path",
-        side_effect=lambda path, _: path,
-    )
-
-
 @pytest.fixture
 def mock_get_reporting_field_titles(mocker):
     return mocker.patch(
@@ -129,7 +126,6 @@ class TestReportReviewChangesService:
         mock_get_reporting_field_titles,
         mock_detect_renames,
         mock_diff_sections,
-        mock_fix_facility_uuid_in_path,
     ):
 
         prev = {"total_emissions": 500, "status": "draft"}
@@ -157,7 +153,6 @@ class TestReportReviewChangesService:
         mock_get_reporting_field_titles,
         mock_detect_renames,
         mock_diff_sections,
-        mock_fix_facility_uuid_in_path,
     ):
         prev = {
             "report_compliance_summary": {
@@ -185,3 +180,13 @@ class TestReportReviewChangesService:
         results = ReportReviewChangesService.get_report_version_diff_changes(prev, curr)
 
         assert results == []
+
+    def test_reporting_field_display_titles_are_cached(self, django_assert_num_queries):
+        cache.delete(REPORTING_FIELD_DISPLAY_TITLES_CACHE_KEY)
+        with django_assert_num_queries(1):
+            titles = _get_reporting_field_display_titles()
+            assert _get_reporting_field_display_titles() == titles
+
+        # Saving a reporting field clears the cached titles
+        baker.make(ReportingField, slug="newField", field_display_title="New Field")
+        assert _get_reporting_field_display_titles()["newField"] == "New Field"
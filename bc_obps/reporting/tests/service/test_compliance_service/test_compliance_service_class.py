@@ -1,4 +1,5 @@
 import dataclasses
+from unittest.mock import patch
 from django.test import TestCase
 from reporting.models.emission_category import EmissionCategory
 from registration.models import Operation
@@ -10,7 +11,9 @@ from reporting.models import (
     Report,
     ReportOperation,
 )
+from reporting.models.naics_regulatory_value import NaicsRegulatoryValue
 from reporting.service.compliance_service import ComplianceService
+from reporting.service.compliance_service.regulatory_values import get_regulatory_parameter_snapshot
 from reporting.tests.service.test_compliance_service.infrastructure import ComplianceTestInfrastructure
 from decimal import Decimal
 from reporting.service.compliance_service.parameters import ProductionPeriod, ComplianceParameters
@@ -268,6 +271,37 @@ class TestComplianceSummaryServiceClass(TestCase):
         for idx, p in enumerate(report_compliance_product_records):
             assert p.annual_production == updated_result.products[idx].annual_production
 
+    def test_compliance_data_for_reporting_year_loads_the_regulatory_parameters_once(self):
+        build_data = ComplianceTestInfrastructure.build()
+        ComplianceService.save_compliance_data(build_data.report_version_1.id)
+        expected = ComplianceService.get_calculated_compliance_data(build_data.report_version_1.id)
+
+        with patch(
+            "reporting.service.compliance_service.compliance_service.get_regulatory_parameter_snapshot",
+            wraps=get_regulatory_parameter_snapshot,
+        ) as get_snapshot:
+            results = ComplianceService.get_calculated_compliance_data_for_reporting_year(
+                build_data.report_version_1.report.reporting_year_id
+            )
+
+        assert results == {build_data.report_version_1.id: expected}
+        get_snapshot.assert_called_once()
+
+    def test_find_stale_compliance_summaries(self):
+        build_data = ComplianceTestInfrastructure.build()
+        ComplianceService.save_compliance_data(build_data.report_version_1.id)
+        reporting_year = build_data.report_version_1.report.reporting_year_id
+        assert ComplianceService.find_stale_compliance_summaries(reporting_year) == {}
+
+        # The reduction factor of the industry is corrected
+        NaicsRegulatoryValue.objects.filter(
+            naics_code_id=ReportOperation.objects.get(report_version=build_data.report_version_1).naics_code_id
+        ).update(reduction_factor=Decimal("0.7000"))
+
+        stale = ComplianceService.find_stale_compliance_summaries(reporting_year)
+        assert stale[build_data.report_version_1.id]["reduction_factor"] == (Decimal("0.6500"), Decimal("0.7000"))
+        assert "emissions_limit" in stale[build_data.report_version_1.id]
+
     def test_compliance_summary_with_pulp_and_paper_regulatory_override(self):
         # Sheet 6
         build_data = ComplianceTestInfrastructure.build_pulp_and_paper_2025()
@@ -0,0 +1,177 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery.baker import make_recipe
+from registration.models.naics_code import NaicsCode
+from reporting.models.emission_category import EmissionCategory
+from reporting.models.naics_regulatory_override import NaicsRegulatoryOverride
+from reporting.models.product_emission_intensity import ProductEmissionIntensity
+from reporting.models.report_version import ReportVersion
+from reporting.models.reporting_year import ReportingYear
+from reporting.service.compliance_service import ComplianceService
+from reporting.service.compliance_service.emission_allocation import (
+    get_allocated_emissions_by_report_product_emission_category,
+    get_reporting_only_allocated,
+)
+from reporting.service.compliance_service.industrial_process import compute_industrial_process_emissions
+from reporting.service.compliance_service.product_compliance_inputs import load_product_compliance_inputs
+from reporting.service.compliance_service.regulatory_values import (
+    get_product_regulatory_values_override,
+    get_regulatory_parameter_snapshot,
+)
+from reporting.models.report_product import ReportProduct
+
+pytestmark = pytest.mark.django_db
+
+# Flaring, industrial process, mobile combustion and excluded non-biomass
+ALLOCATED_CATEGORY_IDS = [1, 3, 4, 12]
+
+
+def build_report_with_products(product_count: int) -> ReportVersion:
+    reporting_year = ReportingYear.objects.get(pk=2024)
+    operation = make_recipe("registration.tests.utils.operation", naics_code=NaicsCode.objects.get(pk=1))
+    report_version = make_recipe(
+        "reporting.tests.utils.report_version",
+        report__operation=operation,
+        report__reporting_year=reporting_year,
+    )
+    make_recipe(
+        "reporting.tests.utils.report_operation", report_version=report_version, naics_code_id=operation.naics_code_id
+    )
+    product_ids = (
+        ProductEmissionIntensity.objects.filter(
+            product__is_regulated=True,
+            valid_from__year__lte=reporting_year.reporting_year,
+            valid_to__year__gte=reporting_year.reporting_year,
+        )
+        .exclude(product__name__startswith="Pulp and paper")
+        .order_by("product_id")
+        .values_list("product_id", flat=True)[:product_count]
+    )
+    assert len(product_ids) == product_count, "Not enough regulated products with an emission intensity"
+
+    # One product gets a regulatory override, to exercise the override lookup
+    NaicsRegulatoryOverride.objects.get_or_create(
+        naics_code_id=operation.naics_code_id,
+        regulated_product_id=product_ids[0],
+        reduction_factor=Decimal("0.9"),
+        tightening_rate=Decimal("0.02"),
+        valid_from=reporting_year.reporting_window_start,
+        valid_to=reporting_year.reporting_window_end,
+    )
+    emission_allocation = make_recipe("reporting.tests.utils.report_emission_allocation", report_version=report_version)
+    categories = EmissionCategory.objects.in_bulk(ALLOCATED_CATEGORY_IDS)
+    for index, product_id in enumerate(product_ids, start=1):
+        report_product = make_recipe(
+            "reporting.tests.utils.report_product",
+            report_version=report_version,
+            product_id=product_id,
+            annual_production=Decimal(1000 * index),
+            production_data_apr_dec=Decimal(750 * index),
+        )
+        for category_id, category in categories.items():
+            make_recipe(
+                "reporting.tests.utils.report_product_emission_allocation",
+                report_emission_allocation=emission_allocation,
+                report_version=report_version,
+                report_product=report_product,
+                emission_category=category,
+                allocated_quantity=Decimal(f"{index * category_id}.0125"),
+            )
+    return ReportVersion.objects.select_related("report__reporting_year", "report_operation__naics_code").get(
+        pk=report_version.id
+    )
+
+
+def per_product_inputs(report_version: ReportVersion) -> list:
+    """The values the compliance calculation used to query for each product, one product at a time."""
+    basic_category_ids = list(EmissionCategory.objects.filter(category_type="basic").values_list("id", flat=True))
+    inputs = []
+    for rp in (
+        ReportProduct.objects.order_by("product_id")
+        .filter(report_version_id=report_version.id, product__is_regulated=True)
+        .distinct("product_id")
+    ):
+        override = get_product_regulatory_values_override(report_version, rp.product_id)
+        inputs.append(
+            (
+                rp.product_id,
+                ComplianceService.get_report_product_aggregated_totals(report_version.id, rp.product_id),
+                ProductEmissionIntensity.objects.get(
+                    product_id=rp.product_id,
+                    valid_from__year__lte=report_version.report.reporting_year.reporting_year,
+                    valid_to__year__gte=report_version.report.reporting_year.reporting_year,
+                ).product_weighted_average_emission_intensity,
+                (override.reduction_factor_override, override.tightening_rate_override),
+                get_allocated_emissions_by_report_product_emission_category(
+                    report_version.id, rp.product_id, basic_category_ids
+                ),
+                get_reporting_only_allocated(report_version.id, rp.product_id),
+                compute_industrial_process_emissions(rp),
+            )
+        )
+    return inputs
+
+
+def grouped_inputs(report_version: ReportVersion) -> list:
+    basic_category_ids = list(EmissionCategory.objects.filter(category_type="basic").values_list("id", flat=True))
+    return [
+        (
+            product.product_id,
+            product.production_totals,
+            product.emission_intensity,
+            (
+                product.regulatory_values_override.reduction_factor_override,
+                product.regulatory_values_override.tightening_rate_override,
+            ),
+            product.allocated_to_categories(basic_category_ids),
+            product.allocated_to_categories([10, 11, 12, 2, 7]),
+            product.industrial_process,
+        )
+        for product in load_product_compliance_inputs(report_version)
+    ]
+
+
+class TestProductComplianceInputs:
+    def test_grouped_inputs_match_per_product_queries(self):
+        report_version = build_report_with_products(4)
+
+        assert grouped_inputs(report_version) == per_product_inputs(report_version)
+
+    def test_products_without_emission_intensity_raise(self):
+        report_version = build_report_with_products(1)
+        make_recipe(
+            "reporting.tests.utils.report_product",
+            report_version=report_version,
+            product=make_recipe("registration.tests.utils.regulated_product", is_regulated=True),
+            production_data_apr_dec=Decimal(1),
+        )
+
+        with pytest.raises(ProductEmissionIntensity.DoesNotExist):
+            load_product_compliance_inputs(report_version)
+
+    def test_compliance_data_query_count_does_not_grow_with_products(self):
+        query_counts = []
+        for product_count in (1, 6):
+            report_version = build_report_with_products(product_count)
+            # The regulatory parameters are loaded once per reporting year, not for each report
+            get_regulatory_parameter_snapshot(report_version.report.reporting_year)
+            with CaptureQueriesContext(connection) as context:
+                result = ComplianceService.get_calculated_compliance_data(report_version.id)
+            assert len(result.products) == product_count
+            query_counts.append(len(context.captured_queries))
+
+        assert query_counts[0] == query_counts[1]
+
+    def test_grouped_inputs_query_count_does_not_grow_with_products(self):
+        query_counts = []
+        for product_count in (1, 6):
+            report_version = build_report_with_products(product_count)
+            snapshot = get_regulatory_parameter_snapshot(report_version.report.reporting_year)
+            with CaptureQueriesContext(connection) as context:
+                assert len(load_product_compliance_inputs(report_version, snapshot)) == product_count
+            query_counts.append(len(context.captured_queries))
+
+        assert query_counts[0] == query_counts[1]
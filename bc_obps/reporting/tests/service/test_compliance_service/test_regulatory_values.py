@@ -1,14 +1,20 @@
 from datetime import date, datetime
 from django.utils import timezone
 from decimal import Decimal
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from model_bakery.baker import make_recipe
+from reporting.models.naics_regulatory_override import NaicsRegulatoryOverride
 from reporting.models.naics_regulatory_value import NaicsRegulatoryValue
+from reporting.models.product_emission_intensity import ProductEmissionIntensity
 from reporting.models.report_version import ReportVersion
+from reporting.models.reporting_year import ReportingYear
 from reporting.service.compliance_service.regulatory_values import (
     RegulatoryValuesOverride,
     get_industry_regulatory_values,
     get_product_regulatory_values_override,
+    get_regulatory_parameter_snapshot,
 )
 from service.report_service import ReportService
 
@@ -166,3 +172,82 @@ class TestRegulatoryValues(TestCase):
         assert regulatory_values_from_service.reduction_factor == oil_gas_regulatory_values.reduction_factor
         assert regulatory_values_from_service.tightening_rate == oil_gas_regulatory_values.tightening_rate
         assert regulatory_values_from_service.reduction_factor != basic_chem_regulatory_values.reduction_factor
+
+
+class TestRegulatoryParameterSnapshot(TestCase):
+    def test_snapshot_matches_the_regulatory_parameter_queries(self):
+        for reporting_year in ReportingYear.objects.filter(reporting_year__in=[2024, 2025]):
+            snapshot = get_regulatory_parameter_snapshot(reporting_year)
+            in_reporting_window = {
+                "valid_from__lte": reporting_year.reporting_window_start,
+                "valid_to__gte": reporting_year.reporting_window_end,
+            }
+
+            for naics_code_id in NaicsRegulatoryValue.objects.values_list("naics_code_id", flat=True).distinct():
+                try:
+                    expected = NaicsRegulatoryValue.objects.get(naics_code_id=naics_code_id, **in_reporting_window)
+                except NaicsRegulatoryValue.DoesNotExist:
+                    with self.assertRaises(NaicsRegulatoryValue.DoesNotExist):
+                        snapshot.get_industry_regulatory_values(naics_code_id)
+                    continue
+                values = snapshot.get_industry_regulatory_values(naics_code_id)
+                assert (values.reduction_factor, values.tightening_rate) == (
+                    expected.reduction_factor,
+                    expected.tightening_rate,
+                )
+                assert values.compliance_period == reporting_year.reporting_year
+
+            for override in NaicsRegulatoryOverride.objects.filter(**in_reporting_window):
+                assert snapshot.get_regulatory_values_override(
+                    override.naics_code_id, override.regulated_product_id
+                ) == RegulatoryValuesOverride(override.reduction_factor, override.tightening_rate)
+
+            for intensity in ProductEmissionIntensity.objects.filter(
+                valid_from__year__lte=reporting_year.reporting_year,
+                valid_to__year__gte=reporting_year.reporting_year,
+            ):
+                assert (
+                    snapshot.get_emission_intensity(intensity.product_id)
+                    == intensity.product_weighted_average_emission_intensity
+                )
+
+    def test_reading_the_snapshot_needs_no_queries(self):
+        snapshot = get_regulatory_parameter_snapshot(ReportingYear.objects.get(pk=2025))
+        intensity = ProductEmissionIntensity.objects.filter(
+            valid_from__year__lte=2025, valid_to__year__gte=2025
+        ).first()
+
+        with CaptureQueriesContext(connection) as context:
+            snapshot.get_industry_regulatory_values(1)
+            snapshot.get_regulatory_values_override(1, intensity.product_id)
+            snapshot.get_emission_intensity(intensity.product_id)
+
+        assert len(context.captured_queries) == 0
+
+    def test_snapshot_is_rebuilt_when_the_regulatory_parameters_change(self):
+        reporting_year = ReportingYear.objects.get(pk=2024)
+        snapshot = get_regulatory_parameter_snapshot(reporting_year)
+        assert get_regulatory_parameter_snapshot(reporting_year) is snapshot
+        product = make_recipe("registration.tests.utils.regulated_product", name='Test Product')
+        assert snapshot.get_regulatory_values_override(1, product.id) == RegulatoryValuesOverride()
+
+        make_recipe(
+            "reporting.tests.utils.naics_regulatory_override",
+            naics_code_id=1,
+            regulated_product=product,
+            reduction_factor=Decimal("0.9"),
+            tightening_rate=Decimal("0.02"),
+            valid_from=reporting_year.reporting_window_start,
+            valid_to=reporting_year.reporting_window_end,
+        )
+
+        rebuilt_snapshot = get_regulatory_parameter_snapshot(reporting_year)
+        assert rebuilt_snapshot is not snapshot
+        assert rebuilt_snapshot.get_regulatory_values_override(1, product.id) == RegulatoryValuesOverride(
+            Decimal("0.9000"), Decimal("0.0200")
+        )
+
+        NaicsRegulatoryValue.objects.filter(naics_code_id=1).update(tightening_rate=Decimal("0.0300"))
+        assert get_regulatory_parameter_snapshot(reporting_year).get_industry_regulatory_values(
+            1
+        ).tightening_rate == Decimal("0.0300")
@@ -0,0 +1,119 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from model_bakery.baker import make, make_recipe
+from registration.models.activity import Activity
+from reporting.models.emission_category import EmissionCategory
+from reporting.models.emission_category_mapping import EmissionCategoryMapping
+from reporting.models.source_type import SourceType
+from reporting.service.emission_category_mapping_service import (
+    FUEL_EXCLUDED_CATEGORY_NAMES,
+    EmissionCategoryMappingService,
+)
+
+METHODOLOGIES = [
+    {"methodology": "Default HHV/Default EF"},
+    {"methodology": "Solids-HHV"},
+    {"methodology": "Replacement Methodology", "isWoodyBiomass": True},
+    {"methodology": "Replacement Methodology", "isWoodyBiomass": False},
+]
+
+
+def categories_from_queries(activity_id: int, source_type_id: int, fuel_classification, methodology_data: dict) -> list:
+    """The mapping rules, resolved with a query per rule"""
+    mappings = EmissionCategoryMapping.objects.filter(activity_id=activity_id, source_type_id=source_type_id)
+    categories = [mappings.get(emission_category__category_type='basic').emission_category_id]
+    fuel_excluded = mappings.filter(emission_category__category_type='fuel_excluded')
+    if fuel_classification in FUEL_EXCLUDED_CATEGORY_NAMES and fuel_excluded.exists():
+        categories.append(
+            fuel_excluded.get(
+                emission_category__category_name=FUEL_EXCLUDED_CATEGORY_NAMES[fuel_classification]
+            ).emission_category_id
+        )
+    other = mappings.filter(emission_category__category_type='other_excluded').order_by("id").first()
+    if other:
+        categories.append(other.emission_category_id)
+    is_woody_biomass_methodology = methodology_data["methodology"] in ["Solids-HHV", "Solids-CC"] or (
+        methodology_data["methodology"] == "Replacement Methodology" and methodology_data.get("isWoodyBiomass")
+    )
+    if Activity.objects.get(id=activity_id).slug == 'pulp_and_paper' and is_woody_biomass_methodology:
+        categories.append(
+            mappings.get(
+                emission_category__category_name='CO2 emissions from excluded woody biomass'
+            ).emission_category_id
+        )
+    return list(dict.fromkeys(categories))
+
+
+class TestEmissionCategoryMappingService(TestCase):
+    def test_index_matches_the_mapping_rules(self):
+        index = EmissionCategoryMappingService.get_mapping_index()
+
+        for activity_id, source_type_id in EmissionCategoryMapping.objects.values_list(
+            "activity_id", "source_type_id"
+        ).distinct():
+            for fuel_classification in [None, *FUEL_EXCLUDED_CATEGORY_NAMES, "Non-exempted Biomass"]:
+                for methodology_data in METHODOLOGIES:
+                    try:
+                        expected = categories_from_queries(
+                            activity_id, source_type_id, fuel_classification, methodology_data
+                        )
+                    except EmissionCategoryMapping.DoesNotExist:
+                        with self.assertRaises(EmissionCategoryMapping.DoesNotExist):
+                            index.get_emission_category_ids(
+                                activity_id, source_type_id, fuel_classification, methodology_data
+                            )
+                        continue
+                    assert (
+                        index.get_emission_category_ids(
+                            activity_id, source_type_id, fuel_classification, methodology_data
+                        )
+                        == expected
+                    ), (activity_id, source_type_id, fuel_classification, methodology_data)
+
+    def test_resolving_categories_needs_no_queries(self):
+        index = EmissionCategoryMappingService.get_mapping_index()
+        mapping = EmissionCategoryMapping.objects.filter(emission_category__category_type='basic').first()
+
+        with CaptureQueriesContext(connection) as context:
+            index.get_emission_category_ids(
+                mapping.activity_id, mapping.source_type_id, "Woody Biomass", METHODOLOGIES[0]
+            )
+
+        assert len(context.captured_queries) == 0
+
+    def test_index_is_rebuilt_when_the_mappings_change(self):
+        index = EmissionCategoryMappingService.get_mapping_index()
+        assert EmissionCategoryMappingService.get_mapping_index() is index
+
+        activity = Activity.objects.first()
+        source_type = make(SourceType, json_key="newSourceType")
+        with self.assertRaises(EmissionCategoryMapping.DoesNotExist):
+            index.get_emission_category_ids(activity.id, source_type.id, None, METHODOLOGIES[0])
+
+        flaring = EmissionCategory.objects.get(category_name='Flaring emissions')
+        EmissionCategoryMapping.objects.create(activity=activity, source_type=source_type, emission_category=flaring)
+
+        rebuilt_index = EmissionCategoryMappingService.get_mapping_index()
+        assert rebuilt_index is not index
+        assert rebuilt_index.get_emission_category_ids(activity.id, source_type.id, None, METHODOLOGIES[0]) == [
+            flaring.id
+        ]
+
+    def test_set_emission_categories(self):
+        emission_1 = make_recipe("reporting.tests.utils.report_emission")
+        emission_2 = make_recipe("reporting.tests.utils.report_emission")
+        emission_1.emission_categories.set([1, 10])
+        emission_2.emission_categories.set([5])
+        kept_category_row_id = emission_1.emission_categories.through.objects.get(
+            reportemission_id=emission_1.id, emissioncategory_id=1
+        ).id
+
+        with CaptureQueriesContext(connection) as context:
+            EmissionCategoryMappingService.set_emission_categories({emission_1.id: [1, 11], emission_2.id: [3, 12, 3]})
+
+        # Load the existing rows, then one delete and one insert
+        assert len(context.captured_queries) == 3
+        assert sorted(emission_1.emission_categories.values_list("id", flat=True)) == [1, 11]
+        assert sorted(emission_2.emission_categories.values_list("id", flat=True)) == [3, 12]
+        assert emission_1.emission_categories.through.objects.filter(id=kept_category_row_id).exists()
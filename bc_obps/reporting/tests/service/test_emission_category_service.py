@@ -1,8 +1,14 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from reporting.models.report_fuel import ReportFuel
 from reporting.models.report_emission import ReportEmission
 from reporting.models.report_source_type import ReportSourceType
-from reporting.service.emission_category_service import EmissionCategoryService
+from reporting.service.emission_category_service import (
+    CATEGORY_TOTAL_KEYS,
+    EmissionCategoryService,
+    EmissionCategoryTotals,
+)
 from reporting.tests.service.test_report_activity_save_service.infrastructure import TestInfrastructure
 from decimal import Decimal
 from model_bakery.baker import make, make_recipe
@@ -517,3 +523,70 @@ class TestEmissionCategoryService(TestCase):
             )
         )
         assert overlapping_return_value == Decimal('30.0000')
+
+    def test_category_totals_by_facility_reports(self):
+        report_source_type_one = make_recipe("reporting.tests.utils.report_source_type")
+        report_source_type_two = make_recipe(
+            "reporting.tests.utils.report_source_type", report_version=report_source_type_one.report_version
+        )
+        facility_report_without_emissions = make_recipe(
+            "reporting.tests.utils.facility_report", report_version=report_source_type_one.report_version
+        )
+        for report_source_type, categories_and_emissions in [
+            (report_source_type_one, [([1], 10), ([3, 10, 11], 5), ([2, 12], 20)]),
+            (report_source_type_two, [([5], 100), ([3, 12], 50), ([10], 1)]),
+        ]:
+            for categories, emission in categories_and_emissions:
+                make_recipe(
+                    "reporting.tests.utils.report_emission",
+                    report_source_type=report_source_type,
+                    report_version=report_source_type.report_version,
+                    json_data={"equivalentEmission": emission},
+                ).emission_categories.set(categories)
+        facility_report_ids = [
+            report_source_type_one.report_activity.facility_report_id,
+            report_source_type_two.report_activity.facility_report_id,
+            facility_report_without_emissions.id,
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            totals = EmissionCategoryService.get_category_totals_by_facility_reports(facility_report_ids)
+        assert len(context.captured_queries) == 1
+
+        facility_one_totals = totals[facility_report_ids[0]]
+        assert facility_one_totals.category_total(1) == Decimal('10')
+        assert facility_one_totals.category_total(3) == Decimal('5')
+        assert facility_one_totals.category_total(10) == Decimal('5')
+        assert facility_one_totals.attributable_for_reporting == Decimal('35')
+        assert facility_one_totals.attributable_for_threshold == Decimal('30')
+        # Each emission is counted once, whatever the number of reporting-only or excluded biomass categories it has
+        assert facility_one_totals.reporting_only == Decimal('25')
+        assert facility_one_totals.industrial_process_excluded_biomass_overlap == Decimal('5')
+
+        facility_two_totals = totals[facility_report_ids[1]]
+        assert facility_two_totals.attributable_for_reporting == Decimal('150')
+        assert facility_two_totals.reporting_only == Decimal('51')
+        assert facility_two_totals.industrial_process_excluded_biomass_overlap == Decimal('0')
+
+        assert totals[facility_report_ids[2]] == EmissionCategoryTotals()
+
+        # Each rollup matches the per-category aggregates
+        for facility_report_id in facility_report_ids:
+            assert totals[facility_report_id].as_dict() == {
+                **{
+                    key: EmissionCategoryService.get_total_emissions_by_emission_category(
+                        facility_report_id, category_id
+                    )
+                    for category_id, key in CATEGORY_TOTAL_KEYS.items()
+                },
+                'attributable_for_reporting': totals[facility_report_id].attributable_for_reporting,
+                'attributable_for_threshold': totals[facility_report_id].attributable_for_threshold,
+                'reporting_only': EmissionCategoryService.get_reporting_only_emissions(facility_report_id),
+            }
+
+        version_totals = EmissionCategoryService.get_category_totals_by_report_version(
+            report_source_type_one.report_version_id
+        )
+        assert version_totals.attributable_for_reporting == Decimal('185')
+        assert version_totals.reporting_only == Decimal('76')
+        assert version_totals.industrial_process_excluded_biomass_overlap == Decimal('5')
@@ -1,10 +1,19 @@
+import copy
+from typing import Any, Callable, Tuple
 from unittest.mock import patch
 import uuid
 import pytest
 from unittest.mock import MagicMock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery.baker import make_recipe
 from reporting.models.report_activity import ReportActivity
+from reporting.models.report_emission import ReportEmission
+from reporting.models.report_raw_activity_data import ReportRawActivityData
+from reporting.service.report_activity_bulk_save_service import ReportActivityBulkSaveService
 from reporting.service.report_activity_load_service import ReportActivityLoadService
+from reporting.tests.service.test_report_activity_save_service import data
+from reporting.tests.service.test_report_activity_save_service.infrastructure import TestInfrastructure
 
 
 @pytest.mark.django_db
@@ -32,3 +41,90 @@ class TestReportActivityLoadService:
         serialized = ReportActivityLoadService.load(1000, uuid.UUID(int=0), 1000)
 
         assert serialized == {}
+
+
+def save(infrastructure: TestInfrastructure, payload: dict) -> None:
+    ReportActivityBulkSaveService(
+        infrastructure.report_version.id,
+        infrastructure.facility_report.facility.id,
+        infrastructure.activity.id,
+        infrastructure.user.user_guid,
+    ).save(payload)
+
+
+def load(infrastructure: TestInfrastructure, use_raw_data: bool = False) -> dict:
+    return ReportActivityLoadService.load(
+        infrastructure.report_version.id,
+        infrastructure.facility_report.facility.id,
+        infrastructure.activity.id,
+        use_raw_data=use_raw_data,
+    )
+
+
+def count_queries(function: Callable[[], Any]) -> Tuple[Any, int]:
+    with CaptureQueriesContext(connection) as context:
+        result = function()
+    return result, len(context.captured_queries)
+
+
+@pytest.mark.django_db
+class TestReportActivityLoadServiceQueries:
+    def test_loads_in_a_constant_number_of_queries(self):
+        small_tree = TestInfrastructure.build_from_real_config()
+        save(small_tree, copy.deepcopy(data.test_data))
+        _, small_tree_queries = count_queries(lambda: load(small_tree))
+
+        # A larger tree: more units, each with fuels and emissions
+        large_tree = TestInfrastructure.build_from_real_config()
+        payload = copy.deepcopy(data.test_data)
+        useful_energy = payload["sourceTypes"]["gscFuelOrWasteLinearFacilitiesUsefulEnergy"]
+        useful_energy["units"] = [copy.deepcopy(useful_energy["units"][0]) for _ in range(6)]
+        save(large_tree, payload)
+        loaded, large_tree_queries = count_queries(lambda: load(large_tree))
+
+        assert len(loaded["sourceTypes"]["gscFuelOrWasteLinearFacilitiesUsefulEnergy"]["units"]) == 6
+        assert large_tree_queries == small_tree_queries
+
+    def test_returns_the_raw_data_when_in_sync(self):
+        infrastructure = TestInfrastructure.build_from_real_config()
+        save(infrastructure, copy.deepcopy(data.test_data))
+        # Saving a loaded form without adding records leaves the raw data in sync
+        save(infrastructure, load(infrastructure))
+
+        loaded, queries = count_queries(lambda: load(infrastructure, use_raw_data=True))
+
+        assert queries == 2
+        assert loaded == load(infrastructure)
+
+    def test_serializes_when_the_raw_data_has_new_records(self):
+        infrastructure = TestInfrastructure.build_from_real_config()
+        save(infrastructure, copy.deepcopy(data.test_data))
+
+        # The raw data of a first save has no ids
+        assert load(infrastructure, use_raw_data=True) == load(infrastructure)
+
+    def test_serializes_when_a_record_changed_after_the_raw_data(self):
+        infrastructure = TestInfrastructure.build_from_real_config()
+        save(infrastructure, copy.deepcopy(data.test_data))
+        save(infrastructure, load(infrastructure))
+        ReportEmission.objects.filter(report_version=infrastructure.report_version).delete()
+
+        loaded = load(infrastructure, use_raw_data=True)
+
+        assert loaded == load(infrastructure)
+        assert (
+            loaded["sourceTypes"]["gscFuelOrWasteLinearFacilitiesUsefulEnergy"]["units"][0]["fuels"][0]["emissions"]
+            == []
+        )
+
+    def test_serializes_when_the_raw_fuel_type_is_not_the_saved_one(self):
+        infrastructure = TestInfrastructure.build_from_real_config()
+        save(infrastructure, copy.deepcopy(data.test_data))
+        payload = load(infrastructure)
+        save(infrastructure, payload)
+        raw_data = copy.deepcopy(payload)
+        fuel = raw_data["sourceTypes"]["gscFuelOrWasteLinearFacilitiesUsefulEnergy"]["units"][0]["fuels"][0]
+        fuel["fuelType"]["fuelUnit"] = "not the unit"
+        ReportRawActivityData.objects.filter(facility_report=infrastructure.facility_report).update(json_data=raw_data)
+
+        assert load(infrastructure, use_raw_data=True) == load(infrastructure) == payload
@@ -0,0 +1,240 @@
+import copy
+from typing import Callable, Type
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from common.exceptions import UserError
+from reporting.models.fuel_type import FuelType
+from reporting.models.gas_type import GasType
+from reporting.models.report_activity import ReportActivity
+from reporting.models.report_raw_activity_data import ReportRawActivityData
+from reporting.models.source_type import SourceType
+from reporting.service.report_activity_bulk_save_service import ReportActivityBulkSaveService
+from reporting.service.report_activity_load_service import ReportActivityLoadService
+from reporting.service.report_activity_save_service import ReportActivitySaveService
+from reporting.tests.service.test_report_activity_save_service import data
+from reporting.tests.service.test_report_activity_save_service.infrastructure import TestInfrastructure
+
+
+def build_service(
+    service_class: Type[ReportActivitySaveService], infrastructure: TestInfrastructure
+) -> ReportActivitySaveService:
+    return service_class(
+        infrastructure.report_version.id,
+        infrastructure.facility_report.facility.id,
+        infrastructure.activity.id,
+        infrastructure.user.user_guid,
+    )
+
+
+def snapshot(report_activity: ReportActivity, original_ids: set) -> dict:
+    """
+    The saved report data of an activity, in id order and without the ids themselves
+    (only whether each row existed before the save), so two activities can be compared.
+    """
+
+    def row_id(row) -> str:
+        return "kept" if (type(row).__name__, row.id) in original_ids else "new"
+
+    def emissions(queryset) -> list:
+        return [
+            {
+                "id": row_id(emission),
+                "gas_type": emission.gas_type.chemical_formula,
+                "json_data": emission.json_data,
+                "categories": sorted(emission.emission_categories.values_list("id", flat=True)),
+                "methodology": {
+                    "id": row_id(emission.report_methodology),
+                    "methodology": emission.report_methodology.methodology.name,
+                    "json_data": emission.report_methodology.json_data,
+                },
+            }
+            for emission in queryset.order_by("id")
+        ]
+
+    def fuels(queryset) -> list:
+        return [
+            {
+                "id": row_id(fuel),
+                "fuel_type": fuel.fuel_type.name,
+                "json_data": fuel.json_data,
+                "emissions": emissions(fuel.reportemission_records),
+            }
+            for fuel in queryset.order_by("id")
+        ]
+
+    report_activity.refresh_from_db()
+    return {
+        "json_data": report_activity.json_data,
+        "source_types": [
+            {
+                "id": row_id(source_type),
+                "source_type": source_type.source_type.json_key,
+                "schema": source_type.activity_source_type_base_schema_id,
+                "json_data": source_type.json_data,
+                "units": [
+                    {
+                        "id": row_id(unit),
+                        "type": unit.type,
+                        "json_data": unit.json_data,
+                        "fuels": fuels(unit.reportfuel_records),
+                        "emissions": emissions(unit.reportemission_records),
+                    }
+                    for unit in source_type.reportunit_records.order_by("id")
+                ],
+                "fuels": fuels(source_type.reportfuel_records.filter(report_unit__isnull=True)),
+                "emissions": emissions(
+                    source_type.reportemission_records.filter(report_unit__isnull=True, report_fuel__isnull=True)
+                ),
+            }
+            for source_type in report_activity.reportsourcetype_records.order_by("id")
+        ],
+    }
+
+
+def saved_ids(payload: dict) -> set:
+    """(table, id) of every row referenced in a payload loaded by ReportActivityLoadService"""
+    ids = set()
+
+    def collect(node: dict, table: str) -> None:
+        ids.add((table, node["id"]))
+        for unit in node.get("units", []):
+            collect(unit, "ReportUnit")
+        for fuel in node.get("fuels", []):
+            collect(fuel, "ReportFuel")
+        for emission in node.get("emissions", []):
+            collect(emission, "ReportEmission")
+            ids.add(("ReportMethodology", emission["methodology"]["id"]))
+
+    for source_type in payload["sourceTypes"].values():
+        collect(source_type, "ReportSourceType")
+    return ids
+
+
+class TestReportActivityBulkSaveService(TestCase):
+    """
+    Differential tests: the bulk service must leave the database in the same state as ReportActivitySaveService.
+    """
+
+    def assert_same_result(self, initial_payload: dict, edit: Callable[[dict], None] | None = None) -> None:
+        results = []
+        for service_class in (ReportActivitySaveService, ReportActivityBulkSaveService):
+            infrastructure = TestInfrastructure.build_from_real_config()
+            payload = copy.deepcopy(initial_payload)
+            original_ids: set = set()
+            if edit is not None:
+                # Start from the same saved data, then edit it like the form would
+                build_service(ReportActivitySaveService, infrastructure).save(payload)
+                payload = ReportActivityLoadService.load(
+                    infrastructure.report_version.id,
+                    infrastructure.facility_report.facility.id,
+                    infrastructure.activity.id,
+                )
+                original_ids = saved_ids(payload)
+                edit(payload)
+
+            report_activity = build_service(service_class, infrastructure).save(payload)
+
+            raw_data = ReportRawActivityData.objects.get(facility_report=infrastructure.facility_report).json_data
+            results.append((snapshot(report_activity, original_ids), payload == raw_data, original_ids))
+
+        (legacy, legacy_raw_data_saved, _), (bulk, bulk_raw_data_saved, _) = results
+        assert bulk == legacy
+        assert legacy_raw_data_saved and bulk_raw_data_saved
+
+    def test_create(self):
+        self.assert_same_result(data.test_data)
+
+    def test_resave_without_changes(self):
+        self.assert_same_result(data.test_data, lambda payload: None)
+
+    def test_update(self):
+        def edit(payload: dict) -> None:
+            source_types = payload["sourceTypes"]
+            useful_energy = source_types["gscFuelOrWasteLinearFacilitiesUsefulEnergy"]
+            useful_energy["test_st_str"] = "edited"
+            unit = useful_energy["units"][0]
+            unit["description"] = "edited description"
+            unit["fuels"][0]["fuelType"] = {"fuelName": "Diesel"}
+            unit["fuels"][0]["emissions"][0]["emission"] = 3
+            unit["fuels"].append(
+                {
+                    "fuelType": {"fuelName": "Wood Waste"},
+                    "annualFuelAmount": 5,
+                    "emissions": [{"gasType": "CO2", "emission": 2, "methodology": {"methodology": "Measured CC"}}],
+                }
+            )
+
+            vent_gas = source_types["fieldProcessVentGasLinearFacilities"]
+            # Remove a whole unit, a fuel and an emission
+            del vent_gas["units"][1]
+            del vent_gas["units"][0]["fuels"][1]
+            del vent_gas["units"][0]["fuels"][0]["emissions"][1]
+            emission = vent_gas["units"][0]["fuels"][0]["emissions"][0]
+            emission["methodology"] = {
+                "id": emission["methodology"]["id"],
+                "methodology": "Measured CC",
+                "fuelAnnualWeightedAverageCarbonContentWeightFraction": 1,
+            }
+
+        self.assert_same_result(data.test_data, edit)
+
+    def test_remove_source_type(self):
+        def edit(payload: dict) -> None:
+            del payload["sourceTypes"]["fieldProcessVentGasLinearFacilities"]
+            payload["fieldProcessVentGasLinearFacilities"] = False
+
+        self.assert_same_result(data.test_data, edit)
+
+    def test_validation_errors_match(self):
+        def missing_fuel_name(payload: dict) -> None:
+            payload["sourceTypes"]["fieldProcessVentGasLinearFacilities"]["units"][0]["fuels"][0]["fuelType"] = {}
+
+        def missing_methodology(payload: dict) -> None:
+            del payload["sourceTypes"]["fieldProcessVentGasLinearFacilities"]["units"][1]["fuels"][1]["emissions"][0][
+                "methodology"
+            ]
+
+        def unknown_gas_type(payload: dict) -> None:
+            payload["sourceTypes"]["fieldProcessVentGasLinearFacilities"]["units"][0]["fuels"][0]["emissions"][0][
+                "gasType"
+            ] = "XYZ"
+
+        def unknown_fuel_type(payload: dict) -> None:
+            payload["sourceTypes"]["fieldProcessVentGasLinearFacilities"]["units"][0]["fuels"][0]["fuelType"] = {
+                "fuelName": "Not a fuel"
+            }
+
+        def unknown_source_type(payload: dict) -> None:
+            payload["sourceTypes"]["notASourceType"] = {"units": []}
+
+        for edit, expected_error in [
+            (missing_fuel_name, UserError),
+            (missing_methodology, UserError),
+            (unknown_gas_type, GasType.DoesNotExist),
+            (unknown_fuel_type, FuelType.DoesNotExist),
+            (unknown_source_type, SourceType.DoesNotExist),
+        ]:
+            messages = []
+            for service_class in (ReportActivitySaveService, ReportActivityBulkSaveService):
+                payload = copy.deepcopy(data.test_data)
+                edit(payload)
+                with self.assertRaises(expected_error) as context:
+                    build_service(service_class, TestInfrastructure.build_from_real_config()).save(payload)
+                messages.append(str(context.exception))
+            assert messages[0] == messages[1], edit.__name__
+
+    def test_bulk_save_uses_fewer_queries(self):
+        payload = copy.deepcopy(data.test_data)
+        vent_gas_units = payload["sourceTypes"]["fieldProcessVentGasLinearFacilities"]["units"]
+        vent_gas_units.extend(copy.deepcopy(vent_gas_units) * 5)
+
+        query_counts = []
+        for service_class in (ReportActivitySaveService, ReportActivityBulkSaveService):
+            service = build_service(service_class, TestInfrastructure.build_from_real_config())
+            with CaptureQueriesContext(connection) as context:
+                service.save(copy.deepcopy(payload))
+            query_counts.append(len(context.captured_queries))
+
+        legacy_queries, bulk_queries = query_counts
+        assert bulk_queries < legacy_queries / 2
@@ -13,6 +13,7 @@ from reporting.service.report_validation.report_validation_tags import Validatio
 
 @pytest.mark.django_db
 class TestReportSubmissionService:
+    @patch("reporting.service.report_version_snapshot_service.ReportVersionSnapshotService.save_snapshot_on_commit")
     @patch("reporting.service.compliance_service.ComplianceService.save_compliance_data")
     @patch("reporting.service.report_sign_off_service.ReportSignOffService.save_report_sign_off")
     @patch("reporting.service.report_submission_service.report_submitted.send")
@@ -29,6 +30,7 @@ class TestReportSubmissionService:
         mock_signal_send,
         mock_save_report_sign_off,
         mock_save_compliance_data,
+        mock_save_snapshot,
     ):
         # Arrange
         version_id = 1
@@ -96,6 +98,9 @@ class TestReportSubmissionService:
         # Assert that the fake report version was saved.
         fake_report_version.save.assert_called_once()
 
+        # Assert that the snapshot of the submitted version was saved
+        mock_save_snapshot.assert_called_once_with(version_id)
+
         # Assert that the report_submitted signal was sent with the correct parameters.
         mock_signal_send.assert_called_once_with(
             sender=ReportSubmissionService, version_id=version_id, user_guid=user_guid
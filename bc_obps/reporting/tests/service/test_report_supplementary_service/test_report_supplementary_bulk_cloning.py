@@ -0,0 +1,447 @@
+import json
+from collections import Counter
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from common.constants import AUDIT_FIELDS
+from registration.models import Activity, RegulatedProduct
+from reporting.models import (
+    ActivityJsonSchema,
+    ActivitySourceTypeJsonSchema,
+    EmissionCategory,
+    FacilityReport,
+    FuelType,
+    GasType,
+    Methodology,
+    ReportActivity,
+    ReportEmission,
+    ReportEmissionAllocation,
+    ReportFuel,
+    ReportMethodology,
+    ReportNonAttributableEmissions,
+    ReportProduct,
+    ReportProductEmissionAllocation,
+    ReportRawActivityData,
+    ReportSourceType,
+    ReportUnit,
+    SourceType,
+)
+from reporting.service.report_supplementary_version_service.report_supplementary_cloning import (
+    clone_report_version_facilities,
+)
+
+pytestmark = pytest.mark.django_db
+
+CLONED_MODELS = [
+    FacilityReport,
+    ReportActivity,
+    ReportRawActivityData,
+    ReportSourceType,
+    ReportUnit,
+    ReportFuel,
+    ReportEmission,
+    ReportMethodology,
+    ReportNonAttributableEmissions,
+    ReportEmissionAllocation,
+    ReportProduct,
+    ReportProductEmissionAllocation,
+]
+M2M_FIELDS = {
+    FacilityReport: "activities",
+    ReportEmission: "emission_categories",
+    ReportNonAttributableEmissions: "gas_type",
+}
+
+
+def _save_copy(row, **fields):
+    row.pk = None
+    row._state.adding = True
+    for name, value in fields.items():
+        setattr(row, name, value)
+    row.save()
+    return row
+
+
+def _legacy_clone_source_type(source_type, new_activity):
+    old_source_type_id = source_type.id
+    schema = source_type.activity_source_type_base_schema
+    units = list(ReportUnit.objects.filter(report_source_type_id=old_source_type_id)) if schema.has_unit else []
+    fuels_by_unit = {
+        unit.id: list(ReportFuel.objects.filter(report_source_type_id=old_source_type_id, report_unit=unit))
+        for unit in units
+    }
+    direct_fuels = (
+        list(ReportFuel.objects.filter(report_source_type_id=old_source_type_id, report_unit__isnull=True))
+        if schema.has_fuel and not schema.has_unit
+        else []
+    )
+    new_version = new_activity.report_version
+    new_source_type = _save_copy(source_type, report_version=new_version, report_activity=new_activity)
+
+    def clone_emissions(emissions, new_unit=None, new_fuel=None):
+        for emission in list(emissions):
+            categories = list(emission.emission_categories.all())
+            methodologies = list(ReportMethodology.objects.filter(report_emission=emission))
+            new_emission = _save_copy(
+                emission,
+                report_version=new_version,
+                report_source_type=new_source_type,
+                report_unit=new_unit if (new_fuel is None or emission.report_unit_id) else None,
+                report_fuel=new_fuel,
+            )
+            new_emission.emission_categories.set(categories)
+            for methodology in methodologies:
+                _save_copy(methodology, report_version=new_version, report_emission=new_emission)
+
+    def clone_fuels(fuels, new_unit=None):
+        for fuel in fuels:
+            emissions = list(ReportEmission.objects.filter(report_source_type_id=old_source_type_id, report_fuel=fuel))
+            new_fuel = _save_copy(
+                fuel, report_version=new_version, report_source_type=new_source_type, report_unit=new_unit
+            )
+            clone_emissions(emissions, new_unit=new_unit, new_fuel=new_fuel)
+
+    for unit in units:
+        unit_emissions = list(
+            ReportEmission.objects.filter(
+                report_source_type_id=old_source_type_id, report_unit=unit, report_fuel__isnull=True
+            )
+        )
+        unit_fuels = fuels_by_unit[unit.id]
+        new_unit = _save_copy(unit, report_version=new_version, report_source_type=new_source_type)
+        if schema.has_fuel:
+            clone_fuels(unit_fuels, new_unit)
+        else:
+            clone_emissions(unit_emissions, new_unit=new_unit)
+    if schema.has_fuel and not schema.has_unit:
+        clone_fuels(direct_fuels)
+    if not schema.has_unit and not schema.has_fuel:
+        clone_emissions(
+            ReportEmission.objects.filter(
+                report_source_type_id=old_source_type_id, report_unit__isnull=True, report_fuel__isnull=True
+            )
+        )
+
+
+def _legacy_clone_report_version_facilities(old_version, new_version):
+    """The previous object-by-object clone of the facility tree, kept as the reference for the bulk clone."""
+    for facility_report in FacilityReport.objects.filter(report_version=old_version):
+        old_facility_report_id = facility_report.id
+        activities = list(facility_report.activities.all())
+        report_activities = list(ReportActivity.objects.filter(facility_report_id=old_facility_report_id))
+        non_attributable = list(
+            ReportNonAttributableEmissions.objects.filter(
+                report_version=old_version, facility_report_id=old_facility_report_id
+            )
+        )
+        allocation = ReportEmissionAllocation.objects.filter(
+            report_version=old_version, facility_report_id=old_facility_report_id
+        ).first()
+        products = list(
+            ReportProduct.objects.filter(report_version=old_version, facility_report_id=old_facility_report_id)
+        )
+
+        new_facility_report = _save_copy(facility_report, report_version=new_version, is_completed=False)
+        new_facility_report.activities.set(activities)
+
+        for report_activity in report_activities:
+            source_types = list(ReportSourceType.objects.filter(report_activity=report_activity))
+            raw_data = ReportRawActivityData.objects.filter(
+                facility_report_id=old_facility_report_id, activity_id=report_activity.activity_id
+            ).first()
+            new_activity = _save_copy(report_activity, report_version=new_version, facility_report=new_facility_report)
+            if raw_data:
+                _save_copy(raw_data, report_version=new_version, facility_report=new_facility_report)
+            for source_type in source_types:
+                _legacy_clone_source_type(source_type, new_activity)
+
+        for emission in non_attributable:
+            gas_types = list(emission.gas_type.all())
+            _save_copy(emission, report_version=new_version, facility_report=new_facility_report).gas_type.set(
+                gas_types
+            )
+
+        new_allocation = None
+        if allocation:
+            new_allocation = _save_copy(allocation, report_version=new_version, facility_report=new_facility_report)
+        for product in products:
+            product_allocations = list(
+                ReportProductEmissionAllocation.objects.filter(report_version=old_version, report_product=product)
+            )
+            new_product = _save_copy(product, report_version=new_version, facility_report=new_facility_report)
+            for product_allocation in product_allocations:
+                _save_copy(
+                    product_allocation,
+                    report_version=new_version,
+                    report_product=new_product,
+                    report_emission_allocation=new_allocation or product_allocation.report_emission_allocation,
+                )
+
+
+def build_synthetic_report(report_version, facility_count):
+    """
+    A report with every source type shape (units and fuels, units only, fuels only, neither) for each facility,
+    plus rows that cloning leaves behind, built with bulk inserts so large reports are quick to set up.
+    """
+    schemas = {(schema.has_unit, schema.has_fuel): schema for schema in ActivitySourceTypeJsonSchema.objects.all()}
+    activity_schema = ActivityJsonSchema.objects.first()
+    activities = list(Activity.objects.order_by("id")[:3])
+    source_types = list(SourceType.objects.order_by("id")[: len(schemas)])
+    fuel_type = FuelType.objects.first()
+    gas_types = list(GasType.objects.order_by("id")[:2])
+    categories = list(EmissionCategory.objects.order_by("id")[:2])
+    methodology = Methodology.objects.first()
+    product = RegulatedProduct.objects.first()
+    facilities = baker.make_recipe(
+        "registration.tests.utils.facility", operation=report_version.report.operation, _quantity=facility_count
+    )
+    sequence = iter(range(10**9))
+
+    def data(kind):
+        return {"kind": kind, "n": next(sequence)}
+
+    def insert(model, rows):
+        return model.objects.bulk_create(rows)
+
+    facility_reports = insert(
+        FacilityReport,
+        [
+            baker.prepare(FacilityReport, report_version=report_version, facility=facility, is_completed=True)
+            for facility in facilities
+        ],
+    )
+    FacilityReport.activities.through.objects.bulk_create(
+        [
+            FacilityReport.activities.through(facilityreport_id=facility_report.id, activity_id=activity.id)
+            for facility_report in facility_reports
+            for activity in activities
+        ]
+    )
+    report_activities = insert(
+        ReportActivity,
+        [
+            ReportActivity(
+                report_version=report_version,
+                facility_report=facility_report,
+                activity=activity,
+                activity_base_schema=activity_schema,
+                json_data=data("activity"),
+            )
+            for facility_report in facility_reports
+            for activity in activities[:2]
+        ],
+    )
+    # Raw data for the first activity only, and for an activity without report data which is not cloned
+    insert(
+        ReportRawActivityData,
+        [
+            ReportRawActivityData(
+                report_version=report_version,
+                facility_report=facility_report,
+                activity=activity,
+                json_data=data("raw"),
+            )
+            for facility_report in facility_reports
+            for activity in (activities[0], activities[2])
+        ],
+    )
+    report_source_types = insert(
+        ReportSourceType,
+        [
+            ReportSourceType(
+                report_version=report_version,
+                report_activity=report_activity,
+                activity_source_type_base_schema=schema,
+                source_type=source_type,
+                json_data=data("source_type"),
+            )
+            for report_activity in report_activities
+            for schema, source_type in zip(schemas.values(), source_types)
+        ],
+    )
+    units = insert(
+        ReportUnit,
+        [
+            ReportUnit(report_version=report_version, report_source_type=source_type, json_data=data("unit"))
+            for source_type in report_source_types
+            for _ in range(2)
+        ],
+    )
+
+    def fuel(source_type, unit):
+        return ReportFuel(
+            report_version=report_version,
+            report_source_type=source_type,
+            report_unit=unit,
+            fuel_type=fuel_type,
+            json_data=data("fuel"),
+        )
+
+    fuels = insert(
+        ReportFuel,
+        # Unit fuels, plus fuels directly under every source type (only kept when the schema has fuel but no unit)
+        [fuel(unit.report_source_type, unit) for unit in units]
+        + [fuel(source_type, None) for source_type in report_source_types],
+    )
+
+    def emission(source_type, unit=None, report_fuel=None):
+        return ReportEmission(
+            report_version=report_version,
+            report_source_type=source_type,
+            report_unit=unit,
+            report_fuel=report_fuel,
+            gas_type=gas_types[0],
+            json_data=data("emission"),
+        )
+
+    emissions = insert(
+        ReportEmission,
+        [emission(f.report_source_type, report_fuel=f) for f in fuels]
+        + [emission(unit.report_source_type, unit) for unit in units]
+        + [emission(source_type) for source_type in report_source_types],
+    )
+    ReportEmission.emission_categories.through.objects.bulk_create(
+        [
+            ReportEmission.emission_categories.through(reportemission_id=e.id, emissioncategory_id=category.id)
+            for e in emissions
+            for category in categories
+        ]
+    )
+    insert(
+        ReportMethodology,
+        [
+            ReportMethodology(
+                report_version=report_version, report_emission=e, methodology=methodology, json_data=data("method")
+            )
+            for e in emissions
+        ],
+    )
+    non_attributable = insert(
+        ReportNonAttributableEmissions,
+        [
+            ReportNonAttributableEmissions(
+                report_version=report_version,
+                facility_report=facility_report,
+                activity="activity",
+                source_type="source type",
+                emission_category=categories[0],
+            )
+            for facility_report in facility_reports
+        ],
+    )
+    ReportNonAttributableEmissions.gas_type.through.objects.bulk_create(
+        [
+            ReportNonAttributableEmissions.gas_type.through(
+                reportnonattributableemissions_id=e.id, gastype_id=gas_type.id
+            )
+            for e in non_attributable
+            for gas_type in gas_types
+        ]
+    )
+    allocations = insert(
+        ReportEmissionAllocation,
+        [
+            baker.prepare(ReportEmissionAllocation, report_version=report_version, facility_report=facility_report)
+            for facility_report in facility_reports
+        ],
+    )
+    products = insert(
+        ReportProduct,
+        [
+            baker.prepare(
+                ReportProduct, report_version=report_version, facility_report=facility_report, product=product
+            )
+            for facility_report in facility_reports
+        ],
+    )
+    insert(
+        ReportProductEmissionAllocation,
+        [
+            baker.prepare(
+                ReportProductEmissionAllocation,
+                report_version=report_version,
+                report_emission_allocation=allocation,
+                report_product=report_product,
+                emission_category=categories[0],
+            )
+            for allocation, report_product in zip(allocations, products)
+        ],
+    )
+
+
+def snapshot_facility_tree(report_version):
+    """
+    Every row of the facility tree of `report_version` as a multiset of natural keys per model: own values, parent
+    rows' natural keys in place of foreign key ids, and many-to-many ids, ignoring ids and audit columns.
+    """
+    rows_by_model = {}
+    for model in CLONED_MODELS:
+        queryset = model.objects.filter(report_version=report_version)
+        if model in M2M_FIELDS:
+            queryset = queryset.prefetch_related(M2M_FIELDS[model])
+        rows_by_model[model] = {row.pk: row for row in queryset}
+    keys = {}
+
+    def natural_key(model, pk):
+        if (model, pk) in keys:
+            return keys[(model, pk)]
+        row = rows_by_model[model].get(pk) or model.objects.get(pk=pk)
+        values = []
+        for field in model._meta.concrete_fields:
+            if field.primary_key or field.name in AUDIT_FIELDS or field.name == "report_version":
+                continue
+            value = getattr(row, field.attname)
+            if field.is_relation and field.related_model in rows_by_model and value is not None:
+                value = natural_key(field.related_model, value)
+            values.append((field.name, json.dumps(value, sort_keys=True, default=str)))
+        if model in M2M_FIELDS:
+            values.append((M2M_FIELDS[model], tuple(sorted(r.pk for r in getattr(row, M2M_FIELDS[model]).all()))))
+        keys[(model, pk)] = tuple(values)
+        return keys[(model, pk)]
+
+    return {model.__name__: Counter(natural_key(model, pk) for pk in rows_by_model[model]) for model in CLONED_MODELS}
+
+
+def _new_version(report_version):
+    # A separate report, since a report can only have one draft version at a time
+    return baker.make_recipe("reporting.tests.utils.report_version")
+
+
+class TestBulkFacilityCloning:
+    def test_bulk_clone_matches_the_object_by_object_clone(self):
+        source = baker.make_recipe("reporting.tests.utils.report_version")
+        build_synthetic_report(source, facility_count=3)
+        legacy_target = _new_version(source)
+        bulk_target = _new_version(source)
+
+        _legacy_clone_report_version_facilities(source, legacy_target)
+        clone_report_version_facilities(source, bulk_target)
+
+        legacy_snapshot = snapshot_facility_tree(legacy_target)
+        assert snapshot_facility_tree(bulk_target) == legacy_snapshot
+        assert all(legacy_snapshot.values()), "every cloned table should have rows"
+        # The source tree is untouched
+        assert FacilityReport.objects.filter(report_version=source, is_completed=True).count() == 3
+
+    def test_bulk_clone_query_count_does_not_grow_with_facilities(self):
+        query_counts = []
+        for facility_count in (1, 4):
+            source = baker.make_recipe("reporting.tests.utils.report_version")
+            build_synthetic_report(source, facility_count=facility_count)
+            target = _new_version(source)
+            with CaptureQueriesContext(connection) as context:
+                clone_report_version_facilities(source, target)
+            query_counts.append(len(context.captured_queries))
+
+        assert query_counts[0] == query_counts[1]
+
+    def test_bulk_clone_validates_the_cloned_rows(self):
+        source = baker.make_recipe("reporting.tests.utils.report_version")
+        build_synthetic_report(source, facility_count=1)
+        # Bypass save() to store a value its validation would reject
+        ReportProduct.objects.filter(report_version=source).update(production_methodology="not a methodology")
+
+        with pytest.raises(ValidationError, match="production_methodology"):
+            clone_report_version_facilities(source, _new_version(source))
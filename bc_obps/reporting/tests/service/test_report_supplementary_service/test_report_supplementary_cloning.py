@@ -36,6 +36,7 @@ from reporting.models import (
     ReportVersion,
 )
 import common.lib.pgtrigger as pgtrigger
+from reporting.models.triggers import immutable_report_version_trigger_uris
 from django.db.models import Q
 from registration.models import Contact
 
@@ -366,7 +367,7 @@ class ReportSupplementaryCloningTests(TestCase):
         from the old report version to the new report version.
         """
         # PRE-ACT: Create a ReportVerification and an associated Visit for the old report version.
-        with pgtrigger.ignore('reporting.ReportVerification:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportVerification')):
             verification = make_recipe(
                 'reporting.tests.utils.report_verification',
                 report_version=self.old_report_version,
@@ -376,7 +377,7 @@ class ReportSupplementaryCloningTests(TestCase):
                 threats_to_independence=True,
                 verification_conclusion=ReportVerification.VerificationConclusion.POSITIVE,
             )
-        with pgtrigger.ignore('reporting.ReportVerificationVisit:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportVerificationVisit')):
             make_recipe(
                 'reporting.tests.utils.report_verification_visit',
                 report_verification=verification,
@@ -428,7 +429,7 @@ class ReportSupplementaryCloningTests(TestCase):
         from the old report version to the new report version.
         """
         # PRE-ACT: Create two ReportAttachment instances for the old report version.
-        with pgtrigger.ignore('reporting.ReportAttachment:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportAttachment')):
             make_recipe(
                 'reporting.tests.utils.report_attachment',
                 report_version=self.old_report_version,
@@ -436,7 +437,7 @@ class ReportSupplementaryCloningTests(TestCase):
                 attachment_type="verification_statement",
                 attachment_name="Attachment 1",
             )
-        with pgtrigger.ignore('reporting.ReportAttachment:immutable_report_version'):
+        with pgtrigger.ignore(*immutable_report_version_trigger_uris('reporting.ReportAttachment')):
             make_recipe(
                 'reporting.tests.utils.report_attachment',
                 report_version=self.old_report_version,
@@ -530,6 +531,9 @@ class ReportSupplementaryCloningTests(TestCase):
             patch(
                 "reporting.service.report_supplementary_version_service.report_supplementary_cloning.EmissionCategoryMappingService.apply_emission_categories"
             ) as mock_apply,
+            patch(
+                "reporting.service.report_supplementary_version_service.report_supplementary_cloning.EmissionCategoryMappingService.get_mapping_index"
+            ) as mock_get_mapping_index,
             patch(
                 "reporting.service.report_supplementary_version_service.report_supplementary_cloning.model_to_dict"
             ) as mock_model_to_dict,
@@ -556,7 +560,9 @@ class ReportSupplementaryCloningTests(TestCase):
                     'report_fuel': fake_emission.report_fuel,
                     'report_methodology': fake_methodology,
                 },
+                index=mock_get_mapping_index.return_value,
             )
+            mock_get_mapping_index.assert_called_once_with()
 
     def test_clone_all(self):
         """
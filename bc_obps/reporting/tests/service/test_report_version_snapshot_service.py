@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock, patch
+from django.test import TestCase
+from model_bakery.baker import make_recipe
+from reporting.models import ReportVersion, ReportVersionSnapshot
+from reporting.service import report_version_snapshot_service
+from reporting.service.report_version_snapshot_service import ReportVersionSnapshotService
+
+
+@patch("reporting.schema.report_final_review.ComplianceService.get_calculated_compliance_data", return_value=None)
+class TestReportVersionSnapshotService(TestCase):
+    def setUp(self):
+        self.report_version = make_recipe("reporting.tests.utils.report_version")
+        self.report_operation = make_recipe(
+            "reporting.tests.utils.report_operation", report_version=self.report_version
+        )
+        self.facility_report = make_recipe("reporting.tests.utils.facility_report", report_version=self.report_version)
+        # Submitted once its data is created, since the data of submitted versions is immutable
+        ReportVersion.objects.filter(id=self.report_version.id).update(
+            status=ReportVersion.ReportVersionStatus.Submitted, is_latest_submitted=True
+        )
+
+    def test_snapshot_is_saved_once_the_transaction_commits(self, mock_compliance: MagicMock):
+        with self.captureOnCommitCallbacks() as callbacks:
+            ReportVersionSnapshotService.save_snapshot_on_commit(self.report_version.id)
+            assert not ReportVersionSnapshot.objects.filter(report_version=self.report_version).exists()
+
+        for callback in callbacks:
+            callback()
+        assert ReportVersionSnapshot.objects.filter(report_version=self.report_version).exists()
+
+    def test_snapshot_failure_after_commit_is_only_logged(self, mock_compliance: MagicMock):
+        with patch.object(ReportVersionSnapshotService, "save_snapshot", side_effect=Exception("serialization failed")):
+            with self.captureOnCommitCallbacks(execute=True):
+                ReportVersionSnapshotService.save_snapshot_on_commit(self.report_version.id)
+
+        assert not ReportVersionSnapshot.objects.filter(report_version=self.report_version).exists()
+
+    def test_snapshot_serves_the_saved_data_without_serializing_again(self, mock_compliance: MagicMock):
+        ReportVersionSnapshotService.save_snapshot(self.report_version.id)
+        snapshot = ReportVersionSnapshot.objects.get(report_version=self.report_version)
+        assert snapshot.format_version == report_version_snapshot_service.SNAPSHOT_FORMAT_VERSION
+
+        live_final_review = ReportVersionSnapshotService.serialize_final_review(self.report_version.id)
+        live_review_changes = ReportVersionSnapshotService.serialize_review_changes(self.report_version.id)
+        with patch.object(ReportVersionSnapshotService, "serialize_final_review") as mock_serialize_final_review:
+            with patch.object(
+                ReportVersionSnapshotService, "serialize_review_changes"
+            ) as mock_serialize_review_changes:
+                with self.assertNumQueries(1):
+                    assert ReportVersionSnapshotService.get_final_review_data(self.report_version.id) == (
+                        live_final_review
+                    )
+                assert ReportVersionSnapshotService.get_review_changes_data(self.report_version.id) == (
+                    live_review_changes
+                )
+        mock_serialize_final_review.assert_not_called()
+        mock_serialize_review_changes.assert_not_called()
+
+        facility_report_data = ReportVersionSnapshotService.get_facility_report_data(
+            self.report_version.id, self.facility_report.facility_id
+        )
+        assert facility_report_data["facility_name"] == self.facility_report.facility_name
+        assert facility_report_data == live_review_changes["facility_reports"][self.facility_report.facility_name]
+
+    def test_mutable_fields_are_read_from_the_report_version(self, mock_compliance: MagicMock):
+        ReportVersionSnapshotService.save_snapshot(self.report_version.id)
+        # A supplementary version was submitted after this one
+        ReportVersion.objects.filter(id=self.report_version.id).update(is_latest_submitted=False)
+
+        assert (
+            ReportVersionSnapshotService.get_final_review_data(self.report_version.id)["is_latest_submitted"] is False
+        )
+        assert (
+            ReportVersionSnapshotService.get_review_changes_data(self.report_version.id)["is_latest_submitted"] is False
+        )
+
+    def test_versions_without_a_current_snapshot_are_serialized(self, mock_compliance: MagicMock):
+        assert ReportVersionSnapshotService.get_snapshot_data(self.report_version.id) is None
+        assert (
+            ReportVersionSnapshotService.get_facility_report_data(
+                self.report_version.id, self.facility_report.facility_id
+            )
+            is None
+        )
+        assert ReportVersionSnapshotService.get_final_review_data(self.report_version.id) == (
+            ReportVersionSnapshotService.serialize_final_review(self.report_version.id)
+        )
+
+        ReportVersionSnapshotService.save_snapshot(self.report_version.id)
+        with patch.object(report_version_snapshot_service, "SNAPSHOT_FORMAT_VERSION", 2):
+            assert ReportVersionSnapshotService.get_snapshot_data(self.report_version.id) is None
+
+    def test_backfill_snapshots(self, mock_compliance: MagicMock):
+        draft_version = make_recipe("reporting.tests.utils.report_version")
+
+        assert ReportVersionSnapshotService.backfill_snapshots() == 1
+        assert ReportVersionSnapshot.objects.filter(report_version=self.report_version).exists()
+        assert not ReportVersionSnapshot.objects.filter(report_version=draft_version).exists()
+
+        # Only the snapshots of an older format are saved again, unless they are rebuilt
+        assert ReportVersionSnapshotService.backfill_snapshots() == 0
+        with patch.object(report_version_snapshot_service, "SNAPSHOT_FORMAT_VERSION", 2):
+            assert ReportVersionSnapshotService.backfill_snapshots() == 1
+        assert ReportVersionSnapshotService.backfill_snapshots(rebuild=True) == 1
@@ -5,6 +5,7 @@ from registration.models.naics_code import NaicsCode
 from registration.models.user_operator import UserOperator
 from model_bakery.baker import make_recipe
 from reporting.models.report_operation import ReportOperation
+from reporting.models.reporting_dashboard_report import ReportingDashboardReport
 from registration.models.operation_designated_operator_timeline import OperationDesignatedOperatorTimeline
 from registration.tests.utils.bakers import operation_baker, operator_baker
 from reporting.service.reporting_dashboard_service import ReportingDashboardService
@@ -689,3 +690,68 @@ class TestReportingDashboardService:
         assert result_list[0]["report_version_id"] == bravo_report_version.id
         assert result_list[0]["report_status"] == "Submitted"
         assert result_list[0]["operation_name"] == bravo_report_version.report_operation.operation_name
+
+    def test_dashboard_report_rows_follow_report_changes(self):
+        report_version = report_version_baker()
+        report = report_version.report
+        assert ReportingDashboardReport.objects.get(report=report).report_version_id == report_version.id
+        assert ReportingDashboardService.find_stale_dashboard_reports([report.id]) == {}
+
+        report_version.status = ReportVersion.ReportVersionStatus.Submitted
+        report_version.save()
+        new_version = report_version_baker(report=report)
+        report_operation = new_version.report_operation
+        report_operation.operation_name = "Renamed Operation"
+        report_operation.save()
+
+        dashboard_report = ReportingDashboardReport.objects.get(report=report)
+        assert dashboard_report.report_version_id == new_version.id
+        assert dashboard_report.first_report_version_id == report_version.id
+        assert dashboard_report.report_status == ReportVersion.ReportVersionStatus.Draft
+        assert dashboard_report.operation_name == "Renamed Operation"
+        assert ReportingDashboardService.find_stale_dashboard_reports([report.id]) == {}
+
+        new_version.delete()
+        assert ReportingDashboardReport.objects.get(report=report).report_version_id == report_version.id
+        assert ReportingDashboardService.find_stale_dashboard_reports([report.id]) == {}
+
+        # Submitted versions can't be deleted, so deleting a report is checked on a draft one
+        draft_report = report_version_baker().report
+        assert ReportingDashboardReport.objects.filter(report=draft_report).exists()
+        draft_report.delete()
+        assert not ReportingDashboardReport.objects.filter(report_id=draft_report.id).exists()
+
+    def test_refresh_dashboard_reports_fixes_rows_changed_by_bulk_updates(self):
+        report_version = report_version_baker()
+        report_id = report_version.report_id
+        # Bulk updates don't send signals
+        ReportVersion.objects.filter(id=report_version.id).update(status=ReportVersion.ReportVersionStatus.Submitted)
+
+        stale = ReportingDashboardService.find_stale_dashboard_reports([report_id])
+        assert stale[report_id]["report_status"] == ("Draft", "Submitted")
+
+        ReportingDashboardService.refresh_dashboard_reports([report_id])
+        assert ReportingDashboardService.find_stale_dashboard_reports([report_id]) == {}
+
+    @patch(
+        "service.data_access_service.operation_designated_operator_timeline_service.OperationDesignatedOperatorTimelineDataAccessService.get_operation_timeline_for_user"
+    )
+    @patch("service.data_access_service.user_service.UserDataAccessService.get_by_guid")
+    def test_operations_for_reporting_dashboard_read_the_dashboard_report_rows(
+        self,
+        mock_get_by_guid: MagicMock | AsyncMock,
+        get_operation_timeline_for_user: MagicMock | AsyncMock,
+    ):
+        user_operator = baker.make_recipe('registration.tests.utils.approved_user_operator')
+        mock_get_by_guid.return_value = user_operator.user
+        get_operation_timeline_for_user.side_effect = (
+            lambda user, exclude_previously_owned=False: OperationDesignatedOperatorTimeline.objects.all()
+        )
+
+        queryset = ReportingDashboardService.get_operations_for_reporting_dashboard(
+            user_operator.user.user_guid, 2024, filters=ReportingDashboardOperationFilterSchema()
+        )
+
+        sql = str(queryset.query)
+        assert '"erc"."reporting_dashboard_report"' in sql
+        assert '"erc"."report_version"' not in sql
@@ -1,6 +1,6 @@
+from math import ceil
 from typing import Any, Dict, List, Optional
 
-from django.core.paginator import Paginator
 from django.db.models import Case, Count, IntegerField, QuerySet, Sum, When
 from django.http import HttpRequest
 from ninja import Query, Schema
@@ -36,11 +36,13 @@ class ReportingCustomPagination(PaginationBase):
             ),
         )
 
-        paginator = Paginator(queryset, page_size)
-        page_obj = paginator.get_page(page)
+        # Like Paginator.get_page, out of range pages return the last page. The total count is reused instead of
+        # letting a Paginator count the rows again.
+        last_page = max(1, ceil(results["total_count"] / page_size))
+        offset = (min(page, last_page) - 1) * page_size
 
         return {
-            "items": list(page_obj.object_list),  # Items for the current page
+            "items": list(queryset[offset : offset + page_size]),  # Items for the current page  # noqa: E203
             "count": results["total_count"],  # Total count of items
             "is_completed_count": results["completed_count"],
         }
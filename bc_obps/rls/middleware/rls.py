@@ -1,6 +1,6 @@
 import logging
-from typing import Callable, Optional
-from django.db import connection
+from typing import Callable, List, Optional, Tuple, cast
+from django.db import connection, transaction
 from django.conf import settings
 from django.http import HttpRequest, HttpResponse
 from registration.models import User
@@ -8,6 +8,9 @@ from django.db.backends.utils import CursorWrapper
 
 logger = logging.getLogger(__name__)
 
+# An entry of Django's `connection.run_on_commit`: (savepoint ids, callback, robust)
+CommitHook = Tuple[object, Callable[[], object], bool]
+
 
 class RlsMiddleware:
     """
@@ -30,23 +33,63 @@ class RlsMiddleware:
         user: Optional[User] = getattr(request, 'current_user', None)
         # Note from Dylan for later:
         # when we get to actually setting roles, we'll want to still set a role here. We might need an "Unauthenticated" role to set in this case.
+        if settings.RLS_TRANSACTION_SCOPED_CONTEXT:
+            outermost = not connection.in_atomic_block
+            commit_hooks: List[CommitHook] = []
+            with transaction.atomic():
+                self._set_user_context(user, is_local=True)
+                response = self.get_response(request)
+                if outermost and not connection.needs_rollback:
+                    # The SET LOCAL context ends with the commit, before Django runs the on_commit callbacks;
+                    # take them over so they run with the context re-applied
+                    commit_hooks = self._take_commit_hooks()
+            self._run_commit_hooks(user, commit_hooks)
+            return response
         self._set_user_context(user)
         return self.get_response(request)
 
     @staticmethod
-    def _set_user_guid_and_role(cursor: CursorWrapper, user: User) -> None:
-        cursor.execute('set my.guid = %s', [str(user.user_guid)])
-        # set the role based on the user's app role
-        cursor.execute('set role %s', [user.app_role.role_name])
+    def _take_commit_hooks() -> List[CommitHook]:
+        # django-stubs still types the entries as (savepoint ids, callback) pairs
+        commit_hooks = cast(List[CommitHook], connection.run_on_commit)
+        connection.run_on_commit = []
+        return commit_hooks
+
+    def _run_commit_hooks(self, user: Optional[User], commit_hooks: List[CommitHook]) -> None:
+        """
+        Runs the request's on_commit callbacks the way Django does (in order, logging the errors of robust ones), each
+        in its own transaction with the user's context set, so their queries go through RLS and the audit triggers.
+        Callbacks registered by a callback are run the same way.
+        """
+        while commit_hooks:
+            _, func, robust = commit_hooks.pop(0)
+            try:
+                with transaction.atomic():
+                    self._set_user_context(user, is_local=True)
+                    func()
+                    if not connection.needs_rollback:
+                        commit_hooks += self._take_commit_hooks()
+            except Exception as e:
+                if not robust:
+                    raise
+                logger.error(f"Error calling {func.__qualname__} in on_commit(): {str(e)}", exc_info=True)
 
     @staticmethod
-    def _reset_user_guid_and_role(cursor: CursorWrapper) -> None:
-        cursor.execute('reset my.guid')
-        cursor.execute('reset role')
+    def _set_user_guid_and_role(cursor: CursorWrapper, user: User, is_local: bool = False) -> None:
+        # set the guid and the role based on the user's app role in one round trip
+        cursor.execute(
+            "select set_config('my.guid', %s, %s), set_config('role', %s, %s)",
+            [str(user.user_guid), is_local, user.app_role.role_name, is_local],
+        )
 
-    def _set_user_context(self, user: Optional[User]) -> None:
+    @staticmethod
+    def _reset_user_guid_and_role(cursor: CursorWrapper, is_local: bool = False) -> None:
+        # equivalent to `reset my.guid` and `reset role`
+        cursor.execute("select set_config('my.guid', '', %s), set_config('role', 'none', %s)", [is_local, is_local])
+
+    def _set_user_context(self, user: Optional[User], is_local: bool = False) -> None:
         """
-        Sets the database session context for the given user, including their GUID and role.
+        Sets the database context for the given user, including their GUID and role.
         If no user is provided, resets the context.
 
         Django guarantees that each API request will be handled on the same database
@@ -54,12 +97,16 @@ class RlsMiddleware:
         This means that if django is configured to use a db connection pool, context values,
         like `set role` and `set some_param`, might bleed between user requests if they're
         not properly reset by this middleware.
+
+        With `is_local`, the context only lasts until the end of the current transaction (`SET LOCAL`),
+        so it can't bleed into the next request on a pooled connection. If setting it fails, the
+        request's transaction is aborted and its queries fail instead of running without a context.
         """
         try:
             with connection.cursor() as cursor:
                 if user:
-                    self._set_user_guid_and_role(cursor, user)
+                    self._set_user_guid_and_role(cursor, user, is_local)
                 else:
-                    self._reset_user_guid_and_role(cursor)
+                    self._reset_user_guid_and_role(cursor, is_local)
         except Exception as e:
             logger.error(f"Failed to set user context: {str(e)}", exc_info=True)
@@ -1,5 +1,6 @@
 from unittest.mock import patch, MagicMock
-from django.test import TestCase, RequestFactory
+from django.db import connection
+from django.test import TestCase, RequestFactory, override_settings
 from django.http import HttpResponse
 from model_bakery import baker
 from rls.middleware.rls import RlsMiddleware
@@ -62,21 +63,75 @@ class TestRlsMiddleware(TestCase):
     def test_set_user_context_executes_set_query_for_authenticated_user(self, mock_cursor):
         self.middleware._set_user_context(self.user)
 
-        # Assert the database queries were executed with the correct parameters
+        # Assert the guid and role are set in a single query with the correct parameters
         mock_cursor.assert_called_once()
         cursor_instance = mock_cursor().__enter__()
-        cursor_instance.execute.assert_any_call('set my.guid = %s', [str(self.user.user_guid)])
-        cursor_instance.execute.assert_any_call('set role %s', [self.user.app_role.role_name])
+        cursor_instance.execute.assert_called_once_with(
+            "select set_config('my.guid', %s, %s), set_config('role', %s, %s)",
+            [str(self.user.user_guid), False, self.user.app_role.role_name, False],
+        )
 
     @patch("rls.middleware.rls.connection.cursor")
     def test_set_user_context_executes_reset_query_for_anonymous_user(self, mock_cursor):
         self.middleware._set_user_context(None)
 
-        # Assert the database reset queries were executed
+        # Assert the guid and role are reset in a single query
         mock_cursor.assert_called_once()
         cursor_instance = mock_cursor().__enter__()
-        cursor_instance.execute.assert_any_call('reset my.guid')
-        cursor_instance.execute.assert_any_call('reset role')
+        cursor_instance.execute.assert_called_once_with(
+            "select set_config('my.guid', '', %s), set_config('role', 'none', %s)", [False, False]
+        )
+
+    def test_set_user_context_sets_guid_and_role_in_database(self):
+        self.middleware._set_user_context(self.user)
+        with connection.cursor() as cursor:
+            cursor.execute("select current_user, current_setting('my.guid', true)")
+            self.assertEqual(cursor.fetchone(), (self.user.app_role.role_name, str(self.user.user_guid)))
+
+        self.middleware._set_user_context(None)
+        with connection.cursor() as cursor:
+            cursor.execute("select current_user = session_user, current_setting('my.guid', true)")
+            self.assertEqual(cursor.fetchone(), (True, ''))
+
+    @override_settings(RLS_TRANSACTION_SCOPED_CONTEXT=True)
+    @patch("rls.middleware.rls.RlsMiddleware._set_user_context")
+    def test_transaction_scoped_context_wraps_request_in_transaction(self, mock_set_user_context):
+        request = self.factory.get("/")
+        request.current_user = self.user
+
+        with patch("rls.middleware.rls.transaction.atomic") as mock_atomic:
+            response = self.middleware(request)
+
+        # The context is set and the view runs inside the same transaction
+        mock_atomic.return_value.__enter__.assert_called_once()
+        mock_atomic.return_value.__exit__.assert_called_once()
+        mock_set_user_context.assert_called_once_with(self.user, is_local=True)
+        self.assertEqual(response.content, b"OK")
+
+    def test_commit_hooks_run_with_the_user_context(self):
+        contexts = []
+
+        def read_context():
+            with connection.cursor() as cursor:
+                cursor.execute("select current_user, current_setting('my.guid', true)")
+                contexts.append(cursor.fetchone())
+
+        def fail():
+            raise Exception("Callback error")
+
+        with self.assertLogs("rls.middleware.rls", level="ERROR") as log:
+            self.middleware._run_commit_hooks(self.user, [(set(), fail, True), (set(), read_context, False)])
+
+        # A failing robust callback is logged and the next one still runs with the user's guid and role
+        self.assertIn("Callback error", log.output[0])
+        self.assertEqual(contexts, [(self.user.app_role.role_name, str(self.user.user_guid))])
+
+    def test_commit_hooks_raise_the_error_of_a_non_robust_callback(self):
+        def fail():
+            raise Exception("Callback error")
+
+        with self.assertRaisesMessage(Exception, "Callback error"):
+            self.middleware._run_commit_hooks(self.user, [(set(), fail, False)])
 
     @patch("rls.middleware.rls.connection.cursor")
     def test_set_user_context_logs_error_on_failure_authenticated(self, mock_cursor):
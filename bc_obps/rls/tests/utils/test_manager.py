@@ -203,3 +203,18 @@ class TestRlsManager(TestCase):
         mock_cursor_instance.execute.assert_any_call(SQL("set role {}").format(Identifier('db_user')))
         # Verify that set role was called to restore original role
         mock_cursor_instance.execute.assert_any_call(SQL("set role {}").format(Identifier('original_user')))
+
+    @patch('rls.utils.manager.settings')
+    @patch('rls.utils.manager.connection')
+    def test_bypass_rls_inside_transaction_sets_local_role(self, mock_connection, mock_settings):
+        mock_settings.DB_USER = 'db_user'
+        mock_connection.in_atomic_block = True
+        mock_cursor_instance = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor_instance.fetchone.return_value = ['original_user']
+
+        with RlsManager.bypass_rls():
+            pass
+
+        # The role switch can't outlive the transaction
+        mock_cursor_instance.execute.assert_any_call(SQL("set local role {}").format(Identifier('db_user')))
+        mock_cursor_instance.execute.assert_any_call(SQL("set local role {}").format(Identifier('original_user')))
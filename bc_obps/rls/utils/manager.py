@@ -14,16 +14,19 @@ class RlsManager:
     @contextmanager
     def bypass_rls() -> Any:
         original_role = None
+        # Inside a transaction the role is switched with `set local role` so it can't outlive the transaction
+        # (e.g. a request's transaction-scoped RLS context on a pooled connection)
+        set_role = SQL("set local role {}") if connection.in_atomic_block else SQL("set role {}")
         with connection.cursor() as cursor:
             cursor.execute("SELECT current_user")
             original_role = cursor.fetchone()[0]
-            cursor.execute(SQL("set role {}").format(Identifier(settings.DB_USER)))
+            cursor.execute(set_role.format(Identifier(settings.DB_USER)))
         try:
             yield
         finally:
             with connection.cursor() as cursor:
                 if original_role:
-                    cursor.execute(SQL("set role {}").format(Identifier(original_role)))
+                    cursor.execute(set_role.format(Identifier(original_role)))
                 else:
                     cursor.execute("reset role;")
 
@@ -7,6 +7,7 @@ import requests
 from django.utils import timezone
 from common.models import EmailNotification, EmailNotificationTemplate
 from django.conf import settings
+from service.http.outbound_http_client import OutboundHttpClient
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,7 @@ class EmailService(object):
     api_url: str
     client_id: str
     client_secret: str
+    http_client: OutboundHttpClient
 
     # Singleton pattern to ensure only one instance of EmailService is created
     @typing.no_type_check
@@ -50,6 +52,7 @@ class EmailService(object):
             cls._instance.token_endpoint = settings.CHES_TOKEN_ENDPOINT
             cls._instance.token = None
             cls._instance.token_expiry = timezone.now()
+            cls._instance.http_client = OutboundHttpClient("CHES")
             logger.info(
                 f'Logger: Initializing EmailService for clientID {cls._instance.client_id} to connect to {cls._instance.api_url}'
             )
@@ -88,14 +91,12 @@ class EmailService(object):
         """
         headers = {"Authorization": f'Bearer {self.token}'} if self.token else {}
         if method == 'GET':
-            response = requests.get(self.api_url + endpoint, headers=headers, timeout=10)
+            return self.http_client.request('GET', self.api_url + endpoint, headers=headers, timeout=10)
         elif method == 'POST':
-            response = requests.post(self.api_url + endpoint, headers=headers, json=data, timeout=10)
+            return self.http_client.request('POST', self.api_url + endpoint, headers=headers, json=data, timeout=10)
         else:
             raise ValueError("Invalid HTTP method")
 
-        return response
-
     def health_check(self) -> Optional[Any]:
         """
         Retrieves health check data from CHES API.
@@ -233,6 +233,11 @@ def handle_source_type_schema(
     return st_schema
 
 
+def adds_not_applicable_methodology(facility_type: str) -> bool:
+    # Small aggregates & medium facilities may report "Not Applicable" as a methodology
+    return facility_type == 'Small Aggregate' or facility_type == 'Medium Facility'
+
+
 # Called by build_schema. Builds the source type schema including gas_type & methodology dependencies
 def build_source_type_schema(
     config_id: int,
@@ -331,9 +336,7 @@ def build_schema(
     facility_type = FacilityReport.objects.get(
         facility_id=facility_id, report_version_id=report_version_id
     ).facility_type
-    add_not_applicable_methodology = (
-        True if facility_type == 'Small Aggregate' or facility_type == 'Medium Facility' else False
-    )
+    add_not_applicable_methodology = adds_not_applicable_methodology(facility_type)
 
     rjsf_schema: Dict = activity_schema.json_schema
     # Fetch valid config elements for the activity
@@ -0,0 +1,226 @@
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean the remote service is unhealthy (as opposed to rejecting our request)
+CIRCUIT_BREAKING_STATUSES = frozenset({500, 502, 503, 504})
+RETRY_STATUSES = frozenset({429}) | CIRCUIT_BREAKING_STATUSES
+
+
+def endpoint_label(url: str) -> str:
+    """The URL path with id-like segments (any segment containing a digit) collapsed, to group metrics by endpoint."""
+    return "/".join(
+        "{id}" if any(c.isdigit() for c in segment) else segment for segment in urlparse(url).path.split("/")
+    )
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    Raised instead of sending a request while the circuit for a service is open.
+    Subclasses `requests.ConnectionError` so callers' existing `RequestException` handling applies unchanged.
+    """
+
+    def __init__(self, service_name: str, retry_after: float):
+        self.service_name = service_name
+        self.retry_after = retry_after
+        super().__init__(f"{service_name} API is unavailable; not retrying for another {retry_after:.0f}s")
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    - closed: requests go through; `failure_threshold` consecutive failures open the circuit.
+    - open: requests fail fast with `CircuitOpenError` for `reset_timeout` seconds.
+    - half-open: a single trial request goes through; success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, service_name: str, failure_threshold: int, reset_timeout: float):
+        self.service_name = service_name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_request(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial_in_flight:
+                raise CircuitOpenError(self.service_name, max(remaining, 0))
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"{self.service_name} API recovered, closing circuit")
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._opened_at is not None or self._consecutive_failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.error(
+                        f"{self.service_name} API failed {self._consecutive_failures} times in a row, "
+                        f"opening circuit for {self.reset_timeout}s"
+                    )
+                self._opened_at = time.monotonic()
+
+    def end_request(self) -> None:
+        """Frees the half-open trial, however the request ended (e.g. with an error that isn't a recorded failure)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+
+@dataclass
+class EndpointLatency:
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+
+class OutboundHttpMetrics:
+    """
+    Per-process latency and error counts of outbound API calls, keyed by (service, method, endpoint).
+    The snapshot is logged every `OUTBOUND_HTTP_METRICS_LOG_SECONDS` (0 disables it) so it reaches the log aggregator.
+    """
+
+    _endpoints: Dict[Tuple[str, str, str], EndpointLatency] = {}
+    _last_logged_at: Optional[float] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, service_name: str, method: str, endpoint: str, elapsed_seconds: float, error: bool) -> None:
+        with cls._lock:
+            latency = cls._endpoints.setdefault((service_name, method, endpoint), EndpointLatency())
+            latency.count += 1
+            latency.errors += int(error)
+            latency.total_seconds += elapsed_seconds
+            latency.max_seconds = max(latency.max_seconds, elapsed_seconds)
+            log_due = cls._log_due()
+        if log_due:
+            logger.info(f"Outbound HTTP metrics: {json.dumps(cls.snapshot())}")
+
+    @classmethod
+    def _log_due(cls) -> bool:
+        # Called with the lock held; the first call only starts the interval
+        interval = settings.OUTBOUND_HTTP_METRICS_LOG_SECONDS
+        now = time.monotonic()
+        if not interval:
+            return False
+        if cls._last_logged_at is None:
+            cls._last_logged_at = now
+            return False
+        if now - cls._last_logged_at < interval:
+            return False
+        cls._last_logged_at = now
+        return True
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, Any]]:
+        with cls._lock:
+            return {
+                f"{service_name} {method} {endpoint}": {
+                    "count": latency.count,
+                    "errors": latency.errors,
+                    "mean_ms": round(latency.mean_seconds * 1000, 1),
+                    "max_ms": round(latency.max_seconds * 1000, 1),
+                }
+                for (service_name, method, endpoint), latency in sorted(cls._endpoints.items())
+            }
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._endpoints.clear()
+            cls._last_logged_at = None
+
+
+class OutboundHttpClient:
+    """
+    Keep-alive HTTP client for one government API (eLicensing, CHES, BCCR).
+
+    Wraps a pooled `requests.Session` that retries idempotent requests with backoff on 429/5xx and connection
+    errors, a circuit breaker that fails fast while the service is down, and per-endpoint latency metrics.
+    Pool and retry sizes come from the `OUTBOUND_HTTP_*` settings.
+    """
+
+    def __init__(self, service_name: str):
+        self.service_name = service_name
+        self.session = self._build_session(settings.OUTBOUND_HTTP_POOL_MAXSIZE.get(service_name, 10))
+        self.circuit_breaker = CircuitBreaker(
+            service_name,
+            failure_threshold=settings.OUTBOUND_HTTP_CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=settings.OUTBOUND_HTTP_CIRCUIT_RESET_SECONDS,
+        )
+
+    @staticmethod
+    def _build_session(pool_maxsize: int) -> requests.Session:
+        retry = Retry(
+            total=settings.OUTBOUND_HTTP_MAX_RETRIES,
+            # A read timeout already cost the caller the full timeout, so it is not multiplied by retrying
+            read=0,
+            backoff_factor=settings.OUTBOUND_HTTP_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUSES,
+            # Only idempotent methods are retried after the request was sent; POSTs are retried on connect errors only
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            # Hand the last response back to the caller so its own error handling runs
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_maxsize, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the pooled session; `kwargs` are passed on to `requests.Session.request`."""
+        endpoint = endpoint_label(url)
+        self.circuit_breaker.before_request()
+        try:
+            start = time.monotonic()
+            try:
+                response = self.session.request(method=method, url=url, **kwargs)
+            except requests.RequestException:
+                OutboundHttpMetrics.record(self.service_name, method, endpoint, time.monotonic() - start, error=True)
+                self.circuit_breaker.record_failure()
+                raise
+
+            server_error = response.status_code in CIRCUIT_BREAKING_STATUSES
+            elapsed = time.monotonic() - start
+            OutboundHttpMetrics.record(self.service_name, method, endpoint, elapsed, error=server_error)
+            if server_error:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            logger.debug(f"{self.service_name} API {method} {endpoint} took {elapsed * 1000:.0f}ms")
+            return response
+        finally:
+            self.circuit_breaker.end_request()
@@ -1,20 +1,65 @@
 import base64
+import hashlib
+import json
 import logging
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, Generator
+from typing import Dict, Any, Iterator, Literal, Optional, Tuple, Generator
+from django.conf import settings
 from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, storages
 from django.template.loader import get_template
 from django.template.exceptions import TemplateDoesNotExist
+from django.utils import timezone
 from weasyprint import HTML  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Alias of the STORAGES entry rendered PDFs are cached in; without one, PDFs are rendered on every request
+PDF_CACHE_STORAGE_ALIAS = "pdf_cache"
+RENDER_ID_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+SCOPE_PATTERN = re.compile(r"^[\w-]+(/[\w-]+)*$")
+# Markers stored next to a render's directory so every server process reports the same status for it
+PENDING_MARKER_SUFFIX = ".pending"
+FAILED_MARKER_SUFFIX = ".failed"
+
+PdfRenderStatus = Literal["ready", "pending", "failed", "not_found"]
+
+
+@dataclass(frozen=True)
+class PendingPdfRender:
+    """Returned instead of the PDF stream when a background render was started; poll it with `render_id`."""
+
+    render_id: str
+
 
 class PDFGeneratorService:
-    """Service for generating PDF documents from HTML templates"""
+    """
+    Service for generating PDF documents from HTML templates.
+
+    PDFs are rendered by a bounded pool of background threads and stored in the `pdf_cache` storage, keyed by a hash
+    of the template, context and filename (the render id). Generating the same document again streams the stored file
+    instead of rendering it. Stored files are deleted after `PDF_CACHE_MAX_AGE_DAYS` by `delete_expired_renders`.
+
+    Callers pass a `scope` (e.g. the record the document belongs to) that prefixes the storage path; a stored PDF
+    or render status is only found again under the same scope. Pending and failed background renders are recorded as
+    marker files in the same storage, so any server process can answer a poll.
+
+    Without a `pdf_cache` storage nothing is cached, and background renders are rendered synchronously instead.
+    """
 
     CHUNK_SIZE = 64 * 1024
 
+    _executor: Optional[ThreadPoolExecutor] = None
+    _in_flight: Dict[str, Future] = {}
+    _lock = threading.Lock()
+
     @classmethod
     def generate_pdf(
         cls,
@@ -22,7 +67,9 @@ class PDFGeneratorService:
         context: Dict[str, Any],
         filename: str,
         logo_file_name: Optional[str] = None,
-    ) -> Tuple[Generator[bytes, None, None], str, int]:
+        background: bool = False,
+        scope: Optional[str] = None,
+    ) -> Tuple[Generator[bytes, None, None], str, int] | PendingPdfRender:
         """
         Generate a PDF document from an HTML template and return a generator that yields chunks of the PDF data.
 
@@ -31,38 +78,270 @@ class PDFGeneratorService:
             context: Dictionary of context data for the template
             filename: Name of the output PDF file
             logo_file_name: Optional name of a logo file to include as base64 in the context
+            background: If True and the PDF is not cached yet, start rendering it in the background and return a
+                PendingPdfRender instead of waiting for it (ignored when caching is disabled)
+            scope: Optional storage prefix the PDF is kept under; polling the render needs the same scope
 
         Returns:
-            Tuple of (PDF data generator, filename, total_size_in_bytes)
+            Tuple of (PDF data generator, filename, total_size_in_bytes), or a PendingPdfRender
 
         Raises:
             ValueError: If template is not found or PDF generation fails
         """
-        if logo_file_name:
-            context['logo_base64'] = cls._get_logo_base64(logo_file_name)
-
         try:
             template = get_template(template_name)
         except TemplateDoesNotExist:
             logger.error(f"Template '{template_name}' not found")
             raise ValueError(f"Failed to generate PDF: template '{template_name}' not found")
 
+        if scope is not None and not SCOPE_PATTERN.match(scope):
+            raise ValueError(f"Invalid PDF storage scope '{scope}'")
+
+        render_id = cls.get_render_id(template, context, filename, logo_file_name)
+        render_dir = cls._render_dir(render_id, scope)
+        storage_name = f"{render_dir}/{filename}"
+        caching = cls.caching_enabled()
+        if caching and cls._get_storage().exists(storage_name):
+            return cls._stream_stored_pdf(storage_name, filename)
+        # Background renders are polled through the storage
+        background = background and caching
+
+        # Another process is already rendering it
+        if background and cls._marker_status(render_dir) == "pending":
+            return PendingPdfRender(render_id=render_id)
+
+        if logo_file_name:
+            context['logo_base64'] = cls._get_logo_base64(logo_file_name)
+
+        future = cls._submit_render(render_dir, template, context, storage_name, background)
+        if background:
+            return PendingPdfRender(render_id=render_id)
+
+        pdf_file = future.result()
+        total_size = len(pdf_file) if pdf_file else 0
+
+        def pdf_generator() -> Generator[bytes, None, None]:
+            for i in range(0, total_size, cls.CHUNK_SIZE):
+                yield pdf_file[i : i + cls.CHUNK_SIZE] if pdf_file else b""
+
+        return pdf_generator(), filename, total_size
+
+    @classmethod
+    def get_render_status(cls, render_id: str, scope: Optional[str] = None) -> PdfRenderStatus:
+        """
+        Status of a render started by `generate_pdf(..., background=True)` with the same scope.
+        A render whose pending marker is older than `PDF_RENDER_PENDING_TIMEOUT_SECONDS` (its process died) is
+        reported as not found, so the client requests the PDF again.
+        """
+        render_dir = cls._valid_render_dir(render_id, scope)
+        if render_dir is None or not cls.caching_enabled():
+            return "not_found"
+        if cls._find_stored_pdf(render_dir):
+            return "ready"
+        with cls._lock:
+            # A background request can join a synchronous render of this process, which has no markers
+            if render_dir in cls._in_flight:
+                return "pending"
+        return cls._marker_status(render_dir)
+
+    @classmethod
+    def get_rendered_pdf(
+        cls, render_id: str, scope: Optional[str] = None
+    ) -> Optional[Tuple[Generator[bytes, None, None], str, int]]:
+        """Stream a stored PDF by render id and scope, or None if it has not been rendered (yet)."""
+        render_dir = cls._valid_render_dir(render_id, scope)
+        if render_dir is None or not cls.caching_enabled():
+            return None
+        storage_name = cls._find_stored_pdf(render_dir)
+        if storage_name is None:
+            return None
+        return cls._stream_stored_pdf(storage_name, Path(storage_name).name)
+
+    @staticmethod
+    def caching_enabled() -> bool:
+        return PDF_CACHE_STORAGE_ALIAS in settings.STORAGES
+
+    @classmethod
+    def delete_expired_renders(cls) -> int:
+        """
+        Delete the stored PDFs and render markers older than `PDF_CACHE_MAX_AGE_DAYS`. The render id hashes the
+        context, which includes live values like balances, so stored PDFs are rarely requested again for long.
+        Returns the number of files deleted.
+        """
+        if not cls.caching_enabled():
+            return 0
+        storage = cls._get_storage()
+        cutoff = timezone.now() - timedelta(days=settings.PDF_CACHE_MAX_AGE_DAYS)
+        deleted_count = 0
+        for name in cls._walk_storage(storage, ""):
+            try:
+                if storage.get_modified_time(name) < cutoff:
+                    storage.delete(name)
+                    deleted_count += 1
+            except FileNotFoundError:
+                # Deleted by another process since it was listed
+                continue
+        logger.info(f"Deleted {deleted_count} expired PDF cache files")
+        return deleted_count
+
+    @staticmethod
+    def get_render_id(template: Any, context: Dict[str, Any], filename: str, logo_file_name: Optional[str]) -> str:
+        """Content address of a PDF: a hash of the template source, the context and the output filename."""
+        digest = hashlib.sha256()
+        # Hashing the template source (rather than its name) invalidates cached PDFs when the template changes
+        digest.update(str(getattr(getattr(template, "template", None), "source", template)).encode())
+        digest.update(
+            json.dumps(
+                {"context": context, "filename": filename, "logo": logo_file_name},
+                sort_keys=True,
+                default=str,
+                separators=(",", ":"),
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    @staticmethod
+    def render_pdf(template: Any, context: Dict[str, Any]) -> bytes:
+        """Render a loaded template to PDF bytes with WeasyPrint."""
         html_string = template.render(context)
 
         try:
-            pdf_file = HTML(string=html_string).write_pdf()
+            return HTML(string=html_string).write_pdf()  # type: ignore[no-any-return]
         except Exception as e:
             logger.error(f"Failed to generate PDF: {str(e)}")
             raise ValueError("Failed to generate PDF document")
 
-        total_size = len(pdf_file) if pdf_file else 0
+    @classmethod
+    def _submit_render(
+        cls, render_dir: str, template: Any, context: Dict[str, Any], storage_name: str, background: bool
+    ) -> Future:
+        """
+        Start rendering a PDF on the render pool, unless this process is already rendering the same PDF.
+        Only background renders write the markers that polls read; a synchronous caller waits for the result.
+        """
+        with cls._lock:
+            future = cls._in_flight.get(render_dir)
+            if future is not None:
+                return future
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=settings.PDF_RENDER_MAX_WORKERS, thread_name_prefix="pdf-render"
+                )
+            if background:
+                cls._delete_marker(render_dir + FAILED_MARKER_SUFFIX)
+                cls._write_marker(render_dir + PENDING_MARKER_SUFFIX)
+            future = cls._executor.submit(
+                cls._render_and_store, render_dir, template, context, storage_name, background
+            )
+            cls._in_flight[render_dir] = future
+            return future
+
+    @classmethod
+    def _render_and_store(
+        cls, render_dir: str, template: Any, context: Dict[str, Any], storage_name: str, background: bool
+    ) -> bytes:
+        try:
+            pdf_file = cls.render_pdf(template, context)
+        except Exception:
+            if background:
+                cls._write_marker(render_dir + FAILED_MARKER_SUFFIX)
+            cls._finish_render(render_dir, background)
+            raise
+        try:
+            if cls.caching_enabled():
+                # The storage overwrites the name, so a PDF stored by another process in the meantime is replaced
+                # by the same content rather than checked for first
+                cls._get_storage().save(storage_name, ContentFile(pdf_file))
+        except Exception as e:
+            # The PDF can still be returned to the caller; it will be rendered again next time
+            logger.error(f"Failed to store rendered PDF {storage_name}: {str(e)}")
+        finally:
+            cls._finish_render(render_dir, background)
+        return pdf_file
+
+    @classmethod
+    def _finish_render(cls, render_dir: str, background: bool) -> None:
+        if background:
+            cls._delete_marker(render_dir + PENDING_MARKER_SUFFIX)
+        with cls._lock:
+            cls._in_flight.pop(render_dir, None)
+
+    @classmethod
+    def _marker_status(cls, render_dir: str) -> PdfRenderStatus:
+        storage = cls._get_storage()
+        if storage.exists(render_dir + FAILED_MARKER_SUFFIX):
+            return "failed"
+        if not storage.exists(render_dir + PENDING_MARKER_SUFFIX):
+            return "not_found"
+        try:
+            with storage.open(render_dir + PENDING_MARKER_SUFFIX, "rb") as marker:
+                started_at = float(marker.read())
+        except Exception:
+            # Removed since the check above, or unreadable
+            return "not_found"
+        if time.time() - started_at > settings.PDF_RENDER_PENDING_TIMEOUT_SECONDS:
+            return "not_found"
+        return "pending"
+
+    @classmethod
+    def _write_marker(cls, name: str) -> None:
+        # Storages may not overwrite an existing name, so replace it
+        cls._delete_marker(name)
+        try:
+            cls._get_storage().save(name, ContentFile(str(time.time()).encode()))
+        except Exception as e:
+            logger.error(f"Failed to store PDF render marker {name}: {str(e)}")
+
+    @classmethod
+    def _delete_marker(cls, name: str) -> None:
+        try:
+            cls._get_storage().delete(name)
+        except Exception as e:
+            logger.error(f"Failed to delete PDF render marker {name}: {str(e)}")
+
+    @classmethod
+    def _stream_stored_pdf(cls, storage_name: str, filename: str) -> Tuple[Generator[bytes, None, None], str, int]:
+        storage = cls._get_storage()
+        total_size = storage.size(storage_name)
 
         def pdf_generator() -> Generator[bytes, None, None]:
-            for i in range(0, total_size, cls.CHUNK_SIZE):
-                yield pdf_file[i : i + cls.CHUNK_SIZE] if pdf_file else b""
+            with storage.open(storage_name, "rb") as pdf_file:
+                while chunk := pdf_file.read(cls.CHUNK_SIZE):
+                    yield chunk
 
         return pdf_generator(), filename, total_size
 
+    @classmethod
+    def _find_stored_pdf(cls, render_dir: str) -> Optional[str]:
+        try:
+            _, files = cls._get_storage().listdir(render_dir)
+        except FileNotFoundError:
+            return None
+        return f"{render_dir}/{files[0]}" if files else None
+
+    @classmethod
+    def _walk_storage(cls, storage: Storage, path: str) -> Iterator[str]:
+        directories, files = storage.listdir(path)
+        for file_name in files:
+            yield f"{path}/{file_name}" if path else file_name
+        for directory in directories:
+            yield from cls._walk_storage(storage, f"{path}/{directory}" if path else directory)
+
+    @staticmethod
+    def _render_dir(render_id: str, scope: Optional[str]) -> str:
+        # The PDF is stored as <scope>/<render id>/<filename>, so it can be served by scope and render id alone
+        return f"{scope}/{render_id}" if scope else render_id
+
+    @classmethod
+    def _valid_render_dir(cls, render_id: str, scope: Optional[str]) -> Optional[str]:
+        if not RENDER_ID_PATTERN.match(render_id) or (scope is not None and not SCOPE_PATTERN.match(scope)):
+            return None
+        return cls._render_dir(render_id, scope)
+
+    @staticmethod
+    def _get_storage() -> Storage:
+        return storages[PDF_CACHE_STORAGE_ALIAS]
+
     @staticmethod
     def _get_logo_base64(static_file_name: str) -> str:
         """
@@ -0,0 +1,192 @@
+from unittest.mock import MagicMock, patch
+import pytest
+import requests
+from service.http.outbound_http_client import (
+    CircuitBreaker,
+    CircuitOpenError,
+    OutboundHttpClient,
+    OutboundHttpMetrics,
+    endpoint_label,
+)
+
+SESSION_REQUEST_PATH = 'service.http.outbound_http_client.requests.Session.request'
+
+
+def _response(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+class TestEndpointLabel:
+    def test_collapses_id_segments(self):
+        assert endpoint_label('https://api.example.com/client/1234/fees') == '/client/{id}/fees'
+        assert (
+            endpoint_label('https://api.example.com/status/7d2f7b8e-0c0a-4a8e-9d1a-3a1b6e4c2f10?x=1') == '/status/{id}'
+        )
+        assert endpoint_label('https://api.example.com/interestRates') == '/interestRates'
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures_and_fails_fast(self):
+        breaker = CircuitBreaker('test', failure_threshold=2, reset_timeout=60)
+
+        breaker.before_request()
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError, match='test API is unavailable'):
+            breaker.before_request()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker('test', failure_threshold=2, reset_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert not breaker.is_open
+
+    @patch('service.http.outbound_http_client.time.monotonic')
+    def test_half_open_allows_a_single_trial_request(self, mock_monotonic):
+        breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=30)
+        mock_monotonic.return_value = 100.0
+        breaker.record_failure()
+
+        mock_monotonic.return_value = 131.0
+        breaker.before_request()
+        # Other requests keep failing fast while the trial is in flight
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert not breaker.is_open
+        breaker.before_request()
+
+    @patch('service.http.outbound_http_client.time.monotonic')
+    def test_failed_trial_reopens_the_circuit(self, mock_monotonic):
+        breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=30)
+        mock_monotonic.return_value = 100.0
+        breaker.record_failure()
+
+        mock_monotonic.return_value = 131.0
+        breaker.before_request()
+        breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    @patch('service.http.outbound_http_client.time.monotonic')
+    def test_ended_trial_frees_the_half_open_circuit(self, mock_monotonic):
+        breaker = CircuitBreaker('test', failure_threshold=1, reset_timeout=30)
+        mock_monotonic.return_value = 100.0
+        breaker.record_failure()
+
+        mock_monotonic.return_value = 131.0
+        breaker.before_request()
+        breaker.end_request()
+
+        # The trial ended without an outcome: the circuit stays open and the next request is the trial
+        assert breaker.is_open
+        breaker.before_request()
+
+
+class TestOutboundHttpClient:
+    def setup_method(self):
+        OutboundHttpMetrics.reset()
+
+    def test_session_is_pooled_with_retries(self, settings):
+        settings.OUTBOUND_HTTP_POOL_MAXSIZE = {'eLicensing': 7}
+        settings.OUTBOUND_HTTP_MAX_RETRIES = 2
+
+        client = OutboundHttpClient('eLicensing')
+        adapter = client.session.get_adapter('https://api.example.com')
+
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == 2
+        assert {429, 500, 502, 503, 504} <= set(adapter.max_retries.status_forcelist)
+        assert 'POST' not in adapter.max_retries.allowed_methods
+
+    @patch(SESSION_REQUEST_PATH)
+    def test_request_records_latency_per_endpoint(self, mock_request):
+        mock_request.return_value = _response(200)
+        client = OutboundHttpClient('eLicensing')
+
+        response = client.request('GET', 'https://api.example.com/client/1', headers={'a': 'b'}, timeout=5)
+        client.request('GET', 'https://api.example.com/client/2', timeout=5)
+
+        assert response == mock_request.return_value
+        mock_request.assert_any_call(
+            method='GET', url='https://api.example.com/client/1', headers={'a': 'b'}, timeout=5
+        )
+        metrics = OutboundHttpMetrics.snapshot()
+        assert metrics['eLicensing GET /client/{id}']['count'] == 2
+        assert metrics['eLicensing GET /client/{id}']['errors'] == 0
+
+    @patch(SESSION_REQUEST_PATH)
+    def test_server_errors_open_the_circuit(self, mock_request, settings):
+        settings.OUTBOUND_HTTP_CIRCUIT_FAILURE_THRESHOLD = 2
+        mock_request.side_effect = [_response(503), requests.ConnectionError('refused')]
+        client = OutboundHttpClient('eLicensing')
+
+        assert client.request('GET', 'https://api.example.com/balance').status_code == 503
+        with pytest.raises(requests.ConnectionError):
+            client.request('GET', 'https://api.example.com/balance')
+
+        # The third call fails fast without reaching the service
+        with pytest.raises(CircuitOpenError):
+            client.request('GET', 'https://api.example.com/balance')
+        assert mock_request.call_count == 2
+        assert OutboundHttpMetrics.snapshot()['eLicensing GET /balance']['errors'] == 2
+
+    @patch(SESSION_REQUEST_PATH)
+    def test_client_errors_do_not_open_the_circuit(self, mock_request, settings):
+        settings.OUTBOUND_HTTP_CIRCUIT_FAILURE_THRESHOLD = 1
+        mock_request.return_value = _response(400)
+        client = OutboundHttpClient('CHES')
+
+        client.request('POST', 'https://api.example.com/emailMerge', json={})
+        client.request('POST', 'https://api.example.com/emailMerge', json={})
+
+        assert not client.circuit_breaker.is_open
+        assert mock_request.call_count == 2
+
+    @patch('service.http.outbound_http_client.time.monotonic')
+    @patch(SESSION_REQUEST_PATH)
+    def test_metrics_are_logged_periodically(self, mock_request, mock_monotonic, settings, caplog):
+        settings.OUTBOUND_HTTP_METRICS_LOG_SECONDS = 60
+        mock_request.return_value = _response(200)
+        client = OutboundHttpClient('BCCR')
+
+        with caplog.at_level('INFO', logger='service.http.outbound_http_client'):
+            mock_monotonic.return_value = 0
+            client.request('GET', 'https://api.example.com/accounts')
+            mock_monotonic.return_value = 30
+            client.request('GET', 'https://api.example.com/accounts')
+            assert 'Outbound HTTP metrics' not in caplog.text
+
+            mock_monotonic.return_value = 61
+            client.request('GET', 'https://api.example.com/accounts')
+
+        assert '"BCCR GET /accounts": {"count": 3' in caplog.text
+
+    @patch(SESSION_REQUEST_PATH)
+    @patch('service.http.outbound_http_client.time.monotonic')
+    def test_unexpected_error_of_the_trial_request_does_not_leave_the_circuit_stuck(
+        self, mock_monotonic, mock_request, settings
+    ):
+        settings.OUTBOUND_HTTP_CIRCUIT_FAILURE_THRESHOLD = 1
+        settings.OUTBOUND_HTTP_CIRCUIT_RESET_SECONDS = 30
+        mock_request.side_effect = [ValueError('bad request arguments'), _response(200)]
+        client = OutboundHttpClient('eLicensing')
+        mock_monotonic.return_value = 100.0
+        client.circuit_breaker.record_failure()
+
+        mock_monotonic.return_value = 131.0
+        with pytest.raises(ValueError):
+            client.request('GET', 'https://api.example.com/balance')
+
+        assert client.request('GET', 'https://api.example.com/balance').status_code == 200
+        assert not client.circuit_breaker.is_open
@@ -1,7 +1,29 @@
+import os
+import threading
+import time
 from unittest.mock import patch, MagicMock
 import pytest
 from django.template.exceptions import TemplateDoesNotExist
-from service.pdf.pdf_generator_service import PDFGeneratorService
+from service.pdf.pdf_generator_service import PDFGeneratorService, PendingPdfRender
+
+
+@pytest.fixture(autouse=True)
+def pdf_cache_storage(settings, tmp_path):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "pdf_cache": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": tmp_path, "allow_overwrite": True},
+        },
+    }
+    return tmp_path
+
+
+def _mock_template(source="<html>{{ key }}</html>"):
+    mock_template = MagicMock()
+    mock_template.template.source = source
+    mock_template.render.return_value = "<html>test</html>"
+    return mock_template
 
 
 class TestPDFGeneratorService:
@@ -84,3 +106,170 @@ class TestPDFGeneratorService:
         # Act/Assert
         with pytest.raises(ValueError, match="Failed to generate PDF document"):
             PDFGeneratorService.generate_pdf("test.html", {}, "test.pdf")
+
+    @patch('service.pdf.pdf_generator_service.get_template')
+    @patch('service.pdf.pdf_generator_service.HTML')
+    def test_generate_pdf_streams_cached_pdf_from_storage(self, mock_html, mock_get_template, pdf_cache_storage):
+        mock_get_template.return_value = _mock_template()
+        mock_pdf = b"x" * (PDFGeneratorService.CHUNK_SIZE + 10)
+        mock_html.return_value.write_pdf.return_value = mock_pdf
+
+        first, _, _ = PDFGeneratorService.generate_pdf("test.html", {"key": "value"}, "test.pdf")
+        assert b"".join(first) == mock_pdf
+        generator, filename, size = PDFGeneratorService.generate_pdf("test.html", {"key": "value"}, "test.pdf")
+
+        # The second request is served from storage, in chunks, without rendering again
+        mock_html.return_value.write_pdf.assert_called_once()
+        assert list(pdf_cache_storage.glob("*/test.pdf"))
+        chunks = list(generator)
+        assert len(chunks) == 2
+        assert b"".join(chunks) == mock_pdf
+        assert (filename, size) == ("test.pdf", len(mock_pdf))
+
+    def test_render_id_depends_on_template_source_context_and_filename(self):
+        render_ids = [
+            PDFGeneratorService.get_render_id(_mock_template(source), context, filename, None)
+            for source, context, filename in [
+                ("a", {"key": 1}, "test.pdf"),
+                ("a", {"key": 2}, "test.pdf"),
+                ("b", {"key": 1}, "test.pdf"),
+                ("a", {"key": 1}, "other.pdf"),
+                ("a", {"key": 1}, "test.pdf"),
+            ]
+        ]
+
+        assert len(set(render_ids)) == 4
+        assert render_ids[0] == render_ids[-1]
+
+    @patch('service.pdf.pdf_generator_service.get_template')
+    @patch('service.pdf.pdf_generator_service.HTML')
+    def test_background_render_can_be_polled(self, mock_html, mock_get_template):
+        mock_get_template.return_value = _mock_template()
+        rendering = threading.Event()
+        mock_html.return_value.write_pdf.side_effect = lambda: rendering.wait(5) and b"test pdf content"
+
+        pending = PDFGeneratorService.generate_pdf(
+            "test.html", {"key": "value"}, "test.pdf", background=True, scope="versions/1"
+        )
+
+        assert isinstance(pending, PendingPdfRender)
+        assert PDFGeneratorService.get_render_status(pending.render_id, "versions/1") == "pending"
+        assert PDFGeneratorService.get_rendered_pdf(pending.render_id, "versions/1") is None
+
+        future = PDFGeneratorService._in_flight[f"versions/1/{pending.render_id}"]
+        rendering.set()
+        future.result(timeout=5)
+        assert PDFGeneratorService.get_render_status(pending.render_id, "versions/1") == "ready"
+        generator, filename, size = PDFGeneratorService.get_rendered_pdf(pending.render_id, "versions/1")
+        assert (b"".join(generator), filename, size) == (b"test pdf content", "test.pdf", 16)
+
+    @patch('service.pdf.pdf_generator_service.get_template')
+    @patch('service.pdf.pdf_generator_service.HTML')
+    def test_rendered_pdf_is_only_served_under_its_scope(self, mock_html, mock_get_template):
+        mock_get_template.return_value = _mock_template()
+        mock_html.return_value.write_pdf.return_value = b"test pdf content"
+        PDFGeneratorService.generate_pdf("test.html", {"key": "value"}, "test.pdf", scope="versions/1")
+        render_id = PDFGeneratorService.get_render_id(_mock_template(), {"key": "value"}, "test.pdf", None)
+
+        assert PDFGeneratorService.get_render_status(render_id, "versions/1") == "ready"
+        assert PDFGeneratorService.get_render_status(render_id, "versions/2") == "not_found"
+        assert PDFGeneratorService.get_rendered_pdf(render_id, "versions/2") is None
+        assert PDFGeneratorService.get_rendered_pdf(render_id) is None
+        assert PDFGeneratorService.get_rendered_pdf(render_id, "../versions/1") is None
+
+    @patch('service.pdf.pdf_generator_service.time.time')
+    def test_render_status_is_read_from_storage(self, mock_time, pdf_cache_storage):
+        # A render started by another process is only known through its marker files
+        render_id = "b" * 64
+        (pdf_cache_storage / "versions" / "1").mkdir(parents=True)
+        (pdf_cache_storage / "versions" / "1" / f"{render_id}.pending").write_text("1000.0")
+
+        mock_time.return_value = 1100.0
+        assert PDFGeneratorService.get_render_status(render_id, "versions/1") == "pending"
+        # Its process is assumed gone once the marker is older than the timeout
+        mock_time.return_value = 2000.0
+        assert PDFGeneratorService.get_render_status(render_id, "versions/1") == "not_found"
+
+        (pdf_cache_storage / "versions" / "1" / f"{render_id}.failed").write_text("1000.0")
+        assert PDFGeneratorService.get_render_status(render_id, "versions/1") == "failed"
+
+    @patch('service.pdf.pdf_generator_service.get_template')
+    @patch('service.pdf.pdf_generator_service.HTML')
+    def test_failed_background_render_is_reported(self, mock_html, mock_get_template):
+        mock_get_template.return_value = _mock_template()
+        rendering = threading.Event()
+
+        def fail_render():
+            rendering.wait(5)
+            raise Exception("PDF generation failed")
+
+        mock_html.return_value.write_pdf.side_effect = fail_render
+
+        pending = PDFGeneratorService.generate_pdf("test.html", {"key": "value"}, "test.pdf", background=True)
+
+        future = PDFGeneratorService._in_flight[pending.render_id]
+        rendering.set()
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+        assert PDFGeneratorService.get_render_status(pending.render_id) == "failed"
+
+        # Requesting it again starts a new render
+        mock_html.return_value.write_pdf.side_effect = None
+        mock_html.return_value.write_pdf.return_value = b"test pdf content"
+        generator, _, _ = PDFGeneratorService.generate_pdf("test.html", {"key": "value"}, "test.pdf")
+        assert b"".join(generator) == b"test pdf content"
+        assert PDFGeneratorService.get_render_status(pending.render_id) == "ready"
+
+    def test_unknown_render_ids_are_not_found(self):
+        assert PDFGeneratorService.get_render_status("0" * 64) == "not_found"
+        assert PDFGeneratorService.get_render_status("../../etc/passwd") == "not_found"
+        assert PDFGeneratorService.get_rendered_pdf("../../etc/passwd") is None
+
+    @patch('service.pdf.pdf_generator_service.get_template')
+    @patch('service.pdf.pdf_generator_service.HTML')
+    def test_synchronous_render_writes_no_markers(self, mock_html, mock_get_template, pdf_cache_storage):
+        mock_get_template.return_value = _mock_template()
+        mock_html.return_value.write_pdf.return_value = b"test pdf content"
+
+        PDFGeneratorService.generate_pdf("test.html", {"key": "value"}, "test.pdf", scope="versions/1")
+
+        stored_files = [path.name for path in pdf_cache_storage.rglob("*") if path.is_file()]
+        assert stored_files == ["test.pdf"]
+
+    @patch('service.pdf.pdf_generator_service.get_template')
+    @patch('service.pdf.pdf_generator_service.HTML')
+    def test_pdfs_are_not_cached_without_a_cache_storage(self, mock_html, mock_get_template, settings):
+        settings.STORAGES = {alias: config for alias, config in settings.STORAGES.items() if alias != "pdf_cache"}
+        mock_get_template.return_value = _mock_template()
+        mock_html.return_value.write_pdf.return_value = b"test pdf content"
+
+        for _ in range(2):
+            # Background renders can't be polled without the storage, so they're rendered synchronously
+            generator, _, _ = PDFGeneratorService.generate_pdf(
+                "test.html", {"key": "value"}, "test.pdf", background=True
+            )
+            assert b"".join(generator) == b"test pdf content"
+
+        assert mock_html.return_value.write_pdf.call_count == 2
+        render_id = PDFGeneratorService.get_render_id(_mock_template(), {"key": "value"}, "test.pdf", None)
+        assert PDFGeneratorService.get_render_status(render_id) == "not_found"
+
+    def test_delete_expired_renders(self, settings, pdf_cache_storage):
+        settings.PDF_CACHE_MAX_AGE_DAYS = 7
+        render_dir = pdf_cache_storage / "versions" / "1" / ("a" * 64)
+        render_dir.mkdir(parents=True)
+        expired_pdf = render_dir / "old.pdf"
+        expired_marker = pdf_cache_storage / "versions" / "1" / f"{'a' * 64}.failed"
+        recent_pdf = pdf_cache_storage / ("b" * 64) / "new.pdf"
+        recent_pdf.parent.mkdir()
+        for path in (expired_pdf, expired_marker, recent_pdf):
+            path.write_bytes(b"content")
+        eight_days_ago = time.time() - 8 * 24 * 60 * 60
+        for path in (expired_pdf, expired_marker):
+            os.utime(path, (eight_days_ago, eight_days_ago))
+
+        assert PDFGeneratorService.delete_expired_renders() == 2
+
+        assert not expired_pdf.exists()
+        assert not expired_marker.exists()
+        assert recent_pdf.exists()
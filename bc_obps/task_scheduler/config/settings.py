@@ -6,7 +6,9 @@ class TaskSchedulerConfig(TypedDict):
     default_max_retries: int
     cleanup_days: int
     default_tag: str
-    lock_timeout_minutes: int
+    lock_heartbeat_seconds: int
+    lock_timeout_seconds: int
+    daemon_max_sleep_seconds: int
     timezone: str
 
 
@@ -15,6 +17,8 @@ TASK_SCHEDULER_CONFIG: TaskSchedulerConfig = {
     'default_max_retries': 3,
     'cleanup_days': 30,
     'default_tag': '',
-    'lock_timeout_minutes': 10,
+    'lock_heartbeat_seconds': 30,  # How often a worker renews the locks of the tasks it's running
+    'lock_timeout_seconds': 120,  # A lock that hasn't been renewed for this long belongs to a dead worker
+    'daemon_max_sleep_seconds': 60,  # Longest the scheduler daemon sleeps without checking for due tasks
     'timezone': 'America/Vancouver',  # Default timezone for task scheduling
 }
@@ -1,4 +1,10 @@
-from django.core.management.base import BaseCommand
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from task_scheduler.service.scheduler_daemon import SchedulerDaemon
 from task_scheduler.service.task_service import TaskService
 
 
@@ -9,11 +15,47 @@ class Command(BaseCommand):
         parser.add_argument('--tag', type=str, help='Process only tasks with specific tag')
         parser.add_argument('--dry-run', action='store_true', help='Show what would be run without executing')
         parser.add_argument('--verbose', action='store_true', help='Show detailed output')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker threads claiming tasks concurrently (uses FOR UPDATE SKIP LOCKED)',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=10, help='Number of due tasks each worker claims per query'
+        )
+        parser.add_argument(
+            '--daemon',
+            action='store_true',
+            help='Keep running, waking up when a task is due or created (see SchedulerDaemon)',
+        )
+        parser.add_argument(
+            '--max-sleep',
+            type=float,
+            help='Longest the daemon sleeps without checking for due tasks, in seconds',
+        )
 
     def handle(self, *args, **options):
         tag = options.get('tag')
         dry_run = options.get('dry_run', False)
         verbose = options.get('verbose', False)
+        workers = options.get('workers') or 1
+        batch_size = options.get('batch_size') or 10
+
+        if workers < 1 or batch_size < 1:
+            raise CommandError("--workers and --batch-size must be positive integers")
+
+        if options.get('daemon'):
+            if dry_run:
+                raise CommandError("--dry-run can't be used with --daemon")
+            SchedulerDaemon(
+                tag=tag, workers=workers, batch_size=batch_size, max_sleep_seconds=options.get('max_sleep')
+            ).run()
+            return
+
+        if workers > 1 and not dry_run:
+            self._process_tasks_concurrently(tag, workers, batch_size, verbose)
+            return
 
         due_tasks = TaskService.get_due_tasks(tag)
 
@@ -53,13 +95,14 @@ class Command(BaseCommand):
             f"Processing completed: {processed_count} processed, {successful_count} successful, {failed_count} failed"
         )
 
-    def _execute_single_task(self, task, verbose):
+    def _execute_single_task(self, task, verbose, claimed=False):
         try:
             if verbose:
                 task_type = self._get_task_type(task)
                 self.stdout.write(f"Processing {task_type} task: {task.function_path}")
 
-            if TaskService.process_task(task):
+            succeeded = TaskService.process_claimed_task(task) if claimed else TaskService.process_task(task)
+            if succeeded:
                 if verbose:
                     self.stdout.write(f"  ✓ Success: {task.function_path}")
                 return 'success'
@@ -70,3 +113,56 @@ class Command(BaseCommand):
         except Exception as e:
             self.stdout.write(f"  ✗ Error processing task {task.function_path}: {e}")
             return 'failed'
+
+    def _process_tasks_concurrently(self, tag, workers, batch_size, verbose):
+        """
+        Drain the due-task queue with a pool of worker threads.
+        Each worker repeatedly claims a batch with SKIP LOCKED until nothing is left to claim, so several pods
+        running this command at the same time share the backlog instead of racing for the same rows.
+        """
+        self.stdout.write(f"Processing due tasks with {workers} workers (batch size {batch_size})...")
+        results = []
+        results_lock = threading.Lock()
+
+        def worker():
+            try:
+                while True:
+                    claimed_tasks = TaskService.claim_due_tasks(batch_size, tag)
+                    if not claimed_tasks:
+                        return
+                    for task in claimed_tasks:
+                        started = time.perf_counter()
+                        result = self._execute_single_task(task, verbose, claimed=True)
+                        with results_lock:
+                            results.append((result, time.perf_counter() - started))
+            finally:
+                # Each thread has its own connection; don't leave it open once the worker exits
+                connection.close()
+
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(worker) for _ in range(workers)]
+            for future in futures:
+                future.result()
+        elapsed = time.perf_counter() - started_at
+
+        if not results:
+            self.stdout.write("No due tasks found")
+            return
+
+        successful_count = sum(1 for result, _ in results if result == 'success')
+        failed_count = len(results) - successful_count
+        self.stdout.write(
+            f"Processing completed: {len(results)} processed, {successful_count} successful, {failed_count} failed"
+        )
+        self._write_timing_report([latency for _, latency in results], elapsed)
+
+    def _write_timing_report(self, latencies, elapsed):
+        latencies = sorted(latencies)
+        p95_index = max(0, int(round(0.95 * len(latencies))) - 1)
+        throughput = len(latencies) / elapsed if elapsed > 0 else float(len(latencies))
+        self.stdout.write(
+            f"Task latency: mean {statistics.mean(latencies):.3f}s, p50 {statistics.median(latencies):.3f}s, "
+            f"p95 {latencies[p95_index]:.3f}s, max {latencies[-1]:.3f}s"
+        )
+        self.stdout.write(f"Throughput: {throughput:.2f} tasks/s over {elapsed:.2f}s")
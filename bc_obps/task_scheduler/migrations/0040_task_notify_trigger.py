@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:15
+
+import pgtrigger.compiler
+import pgtrigger.migrations
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_scheduler', '0039_V5_18_1'),
+    ]
+
+    operations = [
+        pgtrigger.migrations.AddTrigger(
+            model_name='retrytask',
+            trigger=pgtrigger.compiler.Trigger(
+                name='notify_task_scheduler',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func="\n            if new.next_run_time is not null\n                and (tg_op = 'INSERT' or new.next_run_time is distinct from old.next_run_time)\n            then\n                perform pg_notify('task_scheduler', tg_table_name);\n            end if;\n            return null;\n        ",
+                    hash='7d5ac467036dde905e4fee18b31228365bbcdd35',
+                    operation='INSERT OR UPDATE OF "next_run_time"',
+                    pgid='pgtrigger_notify_task_scheduler_9b131',
+                    table='common"."retry_task',
+                    when='AFTER',
+                ),
+            ),
+        ),
+        pgtrigger.migrations.AddTrigger(
+            model_name='scheduledtask',
+            trigger=pgtrigger.compiler.Trigger(
+                name='notify_task_scheduler',
+                sql=pgtrigger.compiler.UpsertTriggerSql(
+                    func="\n            if new.next_run_time is not null\n                and (tg_op = 'INSERT' or new.next_run_time is distinct from old.next_run_time)\n            then\n                perform pg_notify('task_scheduler', tg_table_name);\n            end if;\n            return null;\n        ",
+                    hash='43cd6696d1e37c53c9b1e7582392774d758e8f0f',
+                    operation='INSERT OR UPDATE OF "next_run_time"',
+                    pgid='pgtrigger_notify_task_scheduler_112e7',
+                    table='common"."scheduled_task',
+                    when='AFTER',
+                ),
+            ),
+        ),
+    ]
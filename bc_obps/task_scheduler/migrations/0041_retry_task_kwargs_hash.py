@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:40
+
+import hashlib
+import json
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import migrations, models
+
+ACTIVE_STATUSES = ['pending', 'running', 'failed']
+
+
+def hash_kwargs(kwargs):
+    # Same as task_scheduler.utils.parameters.hash_kwargs at the time of this migration
+    return hashlib.sha256(
+        json.dumps(kwargs, sort_keys=True, separators=(",", ":"), cls=DjangoJSONEncoder).encode()
+    ).hexdigest()
+
+
+def populate_kwargs_hash(apps, schema_editor):
+    RetryTask = apps.get_model('task_scheduler', 'RetryTask')
+    retry_tasks = list(RetryTask.objects.only('id', 'kwargs'))
+    for retry_task in retry_tasks:
+        retry_task.kwargs_hash = hash_kwargs(retry_task.kwargs)
+    RetryTask.objects.bulk_update(retry_tasks, ['kwargs_hash'], batch_size=1000)
+
+
+def deactivate_duplicate_retry_tasks(apps, schema_editor):
+    """
+    Keeps a single active task per call before enforcing it: the running one if any (a worker is making its
+    attempt), otherwise the oldest. The others are made inactive.
+    """
+    RetryTask = apps.get_model('task_scheduler', 'RetryTask')
+    kept_calls = set()
+    duplicate_ids = []
+    active_tasks = RetryTask.objects.filter(status__in=ACTIVE_STATUSES).order_by(
+        models.Case(models.When(status='running', then=0), default=1), 'id'
+    )
+    for retry_task in active_tasks.only('id', 'function_path', 'tag', 'kwargs_hash'):
+        call = (retry_task.function_path, retry_task.tag, retry_task.kwargs_hash)
+        if call in kept_calls:
+            duplicate_ids.append(retry_task.id)
+        kept_calls.add(call)
+    RetryTask.objects.filter(id__in=duplicate_ids).update(status='inactive', next_run_time=None, lock_acquired_at=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task_scheduler', '0040_task_notify_trigger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='retrytask',
+            name='kwargs_hash',
+            field=models.CharField(
+                default='',
+                editable=False,
+                help_text='SHA-256 of the normalized kwargs, to find identical calls',
+                max_length=64,
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_kwargs_hash, migrations.RunPython.noop),
+        migrations.RunPython(deactivate_duplicate_retry_tasks, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='retrytask',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('status__in', ['pending', 'running', 'failed'])),
+                fields=('function_path', 'tag', 'kwargs_hash'),
+                name='retry_task_active_call_unique',
+            ),
+        ),
+    ]
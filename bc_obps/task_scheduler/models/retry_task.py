@@ -1,14 +1,23 @@
+import typing
 from datetime import datetime, timedelta
 from typing import Optional
 from django.db import models
 from django.utils import timezone
+from task_scheduler.utils.parameters import hash_kwargs
 from .task import Task
+from .triggers import notify_task_scheduler_trigger
+
+# Statuses of the tasks that still make attempts at their call (or are making one)
+ACTIVE_STATUSES = [Task.TaskStatus.PENDING, Task.TaskStatus.RUNNING, Task.TaskStatus.FAILED]
 
 
 class RetryTask(Task):
     """Model for retry tasks that are created when a function fails."""
 
     kwargs = models.JSONField(default=dict, help_text="Keyword arguments to pass to the function")
+    kwargs_hash = models.CharField(
+        max_length=64, editable=False, help_text="SHA-256 of the normalized kwargs, to find identical calls"
+    )
     max_retries = models.PositiveIntegerField(default=3, help_text="Maximum number of retry attempts")
     retry_count = models.PositiveIntegerField(default=0, help_text="Current retry attempt number")
     retry_delay_minutes = models.PositiveIntegerField(default=5, help_text="Delay in minutes between retry attempts")
@@ -20,11 +29,28 @@ class RetryTask(Task):
             models.Index(fields=['status', 'next_run_time']),
             models.Index(fields=['tag', 'status']),
         ]
+        constraints = [
+            # At most one task waiting for, or making, attempts at the same call (see create_retry_task)
+            models.UniqueConstraint(
+                fields=['function_path', 'tag', 'kwargs_hash'],
+                condition=models.Q(status__in=ACTIVE_STATUSES),
+                name='retry_task_active_call_unique',
+            )
+        ]
+        triggers = [notify_task_scheduler_trigger()]
 
     def __str__(self) -> str:
         status_display = dict(self.TaskStatus.choices)[self.status]
         return f"{self.function_path} (retry {self.retry_count}/{self.max_retries}) - {status_display}"
 
+    @typing.no_type_check
+    def save(self, *args, **kwargs):
+        """
+        Override the save method to keep the hash of the kwargs in sync with them.
+        """
+        self.kwargs_hash = hash_kwargs(self.kwargs)
+        super().save(*args, **kwargs)
+
     @property
     def can_retry(self) -> bool:
         return self.retry_count < self.max_retries
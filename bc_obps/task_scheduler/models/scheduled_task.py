@@ -4,6 +4,7 @@ from zoneinfo import ZoneInfo
 from django.db import models
 from django.utils import timezone as django_timezone
 from .task import Task
+from .triggers import notify_task_scheduler_trigger
 from task_scheduler.config.settings import TASK_SCHEDULER_CONFIG
 
 
@@ -37,6 +38,7 @@ class ScheduledTask(Task):
             models.Index(fields=['status', 'next_run_time']),
             models.Index(fields=['tag', 'status']),
         ]
+        triggers = [notify_task_scheduler_trigger()]
 
     def __str__(self) -> str:
         status_display = dict(self.TaskStatus.choices)[self.status]
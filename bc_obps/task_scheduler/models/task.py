@@ -8,6 +8,11 @@ from task_scheduler.config.settings import TASK_SCHEDULER_CONFIG
 logger = logging.getLogger(__name__)
 
 
+def get_lock_timeout() -> timedelta:
+    """How long a lock lasts without being renewed by its worker's heartbeat before the task can be claimed again"""
+    return timedelta(seconds=TASK_SCHEDULER_CONFIG['lock_timeout_seconds'])
+
+
 class Task(models.Model):
     """Abstract base model for all tasks."""
 
@@ -37,11 +42,7 @@ class Task(models.Model):
             self.refresh_from_db()
 
             # Check if task is already locked and lock hasn't expired
-            lock_timeout_minutes = TASK_SCHEDULER_CONFIG.get('lock_timeout_minutes', 10)
-            if not isinstance(lock_timeout_minutes, int):
-                lock_timeout_minutes = 10
-            lock_timeout = timedelta(minutes=lock_timeout_minutes)
-            if self.lock_acquired_at and self.lock_acquired_at > timezone.now() - lock_timeout:
+            if self.lock_acquired_at and self.lock_acquired_at > timezone.now() - get_lock_timeout():
                 return False
 
             # Acquire the lock
@@ -50,6 +51,27 @@ class Task(models.Model):
             logger.debug(f"Lock acquired for {self.__class__.__name__} {self.pk}")
             return True
 
+    def renew_lock(self) -> bool:
+        """
+        Re-stamp the lock this instance holds, unless another worker re-claimed the task after the lock expired.
+        Returns whether the lock is still held.
+        """
+        return self._update_held_lock(timezone.now())
+
+    def release_held_lock(self) -> None:
+        """Release the lock this instance holds, leaving it alone if another worker has re-claimed the task"""
+        self._update_held_lock(None)
+
+    def _update_held_lock(self, lock_acquired_at: Optional[datetime]) -> bool:
+        if self.lock_acquired_at is None:
+            return False
+        # Conditional on the stamp this instance took, so a lock re-claimed by another worker is never overwritten
+        held_lock = type(self)._default_manager.filter(pk=self.pk, lock_acquired_at=self.lock_acquired_at)
+        updated = held_lock.update(lock_acquired_at=lock_acquired_at)
+        if updated:
+            self.lock_acquired_at = lock_acquired_at
+        return bool(updated)
+
     def release_lock(self) -> None:
         self.lock_acquired_at = None
         self.save(update_fields=['lock_acquired_at'])
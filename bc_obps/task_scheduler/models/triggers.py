@@ -0,0 +1,24 @@
+import pgtrigger
+
+# Channel the scheduler daemon listens on (see SchedulerDaemon)
+TASK_SCHEDULER_CHANNEL = "task_scheduler"
+
+
+def notify_task_scheduler_trigger() -> pgtrigger.Trigger:
+    """
+    Trigger notifying the scheduler daemon when a task is created or its next run time changes, so it wakes up
+    instead of sleeping until the run time it had planned. Notifications are sent when the transaction commits.
+    """
+    return pgtrigger.Trigger(
+        name="notify_task_scheduler",
+        operation=pgtrigger.Insert | pgtrigger.UpdateOf("next_run_time"),
+        when=pgtrigger.After,
+        func=f"""
+            if new.next_run_time is not null
+                and (tg_op = 'INSERT' or new.next_run_time is distinct from old.next_run_time)
+            then
+                perform pg_notify('{TASK_SCHEDULER_CHANNEL}', tg_table_name);
+            end if;
+            return null;
+        """,
+    )
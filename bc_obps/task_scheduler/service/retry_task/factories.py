@@ -8,6 +8,7 @@ def create_retryable(
     tag: Optional[str] = None,
     max_retries: Optional[int] = None,
     retry_delay_minutes: Optional[int] = None,
+    outbox: Optional[bool] = None,
 ) -> RetryableFunction:
     """
     Create a RetryableFunction instance.
@@ -17,6 +18,8 @@ def create_retryable(
         tag: Tag for the retryable function
         max_retries: Maximum number of retry attempts
         retry_delay_minutes: Delay between retry attempts in minutes
+        outbox: Whether calls are queued for the task scheduler instead of being run inline
+            (None follows the TASK_SCHEDULER_OUTBOX setting)
     """
     tag = tag if tag is not None else str(TASK_SCHEDULER_CONFIG['default_tag'])
     max_retries = max_retries if max_retries is not None else int(str(TASK_SCHEDULER_CONFIG['default_max_retries']))
@@ -31,4 +34,5 @@ def create_retryable(
         tag=tag,
         max_retries=max_retries,
         retry_delay_minutes=retry_delay_minutes,
+        outbox=outbox,
     )
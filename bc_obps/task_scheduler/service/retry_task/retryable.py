@@ -1,12 +1,54 @@
 import logging
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
 from task_scheduler.models import RetryTask
-from task_scheduler.utils.parameters import extract_function_parameters
+from task_scheduler.models.retry_task import ACTIVE_STATUSES
+from task_scheduler.utils.parameters import extract_function_parameters, hash_kwargs
 from task_scheduler.utils.paths import get_function_path
 
 logger = logging.getLogger(__name__)
 
 
+def _insert_or_update_retry_task(task: RetryTask, on_conflict_set: str, params: List[Any]) -> Tuple[RetryTask, bool]:
+    """
+    Inserts the task or, if the same call already has an active task (see the retry_task_active_call_unique
+    constraint), applies the `on_conflict_set` assignments to that task (`task.<column>`) instead.
+    It's a single statement, so concurrent failures of the same call can't both insert a task.
+    Returns the inserted or existing task, and whether it was inserted.
+    """
+    task.kwargs_hash = hash_kwargs(task.kwargs)
+    table = RetryTask._meta.db_table
+    fields = [field for field in RetryTask._meta.concrete_fields if not field.primary_key]
+    quote_name = connection.ops.quote_name
+    active_statuses = ", ".join(f"'{status}'" for status in ACTIVE_STATUSES)
+    sql = (
+        f"INSERT INTO {quote_name(table)} AS task "
+        f"({', '.join(quote_name(field.column) for field in fields)}) VALUES ({', '.join(['%s'] * len(fields))}) "
+        f"ON CONFLICT (function_path, tag, kwargs_hash) WHERE status IN ({active_statuses}) "
+        f"DO UPDATE SET {on_conflict_set} "
+        f"RETURNING {', '.join(f'task.{quote_name(field.column)}' for field in RetryTask._meta.concrete_fields)}, "
+        "(xmax = 0) AS inserted"
+    )
+    values = [field.get_db_prep_save(field.pre_save(task, add=True), connection) for field in fields]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, values + params)
+        *row, inserted = cursor.fetchone()
+
+    # Values are converted the way a queryset would (e.g. the kwargs json)
+    field_values = []
+    for field, value in zip(RetryTask._meta.concrete_fields, row):
+        column = field.get_col(table)
+        for converter in column.get_db_converters(connection):
+            value = converter(value, column, connection)
+        field_values.append(value)
+    retry_task = RetryTask.from_db(
+        connection.alias, [field.attname for field in RetryTask._meta.concrete_fields], field_values
+    )
+    return retry_task, bool(inserted)
+
+
 def create_retry_task(
     function_path: str,
     kwargs: Dict[str, Any],
@@ -14,40 +56,74 @@ def create_retry_task(
     max_retries: int = 3,
     retry_delay_minutes: int = 5,
 ) -> RetryTask:
-    existing_task = RetryTask.objects.filter(
+    """
+    Creates a retry task for a failed call. If the call already has an active task, that task is returned instead:
+    a failed task that can still retry uses up a retry and is rescheduled, others (running, pending or with exhausted
+    retries) are left as is.
+    """
+    task = RetryTask(
         function_path=function_path,
-        kwargs=kwargs,
         tag=tag,
-        status__in=[RetryTask.TaskStatus.PENDING, RetryTask.TaskStatus.RUNNING, RetryTask.TaskStatus.FAILED],
-    ).first()
+        kwargs=kwargs,
+        max_retries=max_retries,
+        retry_delay_minutes=retry_delay_minutes,
+    )
+    task.next_run_time = task.calculate_next_run_time()
 
-    if existing_task:
-        if existing_task.status == RetryTask.TaskStatus.FAILED and existing_task.can_retry:
-            # Update existing failed task instead of creating duplicate
-            existing_task.retry_count += 1
-            existing_task.next_run_time = existing_task.calculate_next_run_time()
-            existing_task.save()
-            logger.info(
-                f"Updated existing failed retry task for {function_path} (retry {existing_task.retry_count}/{existing_task.max_retries})"
-            )
-            return existing_task
-        else:
-            # Task exists but can't be updated (completed, running, or exhausted retries)
-            logger.info(f"Retry task already exists for {function_path}, not creating duplicate")
-            return existing_task
+    can_retry = f"task.status = '{RetryTask.TaskStatus.FAILED}' AND task.retry_count < task.max_retries"
+    task, created = _insert_or_update_retry_task(
+        task,
+        f"retry_count = CASE WHEN {can_retry} THEN task.retry_count + 1 ELSE task.retry_count END, "
+        f"next_run_time = CASE WHEN NOT ({can_retry}) THEN task.next_run_time "
+        "WHEN task.retry_count + 1 < task.max_retries THEN %s + make_interval(mins => task.retry_delay_minutes) "
+        "ELSE NULL END",
+        [timezone.now()],
+    )
+    if created:
+        logger.info(f"Created new retry task: {function_path}")
+    else:
+        logger.info(
+            f"Retry task already exists for {function_path} (retry {task.retry_count}/{task.max_retries}), "
+            "not creating duplicate"
+        )
+    return task
 
-    # Create new retry task only if none exists or existing one can't be updated
+
+def enqueue_retry_task(
+    function_path: str,
+    kwargs: Dict[str, Any],
+    tag: str = "",
+    max_retries: int = 3,
+    retry_delay_minutes: int = 5,
+) -> RetryTask:
+    """
+    Records a call for the task scheduler to run as soon as possible (the outbox mode of RetryableFunction).
+    The task is saved in the caller's transaction, so it only becomes visible to the scheduler once that transaction
+    commits, and it's discarded if the transaction is rolled back.
+    """
     task = RetryTask(
         function_path=function_path,
         tag=tag,
         kwargs=kwargs,
-        max_retries=max_retries,
+        # The first attempt is the one execute would have made, so the call still gets max_retries retries
+        max_retries=max_retries + 1,
         retry_delay_minutes=retry_delay_minutes,
+        next_run_time=timezone.now(),
     )
-
-    task.next_run_time = task.calculate_next_run_time()
-    task.save()
-    logger.info(f"Created new retry task: {function_path}")
+    # If the same call is already waiting for its (next) attempt, that attempt is brought forward
+    waiting = (
+        f"task.status = '{RetryTask.TaskStatus.PENDING}' "
+        f"OR (task.status = '{RetryTask.TaskStatus.FAILED}' AND task.retry_count < task.max_retries)"
+    )
+    task, queued = _insert_or_update_retry_task(
+        task,
+        f"next_run_time = CASE WHEN {waiting} THEN excluded.next_run_time ELSE task.next_run_time END",
+        [],
+    )
+    if queued:
+        logger.info(f"Queued {function_path} in the outbox")
+    else:
+        logger.info(f"Retry task already exists for {function_path}, not queueing the call again")
     return task
 
 
@@ -55,13 +131,29 @@ class RetryableFunction:
     """
     Wrapper class that provides explicit control over retry behavior.
     Creates retry tasks on failure for later execution by the task scheduler.
+
+    In outbox mode (`outbox=True`, or the TASK_SCHEDULER_OUTBOX setting when `outbox` is None), execute doesn't call
+    the function: it records the call as a retry task due now and returns None, and the task scheduler makes the
+    attempts. Only use it for functions whose result isn't used by the caller.
     """
 
-    def __init__(self, func: Callable, tag: str = "", max_retries: int = 3, retry_delay_minutes: int = 5):
+    def __init__(
+        self,
+        func: Callable,
+        tag: str = "",
+        max_retries: int = 3,
+        retry_delay_minutes: int = 5,
+        outbox: Optional[bool] = None,
+    ):
         self.func = func
         self.tag = tag
         self.max_retries = max_retries
         self.retry_delay_minutes = retry_delay_minutes
+        self.outbox = outbox
+
+    @property
+    def uses_outbox(self) -> bool:
+        return self.outbox if self.outbox is not None else settings.TASK_SCHEDULER_OUTBOX
 
     def execute(self, *args: Any, **kwargs: Any) -> Any:
         """
@@ -69,8 +161,18 @@ class RetryableFunction:
         - Creates retry task on failure (args and kwargs need to be serializable)
         - Returns None gracefully (doesn't raise exception)
         - Logs the failure for debugging
+        In outbox mode, the call is queued for the task scheduler instead.
         """
         serialized_params = extract_function_parameters(args, kwargs, self.func)
+        if self.uses_outbox:
+            enqueue_retry_task(
+                function_path=get_function_path(self.func),
+                kwargs=serialized_params,
+                tag=self.tag,
+                max_retries=self.max_retries,
+                retry_delay_minutes=self.retry_delay_minutes,
+            )
+            return None
         try:
             logger.info(f"Executing {self.func.__name__} directly")
             result = self.func(*args, **kwargs)
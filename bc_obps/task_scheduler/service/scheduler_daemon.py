@@ -0,0 +1,174 @@
+import logging
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection, connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.utils import timezone
+from task_scheduler.config.settings import TASK_SCHEDULER_CONFIG
+from task_scheduler.models.triggers import TASK_SCHEDULER_CHANNEL
+from task_scheduler.service.task_service import TaskService
+
+logger = logging.getLogger(__name__)
+
+# Longest the daemon waits for a notification at once, so it notices a shutdown request quickly
+STOP_CHECK_SECONDS = 1.0
+# Pause after a database error, or when a due task couldn't be claimed (e.g. its row is locked by a transaction)
+RETRY_PAUSE_SECONDS = 5.0
+
+
+class SchedulerDaemon:
+    """
+    Long-running task scheduler (`run_tasks --daemon`), replacing repeated one-shot runs of `run_tasks`.
+
+    Runs the due tasks, then sleeps until the earliest next run time, or until the notify_task_scheduler trigger
+    notifies it that a task was created or rescheduled. It also wakes at least every `max_sleep_seconds`, which
+    makes up for notifications missed while reconnecting.
+    SIGTERM and SIGINT stop it gracefully: running tasks finish, and claimed tasks that haven't started are released.
+    """
+
+    def __init__(
+        self,
+        tag: Optional[str] = None,
+        workers: int = 1,
+        batch_size: int = 10,
+        max_sleep_seconds: Optional[float] = None,
+    ):
+        self.tag = tag
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_sleep_seconds = (
+            max_sleep_seconds if max_sleep_seconds is not None else TASK_SCHEDULER_CONFIG['daemon_max_sleep_seconds']
+        )
+        self.processed_count = 0
+        self.failed_count = 0
+        self._counts_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._listen_connection: Optional[BaseDatabaseWrapper] = None
+
+    def stop(self, *args: Any) -> None:
+        if not self._stopping.is_set():
+            logger.info("Stopping the scheduler daemon once the running tasks finish")
+        self._stopping.set()
+
+    def run(self) -> None:
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        logger.info(f"Scheduler daemon started with {self.workers} workers (batch size {self.batch_size})")
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                while not self._stopping.is_set():
+                    self.run_once(executor)
+            finally:
+                self._close_listen_connection()
+                connection.close()
+        logger.info("Scheduler daemon stopped")
+
+    def run_once(self, executor: ThreadPoolExecutor) -> None:
+        """Runs the due tasks, then sleeps until the next task is due or a notification arrives"""
+        try:
+            # Listen before looking for due tasks, so that no task created in between is missed
+            self._listen()
+            processed_count = self._run_due_tasks(executor)
+            # Our own updates notified us as well; the next run time query below sees every committed change
+            self._consume_notifications()
+            self._log_metrics()
+            sleep_seconds = self._seconds_until_next_task()
+            if processed_count == 0 and sleep_seconds == 0:
+                sleep_seconds = RETRY_PAUSE_SECONDS
+            self._wait_for_notification(sleep_seconds)
+        except DatabaseError as e:
+            logger.error(f"Scheduler daemon database error, retrying in {RETRY_PAUSE_SECONDS:.0f}s: {e}")
+            self._close_listen_connection()
+            connection.close()
+            self._stopping.wait(RETRY_PAUSE_SECONDS)
+
+    def _listen(self) -> None:
+        if self._listen_connection is not None:
+            return
+        # A connection of its own, which Django doesn't close or reuse for queries (autocommit, so LISTEN applies now)
+        self._listen_connection = connections.create_connection(DEFAULT_DB_ALIAS)
+        with self._listen_connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {TASK_SCHEDULER_CHANNEL}")
+
+    def _close_listen_connection(self) -> None:
+        if self._listen_connection is not None:
+            self._listen_connection.close()
+            self._listen_connection = None
+
+    def _notifications(self, timeout: float) -> int:
+        """Waits up to `timeout` seconds for a notification; returns the number of notifications received"""
+        if self._listen_connection is None:
+            return 0
+        with self._listen_connection.wrap_database_errors:
+            return len(list(self._listen_connection.connection.notifies(timeout=timeout, stop_after=1)))
+
+    def _consume_notifications(self) -> None:
+        while self._notifications(timeout=0):
+            pass
+
+    def _wait_for_notification(self, seconds: float) -> None:
+        deadline = time.monotonic() + seconds
+        while not self._stopping.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._notifications(timeout=min(remaining, STOP_CHECK_SECONDS)):
+                return
+
+    def _seconds_until_next_task(self) -> float:
+        next_run_time = TaskService.get_next_run_time(self.tag)
+        if next_run_time is None:
+            return self.max_sleep_seconds
+        return min(max((next_run_time - timezone.now()).total_seconds(), 0.0), self.max_sleep_seconds)
+
+    def _run_due_tasks(self, executor: ThreadPoolExecutor) -> int:
+        futures = [executor.submit(self._worker) for _ in range(self.workers)]
+        return sum(future.result() for future in futures)
+
+    def _worker(self) -> int:
+        """Claims and runs batches of due tasks until there are none left; returns the number of tasks run"""
+        processed_count = 0
+        try:
+            while not self._stopping.is_set():
+                claimed_tasks = TaskService.claim_due_tasks(self.batch_size, self.tag)
+                if not claimed_tasks:
+                    break
+                for index, task in enumerate(claimed_tasks):
+                    if self._stopping.is_set():
+                        # Let another worker run them rather than waiting for their locks to expire
+                        for unstarted_task in claimed_tasks[index:]:
+                            unstarted_task.release_held_lock()
+                        break
+                    self._run_task(task)
+                    processed_count += 1
+        finally:
+            # Each thread has its own connection; don't leave it open while the daemon sleeps
+            connection.close()
+        return processed_count
+
+    def _run_task(self, task: Any) -> None:
+        try:
+            succeeded = TaskService.process_claimed_task(task)
+        except Exception as e:
+            logger.error(f"Error processing task {task.function_path}: {e}")
+            succeeded = False
+        with self._counts_lock:
+            self.processed_count += 1
+            self.failed_count += int(not succeeded)
+
+    def get_metrics(self) -> Dict[str, float]:
+        return {
+            **TaskService.get_queue_metrics(self.tag),
+            'processed': self.processed_count,
+            'failed': self.failed_count,
+        }
+
+    def _log_metrics(self) -> None:
+        metrics = self.get_metrics()
+        logger.info(
+            f"Task queue: {metrics['due']} due, {metrics['running']} running, lag {metrics['lag_seconds']:.1f}s; "
+            f"{metrics['processed']} tasks run since start ({metrics['failed']} failed)"
+        )
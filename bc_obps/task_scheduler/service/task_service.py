@@ -1,8 +1,13 @@
 import logging
-from datetime import timedelta
-from typing import Any, List, Optional, Union, cast
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from django.db import connection, transaction
+from django.db.models import Count, F, Min, Q, QuerySet
 from django.utils import timezone
+from task_scheduler.config.settings import TASK_SCHEDULER_CONFIG
 from task_scheduler.models import ScheduledTask, RetryTask
+from task_scheduler.models.task import get_lock_timeout
 from task_scheduler.utils.paths import resolve_function_from_path
 
 logger = logging.getLogger(__name__)
@@ -10,6 +15,39 @@ logger = logging.getLogger(__name__)
 Task = Union[ScheduledTask, RetryTask]
 
 
+class TaskLockHeartbeat:
+    """
+    Renews the lock of a running task every `lock_heartbeat_seconds` from a background thread, so long tasks keep
+    their lock while the locks of dead workers expire after `lock_timeout_seconds`.
+    Renewal only succeeds while the lock is still the one this worker took.
+    """
+
+    def __init__(self, task: Task):
+        self.task = task
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._renew_lock, name=f"task-lock-heartbeat-{task.pk}", daemon=True)
+
+    def __enter__(self) -> "TaskLockHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _renew_lock(self) -> None:
+        try:
+            while not self._stopped.wait(TASK_SCHEDULER_CONFIG['lock_heartbeat_seconds']):
+                if not self.task.renew_lock():
+                    logger.warning(f"Task {self.task.pk} lost its lock to another worker while running")
+                    break
+        except Exception as e:
+            logger.error(f"Failed to renew the lock of task {self.task.pk}: {e}")
+        finally:
+            # The thread has its own connection; don't leave it open once the task is done
+            connection.close()
+
+
 class TaskService:
     """Service for processing and executing tasks."""
 
@@ -31,23 +69,47 @@ class TaskService:
             logger.debug(f"Task {task.pk} is already locked")
             return False
 
+        return cls.process_claimed_task(task)
+
+    @classmethod
+    def process_claimed_task(cls, task: Task) -> bool:
+        """
+        Execute a task whose lock is already held by the caller (e.g. one returned by `claim_due_tasks`).
+        The lock is re-taken before the task starts: a claimed task can wait behind the rest of its batch for longer
+        than the lock timeout, and is skipped if another worker has re-claimed it in the meantime.
+        The lock is renewed while the task runs. The outcome is only recorded, and the lock released, if the lock is
+        still held once the task finishes: a worker that lost its lock leaves the task to its new owner.
+        """
+        if not task.renew_lock():
+            logger.info(f"Task {task.pk} was re-claimed by another worker before it started; skipping it")
+            return False
+
+        error_message: Optional[str] = None
         try:
             task.mark_attempt_started()
-            cls.execute_task_function(task)
-            task.mark_attempt_success()
-            logger.info(f"Task {task.pk} completed successfully")
-            return True
-
+            with TaskLockHeartbeat(task):
+                cls.execute_task_function(task)
         except Exception as e:
             error_message = str(e)
             logger.error(f"Task {task.pk} failed: {error_message}")
+
+        # Re-stamped right before the outcome is written, so the lock can't expire in between
+        if not task.renew_lock():
+            logger.warning(f"Task {task.pk} lost its lock to another worker; its outcome is not recorded")
+            return False
+
+        try:
+            if error_message is None:
+                task.mark_attempt_success()
+                logger.info(f"Task {task.pk} completed successfully")
+                return True
             task.mark_attempt_failed(error_message)
             return False
 
         finally:
             task.next_run_time = task.calculate_next_run_time()
             task.save(update_fields=['next_run_time'])
-            task.release_lock()
+            task.release_held_lock()
 
     @classmethod
     def get_due_tasks(cls, tag: Optional[str] = None) -> List[Task]:
@@ -80,6 +142,101 @@ class TaskService:
 
         return due_tasks
 
+    @staticmethod
+    def _unlocked(now: datetime) -> Q:
+        # Unlocked tasks, or tasks whose lock has expired (e.g. the worker holding it died)
+        return Q(lock_acquired_at__isnull=True) | Q(lock_acquired_at__lte=now - get_lock_timeout())
+
+    @staticmethod
+    def _runnable_tasks(tag: Optional[str]) -> Tuple[QuerySet, QuerySet]:
+        """The scheduled and retry tasks that can run, whether or not they're due or locked"""
+        scheduled_tasks = ScheduledTask.objects.filter(
+            status__in=[
+                ScheduledTask.TaskStatus.PENDING,
+                ScheduledTask.TaskStatus.FAILED,
+                ScheduledTask.TaskStatus.COMPLETED,
+            ]
+        )
+        retry_tasks = RetryTask.objects.filter(
+            status__in=[RetryTask.TaskStatus.PENDING, RetryTask.TaskStatus.FAILED],
+            retry_count__lt=F('max_retries'),
+        )
+        if tag:
+            scheduled_tasks = scheduled_tasks.filter(tag=tag)
+            retry_tasks = retry_tasks.filter(tag=tag)
+        return scheduled_tasks, retry_tasks
+
+    @classmethod
+    def _claimable_tasks(cls, queryset: QuerySet, now: datetime) -> QuerySet:
+        return queryset.filter(cls._unlocked(now), next_run_time__lte=now)
+
+    @classmethod
+    def _claim_from(cls, queryset: QuerySet, limit: int, now: datetime) -> List[Task]:
+        """
+        Lock up to `limit` rows of `queryset` with FOR UPDATE SKIP LOCKED and stamp their lock in the same
+        transaction, so concurrent workers (threads or pods) never claim the same task.
+        """
+        if limit <= 0:
+            return []
+        with transaction.atomic():
+            claimed = list(queryset.select_for_update(skip_locked=True).order_by('next_run_time', 'pk')[:limit])
+            if claimed:
+                queryset.model.objects.filter(pk__in=[task.pk for task in claimed]).update(lock_acquired_at=now)
+                for task in claimed:
+                    task.lock_acquired_at = now
+        return claimed
+
+    @classmethod
+    def claim_due_tasks(cls, batch_size: int, tag: Optional[str] = None) -> List[Task]:
+        """
+        Claim a batch of due tasks in a single query per task table.
+
+        Scheduled tasks are claimed first; retry tasks fill the rest of the batch. Claimed tasks come back with
+        their lock held and should be run with `process_claimed_task`.
+        """
+        now = timezone.now()
+        scheduled_tasks, retry_tasks = cls._runnable_tasks(tag)
+
+        claimed = cls._claim_from(cls._claimable_tasks(scheduled_tasks, now), batch_size, now)
+        claimed += cls._claim_from(cls._claimable_tasks(retry_tasks, now), batch_size - len(claimed), now)
+        return claimed
+
+    @classmethod
+    def get_next_run_time(cls, tag: Optional[str] = None) -> Optional[datetime]:
+        """The earliest next run time of the unlocked tasks that can run, None if there are none"""
+        unlocked = cls._unlocked(timezone.now())
+        next_run_times = [
+            queryset.filter(unlocked).aggregate(next_run_time=Min('next_run_time'))['next_run_time']
+            for queryset in cls._runnable_tasks(tag)
+        ]
+        return min((next_run_time for next_run_time in next_run_times if next_run_time), default=None)
+
+    @classmethod
+    def get_queue_metrics(cls, tag: Optional[str] = None) -> Dict[str, float]:
+        """
+        Depth and lag of the task queue: the due tasks waiting for a worker, the tasks being run, and how long (in
+        seconds) the oldest due task has been waiting.
+        """
+        now = timezone.now()
+        due_count = 0
+        oldest_run_time: Optional[datetime] = None
+        for queryset in cls._runnable_tasks(tag):
+            due = cls._claimable_tasks(queryset, now).aggregate(count=Count('pk'), oldest_run_time=Min('next_run_time'))
+            due_count += due['count']
+            if due['oldest_run_time'] and (oldest_run_time is None or due['oldest_run_time'] < oldest_run_time):
+                oldest_run_time = due['oldest_run_time']
+
+        running_count = 0
+        for model in (ScheduledTask, RetryTask):
+            running = model.objects.filter(lock_acquired_at__gt=now - get_lock_timeout())
+            running_count += (running.filter(tag=tag) if tag else running).count()
+
+        return {
+            'due': due_count,
+            'running': running_count,
+            'lag_seconds': (now - oldest_run_time).total_seconds() if oldest_run_time else 0.0,
+        }
+
     @classmethod
     def cleanup_old_tasks(cls, days: int = 30) -> int:
         cutoff_date = timezone.now() - timedelta(days=days)
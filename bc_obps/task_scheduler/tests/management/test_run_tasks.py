@@ -132,3 +132,33 @@ class TestRunTasksCommand(SimpleTestCase):
         output = out.getvalue()
         self.assertIn("DRY RUN MODE", output)
         self.assertIn("Would process 2 tasks", output)
+
+    @patch('task_scheduler.service.task_service.TaskService.process_claimed_task')
+    @patch('task_scheduler.service.task_service.TaskService.claim_due_tasks')
+    def test_run_tasks_command_with_workers(self, mock_claim_due_tasks, mock_process_claimed):
+        # One worker claims both tasks, every later claim finds the queue drained
+        mock_claim_due_tasks.side_effect = [self.mock_tasks, [], []]
+        mock_process_claimed.side_effect = [True, False]
+
+        out = StringIO()
+        call_command('run_tasks', workers=2, batch_size=5, stdout=out)
+
+        mock_claim_due_tasks.assert_called_with(5, None)
+        self.assertEqual(mock_process_claimed.call_count, 2)
+
+        output = out.getvalue()
+        self.assertIn("Processing due tasks with 2 workers (batch size 5)", output)
+        self.assertIn("Processing completed: 2 processed, 1 successful, 1 failed", output)
+        self.assertIn("Task latency:", output)
+        self.assertIn("Throughput:", output)
+
+    @patch('task_scheduler.service.task_service.TaskService.process_claimed_task')
+    @patch('task_scheduler.service.task_service.TaskService.claim_due_tasks')
+    def test_run_tasks_command_with_workers_no_due_tasks(self, mock_claim_due_tasks, mock_process_claimed):
+        mock_claim_due_tasks.return_value = []
+
+        out = StringIO()
+        call_command('run_tasks', workers=3, stdout=out)
+
+        mock_process_claimed.assert_not_called()
+        self.assertIn("No due tasks found", out.getvalue())
@@ -20,6 +20,7 @@ class RetryTaskTest(BaseTestCase):
             ("id", "ID", None, None),
             ("function_path", "function path", None, None),
             ("kwargs", "kwargs", None, None),
+            ("kwargs_hash", "kwargs hash", None, None),
             ("tag", "tag", None, None),
             ("status", "status", None, None),
             ("next_run_time", "next run time", None, None),
@@ -197,6 +197,19 @@ class TestScheduledTask(BaseTestCase):
         self.test_object.refresh_from_db()
         assert self.test_object.lock_acquired_at is None
 
+    def test_renew_and_release_held_lock_leave_a_reclaimed_lock_alone(self):
+        self.test_object.acquire_lock()
+        assert self.test_object.renew_lock() is True
+
+        # Another worker re-claims the task after the lock expired
+        reclaimed_at = timezone.now() + timedelta(seconds=1)
+        ScheduledTask.objects.filter(pk=self.test_object.pk).update(lock_acquired_at=reclaimed_at)
+
+        assert self.test_object.renew_lock() is False
+        self.test_object.release_held_lock()
+        self.test_object.refresh_from_db()
+        assert self.test_object.lock_acquired_at == reclaimed_at
+
     def test_audit_column_triggers(self):
         # This data model has created_at field, but it does not have triggers set up because it is not a timestamped model
         # Therefore, we override the base test to do nothing
@@ -1,8 +1,18 @@
+import threading
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
-from django.test import SimpleTestCase, TestCase
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
 from model_bakery import baker
-from task_scheduler.service.retry_task.retryable import RetryableFunction, create_retry_task
+from task_scheduler.service.retry_task.retryable import RetryableFunction, create_retry_task, enqueue_retry_task
+from task_scheduler.service.task_service import TaskService
 from task_scheduler.models import RetryTask
+from task_scheduler.utils.paths import get_function_path
+
+
+def outbox_function(param: str) -> None:
+    pass
 
 
 class TestRetryableFunction(SimpleTestCase):
@@ -151,3 +161,145 @@ class TestCreateRetryTask(TestCase):
         self.assertEqual(result, existing_task)
         existing_task.refresh_from_db()
         self.assertEqual(existing_task.retry_count, 3)  # Should not be incremented
+
+    def test_create_retry_task_matches_kwargs_in_any_order(self):
+        existing_task = create_retry_task(function_path='test.module.function', kwargs={'a': 1, 'b': [1, 2]})
+
+        result = create_retry_task(function_path='test.module.function', kwargs={'b': [1, 2], 'a': 1})
+
+        self.assertEqual(result, existing_task)
+        self.assertEqual(RetryTask.objects.count(), 1)
+        # A different call
+        create_retry_task(function_path='test.module.function', kwargs={'a': 1, 'b': [2, 1]})
+        self.assertEqual(RetryTask.objects.count(), 2)
+
+
+class TestCreateRetryTaskConcurrency(TransactionTestCase):
+    available_apps = ['task_scheduler']
+
+    def tearDown(self):
+        # The tables of the common schema aren't flushed after transactional tests
+        RetryTask.objects.all().delete()
+
+    def run_concurrently(self, func, count=20):
+        barrier = threading.Barrier(count)
+        errors = []
+
+        def call():
+            try:
+                barrier.wait()
+                func()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_concurrent_failures_of_a_call_create_a_single_task(self):
+        self.run_concurrently(
+            lambda: create_retry_task(function_path='test.module.function', kwargs={'param': 'value'}, tag='test_tag')
+        )
+        self.run_concurrently(
+            lambda: enqueue_retry_task(function_path='test.module.function', kwargs={'param': 'value'}, tag='test_tag')
+        )
+
+        self.assertEqual(RetryTask.objects.count(), 1)
+
+    def test_concurrent_failures_of_a_failed_call_each_use_a_retry(self):
+        existing_task = baker.make_recipe(
+            "task_scheduler.tests.utils.retry_task",
+            function_path="test.module.function",
+            status=RetryTask.TaskStatus.FAILED,
+            max_retries=100,
+            kwargs={"param": "value"},
+            tag="test_tag",
+        )
+
+        self.run_concurrently(
+            lambda: create_retry_task(function_path='test.module.function', kwargs={'param': 'value'}, tag='test_tag')
+        )
+
+        self.assertEqual(RetryTask.objects.count(), 1)
+        existing_task.refresh_from_db()
+        self.assertEqual(existing_task.retry_count, 20)
+
+
+class TestRetryableFunctionOutbox(TestCase):
+    def setUp(self):
+        self.mock_func = MagicMock()
+        self.retryable = RetryableFunction(
+            func=outbox_function, tag='test_tag', max_retries=2, retry_delay_minutes=10, outbox=True
+        )
+
+    @patch('task_scheduler.service.retry_task.retryable.get_function_path', return_value='test.module.function')
+    def test_execute_queues_the_call_instead_of_running_it(self, mock_get_path):
+        retryable = RetryableFunction(func=self.mock_func, tag='test_tag', max_retries=2, outbox=True)
+        self.mock_func.__name__ = 'test_function'
+
+        result = retryable.execute(param='value')
+
+        self.assertIsNone(result)
+        self.mock_func.assert_not_called()
+        task = RetryTask.objects.get(function_path='test.module.function')
+        self.assertEqual(task.kwargs, {'param': 'value'})
+        self.assertEqual(task.tag, 'test_tag')
+        self.assertEqual(task.status, RetryTask.TaskStatus.PENDING)
+        self.assertEqual(task.retry_count, 0)
+        # The first attempt is made by the scheduler, on top of the retries
+        self.assertEqual(task.max_retries, 3)
+        self.assertLessEqual(task.next_run_time, timezone.now())
+
+    def test_queued_call_is_discarded_when_the_transaction_rolls_back(self):
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                self.retryable.execute(param='value')
+                raise ValueError("Rolled back")
+
+        self.assertFalse(RetryTask.objects.exists())
+
+    def test_identical_pending_call_is_coalesced(self):
+        existing_task = baker.make_recipe(
+            "task_scheduler.tests.utils.retry_task",
+            function_path=get_function_path(outbox_function),
+            status=RetryTask.TaskStatus.PENDING,
+            kwargs={"param": "value"},
+            tag="test_tag",
+            next_run_time=timezone.now() + timedelta(minutes=30),
+        )
+
+        self.retryable.execute(param='value')
+
+        self.assertEqual(RetryTask.objects.count(), 1)
+        existing_task.refresh_from_db()
+        self.assertLessEqual(existing_task.next_run_time, timezone.now())
+
+    @override_settings(TASK_SCHEDULER_OUTBOX=True)
+    def test_outbox_follows_the_setting_unless_set(self):
+        self.mock_func.__name__ = 'test_function'
+        self.mock_func.return_value = 'success_result'
+
+        self.assertTrue(RetryableFunction(func=self.mock_func).uses_outbox)
+        result = RetryableFunction(func=self.mock_func, outbox=False).execute(param='value')
+
+        self.assertEqual(result, 'success_result')
+        self.mock_func.assert_called_once_with(param='value')
+        self.assertFalse(RetryTask.objects.exists())
+
+    @patch('task_scheduler.service.task_service.resolve_function_from_path')
+    def test_scheduler_drains_the_outbox(self, mock_resolve):
+        mock_resolve.return_value = self.mock_func
+        self.retryable.execute(param='value')
+
+        for task in TaskService.claim_due_tasks(batch_size=10):
+            TaskService.process_claimed_task(task)
+
+        self.mock_func.assert_called_once_with(param='value')
+        task = RetryTask.objects.get()
+        self.assertEqual(task.status, RetryTask.TaskStatus.COMPLETED)
+        self.assertIsNone(task.lock_acquired_at)
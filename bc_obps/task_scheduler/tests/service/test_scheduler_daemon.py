@@ -0,0 +1,97 @@
+import threading
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+import pytest
+from django.db import connection
+from django.utils import timezone
+from model_bakery import baker
+from task_scheduler.models import RetryTask
+from task_scheduler.service.scheduler_daemon import SchedulerDaemon
+from task_scheduler.service.task_service import TaskLockHeartbeat, TaskService
+
+# Notifications are only sent, and rows only seen by other threads, once transactions commit
+pytestmark = pytest.mark.django_db(transaction=True, available_apps=["task_scheduler"])
+
+
+@pytest.fixture(autouse=True)
+def delete_tasks():
+    yield
+    # The tables of the common schema aren't flushed after transactional tests
+    RetryTask.objects.all().delete()
+
+
+@pytest.fixture
+def daemon():
+    daemon = SchedulerDaemon(max_sleep_seconds=30)
+    daemon._listen()
+    yield daemon
+    daemon._close_listen_connection()
+
+
+def make_due_retry_task(**kwargs):
+    return baker.make_recipe(
+        "task_scheduler.tests.utils.retry_task", next_run_time=timezone.now() - timedelta(minutes=1), **kwargs
+    )
+
+
+class TestSchedulerDaemon:
+    def test_creating_or_rescheduling_a_task_notifies_the_daemon(self, daemon):
+        task = make_due_retry_task()
+        assert daemon._notifications(timeout=1) == 1
+
+        task.status = RetryTask.TaskStatus.FAILED
+        task.save()
+        assert daemon._notifications(timeout=0) == 0
+
+        task.next_run_time = timezone.now() + timedelta(minutes=5)
+        task.save()
+        assert daemon._notifications(timeout=1) == 1
+
+    def test_daemon_wakes_up_when_a_task_is_created(self, daemon):
+        def create_task():
+            time.sleep(0.2)
+            make_due_retry_task()
+            connection.close()
+
+        creator = threading.Thread(target=create_task)
+        started = time.monotonic()
+        creator.start()
+        daemon._wait_for_notification(daemon._seconds_until_next_task())
+        creator.join()
+
+        assert time.monotonic() - started < 5
+
+    def test_daemon_sleeps_until_the_next_task_is_due(self, daemon):
+        assert daemon._seconds_until_next_task() == 30
+
+        baker.make_recipe("task_scheduler.tests.utils.retry_task", next_run_time=timezone.now() + timedelta(seconds=10))
+        assert 0 < daemon._seconds_until_next_task() <= 10
+
+    @patch('task_scheduler.service.task_service.resolve_function_from_path')
+    def test_stopping_releases_the_claimed_tasks_that_have_not_started(self, mock_resolve, daemon):
+        mock_resolve.return_value = MagicMock(side_effect=lambda **kwargs: daemon.stop())
+        first_task = make_due_retry_task(function_path="test.module.first")
+        second_task = make_due_retry_task(function_path="test.module.second")
+        daemon.batch_size = 2
+
+        daemon._worker()
+
+        first_task.refresh_from_db()
+        second_task.refresh_from_db()
+        assert first_task.status == RetryTask.TaskStatus.COMPLETED
+        assert second_task.status == RetryTask.TaskStatus.PENDING
+        assert second_task.lock_acquired_at is None
+        assert daemon.get_metrics()['processed'] == 1
+
+    def test_heartbeat_renews_the_lock_of_a_running_task(self):
+        task = make_due_retry_task()
+        [task] = TaskService.claim_due_tasks(batch_size=1)
+        claimed_at = task.lock_acquired_at
+
+        with patch.dict('task_scheduler.service.task_service.TASK_SCHEDULER_CONFIG', {'lock_heartbeat_seconds': 0.1}):
+            with TaskLockHeartbeat(task):
+                time.sleep(0.5)
+
+        task.refresh_from_db()
+        assert task.lock_acquired_at > claimed_at
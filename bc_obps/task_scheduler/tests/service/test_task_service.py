@@ -99,6 +99,110 @@ class TestTaskService(TestCase):
         due_tasks = TaskService.get_due_tasks()
         self.assertNotIn(exhausted_retry_task_obj, due_tasks)
 
+    def test_claim_due_tasks_locks_claimed_tasks(self):
+        claimed = TaskService.claim_due_tasks(batch_size=10)
+
+        self.assertCountEqual(claimed, [self.scheduled_task, self.retry_task])
+        self.scheduled_task.refresh_from_db()
+        self.retry_task.refresh_from_db()
+        self.assertIsNotNone(self.scheduled_task.lock_acquired_at)
+        self.assertIsNotNone(self.retry_task.lock_acquired_at)
+
+        # Already-claimed tasks are not handed out again
+        self.assertEqual(TaskService.claim_due_tasks(batch_size=10), [])
+
+    def test_claim_due_tasks_respects_batch_size_and_tag(self):
+        claimed = TaskService.claim_due_tasks(batch_size=1)
+        self.assertEqual(claimed, [self.scheduled_task])
+
+        claimed = TaskService.claim_due_tasks(batch_size=5, tag="another_test")
+        self.assertEqual(claimed, [self.retry_task])
+
+    def test_claim_due_tasks_reclaims_expired_lock(self):
+        self.scheduled_task.lock_acquired_at = timezone.now() - timedelta(hours=1)
+        self.scheduled_task.save()
+
+        claimed = TaskService.claim_due_tasks(batch_size=10, tag="test")
+        self.assertEqual(claimed, [self.scheduled_task])
+
+    def test_get_next_run_time_skips_locked_and_exhausted_tasks(self):
+        self.scheduled_task.lock_acquired_at = timezone.now()
+        self.scheduled_task.save()
+        self.assertEqual(TaskService.get_next_run_time(), self.retry_task.next_run_time)
+        self.assertIsNone(TaskService.get_next_run_time(tag="test"))
+
+        self.retry_task.retry_count = self.retry_task.max_retries
+        self.retry_task.save()
+        self.assertIsNone(TaskService.get_next_run_time())
+
+    def test_get_queue_metrics(self):
+        self.retry_task.next_run_time = timezone.now() - timedelta(minutes=10)
+        self.retry_task.save()
+        baker.make_recipe(
+            "task_scheduler.tests.utils.retry_task",
+            status=RetryTask.TaskStatus.RUNNING,
+            next_run_time=timezone.now() - timedelta(minutes=1),
+            lock_acquired_at=timezone.now(),
+        )
+
+        metrics = TaskService.get_queue_metrics()
+
+        self.assertEqual(metrics['due'], 2)
+        self.assertEqual(metrics['running'], 1)
+        self.assertGreaterEqual(metrics['lag_seconds'], 600)
+        self.assertEqual(TaskService.get_queue_metrics(tag="another_test")['running'], 0)
+
+    def test_claim_due_tasks_skips_exhausted_retry_tasks(self):
+        self.retry_task.retry_count = self.retry_task.max_retries
+        self.retry_task.save()
+
+        claimed = TaskService.claim_due_tasks(batch_size=10)
+        self.assertEqual(claimed, [self.scheduled_task])
+
+    def test_process_claimed_task_does_not_reacquire_lock(self):
+        claimed = TaskService.claim_due_tasks(batch_size=1)
+        with (
+            patch.object(TaskService, 'execute_task_function', return_value=True),
+            patch.object(claimed[0], 'acquire_lock') as mock_acquire,
+        ):
+            result = TaskService.process_claimed_task(claimed[0])
+
+        self.assertTrue(result)
+        mock_acquire.assert_not_called()
+        self.scheduled_task.refresh_from_db()
+        self.assertIsNone(self.scheduled_task.lock_acquired_at)
+
+    def test_process_claimed_task_skips_a_task_reclaimed_by_another_worker(self):
+        [task] = TaskService.claim_due_tasks(batch_size=1)
+        # The task waited behind its batch past the lock timeout and another worker claimed it
+        reclaimed_at = timezone.now() + timedelta(seconds=1)
+        ScheduledTask.objects.filter(pk=task.pk).update(lock_acquired_at=reclaimed_at)
+
+        with patch.object(TaskService, 'execute_task_function') as mock_execute:
+            result = TaskService.process_claimed_task(task)
+
+        self.assertFalse(result)
+        mock_execute.assert_not_called()
+        self.scheduled_task.refresh_from_db()
+        self.assertEqual(self.scheduled_task.lock_acquired_at, reclaimed_at)
+        self.assertEqual(self.scheduled_task.status, ScheduledTask.TaskStatus.PENDING)
+
+    def test_process_claimed_task_leaves_a_lock_lost_while_running_to_its_new_owner(self):
+        [task] = TaskService.claim_due_tasks(batch_size=1)
+        reclaimed_at = timezone.now() + timedelta(seconds=1)
+
+        def run_past_the_lock_timeout(task):
+            # Another worker re-claims the task while it runs
+            ScheduledTask.objects.filter(pk=task.pk).update(lock_acquired_at=reclaimed_at)
+
+        with patch.object(TaskService, 'execute_task_function', side_effect=run_past_the_lock_timeout):
+            result = TaskService.process_claimed_task(task)
+
+        self.assertFalse(result)
+        self.scheduled_task.refresh_from_db()
+        self.assertEqual(self.scheduled_task.lock_acquired_at, reclaimed_at)
+        self.assertEqual(self.scheduled_task.status, ScheduledTask.TaskStatus.RUNNING)
+
     @patch('task_scheduler.service.task_service.resolve_function_from_path')
     def test_process_task_success(self, mock_resolve):
         mock_function = MagicMock()
@@ -108,7 +212,7 @@ class TestTaskService(TestCase):
             patch.object(self.scheduled_task, 'mark_attempt_started') as mock_started,
             patch.object(self.scheduled_task, 'mark_attempt_success') as mock_success,
             patch.object(self.scheduled_task, 'calculate_next_run_time') as mock_calc_next,
-            patch.object(self.scheduled_task, 'release_lock') as mock_release,
+            patch.object(self.scheduled_task, 'release_held_lock') as mock_release,
         ):
 
             mock_calc_next.return_value = timezone.now() + timedelta(hours=1)
@@ -129,7 +233,7 @@ class TestTaskService(TestCase):
             patch.object(self.scheduled_task, 'mark_attempt_started') as mock_started,
             patch.object(self.scheduled_task, 'mark_attempt_failed') as mock_failed,
             patch.object(self.scheduled_task, 'calculate_next_run_time') as mock_calc_next,
-            patch.object(self.scheduled_task, 'release_lock') as mock_release,
+            patch.object(self.scheduled_task, 'release_held_lock') as mock_release,
             patch.object(self.scheduled_task, 'mark_attempt_success') as mock_success,
         ):
 
@@ -156,7 +260,7 @@ class TestTaskService(TestCase):
             patch.object(self.retry_task, 'mark_attempt_started') as mock_started,
             patch.object(self.retry_task, 'mark_attempt_success') as mock_success,
             patch.object(self.retry_task, 'calculate_next_run_time') as mock_calc_next,
-            patch.object(self.retry_task, 'release_lock') as mock_release,
+            patch.object(self.retry_task, 'release_held_lock') as mock_release,
         ):
 
             mock_calc_next.return_value = timezone.now() + timedelta(hours=1)
@@ -176,7 +280,7 @@ class TestTaskService(TestCase):
             patch.object(self.retry_task, 'mark_attempt_started') as mock_started,
             patch.object(self.retry_task, 'mark_attempt_failed') as mock_failed,
             patch.object(self.retry_task, 'calculate_next_run_time') as mock_calc_next,
-            patch.object(self.retry_task, 'release_lock') as mock_release,
+            patch.object(self.retry_task, 'release_held_lock') as mock_release,
             patch.object(self.scheduled_task, 'mark_attempt_success') as mock_success,
         ):
 
@@ -1,3 +1,4 @@
+import hashlib
 import inspect
 import json
 from typing import Any, Callable, Dict, Tuple
@@ -34,3 +35,13 @@ def extract_function_parameters(args: Tuple[Any, ...], kwargs: Dict[str, Any], f
             serialized_params[param_name] = json.loads(json.dumps(arg, cls=DjangoJSONEncoder))
 
     return serialized_params
+
+
+def hash_kwargs(kwargs: Dict[str, Any]) -> str:
+    """
+    SHA-256 of the keyword arguments of a retry task, serialized with sorted keys, so identical calls have the same
+    hash whatever the order of their arguments.
+    """
+    return hashlib.sha256(
+        json.dumps(kwargs, sort_keys=True, separators=(",", ":"), cls=DjangoJSONEncoder).encode()
+    ).hexdigest()
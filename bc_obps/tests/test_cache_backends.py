@@ -0,0 +1,137 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+from django.core.cache import caches
+from django.core.cache.backends.db import DatabaseCache
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from model_bakery import baker
+from bc_obps.cache_backends import TieredCache, migrations_fingerprint
+from bc_obps.db_routers import SHARED_CACHE_DATABASE, SharedCacheRouter
+from registration.middleware.current_user import CurrentUserMiddleware
+from registration.models import AppRole, SharedCacheEntry, User
+
+
+def tiered_cache(location: str, **options) -> dict:
+    return {
+        "BACKEND": "bc_obps.cache_backends.TieredCache",
+        "LOCATION": location,
+        # Same prefix, so both caches read the same shared entries like two processes would
+        "KEY_PREFIX": "test",
+        "OPTIONS": {"SHARED": "shared", "LOCAL_TIMEOUT": 60, **options},
+    }
+
+
+# "default" and "other_process" stand in for the same cache in two processes: they share the shared tier, but each
+# has its own local tier and invalidation state
+TIERED_CACHES = {
+    "shared": {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": 'erc"."shared_cache'},
+    "default": tiered_cache("test_process"),
+    "other_process": tiered_cache("test_other_process"),
+}
+
+
+@override_settings(CACHES=TIERED_CACHES)
+class TestTieredCache(TestCase):
+    def setUp(self):
+        self.cache: TieredCache = caches["default"]
+        self.other_process_cache: TieredCache = caches["other_process"]
+        for cache in (self.cache, self.other_process_cache):
+            cache.clear()
+            cache.reset_stats()
+
+    def test_values_are_shared_and_kept_locally(self):
+        self.cache.set("key", {"value": 1})
+        assert SharedCacheEntry.objects.filter(cache_key__endswith="test:1:key").exists()
+
+        assert self.other_process_cache.get("key") == {"value": 1}
+        # The entry is read from the shared tier once, then from the local tier
+        SharedCacheEntry.objects.all().delete()
+        assert self.other_process_cache.get("key") == {"value": 1}
+        assert self.other_process_cache.get("missing") is None
+
+        assert self.other_process_cache.stats() == {
+            "local_hits": 1,
+            "shared_hits": 1,
+            "misses": 1,
+            "sets": 0,
+            "deletes": 0,
+            "local_invalidations": 0,
+        }
+        assert self.cache.stats()["sets"] == 1
+
+    def test_deleted_keys_are_dropped_from_the_local_tier_of_other_processes(self):
+        self.cache.set("user", "before the role change")
+        self.cache.set("other", "unchanged")
+        assert self.other_process_cache.get("user") == "before the role change"
+        assert self.other_process_cache.get("other") == "unchanged"
+
+        self.cache.delete("user")
+        assert self.cache.get("user") is None
+
+        self.other_process_cache.sync_invalidations(force=True)
+        assert self.other_process_cache.get("user") is None
+        assert self.other_process_cache.get("other") == "unchanged"
+        assert self.other_process_cache.stats()["local_invalidations"] == 1
+
+    def test_clear_empties_the_local_tier_of_other_processes(self):
+        self.cache.set("key", "value")
+        assert self.other_process_cache.get("key") == "value"
+
+        self.cache.clear()
+
+        self.other_process_cache.sync_invalidations(force=True)
+        assert self.other_process_cache.get("key") is None
+        assert not SharedCacheEntry.objects.filter(cache_key__endswith="test:1:key").exists()
+
+    def test_local_copies_dont_outlive_the_entry(self):
+        self.cache.set("short", "value", timeout=0)
+        assert self.cache.get("short") is None
+
+        assert self.cache.add("key", "first")
+        assert not self.cache.add("key", "second")
+        assert self.cache.get("key") == "first"
+        assert self.cache.get_or_set("computed", lambda: "built") == "built"
+        assert self.other_process_cache.get("computed") == "built"
+
+    def test_role_change_invalidates_the_cached_user(self):
+        middleware = CurrentUserMiddleware(lambda request: MagicMock(status_code=200))
+        user = baker.make(User, app_role=AppRole.objects.get(role_name="cas_pending"))
+        request = RequestFactory().get("/", HTTP_AUTHORIZATION=json.dumps({"user_guid": str(user.user_guid)}))
+        middleware(request)
+        assert request.current_user.app_role.role_name == "cas_pending"
+
+        # The role is changed (e.g. by an admin, in another worker)
+        user.app_role = AppRole.objects.get(role_name="cas_analyst")
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+
+        caches["default"].sync_invalidations(force=True)
+        middleware(request)
+        assert request.current_user.app_role.role_name == "cas_analyst"
+
+
+class TestMigrationsFingerprint(SimpleTestCase):
+    def test_fingerprint_changes_with_the_migrations(self):
+        with tempfile.TemporaryDirectory() as base_dir:
+            migrations = Path(base_dir) / "app" / "migrations"
+            migrations.mkdir(parents=True)
+            (migrations / "0001_initial.py").touch()
+            (migrations / "__init__.py").touch()
+            fingerprint = migrations_fingerprint(Path(base_dir))
+            assert migrations_fingerprint(Path(base_dir)) == fingerprint
+
+            (migrations / "0002_configuration.py").touch()
+            assert migrations_fingerprint(Path(base_dir)) != fingerprint
+
+
+class TestSharedCacheRouter(SimpleTestCase):
+    def test_database_cache_queries_use_their_own_connection(self):
+        router = SharedCacheRouter()
+        cache_model = DatabaseCache('erc"."shared_cache', {}).cache_model_class
+
+        assert router.db_for_read(cache_model) == SHARED_CACHE_DATABASE
+        assert router.db_for_write(cache_model) == SHARED_CACHE_DATABASE
+        assert router.db_for_read(User) is None
+        assert router.allow_migrate(SHARED_CACHE_DATABASE, "registration") is False
+        assert router.allow_migrate("default", "registration") is None
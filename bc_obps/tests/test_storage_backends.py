@@ -75,3 +75,36 @@ class TestUnifiedGcsStorage(SimpleTestCase):
         assert return_value == "test_return_value"
         gcs_instance.bucket.copy_blob.assert_called_once()
         assert gcs_instance.bucket.copy_blob.mock_calls[0].args[2] == "path/test_file_20020222000000.abc"
+
+    @patch("bc_obps.storage_backends.GoogleCloudStorage")
+    def test_get_file_buckets_reuses_bucket_handlers(self, mock_gcs):
+        settings.GS_UNSCANNED_BUCKET_NAME = "unscanned"
+        settings.GS_QUARANTINED_BUCKET_NAME = "quarantine"
+        settings.GS_CLEAN_BUCKET_NAME = "clean"
+        files_by_bucket = {
+            "clean": {"clean.pdf"},
+            "unscanned": {"unscanned.pdf"},
+            "quarantine": {"quarantined.pdf"},
+        }
+
+        def build_handler(bucket_name):
+            handler = MagicMock()
+            handler.exists.side_effect = lambda name: name in files_by_bucket[bucket_name]
+            return handler
+
+        mock_gcs.side_effect = build_handler
+
+        storage_backend_under_test = UnifiedGcsStorage()
+        file_buckets = storage_backend_under_test.get_file_buckets(
+            ["clean.pdf", "unscanned.pdf", "quarantined.pdf", "missing.pdf", "clean.pdf"], max_workers=3
+        )
+
+        assert file_buckets == {
+            "clean.pdf": "Clean",
+            "unscanned.pdf": "Unscanned",
+            "quarantined.pdf": "Quarantined",
+            "missing.pdf": None,
+        }
+        assert storage_backend_under_test.get_file_bucket("clean.pdf") == "Clean"
+        # One handler per bucket, whatever the number of files
+        assert mock_gcs.call_count == 3